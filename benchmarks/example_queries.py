@@ -0,0 +1,544 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Times the example queries against synthetic warehouse data.
+
+The database is given by the MYSQL_BENCH_* environment variables (see
+ml_warehouse.engine.url_from_env), kept apart from the MYSQL_* variables
+naming the warehouse itself. With --populate, every warehouse table in it is
+dropped and recreated, and iseq_flowcell, iseq_product_metrics,
+iseq_run_status and pac_bio_run are filled with --rows rows each, along with
+the studies, samples and lane metrics they refer to. Tables are only dropped
+if the database name contains "scratch", "bench" or "test", or if --yes-drop
+is given. Without --populate, the data already there is used.
+
+Each example query runs in a fresh child process, so that its peak RSS is
+not inflated by the queries before it. The results are written to a JSON
+file named after the current commit, which a later run can be compared with.
+Run from the repository root:
+
+    PYTHONPATH=src:tests python benchmarks/example_queries.py \\
+        --populate --rows 100000 [--repeat N] [--compare RESULTS]
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+import re
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Query, Session
+
+from examples.genotyping import get_flgen_plate
+from examples.long_illumina import summarize_long_illumina
+from examples.npg_irods import (
+    find_pacbio_runs,
+    get_bmap_flowcell_records,
+    get_stock_records,
+)
+from examples.npg_qc import (
+    get_iseq_product_metrics_by_decode_percent,
+    get_iseq_product_metrics_by_study,
+    get_iseq_product_metrics_run,
+)
+from examples.recently_updated import (
+    get_recent_fluidigm,
+    get_recent_ont,
+    get_recent_pacbio_runs,
+)
+from examples.stats import get_sequenced_sum
+from ml_warehouse.bulk import load_rows, read_rows
+from ml_warehouse.engine import get_engine, url_from_env
+from ml_warehouse.schema import (
+    Base,
+    IseqFlowcell,
+    IseqProductMetrics,
+    IseqRunLaneMetrics,
+    IseqRunStatus,
+    IseqRunStatusDict,
+    PacBioRun,
+    Sample,
+    Study,
+)
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# The prefix of the environment variables naming the benchmark database.
+ENV_PREFIX = "MYSQL_BENCH"
+
+# Databases whose names match this may have their tables dropped.
+SCRATCH_DBNAME = re.compile(r"scratch|bench|test", re.IGNORECASE)
+
+ID_LIMS = "SQSCP"
+START = datetime(2015, 1, 1)
+END = datetime(2022, 1, 1)
+
+# Cardinalities, modelled on production: one flowcell per run, with 8 lanes
+# of 48 plexes; PacBio runs of 4 wells with 24 tags each; one study per
+# 1,000 libraries and one sample per 4.
+LANES = 8
+PLEXES = 48
+WELLS = ("A1", "B1", "C1", "D1")
+PACBIO_TAGS = 24
+ROWS_PER_STUDY = 1000
+ROWS_PER_SAMPLE = 4
+FACULTY_SPONSORS = 50
+
+# The status history of a completed run, as id_run_status_dict values.
+RUN_LIFECYCLE = (1, 2, 4, 6, 7, 9, 19, 20)
+# The fraction of the most recent runs which are still in progress.
+ACTIVE_RUN_FRACTION = 0.02
+
+# A run is a regression if its median latency grows by more than this.
+DEFAULT_TOLERANCE = 0.2
+
+
+def _timestamp(rng: random.Random) -> datetime:
+    return START + timedelta(seconds=rng.randrange(int((END - START).total_seconds())))
+
+
+def _iseq_runs(rows: int) -> int:
+    return max(1, -(-rows // (LANES * PLEXES)))
+
+
+def study_rows(rows: int, rng: random.Random) -> Iterator[dict]:
+    for i in range(1, max(10, rows // ROWS_PER_STUDY) + 1):
+        ts = _timestamp(rng)
+        yield {
+            "id_study_tmp": i,
+            "id_lims": ID_LIMS,
+            "id_study_lims": str(i),
+            "name": f"Study {i}",
+            "faculty_sponsor": f"Sponsor {i % FACULTY_SPONSORS}",
+            "last_updated": ts,
+            "recorded_at": ts,
+        }
+
+
+def sample_rows(rows: int, rng: random.Random) -> Iterator[dict]:
+    for i in range(1, max(100, rows // ROWS_PER_SAMPLE) + 1):
+        ts = _timestamp(rng)
+        yield {
+            "id_sample_tmp": i,
+            "id_lims": ID_LIMS,
+            "id_sample_lims": str(i),
+            "name": f"sample_{i}",
+            "supplier_name": f"supplier_{i}",
+            "last_updated": ts,
+            "recorded_at": ts,
+        }
+
+
+def iseq_flowcell_rows(rows: int, rng: random.Random) -> Iterator[dict]:
+    studies = max(10, rows // ROWS_PER_STUDY)
+    samples = max(100, rows // ROWS_PER_SAMPLE)
+
+    for i in range(rows):
+        flowcell, plex = divmod(i, PLEXES)
+        flowcell, lane = divmod(flowcell, LANES)
+        ts = _timestamp(rng)
+        yield {
+            "id_iseq_flowcell_tmp": i + 1,
+            "id_sample_tmp": rng.randint(1, samples),
+            # Pools are usually from a single study.
+            "id_study_tmp": flowcell % studies + 1,
+            "id_lims": ID_LIMS,
+            "id_flowcell_lims": str(flowcell + 1),
+            "position": lane + 1,
+            "tag_index": plex + 1,
+            "entity_type": (
+                "library_indexed_spike" if plex == PLEXES - 1 else "library_indexed"
+            ),
+            "entity_id_lims": str(i + 1),
+            "id_pool_lims": f"NT{flowcell + 1}",
+            "last_updated": ts,
+            "recorded_at": ts,
+        }
+
+
+def iseq_product_metrics_rows(rows: int, rng: random.Random) -> Iterator[dict]:
+    for i in range(rows):
+        run, plex = divmod(i, PLEXES)
+        run, lane = divmod(run, LANES)
+        key = f"{run + 1}:{lane + 1}:{plex + 1}"
+        yield {
+            "id_iseq_product": hashlib.sha256(key.encode()).hexdigest(),
+            "id_iseq_flowcell_tmp": i + 1,
+            "id_run": run + 1,
+            "position": lane + 1,
+            "tag_index": plex + 1,
+            "tag_decode_percent": round(rng.uniform(0, 100 / PLEXES * 2), 2),
+        }
+
+
+def iseq_run_lane_metrics_rows(rows: int, rng: random.Random) -> Iterator[dict]:
+    for run in range(1, _iseq_runs(rows) + 1):
+        for lane in range(1, LANES + 1):
+            yield {
+                "id_run": run,
+                "position": lane,
+                "cycles": 318,
+                "interop_cluster_count_pf_total": rng.randint(10**8, 5 * 10**8),
+                "tags_decode_percent": round(rng.uniform(80, 100), 2),
+            }
+
+
+def iseq_run_status_rows(rows: int, rng: random.Random) -> Iterator[dict]:
+    runs = max(1, rows // len(RUN_LIFECYCLE))
+    active = int(runs * (1 - ACTIVE_RUN_FRACTION))
+    spacing = (END - START) / runs
+
+    count = 0
+    for run in range(1, runs + 1):
+        history = RUN_LIFECYCLE
+        if run > active:
+            history = history[: rng.randint(1, len(history) - 1)]
+
+        date = START + spacing * (run - 1)
+        for n, status in enumerate(history):
+            if count == rows:
+                return
+            date += timedelta(hours=rng.randint(1, 72))
+            yield {
+                "id_run": run,
+                "date": date,
+                "id_run_status_dict": status,
+                "iscurrent": int(n == len(history) - 1),
+            }
+            count += 1
+
+
+def pac_bio_run_rows(rows: int, rng: random.Random) -> Iterator[dict]:
+    studies = max(10, rows // ROWS_PER_STUDY)
+    samples = max(100, rows // ROWS_PER_SAMPLE)
+
+    for i in range(rows):
+        run, tag = divmod(i, PACBIO_TAGS)
+        run, well = divmod(run, len(WELLS))
+        ts = _timestamp(rng)
+        yield {
+            "id_pac_bio_tmp": i + 1,
+            "id_sample_tmp": rng.randint(1, samples),
+            "id_study_tmp": run % studies + 1,
+            "id_lims": ID_LIMS,
+            "id_pac_bio_run_lims": str(run + 1),
+            "pac_bio_run_name": f"TRACTION-RUN-{run + 1}",
+            "cost_code": "S0000",
+            "plate_barcode": f"DN{run + 1}",
+            "plate_uuid_lims": f"plate-{run + 1}",
+            "well_label": WELLS[well],
+            "well_uuid_lims": f"well-{run + 1}-{WELLS[well]}",
+            "tag_identifier": str(tag + 1),
+            "pac_bio_library_tube_id_lims": str(i + 1),
+            "pac_bio_library_tube_uuid": f"tube-{i + 1}",
+            "pac_bio_library_tube_name": f"TRAC-2-{i + 1}",
+            "last_updated": ts,
+            "recorded_at": ts,
+        }
+
+
+# In dependency order.
+GENERATORS = (
+    (Study, study_rows),
+    (Sample, sample_rows),
+    (IseqFlowcell, iseq_flowcell_rows),
+    (IseqProductMetrics, iseq_product_metrics_rows),
+    (IseqRunLaneMetrics, iseq_run_lane_metrics_rows),
+    (IseqRunStatus, iseq_run_status_rows),
+    (PacBioRun, pac_bio_run_rows),
+)
+
+
+def populate(
+    engine, rows: int, seed: int = 0, batch_size: int = 10000, force: bool = False
+):
+    """Replaces the database's tables with synthetic data.
+
+    Arguments
+    ---------
+    engine:
+        The Engine for the scratch database.
+    rows: int
+        The number of rows of each of iseq_flowcell, iseq_product_metrics,
+        iseq_run_status and pac_bio_run.
+    seed: int
+        The random seed; the same seed generates the same data.
+    batch_size: int
+        The number of rows per insert.
+    force: bool
+        Drop the tables even if the database name does not mark it as a
+        scratch database.
+    """
+
+    database = engine.url.database or ""
+    if not (force or SCRATCH_DBNAME.search(database)):
+        raise ValueError(
+            f"Refusing to drop the tables of {database!r}, which is not named "
+            "as a scratch database"
+        )
+
+    rng = random.Random(seed)
+    with engine.begin() as conn:
+        # Workaround for invalid default values for dates, as in the tests.
+        # It is needed to insert rows taking those defaults too.
+        conn.execute(text("SET SESSION sql_mode = ''"))
+        Base.metadata.drop_all(conn)
+        Base.metadata.create_all(conn)
+
+        load_rows(
+            conn,
+            IseqRunStatusDict,
+            read_rows("tests/fixtures/00-IseqRunStatusDict.yml"),
+        )
+        for table_cls, generator in GENERATORS:
+            stats = load_rows(conn, table_cls, generator(rows, rng), batch_size)
+            print(stats, file=sys.stderr)
+
+
+def example_queries(rows: int) -> Dict[str, Callable[[Session], Query]]:
+    """Returns the example queries, with arguments matching the synthetic data.
+
+    Arguments
+    ---------
+    rows: int
+        The --rows the data was populated with.
+
+    Returns
+    -------
+    Dict[str, Callable[[Session], Query]]
+        Functions building each query from a Session, keyed by name.
+    """
+
+    # A spread of runs over the whole id range, as npg_qc would ask for.
+    runs = _iseq_runs(rows)
+    run_ids = sorted({1 + (runs - 1) * k // 9 for k in range(10)})
+    since = END - timedelta(days=90)
+
+    return {
+        "get_flgen_plate": lambda s: get_flgen_plate(s, 1382108143, "S70"),
+        "summarize_long_illumina": lambda s: summarize_long_illumina(
+            s, "%Sponsor 1%", START, END - timedelta(days=2), 14, run_ids[:3]
+        ),
+        "get_stock_records": lambda s: get_stock_records(s, "1"),
+        "get_bmap_flowcell_records": lambda s: get_bmap_flowcell_records(
+            s, "KHPZDTGLPQJGPNWU", 2
+        ),
+        "find_pacbio_runs": lambda s: find_pacbio_runs(s, "TRACTION-RUN-1", "B1"),
+        "get_iseq_product_metrics_run": lambda s: get_iseq_product_metrics_run(
+            s, run_ids, "library_indexed_spike", 1
+        ),
+        "get_iseq_product_metrics_by_study": lambda s: (
+            get_iseq_product_metrics_by_study(s, "Study 1", run_ids)
+        ),
+        "get_iseq_product_metrics_by_decode_percent": lambda s: (
+            get_iseq_product_metrics_by_decode_percent(s, 95, run_ids)
+        ),
+        "get_recent_pacbio_runs": lambda s: get_recent_pacbio_runs(s, since),
+        "get_recent_ont": lambda s: get_recent_ont(s, since),
+        "get_recent_fluidigm": lambda s: get_recent_fluidigm(s, since),
+        "get_sequenced_sum": lambda s: get_sequenced_sum(s, END - timedelta(days=365)),
+    }
+
+
+def time_query(url: str, rows: int, name: str, repeat: int) -> dict:
+    """Returns the timings of one example query.
+
+    Meant to run in a child process of its own, as ru_maxrss is the peak RSS
+    over the life of the process.
+
+    Arguments
+    ---------
+    url: str
+        The database URL.
+    rows: int
+        The --rows the data was populated with.
+    name: str
+        The name of the example query.
+    repeat: int
+        The number of timed runs, after one untimed run to warm the caches.
+
+    Returns
+    -------
+    dict
+        The median latency in seconds, the number of rows returned, the rows
+        returned per second and the peak RSS in MiB.
+    """
+
+    engine = get_engine(make_url(url))
+    builder = example_queries(rows)[name]
+
+    timings = []
+    for i in range(repeat + 1):
+        with Session(engine) as sess:
+            start = time.perf_counter()
+            result = builder(sess).all()
+            elapsed = time.perf_counter() - start
+        if i > 0:
+            timings.append(elapsed)
+
+    latency = statistics.median(timings)
+
+    return {
+        "latency": latency,
+        "rows": len(result),
+        "rows_per_second": len(result) / latency if latency > 0 else 0.0,
+        # Linux reports kilobytes.
+        "peak_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def compare(
+    results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE
+) -> bool:
+    """Prints the change in latency from a baseline run.
+
+    Arguments
+    ---------
+    results: dict
+        The results of this run.
+    baseline: dict
+        The results of the run to compare with.
+    tolerance: float
+        The fractional increase in latency tolerated.
+
+    Returns
+    -------
+    bool
+        True if no query regressed by more than the tolerance.
+    """
+
+    if results["rows"] != baseline["rows"]:
+        print(
+            f"Warning: comparing {results['rows']} rows with "
+            f"{baseline['rows']} rows at {baseline['commit']}",
+            file=sys.stderr,
+        )
+
+    ok = True
+    for name, timing in results["queries"].items():
+        before = baseline["queries"].get(name)
+        if before is None:
+            continue
+        ratio = timing["latency"] / before["latency"] if before["latency"] else 1.0
+        regressed = ratio > 1 + tolerance
+        ok = ok and not regressed
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{ratio:6.2f}x  {name}{flag}")
+
+    return ok
+
+
+def current_commit() -> str:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(
+    url: str, rows: int, repeat: int, only: Optional[str] = None
+) -> Dict[str, dict]:
+    """Times each example query in a child process of its own."""
+
+    context = multiprocessing.get_context("fork")
+    timings = {}
+
+    for name in example_queries(rows):
+        if only is not None and name != only:
+            continue
+        with context.Pool(1) as pool:
+            timings[name] = pool.apply(time_query, (url, rows, name, repeat))
+        t = timings[name]
+        print(
+            f"{t['latency'] * 1000:10.1f} ms {t['rows']:9d} rows "
+            f"{t['rows_per_second']:12.0f} rows/s {t['peak_rss_mib']:8.1f} MiB  "
+            f"{name}"
+        )
+
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10**4)
+    parser.add_argument("--populate", action="store_true")
+    parser.add_argument(
+        "--yes-drop",
+        action="store_true",
+        help="Populate even if the database is not named as a scratch database",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--query", help="Time only this example query")
+    parser.add_argument("--output", help="Where to write the results")
+    parser.add_argument("--compare", help="Results of a run to compare with")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    url = url_from_env(prefix=ENV_PREFIX)
+    if url is None:
+        raise SystemExit(
+            f"Set {ENV_PREFIX}_USER, {ENV_PREFIX}_PW, {ENV_PREFIX}_HOST, "
+            f"{ENV_PREFIX}_PORT and {ENV_PREFIX}_DBNAME to the scratch database"
+        )
+    url = url.render_as_string(hide_password=False)
+
+    if args.populate:
+        try:
+            populate(
+                get_engine(make_url(url)), args.rows, args.seed, force=args.yes_drop
+            )
+        except ValueError as e:
+            raise SystemExit(f"{e}; give --yes-drop to populate it anyway")
+
+    commit = current_commit()
+    results = {
+        "commit": commit,
+        "rows": args.rows,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "queries": run(url, args.rows, args.repeat, args.query),
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}-{args.rows}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"Results written to {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
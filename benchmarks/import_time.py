@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Measures the time taken to import ml_warehouse mappings.
+
+Each statement is run in a fresh interpreter, after SQLAlchemy itself has
+been imported, so that the figures only reflect the cost of building the
+mappings. Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/import_time.py [--repeat N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import ml_warehouse.schema",
+    "from ml_warehouse.schema import CgapHeron",
+    "from ml_warehouse.schema import IseqRunStatus",
+    "from ml_warehouse.schema import Study",
+    "from ml_warehouse.schema import Base",
+]
+
+TIMER = """
+import time
+import sqlalchemy.dialects.mysql
+import sqlalchemy.orm
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def time_statement(statement: str, repeat: int) -> float:
+    """Returns the median time in seconds to run an import statement.
+
+    Arguments
+    ---------
+    statement: str
+        The import statement to time.
+    repeat: int
+        The number of fresh interpreters to time it in.
+
+    Returns
+    -------
+    float
+        The median time taken.
+    """
+
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", TIMER.format(statement=statement)]
+        )
+        timings.append(float(output))
+
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    for statement in STATEMENTS:
+        elapsed = time_statement(statement, args.repeat)
+        print(f"{elapsed * 1000:8.1f} ms  {statement}")
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Finds where the IN list strategies of ml_warehouse.in_lists cross over.
+
+Times the npg_qc example queries with each strategy for increasing numbers
+of run ids, on the database given by the MYSQL_BENCH_* environment variables,
+e.g. one populated by benchmarks/example_queries.py. The fastest strategy
+for each number of run ids is marked; CHUNK_THRESHOLD and
+TEMP_TABLE_THRESHOLD should sit where the marks move. Run from the
+repository root:
+
+    PYTHONPATH=src:tests python benchmarks/in_lists.py [--repeat N]
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy.orm import Session
+
+from examples.npg_qc import (
+    get_iseq_product_metrics_by_decode_percent,
+    get_iseq_product_metrics_by_study,
+    get_iseq_product_metrics_run,
+)
+from example_queries import ENV_PREFIX
+from ml_warehouse.engine import get_engine, url_from_env
+from ml_warehouse.in_lists import ChunkedInList, InList, TempTableInList
+
+SIZES = (100, 1000, 2000, 5000, 10000, 20000, 50000, 100000)
+
+STRATEGIES = {
+    "single": InList(),
+    "chunked": ChunkedInList(),
+    "chunked-serial": ChunkedInList(workers=1),
+    "temp-table": TempTableInList(),
+}
+
+BUILDERS = {
+    "get_iseq_product_metrics_run": lambda s, ids: get_iseq_product_metrics_run(
+        s, ids, "library_indexed_spike", 1
+    ),
+    "get_iseq_product_metrics_by_study": lambda s, ids: (
+        get_iseq_product_metrics_by_study(s, "Study 1", ids)
+    ),
+    "get_iseq_product_metrics_by_decode_percent": lambda s, ids: (
+        get_iseq_product_metrics_by_decode_percent(s, 95, ids)
+    ),
+}
+
+
+def time_strategy(engine, strategy, build, run_ids, repeat: int) -> float:
+    """Returns the median time in seconds to fetch every row with a strategy."""
+
+    timings = []
+    for _ in range(repeat):
+        with Session(engine, future=True) as sess:
+            start = time.perf_counter()
+            strategy.all(sess, build, run_ids)
+            timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    url = url_from_env(prefix=ENV_PREFIX)
+    if url is None:
+        raise SystemExit(
+            f"Set {ENV_PREFIX}_USER, {ENV_PREFIX}_PW, {ENV_PREFIX}_HOST, "
+            f"{ENV_PREFIX}_PORT and {ENV_PREFIX}_DBNAME"
+        )
+    engine = get_engine(url)
+
+    for name, build in BUILDERS.items():
+        print(name)
+        print(f"{'run ids':>8}" + "".join(f"{s:>16}" for s in STRATEGIES))
+        for size in SIZES:
+            run_ids = list(range(1, size + 1))
+            timings = {
+                s: time_strategy(engine, strategy, build, run_ids, args.repeat)
+                for s, strategy in STRATEGIES.items()
+            }
+            fastest = min(timings, key=timings.get)
+            print(
+                f"{size:>8}"
+                + "".join(
+                    f"{timings[s] * 1000:13.1f} ms" + ("*" if s == fastest else " ")
+                    for s in STRATEGIES
+                )
+            )
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Compares read-only rows with ORM instances for the hot lookups.
+
+Runs get_stock_records, get_bmap_flowcell_records and get_flgen_plate on the
+database given by the MYSQL_BENCH_* environment variables, once returning ORM
+instances and once through ml_warehouse.rows.fetch_rows, and reports the
+median time taken and the memory held by the results. With --populate,
+--rows rows matching each lookup are first inserted, replacing any
+stock_resource, bmap_flowcell and flgen_plate rows, so the database must be
+named as a scratch database, as for benchmarks/example_queries.py, or
+--yes-drop given. It must hold the studies and samples of
+benchmarks/example_queries.py --populate. Run from the repository root:
+
+    PYTHONPATH=src:tests python benchmarks/read_only_rows.py \\
+        [--populate --rows 10000] [--repeat N]
+"""
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Iterator, List
+
+from sqlalchemy.orm import Query, Session
+
+from examples.genotyping import get_flgen_plate
+from examples.npg_irods import get_bmap_flowcell_records, get_stock_records
+from ml_warehouse.bulk import load_rows
+from example_queries import ENV_PREFIX, SCRATCH_DBNAME
+from ml_warehouse.engine import get_engine, url_from_env
+from ml_warehouse.rows import fetch_rows
+from ml_warehouse.schema import BmapFlowcell, FlgenPlate, StockResource
+
+STOCK_ID = "1"
+CHIP_SERIALNUMBER = "KHPZDTGLPQJGPNWU"
+POSITION = 2
+PLATE_BARCODE = 1382108143
+WELL_LABEL = "S70"
+
+DATE = datetime(2022, 1, 1)
+
+LOOKUPS = {
+    "get_stock_records": lambda s: get_stock_records(s, STOCK_ID),
+    "get_bmap_flowcell_records": lambda s: get_bmap_flowcell_records(
+        s, CHIP_SERIALNUMBER, POSITION
+    ),
+    "get_flgen_plate": lambda s: get_flgen_plate(s, PLATE_BARCODE, WELL_LABEL),
+}
+
+MODES = {
+    "orm": lambda query: query.all(),
+    "rows": fetch_rows,
+}
+
+
+def _common(i: int) -> dict:
+    return {
+        "id_sample_tmp": i % 100 + 1,
+        "id_study_tmp": i % 10 + 1,
+        "id_lims": "SQSCP",
+        "last_updated": DATE,
+        "recorded_at": DATE,
+    }
+
+
+def stock_resource_rows(rows: int) -> Iterator[dict]:
+    for i in range(rows):
+        yield {
+            **_common(i),
+            "created": DATE,
+            "id_stock_resource_lims": STOCK_ID,
+            "labware_type": "tube",
+            "labware_machine_barcode": f"3980{i}",
+            "labware_human_barcode": f"NT{i}",
+            "stock_resource_uuid": f"stock-{i}",
+        }
+
+
+def bmap_flowcell_rows(rows: int) -> Iterator[dict]:
+    for i in range(rows):
+        yield {
+            **_common(i),
+            "experiment_name": f"experiment {i}",
+            "instrument_name": "saphyr",
+            "enzyme_name": "DLE-1",
+            "chip_barcode": f"chip-{i}",
+            "chip_serialnumber": CHIP_SERIALNUMBER,
+            "position": POSITION,
+            "id_flowcell_lims": f"flowcell-{i}",
+        }
+
+
+def flgen_plate_rows(rows: int) -> Iterator[dict]:
+    for i in range(rows):
+        yield {
+            **_common(i),
+            "cost_code": "S0000",
+            "plate_barcode": PLATE_BARCODE,
+            "id_flgen_plate_lims": str(i),
+            "well_label": WELL_LABEL,
+        }
+
+
+def populate(engine, rows: int):
+    """Replaces the rows of the looked up tables with rows matching them."""
+
+    with engine.begin() as conn:
+        for table_cls, generator in (
+            (StockResource, stock_resource_rows),
+            (BmapFlowcell, bmap_flowcell_rows),
+            (FlgenPlate, flgen_plate_rows),
+        ):
+            conn.execute(table_cls.__table__.delete())
+            print(load_rows(conn, table_cls, generator(rows)), file=sys.stderr)
+
+
+def time_mode(
+    engine, build: Callable[[Session], Query], fetch: Callable, repeat: int
+) -> float:
+    """Returns the median time in seconds to fetch the results of a lookup."""
+
+    timings = []
+    for _ in range(repeat):
+        with Session(engine, future=True) as sess:
+            start = time.perf_counter()
+            fetch(build(sess))
+            timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def held_memory(engine, build: Callable[[Session], Query], fetch: Callable) -> int:
+    """Returns the bytes still allocated once the results have been fetched.
+
+    This is the memory held by the results and, for ORM instances, by the
+    Session tracking them.
+    """
+
+    with Session(engine, future=True) as sess:
+        query = build(sess)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            results: List = fetch(query)
+            gc.collect()
+            held = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        del results
+
+    return held
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--populate", action="store_true")
+    parser.add_argument(
+        "--yes-drop",
+        action="store_true",
+        help="Populate even if the database is not named as a scratch database",
+    )
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    url = url_from_env(prefix=ENV_PREFIX)
+    if url is None:
+        raise SystemExit(
+            f"Set {ENV_PREFIX}_USER, {ENV_PREFIX}_PW, {ENV_PREFIX}_HOST, "
+            f"{ENV_PREFIX}_PORT and {ENV_PREFIX}_DBNAME"
+        )
+    engine = get_engine(url)
+    if args.populate:
+        if not (args.yes_drop or SCRATCH_DBNAME.search(url.database or "")):
+            raise SystemExit(
+                f"Refusing to replace rows in {url.database!r}, which is not "
+                "named as a scratch database; give --yes-drop to anyway"
+            )
+        populate(engine, args.rows)
+
+    print(f"{'lookup':<28}{'mode':<6}{'rows':>8}{'time':>12}{'held':>12}")
+    for name, build in LOOKUPS.items():
+        for mode, fetch in MODES.items():
+            with Session(engine, future=True) as sess:
+                count = len(fetch(build(sess)))
+            seconds = time_mode(engine, build, fetch, args.repeat)
+            held = held_memory(engine, build, fetch)
+            print(
+                f"{name:<28}{mode:<6}{count:>8}"
+                f"{seconds * 1000:>9.1f} ms{held / 2**20:>8.1f} MiB"
+            )
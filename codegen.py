@@ -17,10 +17,17 @@
 #
 # @author Adam Blanchet <ab59@sanger.ac.uk>
 
+import ast
 import os
+import shutil
 import subprocess
 from datetime import date
+from typing import Dict, List, Tuple
 
+from ml_warehouse.engine import url_from_env
+
+MAPPINGS_DIR = "src/ml_warehouse/_mappings"
+SCHEMA_FILE = "src/ml_warehouse/schema.py"
 
 COPYRIGHT_TEMPLATE = """# -*- coding: utf-8 -*-
 #
@@ -41,6 +48,83 @@ COPYRIGHT_TEMPLATE = """# -*- coding: utf-8 -*-
 #
 """
 
+BASE_TEMPLATE = '''"""Declarative base shared by all ML warehouse mappings."""
+
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+metadata = Base.metadata
+'''
+
+MAPPINGS_INIT_TEMPLATE = '''"""Generated ML warehouse mappings, one module per table.
+
+Do not import these modules directly; use ml_warehouse.schema, which loads
+them on demand.
+"""
+'''
+
+SCHEMA_TEMPLATE = '''"""SQLAlchemy mappings for the ML warehouse.
+
+The mappings are loaded on demand: importing a class from this module only
+builds that class and the classes it is connected to through relationships
+and foreign keys. For example,
+
+    from ml_warehouse.schema import CgapHeron
+
+builds a single mapping, while
+
+    from ml_warehouse.schema import Study
+
+builds Study, Sample and the LIMS tables that refer to them. Accessing Base
+or metadata loads every mapping, so that the metadata describes the whole
+warehouse (e.g. for Base.metadata.create_all).
+"""
+
+from importlib import import_module
+from typing import Dict, List
+
+# Groups of mappings that must be loaded together, in dependency order.
+# Each group maps a public name to the module that defines it.
+_COMPONENTS = (
+{components})
+
+_REGISTRY: Dict[str, Dict[str, str]] = {{
+    name: component for component in _COMPONENTS for name in component
+}}
+
+__all__ = ["Base", "metadata", *_REGISTRY]
+
+
+def _load(component: Dict[str, str]):
+    for name, module_name in component.items():
+        module = import_module(f"ml_warehouse._mappings.{{module_name}}")
+        globals()[name] = getattr(module, name)
+
+
+def _load_all():
+    for component in _COMPONENTS:
+        _load(component)
+
+    base = import_module("ml_warehouse._mappings._base")
+    globals()["Base"] = base.Base
+    globals()["metadata"] = base.metadata
+
+
+def __getattr__(name: str):
+    if name in ("Base", "metadata"):
+        _load_all()
+    elif name in _REGISTRY:
+        _load(_REGISTRY[name])
+    else:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+    return globals()[name]
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+'''
+
 
 def gen_copyright():
 
@@ -57,44 +141,305 @@ def gen_copyright():
     return copyright
 
 
-if __name__ == "__main__":
-    PW = os.environ["MYSQL_PW"]
-    USER = os.environ["MYSQL_USER"]
-    HOST = os.environ["MYSQL_HOST"]
-    PORT = os.environ["MYSQL_PORT"]
-    DBNAME = os.environ["MYSQL_DBNAME"]
-
-    url = "mysql+pymysql://{user}:{passw}@{host}:{port}/{db}?charset=utf8mb4".format(
-        user=USER, passw=PW, host=HOST, port=PORT, db=DBNAME
+def _defined_name(node: ast.stmt):
+    """Returns the name defined by a top level mapping statement, or None."""
+
+    if isinstance(node, ast.ClassDef):
+        return node.name
+
+    if (
+        isinstance(node, ast.Assign)
+        and isinstance(node.value, ast.Call)
+        and isinstance(node.value.func, ast.Name)
+        and node.value.func.id == "Table"
+    ):
+        return node.targets[0].id
+
+    return None
+
+
+def _table_name(node: ast.stmt) -> str:
+    """Returns the database table name of a class or Table statement."""
+
+    if isinstance(node, ast.ClassDef):
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign) and stmt.targets[0].id == "__tablename__":
+                return stmt.value.value
+
+        raise ValueError(f"Class {node.name} has no __tablename__")
+
+    return node.value.args[0].value
+
+
+def _references(node: ast.stmt) -> Tuple[List[str], List[str], List[str]]:
+    """Returns the classes, tables and base classes a statement refers to."""
+
+    classes, tables = [], []
+    for call in ast.walk(node):
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name)):
+            continue
+        if not (call.args and isinstance(call.args[0], ast.Constant)):
+            continue
+
+        if call.func.id == "relationship":
+            classes.append(call.args[0].value)
+        elif call.func.id == "ForeignKey":
+            tables.append(call.args[0].value.split(".")[0])
+
+    bases = []
+    if isinstance(node, ast.ClassDef):
+        bases = [b.id for b in node.bases if b.id != "Base"]
+
+    return classes, tables, bases
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+
+
+def class_docstring(node: ast.ClassDef) -> str:
+    """Returns the docstring for a mapped class, listing its columns.
+
+    The docstring is written into the generated class, so that
+    ml_warehouse._decorators.add_docstring does not have to build it from the
+    class's columns on every import.
+    """
+
+    lines = [
+        f'    """Constructs a new {node.name}.\n',
+        "\n",
+        "    Parameters\n",
+        "    ----------\n",
+    ]
+    for stmt in node.body:
+        if not _is_column(stmt):
+            continue
+
+        call = stmt.value
+        name = stmt.targets[0].id
+        if call.args and isinstance(call.args[0], ast.Constant):
+            if isinstance(call.args[0].value, str):
+                name = call.args[0].value
+
+        comment = ""
+        for keyword in call.keywords:
+            if keyword.arg == "comment":
+                comment = ": " + _escape(keyword.value.value)
+
+        lines.append(f"    {name}{comment}\n")
+
+    lines.append('    """\n')
+
+    return "".join(lines)
+
+
+def _is_column(stmt: ast.stmt) -> bool:
+    return (
+        isinstance(stmt, ast.Assign)
+        and isinstance(stmt.value, ast.Call)
+        and isinstance(stmt.value.func, ast.Name)
+        and stmt.value.func.id == "Column"
     )
 
+
+def column_docs(body: str, node: ast.ClassDef) -> str:
+    """Adds the comment of each column of a mapped class as its doc.
+
+    SQLAlchemy documents the attribute mapping a column with the column's
+    doc when it maps the class, so that ml_warehouse._decorators.add_docstring
+    does not have to copy the comments over on every import.
+
+    Arguments
+    ---------
+    body: str
+        The source of the class, starting at the line of its class statement.
+    node: ast.ClassDef
+        The parsed class.
+
+    Returns
+    -------
+    str
+        The source of the class with a doc argument added to each Column
+        with a comment and without a doc.
+    """
+
+    lines = body.splitlines(keepends=True)
+    calls = [stmt.value for stmt in node.body if _is_column(stmt)]
+    for call in reversed(calls):
+        keywords = {keyword.arg: keyword.value for keyword in call.keywords}
+        comment = keywords.get("comment")
+        if "doc" in keywords or not isinstance(comment, ast.Constant):
+            continue
+
+        # The closing parenthesis of the call.
+        i, j = call.end_lineno - node.lineno, call.end_col_offset - 1
+        lines[i] = f"{lines[i][:j]}, doc={comment.value!r}{lines[i][j:]}"
+
+    return "".join(lines)
+
+
+def split_schema(
+    source: str, copyright: str
+) -> Tuple[Dict[str, str], List[Dict[str, str]]]:
+    """Splits a file generated by sqlacodegen into one module per table.
+
+    Arguments
+    ---------
+    source: str
+        The contents of the generated file.
+    copyright: str
+        The copyright statement to put at the top of each module.
+
+    Returns
+    -------
+    Tuple[Dict[str, str], List[Dict[str, str]]]
+        The source of each module, keyed by module name, and the groups of
+        names which must be loaded together because they are connected by
+        relationships, foreign keys or inheritance. Each group maps a name to
+        the module defining it.
+    """
+
+    tree = ast.parse(source)
+
+    imports = {}  # Local name -> (module, imported name as written)
+    statements = {}  # Defined name -> statement
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                text = alias.name
+                if alias.asname is not None:
+                    text += f" as {alias.asname}"
+                imports[alias.asname or alias.name] = (node.module, text)
+            continue
+
+        name = _defined_name(node)
+        if name is not None:
+            statements[name] = node
+
+    modules = {name: _table_name(node) for name, node in statements.items()}
+    owners = {table: name for name, table in modules.items()}
+
+    # Union-find over the mappings, so that any name is always loaded
+    # alongside everything SQLAlchemy needs to configure it.
+    parents = {name: name for name in statements}
+
+    def find(name):
+        while parents[name] != name:
+            parents[name] = parents[parents[name]]
+            name = parents[name]
+        return name
+
+    for name, node in statements.items():
+        classes, tables, bases = _references(node)
+        for other in classes + bases + [owners[t] for t in tables]:
+            parents[find(other)] = find(name)
+
+    components = {}
+    for name in statements:
+        components.setdefault(find(name), {})[name] = modules[name]
+
+    sources = {}
+    for name, node in statements.items():
+        used = {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+        _, _, bases = _references(node)
+
+        header = []
+        if isinstance(node, ast.ClassDef):
+            header.append("from ml_warehouse._decorators import add_docstring\n")
+            header.append("from ml_warehouse._mappings._base import Base\n")
+        else:
+            header.append("from ml_warehouse._mappings._base import metadata\n")
+
+        for base in bases:
+            header.append(
+                f"from ml_warehouse._mappings.{modules[base]} import {base}\n"
+            )
+
+        by_module = {}
+        for local, (module, text) in imports.items():
+            if local in used and not module.startswith("ml_warehouse"):
+                by_module.setdefault(module, []).append(text)
+        for module, texts in by_module.items():
+            header.append(f"from {module} import {', '.join(texts)}\n")
+
+        # Drop any decorators already present; they are added back below.
+        lines = source.splitlines(keepends=True)
+        body = "".join(lines[node.lineno - 1 : node.end_lineno])
+        if isinstance(node, ast.ClassDef):
+            body = column_docs(body, node)
+            if ast.get_docstring(node) is None:
+                first, rest = body.split("\n", 1)
+                body = f"{first}\n{class_docstring(node)}\n{rest}"
+            body = "@add_docstring\n" + body
+
+        sources[modules[name]] = copyright + "".join(header) + "\n\n" + body
+
+    return sources, list(components.values())
+
+
+def write_mappings(
+    sources: Dict[str, str], components: List[Dict[str, str]], copyright: str
+):
+    """Writes the per-table mapping modules and the ml_warehouse.schema facade.
+
+    Arguments
+    ---------
+    sources: Dict[str, str]
+        The source of each mapping module, keyed by module name.
+    components: List[Dict[str, str]]
+        The groups of names which must be loaded together.
+    copyright: str
+        The copyright statement to put at the top of each file.
+    """
+
+    shutil.rmtree(MAPPINGS_DIR, ignore_errors=True)
+    os.mkdir(MAPPINGS_DIR)
+
+    sources = {
+        "__init__": copyright + MAPPINGS_INIT_TEMPLATE,
+        "_base": copyright + BASE_TEMPLATE,
+        **sources,
+    }
+    for module_name, src in sources.items():
+        with open(os.path.join(MAPPINGS_DIR, f"{module_name}.py"), "w") as f:
+            f.write(src)
+
+    formatted = []
+    for component in components:
+        entries = "".join(
+            f'        "{name}": "{module}",\n' for name, module in component.items()
+        )
+        formatted.append(f"    {{\n{entries}    }},\n")
+
+    with open(SCHEMA_FILE, "w") as f:
+        f.write(copyright + SCHEMA_TEMPLATE.format(components="".join(formatted)))
+
+
+if __name__ == "__main__":
+    url = url_from_env()
+    if url is None:
+        raise SystemExit(
+            "Set MYSQL_USER, MYSQL_PW, MYSQL_HOST, MYSQL_PORT and MYSQL_DBNAME"
+        )
+
     # Generate the declarative mappings.
     # Raise an error in case of non-zero process exit code.
     subprocess.run(
         [
             "sqlacodegen",
-            url,
+            url.render_as_string(hide_password=False),
             "--outfile",
             "generated.py",
             "--noviews",
         ]
     ).check_returncode()
 
-    # Move the generated file.
-    os.rename("generated.py", "src/ml_warehouse/schema.py")
-
-    # Decorate the classes and add copyright statement
-    result = [gen_copyright()]
-    with open("src/ml_warehouse/schema.py", "r") as read_file:
-
-        result.append("from ml_warehouse._decorators import add_docstring\n")
-
-        for line in read_file.readlines():
-
-            if line.startswith("class"):
-                result.append("@add_docstring\n")
-
-            result.append(line)
+    with open("generated.py", "r") as read_file:
+        generated = read_file.read()
+    os.remove("generated.py")
 
-    with open("src/ml_warehouse/schema.py", "w") as write_file:
-        write_file.writelines(result)
+    # Split the mappings into one module per table, decorate the classes and
+    # add copyright statements.
+    copyright = gen_copyright()
+    sources, components = split_schema(generated, copyright)
+    write_mappings(sources, components, copyright)
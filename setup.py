@@ -33,10 +33,27 @@ setup(
     package_dir={"": "src"},
     setup_requires=["setuptools_scm"],
     install_requires=[
-        "sqlalchemy >= 1.4",
+        "sqlalchemy >= 1.4.33",
         "sqlalchemy-utils",
         "cryptography",
         "pymysql",
     ],
-    tests_require=["black", "pytest", "pytest-it", "pyyaml"],
+    extras_require={
+        "arrow": ["pyarrow"],
+        "async": ["aiomysql", "greenlet"],
+        "pandas": ["numpy", "pandas"],
+        "yaml": ["pyyaml"],
+    },
+    tests_require=[
+        "aiomysql",
+        "aiosqlite",
+        "black",
+        "greenlet",
+        "numpy",
+        "pandas",
+        "pyarrow",
+        "pytest",
+        "pytest-it",
+        "pyyaml",
+    ],
 )
@@ -21,6 +21,22 @@ from sqlalchemy.orm.attributes import InstrumentedAttribute
 
 
 def add_docstring(decorated_class):
+    """Documents the constructor and column attributes of a mapped class.
+
+    Classes written by codegen.py carry a generated docstring listing their
+    columns, which is reused as is for the constructor, and give each column
+    its comment as its doc, which SQLAlchemy puts on the attribute. Classes
+    without a generated docstring (e.g. edited by hand) have both built from
+    their columns instead.
+    """
+
+    docstring = decorated_class.__dict__.get("__doc__")
+    generated = f"Constructs a new {decorated_class.__name__}."
+
+    if docstring is not None and docstring.startswith(generated):
+        decorated_class.__init__.__doc__ = docstring
+
+        return decorated_class
 
     decorated_class.__init__.__doc__ = gather_arguments(decorated_class)
 
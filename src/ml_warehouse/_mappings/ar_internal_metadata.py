@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, String
+from sqlalchemy.dialects.mysql import DATETIME as mysqlDATETIME
+
+
+@add_docstring
+class ArInternalMetadata(Base):
+    """Constructs a new ArInternalMetadata.
+
+    Parameters
+    ----------
+    key
+    created_at
+    updated_at
+    value
+    """
+
+    __tablename__ = 'ar_internal_metadata'
+
+    key = Column(String(255), primary_key=True)
+    created_at = Column(mysqlDATETIME(fsp=6), nullable=False)
+    updated_at = Column(mysqlDATETIME(fsp=6), nullable=False)
+    value = Column(String(255))
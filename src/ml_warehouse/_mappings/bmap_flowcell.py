@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class BmapFlowcell(Base):
+    """Constructs a new BmapFlowcell.
+
+    Parameters
+    ----------
+    id_bmap_flowcell_tmp
+    last_updated: Timestamp of last update
+    recorded_at: Timestamp of warehouse update
+    id_sample_tmp: Sample id, see "sample.id_sample_tmp"
+    id_study_tmp: Study id, see "study.id_study_tmp"
+    experiment_name: The name of the experiment, eg. The lims generated run id
+    instrument_name: The name of the instrument on which the sample was run
+    enzyme_name: The name of the recognition enzyme used
+    chip_barcode: Manufacturer chip identifier
+    id_flowcell_lims: LIMs-specific flowcell id
+    id_lims: LIM system identifier
+    chip_serialnumber: Manufacturer chip identifier
+    position: Flowcell position
+    id_library_lims: Earliest LIMs identifier associated with library creation
+    """
+
+    __tablename__ = 'bmap_flowcell'
+
+    id_bmap_flowcell_tmp = Column(mysqlINTEGER(11), primary_key=True)
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last update', doc='Timestamp of last update')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update', doc='Timestamp of warehouse update')
+    id_sample_tmp = Column(ForeignKey('sample.id_sample_tmp'), nullable=False, index=True, comment='Sample id, see "sample.id_sample_tmp"', doc='Sample id, see "sample.id_sample_tmp"')
+    id_study_tmp = Column(ForeignKey('study.id_study_tmp'), nullable=False, index=True, comment='Study id, see "study.id_study_tmp"', doc='Study id, see "study.id_study_tmp"')
+    experiment_name = Column(String(255), nullable=False, comment='The name of the experiment, eg. The lims generated run id', doc='The name of the experiment, eg. The lims generated run id')
+    instrument_name = Column(String(255), nullable=False, comment='The name of the instrument on which the sample was run', doc='The name of the instrument on which the sample was run')
+    enzyme_name = Column(String(255), nullable=False, comment='The name of the recognition enzyme used', doc='The name of the recognition enzyme used')
+    chip_barcode = Column(String(255), nullable=False, comment='Manufacturer chip identifier', doc='Manufacturer chip identifier')
+    id_flowcell_lims = Column(String(255), nullable=False, index=True, comment='LIMs-specific flowcell id', doc='LIMs-specific flowcell id')
+    id_lims = Column(String(10), nullable=False, comment='LIM system identifier', doc='LIM system identifier')
+    chip_serialnumber = Column(String(16), comment='Manufacturer chip identifier', doc='Manufacturer chip identifier')
+    position = Column(mysqlINTEGER(10, unsigned=True), comment='Flowcell position', doc='Flowcell position')
+    id_library_lims = Column(String(255), index=True, comment='Earliest LIMs identifier associated with library creation', doc='Earliest LIMs identifier associated with library creation')
+
+    sample = relationship('Sample', back_populates='bmap_flowcell')
+    study = relationship('Study', back_populates='bmap_flowcell')
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, String, TIMESTAMP, text
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+
+
+@add_docstring
+class CgapAnalyte(Base):
+    """Constructs a new CgapAnalyte.
+
+    Parameters
+    ----------
+    cgap_analyte_tmp: Internal to this database id. Value can change.
+    cell_line_uuid
+    destination
+    slot_uuid
+    release_date
+    labware_barcode
+    cell_state
+    jobs
+    passage_number
+    project
+    """
+
+    __tablename__ = 'cgap_analyte'
+
+    cgap_analyte_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, comment='Internal to this database id. Value can change.', doc='Internal to this database id. Value can change.')
+    cell_line_uuid = Column(String(36, 'utf8_unicode_ci'), nullable=False, index=True)
+    destination = Column(String(32, 'utf8_unicode_ci'), nullable=False)
+    slot_uuid = Column(String(36, 'utf8_unicode_ci'), nullable=False, unique=True)
+    release_date = Column(TIMESTAMP, nullable=False, server_default=text("'0000-00-00 00:00:00'"))
+    labware_barcode = Column(String(20, 'utf8_unicode_ci'), nullable=False)
+    cell_state = Column(String(40, 'utf8_unicode_ci'), nullable=False)
+    jobs = Column(String(64, 'utf8_unicode_ci'))
+    passage_number = Column(mysqlINTEGER(2))
+    project = Column(String(50, 'utf8_unicode_ci'))
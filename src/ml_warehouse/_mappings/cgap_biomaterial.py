@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+
+
+@add_docstring
+class CgapBiomaterial(Base):
+    """Constructs a new CgapBiomaterial.
+
+    Parameters
+    ----------
+    cgap_biomaterial_tmp: Internal to this database id. Value can change.
+    donor_uuid
+    biomaterial_uuid
+    donor_accession_number
+    donor_name
+    """
+
+    __tablename__ = 'cgap_biomaterial'
+
+    cgap_biomaterial_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, comment='Internal to this database id. Value can change.', doc='Internal to this database id. Value can change.')
+    donor_uuid = Column(String(36, 'utf8_unicode_ci'), nullable=False, index=True)
+    biomaterial_uuid = Column(String(36, 'utf8_unicode_ci'), nullable=False, unique=True)
+    donor_accession_number = Column(String(38, 'utf8_unicode_ci'))
+    donor_name = Column(String(64, 'utf8_unicode_ci'))
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, Index, String, TIMESTAMP, text
+from sqlalchemy.dialects.mysql import ENUM as mysqlENUM, INTEGER as mysqlINTEGER, TINYINT as mysqlTINYINT
+
+
+@add_docstring
+class CgapHeron(Base):
+    """Constructs a new CgapHeron.
+
+    Parameters
+    ----------
+    cgap_heron_tmp: Internal to this database id. Value can change.
+    container_barcode
+    supplier_sample_id
+    position
+    sample_type
+    release_time
+    study
+    destination
+    sample_state
+    tube_barcode
+    wrangled
+    lysis_buffer
+    priority
+    sample_identifier: The COG-UK barcode of a sample or the mixtio barcode of a control
+    control_type
+    control_accession_number
+    """
+
+    __tablename__ = 'cgap_heron'
+    __table_args__ = (
+        Index('cgap_heron_destination_wrangled', 'destination', 'wrangled'),
+        Index('cgap_heron_rack_and_position', 'container_barcode', 'position', unique=True)
+    )
+
+    cgap_heron_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, comment='Internal to this database id. Value can change.', doc='Internal to this database id. Value can change.')
+    container_barcode = Column(String(32, 'utf8_unicode_ci'), nullable=False)
+    supplier_sample_id = Column(String(64, 'utf8_unicode_ci'), nullable=False, index=True)
+    position = Column(String(8, 'utf8_unicode_ci'), nullable=False)
+    sample_type = Column(String(32, 'utf8_unicode_ci'), nullable=False)
+    release_time = Column(TIMESTAMP, nullable=False, index=True, server_default=text("'0000-00-00 00:00:00'"))
+    study = Column(String(32, 'utf8_unicode_ci'), nullable=False, index=True)
+    destination = Column(String(32, 'utf8_unicode_ci'), nullable=False)
+    sample_state = Column(String(32, 'utf8_unicode_ci'), nullable=False)
+    tube_barcode = Column(String(32, 'utf8_unicode_ci'), unique=True)
+    wrangled = Column(TIMESTAMP)
+    lysis_buffer = Column(String(64, 'utf8_unicode_ci'))
+    priority = Column(mysqlTINYINT(4))
+    sample_identifier = Column(String(64, 'utf8_unicode_ci'), index=True, comment='The COG-UK barcode of a sample or the mixtio barcode of a control', doc='The COG-UK barcode of a sample or the mixtio barcode of a control')
+    control_type = Column(mysqlENUM('Positive', 'Negative', collation='utf8_unicode_ci'))
+    control_accession_number = Column(String(32, 'utf8_unicode_ci'))
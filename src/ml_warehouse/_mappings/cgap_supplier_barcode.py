@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, String, TIMESTAMP, text
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+
+
+@add_docstring
+class CgapSupplierBarcode(Base):
+    """Constructs a new CgapSupplierBarcode.
+
+    Parameters
+    ----------
+    cgap_supplier_barcode_tmp: Internal to this database id. Value can change.
+    biomaterial_uuid
+    supplier_barcode
+    date
+    """
+
+    __tablename__ = 'cgap_supplier_barcode'
+
+    cgap_supplier_barcode_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, comment='Internal to this database id. Value can change.', doc='Internal to this database id. Value can change.')
+    biomaterial_uuid = Column(String(36, 'utf8_unicode_ci'), nullable=False, index=True)
+    supplier_barcode = Column(String(20, 'utf8_unicode_ci'), nullable=False, unique=True)
+    date = Column(TIMESTAMP, nullable=False, server_default=text("'0000-00-00 00:00:00'"))
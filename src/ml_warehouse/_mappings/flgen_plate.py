@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER, SMALLINT as mysqlSMALLINT, TINYINT as mysqlTINYINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class FlgenPlate(Base):
+    """Constructs a new FlgenPlate.
+
+    Parameters
+    ----------
+    id_flgen_plate_tmp: Internal to this database id, value can change
+    id_sample_tmp: Sample id, see "sample.id_sample_tmp"
+    id_study_tmp: Study id, see "study.id_study_tmp"
+    cost_code: Valid WTSI cost code
+    id_lims: LIM system identifier, e.g. CLARITY-GCLP, SEQSCAPE
+    last_updated: Timestamp of last update
+    recorded_at: Timestamp of warehouse update
+    plate_barcode: Manufacturer (Fluidigm) chip barcode
+    id_flgen_plate_lims: LIMs-specific plate id
+    well_label: Manufactuer well identifier within a plate, S001-S192
+    plate_barcode_lims: LIMs-specific plate barcode
+    plate_uuid_lims: LIMs-specific plate uuid
+    plate_size: Total number of wells on a plate
+    plate_size_occupied: Number of occupied wells on a plate
+    well_uuid_lims: LIMs-specific well uuid
+    qc_state: QC state; 1 (pass), 0 (fail), NULL (not known)
+    """
+
+    __tablename__ = 'flgen_plate'
+    __table_args__ = (
+        Index('flgen_plate_id_lims_id_flgen_plate_lims_index', 'id_lims', 'id_flgen_plate_lims'),
+    )
+
+    id_flgen_plate_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    id_sample_tmp = Column(ForeignKey('sample.id_sample_tmp'), nullable=False, index=True, comment='Sample id, see "sample.id_sample_tmp"', doc='Sample id, see "sample.id_sample_tmp"')
+    id_study_tmp = Column(ForeignKey('study.id_study_tmp'), nullable=False, index=True, comment='Study id, see "study.id_study_tmp"', doc='Study id, see "study.id_study_tmp"')
+    cost_code = Column(String(20, 'utf8_unicode_ci'), nullable=False, comment='Valid WTSI cost code', doc='Valid WTSI cost code')
+    id_lims = Column(String(10, 'utf8_unicode_ci'), nullable=False, comment='LIM system identifier, e.g. CLARITY-GCLP, SEQSCAPE', doc='LIM system identifier, e.g. CLARITY-GCLP, SEQSCAPE')
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last update', doc='Timestamp of last update')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update', doc='Timestamp of warehouse update')
+    plate_barcode = Column(mysqlINTEGER(10, unsigned=True), nullable=False, comment='Manufacturer (Fluidigm) chip barcode', doc='Manufacturer (Fluidigm) chip barcode')
+    id_flgen_plate_lims = Column(String(20, 'utf8_unicode_ci'), nullable=False, comment='LIMs-specific plate id', doc='LIMs-specific plate id')
+    well_label = Column(String(10, 'utf8_unicode_ci'), nullable=False, comment='Manufactuer well identifier within a plate, S001-S192', doc='Manufactuer well identifier within a plate, S001-S192')
+    plate_barcode_lims = Column(String(128, 'utf8_unicode_ci'), comment='LIMs-specific plate barcode', doc='LIMs-specific plate barcode')
+    plate_uuid_lims = Column(String(36, 'utf8_unicode_ci'), comment='LIMs-specific plate uuid', doc='LIMs-specific plate uuid')
+    plate_size = Column(mysqlSMALLINT(6), comment='Total number of wells on a plate', doc='Total number of wells on a plate')
+    plate_size_occupied = Column(mysqlSMALLINT(6), comment='Number of occupied wells on a plate', doc='Number of occupied wells on a plate')
+    well_uuid_lims = Column(String(36, 'utf8_unicode_ci'), comment='LIMs-specific well uuid', doc='LIMs-specific well uuid')
+    qc_state = Column(mysqlTINYINT(1), comment='QC state; 1 (pass), 0 (fail), NULL (not known)', doc='QC state; 1 (pass), 0 (fail), NULL (not known)')
+
+    sample = relationship('Sample', back_populates='flgen_plate')
+    study = relationship('Study', back_populates='flgen_plate')
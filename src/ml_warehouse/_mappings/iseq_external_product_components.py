@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import CHAR, Column, ForeignKey, Index
+from sqlalchemy.dialects.mysql import BIGINT as mysqlBIGINT, TINYINT as mysqlTINYINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class IseqExternalProductComponents(Base):
+    """Constructs a new IseqExternalProductComponents.
+
+    Parameters
+    ----------
+    id_iseq_ext_pr_components_tmp: Internal to this database id, value can change
+    id_iseq_product_ext: id (digest) for the external product composition
+    id_iseq_product: id (digest) for one of the products components
+    num_components: Number of component products for this product
+    component_index: Unique component index within all components of this product, a value from 1 to the value of num_components column for this product
+    """
+
+    __tablename__ = 'iseq_external_product_components'
+    __table_args__ = (
+        Index('iseq_ext_pr_comp_compi', 'component_index', 'num_components'),
+        Index('iseq_ext_pr_comp_ncomp', 'num_components', 'id_iseq_product'),
+        Index('iseq_ext_pr_comp_unique', 'id_iseq_product', 'id_iseq_product_ext', unique=True),
+        {'comment': 'Table linking iseq_external_product_metrics table products to '
+                'components in the iseq_product_metrics table'}
+    )
+
+    id_iseq_ext_pr_components_tmp = Column(mysqlBIGINT(20, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    id_iseq_product_ext = Column(ForeignKey('iseq_external_product_metrics.id_iseq_product'), nullable=False, index=True, comment='id (digest) for the external product composition', doc='id (digest) for the external product composition')
+    id_iseq_product = Column(CHAR(64, 'utf8_unicode_ci'), nullable=False, comment='id (digest) for one of the products components', doc='id (digest) for one of the products components')
+    num_components = Column(mysqlTINYINT(3, unsigned=True), nullable=False, comment='Number of component products for this product', doc='Number of component products for this product')
+    component_index = Column(mysqlTINYINT(3, unsigned=True), nullable=False, comment='Unique component index within all components of this product, a value from 1 to the value of num_components column for this product', doc='Unique component index within all components of this product, a value from 1 to the value of num_components column for this product')
+
+    iseq_external_product_metrics = relationship('IseqExternalProductMetrics', back_populates='iseq_external_product_components')
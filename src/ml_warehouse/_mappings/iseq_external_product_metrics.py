@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import CHAR, Column, Date, DateTime, Float, String, text
+from sqlalchemy.dialects.mysql import BIGINT as mysqlBIGINT, CHAR as mysqlCHAR, FLOAT as mysqlFLOAT, INTEGER as mysqlINTEGER, TINYINT as mysqlTINYINT, VARCHAR as mysqlVARCHAR
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class IseqExternalProductMetrics(Base):
+    """Constructs a new IseqExternalProductMetrics.
+
+    Parameters
+    ----------
+    id_iseq_ext_pr_metrics_tmp: Internal to this database id, value can change
+    file_name: Comma-delimitered alphabetically sorted list of file names, which unambigiously define WSI sources of data
+    file_path: Comma-delimitered alphabetically sorted list of full external file paths for the files in file_names column as uploaded by WSI
+    created: Datetime this record was created
+    last_changed: Datetime this record was created or changed
+    supplier_sample_name: Sample name given by the supplier, as recorded by WSI
+    plate_barcode: Stock plate barcode, as recorded by WSI
+    library_id: WSI library identifier
+    md5_staging: WSI validation hex MD5, not set for multiple source files
+    manifest_upload_status: WSI manifest upload status, one of "IN PROGRESS", "DONE", "FAIL", not set for multiple source files
+    manifest_upload_status_change_date: Date the status of manifest upload is changed by WSI
+    id_run: NPG run identifier, defined where the product corresponds to a single line
+    id_iseq_product: product id
+    iseq_composition_tmp: JSON representation of the composition object, the column might be deleted in future
+    id_archive_product: Archive ID for data product
+    destination: Data destination, from 20200323 defaults to "UKBMP"
+    processing_status: Overall status of the product, one of "PASS", "HOLD", "INSUFFICIENT", "FAIL"
+    qc_overall_assessment: State of the product after phase 3 of processing, one of "PASS" or "FAIL"
+    qc_status: State of the product after phase 2 of processing, one of "PASS", "HOLD", "INSUFFICIENT", "FAIL"
+    sequencing_start_date: Sequencing start date obtained from the CRAM file header, not set for multiple source files
+    upload_date: Upload date, not set for multiple source files
+    md5_validation_date: Date of MD5 validation, not set for multiple source files
+    processing_start_date: Processing start date
+    analysis_start_date
+    phase2_end_date: Date the phase 2 analysis finished for this product
+    analysis_end_date
+    archival_date: Date made available or pushed to archive service
+    archive_confirmation_date: Date of confirmation of integrity of data product by archive service
+    md5: External validation hex MD5, not set for multiple source files
+    md5_validation: Outcome of MD5 validation as "PASS" or "FAIL", not set for multiple source files
+    format_validation: Outcome of format validation as "PASS" or "FAIL", not set for multiple source files
+    upload_status: Upload status as "PASS" or "FAIL", "PASS" if both MD5 and format validation are "PASS", not set for multiple source files
+    instrument_id: Comma separated sorted list of instrument IDs obtained from the CRAM file header(s)
+    flowcell_id: Comma separated sorted list of flowcell IDs obtained from the CRAM file header(s)
+    annotation: Annotation regarding data provenance, i.e. is sequence data from first pass, re-run, top-up, etc.
+    min_read_length: Minimum read length observed in the data file
+    target_autosome_coverage_threshold: Target autosome coverage threshold, defaults to 15
+    target_autosome_gt_coverage_threshold: Coverage percent at >= target_autosome_coverage_threshold X as a fraction
+    target_autosome_gt_coverage_threshold_assessment: "PASS" if target_autosome_percent_gt_coverage_threshold > 95%, "FAIL" otherwise
+    verify_bam_id_score: FREEMIX value of sample contamination levels as a fraction
+    verify_bam_id_score_assessment: "PASS" if verify_bam_id_score > 0.01, "FAIL" otherwise
+    double_error_fraction: Fraction of marker pairs with two read pairs evidencing parity and non-parity, may only be calculated if 1% <= verify_bam_id_score < 5%
+    contamination_assessment: "PASS" or "FAIL" based on verify_bam_id_score_assessment and double_error_fraction < 0.2%
+    yield_whole_genome: Sequence data quantity (Gb) excluding duplicate reads, adaptors, overlapping bases from reads on the same fragment, soft-clipped bases
+    yield: Sequence data quantity (Gb) excluding duplicate reads, adaptors, overlapping bases from reads on the same fragment, soft-clipped bases, non-N autosome only
+    yield_q20: Yield in bases at or above Q20 filtered in the same way as the yield column values
+    yield_q30: Yield in bases at or above Q30 filtered in the same way as the yield column values
+    num_reads: Number of reads filtered in the same way as the yield column values
+    gc_fraction_forward_read
+    gc_fraction_reverse_read
+    adapter_contamination: The maximum over adapters and cycles in reads/fragments as a fraction per file and RG. Values for first and second reads separated with ",", and values for individual files separated with "/". e.g. "0.1/0.1/0.1/0.1,0.1/0.1/0.1/0.1"
+    adapter_contamination_assessment: "PASS", "WARN", "FAIL" per read and file. Multiple values are represented as forward slash-separated array of strings with a comma separating entries for paired-end 1 and 2 reads e.g. "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"
+    pre_adapter_min_total_qscore: Minimum of TOTAL_QSCORE values in PreAdapter report from CollectSequencingArtifactMetrics
+    ref_bias_min_total_qscore: Minimum of TOTAL_QSCORE values in BaitBias report from CollectSequencingArtifactMetrics
+    target_proper_pair_mapped_reads_fraction: Fraction of properly paired mapped reads filtered in the same way as the yield column values
+    target_proper_pair_mapped_reads_assessment: "PASS" if target_proper_pair_mapped_reads_fraction > 0.95, "FAIL" otherwise
+    insert_size_mean
+    insert_size_std
+    sequence_error_rate: Reported by samtools, as a fraction
+    basic_statistics_assessement: FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"
+    overrepresented_sequences_assessement: FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"
+    n_content_per_base_assessement: FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"
+    sequence_content_per_base_assessement: FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"
+    sequence_quality_per_base_assessement: FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"
+    gc_content_per_sequence_assessement: FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"
+    quality_scores_per_sequence_assessement: FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"
+    sequence_duplication_levels_assessement: FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"
+    sequence_length_distribution_assessement: FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"
+    FastQC_overall_assessment: FastQC "PASS" or "FAIL"
+    nrd: Sample discordance levels at non-reference genotypes as a fraction
+    nrd_assessment: "PASS" based on nrd_persent < 2% or "FAIL" or "NA" if genotyping data not available for this sample
+    sex_reported: Sex as reported by sample supplier
+    sex_computed: Genetic sex as identified by sequence data
+    input_files_status: Status of the input files, either 'USEABLE' or 'DELETED'
+    intermediate_files_status: Status of the intermediate files, either 'USEABLE' or 'DELETED'
+    output_files_status: Status of the output files, either 'ARCHIVED', 'USEABLE' or 'DELETED'
+    input_status_override_ref: Status override reference for the input files
+    intermediate_status_override_ref: Status override reference for the intermediate files
+    output_status_override_ref: Status override reference for the output files
+    """
+
+    __tablename__ = 'iseq_external_product_metrics'
+    __table_args__ = {'comment': 'Externally computed metrics for data sequenced at WSI'}
+
+    id_iseq_ext_pr_metrics_tmp = Column(mysqlBIGINT(20, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    file_name = Column(String(300), nullable=False, index=True, comment='Comma-delimitered alphabetically sorted list of file names, which unambigiously define WSI sources of data', doc='Comma-delimitered alphabetically sorted list of file names, which unambigiously define WSI sources of data')
+    file_path = Column(String(760), nullable=False, unique=True, comment='Comma-delimitered alphabetically sorted list of full external file paths for the files in file_names column as uploaded by WSI', doc='Comma-delimitered alphabetically sorted list of full external file paths for the files in file_names column as uploaded by WSI')
+    created = Column(DateTime, server_default=text('CURRENT_TIMESTAMP'), comment='Datetime this record was created', doc='Datetime this record was created')
+    last_changed = Column(DateTime, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='Datetime this record was created or changed', doc='Datetime this record was created or changed')
+    supplier_sample_name = Column(mysqlVARCHAR(255, charset='utf8', collation='utf8_unicode_ci'), index=True, comment='Sample name given by the supplier, as recorded by WSI', doc='Sample name given by the supplier, as recorded by WSI')
+    plate_barcode = Column(mysqlVARCHAR(255, charset='utf8', collation='utf8_unicode_ci'), index=True, comment='Stock plate barcode, as recorded by WSI', doc='Stock plate barcode, as recorded by WSI')
+    library_id = Column(mysqlINTEGER(11), index=True, comment='WSI library identifier', doc='WSI library identifier')
+    md5_staging = Column(CHAR(32), comment='WSI validation hex MD5, not set for multiple source files', doc='WSI validation hex MD5, not set for multiple source files')
+    manifest_upload_status = Column(CHAR(15), index=True, comment='WSI manifest upload status, one of "IN PROGRESS", "DONE", "FAIL", not set for multiple source files', doc='WSI manifest upload status, one of "IN PROGRESS", "DONE", "FAIL", not set for multiple source files')
+    manifest_upload_status_change_date = Column(DateTime, comment='Date the status of manifest upload is changed by WSI', doc='Date the status of manifest upload is changed by WSI')
+    id_run = Column(mysqlINTEGER(10, unsigned=True), index=True, comment='NPG run identifier, defined where the product corresponds to a single line', doc='NPG run identifier, defined where the product corresponds to a single line')
+    id_iseq_product = Column(mysqlCHAR(64, charset='utf8', collation='utf8_unicode_ci'), index=True, comment='product id', doc='product id')
+    iseq_composition_tmp = Column(String(600), comment='JSON representation of the composition object, the column might be deleted in future', doc='JSON representation of the composition object, the column might be deleted in future')
+    id_archive_product = Column(CHAR(64), comment='Archive ID for data product', doc='Archive ID for data product')
+    destination = Column(String(15), server_default=text("'UKBMP'"), comment='Data destination, from 20200323 defaults to "UKBMP"', doc='Data destination, from 20200323 defaults to "UKBMP"')
+    processing_status = Column(CHAR(15), index=True, comment='Overall status of the product, one of "PASS", "HOLD", "INSUFFICIENT", "FAIL"', doc='Overall status of the product, one of "PASS", "HOLD", "INSUFFICIENT", "FAIL"')
+    qc_overall_assessment = Column(CHAR(4), index=True, comment='State of the product after phase 3 of processing, one of "PASS" or "FAIL"', doc='State of the product after phase 3 of processing, one of "PASS" or "FAIL"')
+    qc_status = Column(CHAR(15), comment='State of the product after phase 2 of processing, one of "PASS", "HOLD", "INSUFFICIENT", "FAIL"', doc='State of the product after phase 2 of processing, one of "PASS", "HOLD", "INSUFFICIENT", "FAIL"')
+    sequencing_start_date = Column(Date, comment='Sequencing start date obtained from the CRAM file header, not set for multiple source files', doc='Sequencing start date obtained from the CRAM file header, not set for multiple source files')
+    upload_date = Column(Date, comment='Upload date, not set for multiple source files', doc='Upload date, not set for multiple source files')
+    md5_validation_date = Column(Date, comment='Date of MD5 validation, not set for multiple source files', doc='Date of MD5 validation, not set for multiple source files')
+    processing_start_date = Column(Date, comment='Processing start date', doc='Processing start date')
+    analysis_start_date = Column(Date)
+    phase2_end_date = Column(DateTime, comment='Date the phase 2 analysis finished for this product', doc='Date the phase 2 analysis finished for this product')
+    analysis_end_date = Column(Date)
+    archival_date = Column(Date, comment='Date made available or pushed to archive service', doc='Date made available or pushed to archive service')
+    archive_confirmation_date = Column(Date, comment='Date of confirmation of integrity of data product by archive service', doc='Date of confirmation of integrity of data product by archive service')
+    md5 = Column(CHAR(32), comment='External validation hex MD5, not set for multiple source files', doc='External validation hex MD5, not set for multiple source files')
+    md5_validation = Column(CHAR(4), comment='Outcome of MD5 validation as "PASS" or "FAIL", not set for multiple source files', doc='Outcome of MD5 validation as "PASS" or "FAIL", not set for multiple source files')
+    format_validation = Column(CHAR(4), comment='Outcome of format validation as "PASS" or "FAIL", not set for multiple source files', doc='Outcome of format validation as "PASS" or "FAIL", not set for multiple source files')
+    upload_status = Column(CHAR(4), comment='Upload status as "PASS" or "FAIL", "PASS" if both MD5 and format validation are "PASS", not set for multiple source files', doc='Upload status as "PASS" or "FAIL", "PASS" if both MD5 and format validation are "PASS", not set for multiple source files')
+    instrument_id = Column(String(256), index=True, comment='Comma separated sorted list of instrument IDs obtained from the CRAM file header(s)', doc='Comma separated sorted list of instrument IDs obtained from the CRAM file header(s)')
+    flowcell_id = Column(String(256), index=True, comment='Comma separated sorted list of flowcell IDs obtained from the CRAM file header(s)', doc='Comma separated sorted list of flowcell IDs obtained from the CRAM file header(s)')
+    annotation = Column(String(15), comment='Annotation regarding data provenance, i.e. is sequence data from first pass, re-run, top-up, etc.', doc='Annotation regarding data provenance, i.e. is sequence data from first pass, re-run, top-up, etc.')
+    min_read_length = Column(mysqlTINYINT(3, unsigned=True), comment='Minimum read length observed in the data file', doc='Minimum read length observed in the data file')
+    target_autosome_coverage_threshold = Column(mysqlINTEGER(3, unsigned=True), server_default=text("'15'"), comment='Target autosome coverage threshold, defaults to 15', doc='Target autosome coverage threshold, defaults to 15')
+    target_autosome_gt_coverage_threshold = Column(Float, comment='Coverage percent at >= target_autosome_coverage_threshold X as a fraction', doc='Coverage percent at >= target_autosome_coverage_threshold X as a fraction')
+    target_autosome_gt_coverage_threshold_assessment = Column(CHAR(4), comment='"PASS" if target_autosome_percent_gt_coverage_threshold > 95%, "FAIL" otherwise', doc='"PASS" if target_autosome_percent_gt_coverage_threshold > 95%, "FAIL" otherwise')
+    verify_bam_id_score = Column(mysqlFLOAT(unsigned=True), comment='FREEMIX value of sample contamination levels as a fraction', doc='FREEMIX value of sample contamination levels as a fraction')
+    verify_bam_id_score_assessment = Column(CHAR(4), comment='"PASS" if verify_bam_id_score > 0.01, "FAIL" otherwise', doc='"PASS" if verify_bam_id_score > 0.01, "FAIL" otherwise')
+    double_error_fraction = Column(mysqlFLOAT(unsigned=True), comment='Fraction of marker pairs with two read pairs evidencing parity and non-parity, may only be calculated if 1% <= verify_bam_id_score < 5%', doc='Fraction of marker pairs with two read pairs evidencing parity and non-parity, may only be calculated if 1% <= verify_bam_id_score < 5%')
+    contamination_assessment = Column(CHAR(4), comment='"PASS" or "FAIL" based on verify_bam_id_score_assessment and double_error_fraction < 0.2%', doc='"PASS" or "FAIL" based on verify_bam_id_score_assessment and double_error_fraction < 0.2%')
+    yield_whole_genome = Column(mysqlFLOAT(unsigned=True), comment='Sequence data quantity (Gb) excluding duplicate reads, adaptors, overlapping bases from reads on the same fragment, soft-clipped bases', doc='Sequence data quantity (Gb) excluding duplicate reads, adaptors, overlapping bases from reads on the same fragment, soft-clipped bases')
+    yield_ = Column('yield', mysqlFLOAT(unsigned=True), comment='Sequence data quantity (Gb) excluding duplicate reads, adaptors, overlapping bases from reads on the same fragment, soft-clipped bases, non-N autosome only', doc='Sequence data quantity (Gb) excluding duplicate reads, adaptors, overlapping bases from reads on the same fragment, soft-clipped bases, non-N autosome only')
+    yield_q20 = Column(mysqlBIGINT(20, unsigned=True), comment='Yield in bases at or above Q20 filtered in the same way as the yield column values', doc='Yield in bases at or above Q20 filtered in the same way as the yield column values')
+    yield_q30 = Column(mysqlBIGINT(20, unsigned=True), comment='Yield in bases at or above Q30 filtered in the same way as the yield column values', doc='Yield in bases at or above Q30 filtered in the same way as the yield column values')
+    num_reads = Column(mysqlBIGINT(20, unsigned=True), comment='Number of reads filtered in the same way as the yield column values', doc='Number of reads filtered in the same way as the yield column values')
+    gc_fraction_forward_read = Column(mysqlFLOAT(unsigned=True))
+    gc_fraction_reverse_read = Column(mysqlFLOAT(unsigned=True))
+    adapter_contamination = Column(String(255), comment='The maximum over adapters and cycles in reads/fragments as a fraction per file and RG. Values for first and second reads separated with ",", and values for individual files separated with "/". e.g. "0.1/0.1/0.1/0.1,0.1/0.1/0.1/0.1"', doc='The maximum over adapters and cycles in reads/fragments as a fraction per file and RG. Values for first and second reads separated with ",", and values for individual files separated with "/". e.g. "0.1/0.1/0.1/0.1,0.1/0.1/0.1/0.1"')
+    adapter_contamination_assessment = Column(String(255), comment='"PASS", "WARN", "FAIL" per read and file. Multiple values are represented as forward slash-separated array of strings with a comma separating entries for paired-end 1 and 2 reads e.g. "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"', doc='"PASS", "WARN", "FAIL" per read and file. Multiple values are represented as forward slash-separated array of strings with a comma separating entries for paired-end 1 and 2 reads e.g. "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"')
+    pre_adapter_min_total_qscore = Column(mysqlTINYINT(3, unsigned=True), comment='Minimum of TOTAL_QSCORE values in PreAdapter report from CollectSequencingArtifactMetrics', doc='Minimum of TOTAL_QSCORE values in PreAdapter report from CollectSequencingArtifactMetrics')
+    ref_bias_min_total_qscore = Column(mysqlTINYINT(3, unsigned=True), comment='Minimum of TOTAL_QSCORE values in BaitBias report from CollectSequencingArtifactMetrics', doc='Minimum of TOTAL_QSCORE values in BaitBias report from CollectSequencingArtifactMetrics')
+    target_proper_pair_mapped_reads_fraction = Column(mysqlFLOAT(unsigned=True), comment='Fraction of properly paired mapped reads filtered in the same way as the yield column values', doc='Fraction of properly paired mapped reads filtered in the same way as the yield column values')
+    target_proper_pair_mapped_reads_assessment = Column(CHAR(4), comment='"PASS" if target_proper_pair_mapped_reads_fraction > 0.95, "FAIL" otherwise', doc='"PASS" if target_proper_pair_mapped_reads_fraction > 0.95, "FAIL" otherwise')
+    insert_size_mean = Column(mysqlFLOAT(unsigned=True))
+    insert_size_std = Column(mysqlFLOAT(unsigned=True))
+    sequence_error_rate = Column(mysqlFLOAT(unsigned=True), comment='Reported by samtools, as a fraction', doc='Reported by samtools, as a fraction')
+    basic_statistics_assessement = Column(String(255), comment='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"', doc='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"')
+    overrepresented_sequences_assessement = Column(String(255), comment='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"', doc='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"')
+    n_content_per_base_assessement = Column(String(255), comment='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"', doc='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"')
+    sequence_content_per_base_assessement = Column(String(255), comment='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"', doc='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"')
+    sequence_quality_per_base_assessement = Column(String(255), comment='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"', doc='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"')
+    gc_content_per_sequence_assessement = Column(String(255), comment='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"', doc='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"')
+    quality_scores_per_sequence_assessement = Column(String(255), comment='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"', doc='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"')
+    sequence_duplication_levels_assessement = Column(String(255), comment='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"', doc='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"')
+    sequence_length_distribution_assessement = Column(String(255), comment='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"', doc='FastQC "PASS", "WARN", "FAIL" per input file. Array of strings separated by "/", with a "," separating entries for paired-end 1 and 2 reads. e.g. Four RG "PASS/PASS/WARN/PASS,PASS/PASS/WARN/PASS"')
+    FastQC_overall_assessment = Column(CHAR(4), comment='FastQC "PASS" or "FAIL"', doc='FastQC "PASS" or "FAIL"')
+    nrd = Column(mysqlFLOAT(unsigned=True), comment='Sample discordance levels at non-reference genotypes as a fraction', doc='Sample discordance levels at non-reference genotypes as a fraction')
+    nrd_assessment = Column(CHAR(4), comment='"PASS" based on nrd_persent < 2% or "FAIL" or "NA" if genotyping data not available for this sample', doc='"PASS" based on nrd_persent < 2% or "FAIL" or "NA" if genotyping data not available for this sample')
+    sex_reported = Column(CHAR(6), comment='Sex as reported by sample supplier', doc='Sex as reported by sample supplier')
+    sex_computed = Column(CHAR(6), comment='Genetic sex as identified by sequence data', doc='Genetic sex as identified by sequence data')
+    input_files_status = Column(CHAR(10), comment="Status of the input files, either 'USEABLE' or 'DELETED'", doc="Status of the input files, either 'USEABLE' or 'DELETED'")
+    intermediate_files_status = Column(CHAR(10), comment="Status of the intermediate files, either 'USEABLE' or 'DELETED'", doc="Status of the intermediate files, either 'USEABLE' or 'DELETED'")
+    output_files_status = Column(CHAR(10), comment="Status of the output files, either 'ARCHIVED', 'USEABLE' or 'DELETED'", doc="Status of the output files, either 'ARCHIVED', 'USEABLE' or 'DELETED'")
+    input_status_override_ref = Column(String(255), comment='Status override reference for the input files', doc='Status override reference for the input files')
+    intermediate_status_override_ref = Column(String(255), comment='Status override reference for the intermediate files', doc='Status override reference for the intermediate files')
+    output_status_override_ref = Column(String(255), comment='Status override reference for the output files', doc='Status override reference for the output files')
+
+    iseq_external_product_components = relationship('IseqExternalProductComponents', back_populates='iseq_external_product_metrics')
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, String, text
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER, SMALLINT as mysqlSMALLINT, TINYINT as mysqlTINYINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class IseqFlowcell(Base):
+    """Constructs a new IseqFlowcell.
+
+    Parameters
+    ----------
+    id_iseq_flowcell_tmp: Internal to this database id, value can change
+    last_updated: Timestamp of last update
+    recorded_at: Timestamp of warehouse update
+    id_sample_tmp: Sample id, see "sample.id_sample_tmp"
+    id_lims: LIM system identifier, e.g. CLARITY-GCLP, SEQSCAPE
+    id_flowcell_lims: LIMs-specific flowcell id, batch_id for Sequencescape
+    position: Flowcell lane number
+    entity_type: Lane type: library, pool, library_control, library_indexed, library_indexed_spike
+    entity_id_lims: Most specific LIMs identifier associated with this lane or plex or spike
+    is_spiked: Boolean flag indicating presence of a spike
+    id_pool_lims: Most specific LIMs identifier associated with the pool
+    id_study_tmp: Study id, see "study.id_study_tmp"
+    cost_code: Valid WTSI cost code
+    is_r_and_d: A boolean flag derived from cost code, flags RandD
+    priority: Priority
+    manual_qc: Legacy QC decision value set per lane which may be used for per-lane billing: iseq_product_metrics.qc is likely to contain the per product QC summary of use to most downstream users
+    external_release: Defaults to manual qc value; can be changed by the user later
+    flowcell_barcode: Manufacturer flowcell barcode or other identifier
+    tag_index: Tag index, NULL if lane is not a pool
+    tag_sequence: Tag sequence
+    tag_set_id_lims: LIMs-specific identifier of the tag set
+    tag_set_name: WTSI-wide tag set name
+    tag_identifier: The position of tag within the tag group
+    tag2_sequence: Tag sequence for tag 2
+    tag2_set_id_lims: LIMs-specific identifier of the tag set for tag 2
+    tag2_set_name: WTSI-wide tag set name for tag 2
+    tag2_identifier: The position of tag2 within the tag group
+    pipeline_id_lims: LIMs-specific pipeline identifier that unambiguously defines library type
+    bait_name: WTSI-wide name that uniquely identifies a bait set
+    requested_insert_size_from: Requested insert size min value
+    requested_insert_size_to: Requested insert size max value
+    forward_read_length: Requested forward read length, bp
+    reverse_read_length: Requested reverse read length, bp
+    legacy_library_id: Legacy library_id for backwards compatibility.
+    id_library_lims: Earliest LIMs identifier associated with library creation
+    team: The team responsible for creating the flowcell
+    purpose: Describes the reason the sequencing was conducted. Eg. Standard, QC, Control
+    suboptimal: Indicates that a sample has failed a QC step during processing
+    primer_panel: Primer Panel name
+    spiked_phix_barcode: Barcode of the PhiX tube added to the lane
+    spiked_phix_percentage: Percentage PhiX tube spiked in the pool in terms of molar concentration
+    loading_concentration: Final instrument loading concentration (pM)
+    workflow: Workflow used when processing the flowcell
+    """
+
+    __tablename__ = 'iseq_flowcell'
+    __table_args__ = (
+        Index('index_iseq_flowcell_id_flowcell_lims_position_tag_index_id_lims', 'id_flowcell_lims', 'position', 'tag_index', 'id_lims', unique=True),
+        Index('index_iseqflowcell__flowcell_barcode__position__tag_index', 'flowcell_barcode', 'position', 'tag_index'),
+        Index('index_iseqflowcell__id_flowcell_lims__position__tag_index', 'id_flowcell_lims', 'position', 'tag_index'),
+        Index('iseq_flowcell_id_lims_id_flowcell_lims_index', 'id_lims', 'id_flowcell_lims')
+    )
+
+    id_iseq_flowcell_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last update', doc='Timestamp of last update')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update', doc='Timestamp of warehouse update')
+    id_sample_tmp = Column(ForeignKey('sample.id_sample_tmp'), nullable=False, index=True, comment='Sample id, see "sample.id_sample_tmp"', doc='Sample id, see "sample.id_sample_tmp"')
+    id_lims = Column(String(10, 'utf8_unicode_ci'), nullable=False, comment='LIM system identifier, e.g. CLARITY-GCLP, SEQSCAPE', doc='LIM system identifier, e.g. CLARITY-GCLP, SEQSCAPE')
+    id_flowcell_lims = Column(String(20, 'utf8_unicode_ci'), nullable=False, comment='LIMs-specific flowcell id, batch_id for Sequencescape', doc='LIMs-specific flowcell id, batch_id for Sequencescape')
+    position = Column(mysqlSMALLINT(2, unsigned=True), nullable=False, comment='Flowcell lane number', doc='Flowcell lane number')
+    entity_type = Column(String(30, 'utf8_unicode_ci'), nullable=False, comment='Lane type: library, pool, library_control, library_indexed, library_indexed_spike', doc='Lane type: library, pool, library_control, library_indexed, library_indexed_spike')
+    entity_id_lims = Column(String(20, 'utf8_unicode_ci'), nullable=False, comment='Most specific LIMs identifier associated with this lane or plex or spike', doc='Most specific LIMs identifier associated with this lane or plex or spike')
+    is_spiked = Column(mysqlTINYINT(1), nullable=False, server_default=text("'0'"), comment='Boolean flag indicating presence of a spike', doc='Boolean flag indicating presence of a spike')
+    id_pool_lims = Column(String(20, 'utf8_unicode_ci'), nullable=False, index=True, comment='Most specific LIMs identifier associated with the pool', doc='Most specific LIMs identifier associated with the pool')
+    id_study_tmp = Column(ForeignKey('study.id_study_tmp'), index=True, comment='Study id, see "study.id_study_tmp"', doc='Study id, see "study.id_study_tmp"')
+    cost_code = Column(String(20, 'utf8_unicode_ci'), comment='Valid WTSI cost code', doc='Valid WTSI cost code')
+    is_r_and_d = Column(mysqlTINYINT(1), server_default=text("'0'"), comment='A boolean flag derived from cost code, flags RandD', doc='A boolean flag derived from cost code, flags RandD')
+    priority = Column(mysqlSMALLINT(2, unsigned=True), server_default=text("'1'"), comment='Priority', doc='Priority')
+    manual_qc = Column(mysqlTINYINT(1), comment='Legacy QC decision value set per lane which may be used for per-lane billing: iseq_product_metrics.qc is likely to contain the per product QC summary of use to most downstream users', doc='Legacy QC decision value set per lane which may be used for per-lane billing: iseq_product_metrics.qc is likely to contain the per product QC summary of use to most downstream users')
+    external_release = Column(mysqlTINYINT(1), comment='Defaults to manual qc value; can be changed by the user later', doc='Defaults to manual qc value; can be changed by the user later')
+    flowcell_barcode = Column(String(15, 'utf8_unicode_ci'), comment='Manufacturer flowcell barcode or other identifier', doc='Manufacturer flowcell barcode or other identifier')
+    tag_index = Column(mysqlSMALLINT(5, unsigned=True), comment='Tag index, NULL if lane is not a pool', doc='Tag index, NULL if lane is not a pool')
+    tag_sequence = Column(String(30, 'utf8_unicode_ci'), comment='Tag sequence', doc='Tag sequence')
+    tag_set_id_lims = Column(String(20, 'utf8_unicode_ci'), comment='LIMs-specific identifier of the tag set', doc='LIMs-specific identifier of the tag set')
+    tag_set_name = Column(String(100, 'utf8_unicode_ci'), comment='WTSI-wide tag set name', doc='WTSI-wide tag set name')
+    tag_identifier = Column(String(30, 'utf8_unicode_ci'), comment='The position of tag within the tag group', doc='The position of tag within the tag group')
+    tag2_sequence = Column(String(30, 'utf8_unicode_ci'), comment='Tag sequence for tag 2', doc='Tag sequence for tag 2')
+    tag2_set_id_lims = Column(String(20, 'utf8_unicode_ci'), comment='LIMs-specific identifier of the tag set for tag 2', doc='LIMs-specific identifier of the tag set for tag 2')
+    tag2_set_name = Column(String(100, 'utf8_unicode_ci'), comment='WTSI-wide tag set name for tag 2', doc='WTSI-wide tag set name for tag 2')
+    tag2_identifier = Column(String(30, 'utf8_unicode_ci'), comment='The position of tag2 within the tag group', doc='The position of tag2 within the tag group')
+    pipeline_id_lims = Column(String(60, 'utf8_unicode_ci'), comment='LIMs-specific pipeline identifier that unambiguously defines library type', doc='LIMs-specific pipeline identifier that unambiguously defines library type')
+    bait_name = Column(String(50, 'utf8_unicode_ci'), comment='WTSI-wide name that uniquely identifies a bait set', doc='WTSI-wide name that uniquely identifies a bait set')
+    requested_insert_size_from = Column(mysqlINTEGER(5, unsigned=True), comment='Requested insert size min value', doc='Requested insert size min value')
+    requested_insert_size_to = Column(mysqlINTEGER(5, unsigned=True), comment='Requested insert size max value', doc='Requested insert size max value')
+    forward_read_length = Column(mysqlSMALLINT(4, unsigned=True), comment='Requested forward read length, bp', doc='Requested forward read length, bp')
+    reverse_read_length = Column(mysqlSMALLINT(4, unsigned=True), comment='Requested reverse read length, bp', doc='Requested reverse read length, bp')
+    legacy_library_id = Column(mysqlINTEGER(11), index=True, comment='Legacy library_id for backwards compatibility.', doc='Legacy library_id for backwards compatibility.')
+    id_library_lims = Column(String(255, 'utf8_unicode_ci'), index=True, comment='Earliest LIMs identifier associated with library creation', doc='Earliest LIMs identifier associated with library creation')
+    team = Column(String(255, 'utf8_unicode_ci'), comment='The team responsible for creating the flowcell', doc='The team responsible for creating the flowcell')
+    purpose = Column(String(30, 'utf8_unicode_ci'), comment='Describes the reason the sequencing was conducted. Eg. Standard, QC, Control', doc='Describes the reason the sequencing was conducted. Eg. Standard, QC, Control')
+    suboptimal = Column(mysqlTINYINT(1), comment='Indicates that a sample has failed a QC step during processing', doc='Indicates that a sample has failed a QC step during processing')
+    primer_panel = Column(String(255, 'utf8_unicode_ci'), comment='Primer Panel name', doc='Primer Panel name')
+    spiked_phix_barcode = Column(String(20, 'utf8_unicode_ci'), comment='Barcode of the PhiX tube added to the lane', doc='Barcode of the PhiX tube added to the lane')
+    spiked_phix_percentage = Column(Float, comment='Percentage PhiX tube spiked in the pool in terms of molar concentration', doc='Percentage PhiX tube spiked in the pool in terms of molar concentration')
+    loading_concentration = Column(Float, comment='Final instrument loading concentration (pM)', doc='Final instrument loading concentration (pM)')
+    workflow = Column(String(20, 'utf8_unicode_ci'), comment='Workflow used when processing the flowcell', doc='Workflow used when processing the flowcell')
+
+    sample = relationship('Sample', back_populates='iseq_flowcell')
+    study = relationship('Study', back_populates='iseq_flowcell')
+    iseq_product_metrics = relationship('IseqProductMetrics', back_populates='iseq_flowcell')
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import CHAR, Column, DateTime, Float, String, text
+from sqlalchemy.dialects.mysql import BIGINT as mysqlBIGINT, INTEGER as mysqlINTEGER, SMALLINT as mysqlSMALLINT, TINYINT as mysqlTINYINT
+
+
+@add_docstring
+class IseqHeronProductMetrics(Base):
+    """Constructs a new IseqHeronProductMetrics.
+
+    Parameters
+    ----------
+    id_iseq_hrpr_metrics_tmp: Internal to this database id, value can change
+    id_iseq_product: Product id, a foreign key into iseq_product_metrics table
+    created: Datetime this record was created
+    last_changed: Datetime this record was created or changed
+    id_run: Run id
+    supplier_sample_name: Sample name given by the supplier, as recorded by WSI
+    pp_name: The name of the pipeline that produced the QC metric
+    pp_version: The version of the pipeline specified in the pp_name column
+    pp_repo_url: URL of the VCS repository for this pipeline
+    artic_qc_outcome: Artic pipeline QC outcome, "TRUE", "FALSE" or a NULL value
+    climb_upload: Datetime files for this sample were uploaded to CLIMB
+    cog_sample_meta: A Boolean flag to mark sample metadata upload to COG
+    path_root: The uploaded files path root for the entity
+    ivar_md: ivar minimum depth used in generating the default consensus
+    pct_N_bases: Percent of N bases
+    pct_covered_bases: Percent of covered bases
+    longest_no_N_run: Longest consensus data stretch without N
+    ivar_amd: ivar minimum depth used in generating the additional consensus
+    pct_N_bases_amd: Percent of N bases in the additional consensus
+    longest_no_N_run_amd: Longest data stretch without N in the additional consensus
+    num_aligned_reads: Number of aligned filtered reads
+    """
+
+    __tablename__ = 'iseq_heron_product_metrics'
+    __table_args__ = {'comment': 'Heron project additional metrics'}
+
+    id_iseq_hrpr_metrics_tmp = Column(mysqlBIGINT(20, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    id_iseq_product = Column(CHAR(64, 'utf8_unicode_ci'), nullable=False, unique=True, comment='Product id, a foreign key into iseq_product_metrics table', doc='Product id, a foreign key into iseq_product_metrics table')
+    created = Column(DateTime, server_default=text('CURRENT_TIMESTAMP'), comment='Datetime this record was created', doc='Datetime this record was created')
+    last_changed = Column(DateTime, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='Datetime this record was created or changed', doc='Datetime this record was created or changed')
+    id_run = Column(mysqlINTEGER(10, unsigned=True), index=True, comment='Run id', doc='Run id')
+    supplier_sample_name = Column(String(255, 'utf8_unicode_ci'), index=True, comment='Sample name given by the supplier, as recorded by WSI', doc='Sample name given by the supplier, as recorded by WSI')
+    pp_name = Column(String(40, 'utf8_unicode_ci'), server_default=text("'ncov2019-artic-nf'"), comment='The name of the pipeline that produced the QC metric', doc='The name of the pipeline that produced the QC metric')
+    pp_version = Column(String(40, 'utf8_unicode_ci'), index=True, comment='The version of the pipeline specified in the pp_name column', doc='The version of the pipeline specified in the pp_name column')
+    pp_repo_url = Column(String(255, 'utf8_unicode_ci'), comment='URL of the VCS repository for this pipeline', doc='URL of the VCS repository for this pipeline')
+    artic_qc_outcome = Column(CHAR(15, 'utf8_unicode_ci'), comment='Artic pipeline QC outcome, "TRUE", "FALSE" or a NULL value', doc='Artic pipeline QC outcome, "TRUE", "FALSE" or a NULL value')
+    climb_upload = Column(DateTime, comment='Datetime files for this sample were uploaded to CLIMB', doc='Datetime files for this sample were uploaded to CLIMB')
+    cog_sample_meta = Column(mysqlTINYINT(1, unsigned=True), comment='A Boolean flag to mark sample metadata upload to COG', doc='A Boolean flag to mark sample metadata upload to COG')
+    path_root = Column(String(255, 'utf8_unicode_ci'), comment='The uploaded files path root for the entity', doc='The uploaded files path root for the entity')
+    ivar_md = Column(mysqlSMALLINT(5, unsigned=True), comment='ivar minimum depth used in generating the default consensus', doc='ivar minimum depth used in generating the default consensus')
+    pct_N_bases = Column(Float, comment='Percent of N bases', doc='Percent of N bases')
+    pct_covered_bases = Column(Float, comment='Percent of covered bases', doc='Percent of covered bases')
+    longest_no_N_run = Column(mysqlSMALLINT(5, unsigned=True), comment='Longest consensus data stretch without N', doc='Longest consensus data stretch without N')
+    ivar_amd = Column(mysqlSMALLINT(5, unsigned=True), comment='ivar minimum depth used in generating the additional consensus', doc='ivar minimum depth used in generating the additional consensus')
+    pct_N_bases_amd = Column(Float, comment='Percent of N bases in the additional consensus', doc='Percent of N bases in the additional consensus')
+    longest_no_N_run_amd = Column(mysqlSMALLINT(5, unsigned=True), comment='Longest data stretch without N in the additional consensus', doc='Longest data stretch without N in the additional consensus')
+    num_aligned_reads = Column(mysqlBIGINT(20, unsigned=True), comment='Number of aligned filtered reads', doc='Number of aligned filtered reads')
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DECIMAL, DateTime, ForeignKey, Index, String, text
+from sqlalchemy.dialects.mysql import BIGINT as mysqlBIGINT, INTEGER as mysqlINTEGER, SMALLINT as mysqlSMALLINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class IseqProductAmpliconstats(Base):
+    """Constructs a new IseqProductAmpliconstats.
+
+    Parameters
+    ----------
+    id_iseq_pr_astats_tmp: Internal to this database id, value can change
+    id_iseq_product: Product id, a foreign key into iseq_product_metrics table
+    primer_panel: A string uniquely identifying the primer panel
+    primer_panel_num_amplicons: Total number of amplicons in the primer panel
+    amplicon_index: Amplicon index (position) in the primer panel, from 1 to the value of primer_panel_num_amplicons
+    pp_name: Name of the portable pipeline that generated the data
+    created: Datetime this record was created
+    last_changed: Datetime this record was created or changed
+    pp_version: Version of the portable pipeline and/or samtools that generated the data
+    metric_FPCOV_1: Coverage percent at depth 1
+    metric_FPCOV_10: Coverage percent at depth 10
+    metric_FPCOV_20: Coverage percent at depth 20
+    metric_FPCOV_100: Coverage percent at depth 100
+    metric_FREADS: Number of aligned filtered reads
+    """
+
+    __tablename__ = 'iseq_product_ampliconstats'
+    __table_args__ = (
+        Index('iseq_hrm_digest_unq', 'id_iseq_product', 'primer_panel', 'amplicon_index', unique=True),
+        Index('iseq_pastats_amplicon', 'primer_panel_num_amplicons', 'amplicon_index'),
+        {'comment': 'Some of per sample per amplicon metrics generated by samtools '
+                'ampliconstats'}
+    )
+
+    id_iseq_pr_astats_tmp = Column(mysqlBIGINT(20, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    id_iseq_product = Column(ForeignKey('iseq_product_metrics.id_iseq_product'), nullable=False, comment='Product id, a foreign key into iseq_product_metrics table', doc='Product id, a foreign key into iseq_product_metrics table')
+    primer_panel = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='A string uniquely identifying the primer panel', doc='A string uniquely identifying the primer panel')
+    primer_panel_num_amplicons = Column(mysqlSMALLINT(5, unsigned=True), nullable=False, comment='Total number of amplicons in the primer panel', doc='Total number of amplicons in the primer panel')
+    amplicon_index = Column(mysqlSMALLINT(5, unsigned=True), nullable=False, comment='Amplicon index (position) in the primer panel, from 1 to the value of primer_panel_num_amplicons', doc='Amplicon index (position) in the primer panel, from 1 to the value of primer_panel_num_amplicons')
+    pp_name = Column(String(40, 'utf8_unicode_ci'), nullable=False, comment='Name of the portable pipeline that generated the data', doc='Name of the portable pipeline that generated the data')
+    created = Column(DateTime, server_default=text('CURRENT_TIMESTAMP'), comment='Datetime this record was created', doc='Datetime this record was created')
+    last_changed = Column(DateTime, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='Datetime this record was created or changed', doc='Datetime this record was created or changed')
+    pp_version = Column(String(40, 'utf8_unicode_ci'), comment='Version of the portable pipeline and/or samtools that generated the data', doc='Version of the portable pipeline and/or samtools that generated the data')
+    metric_FPCOV_1 = Column(DECIMAL(5, 2), comment='Coverage percent at depth 1', doc='Coverage percent at depth 1')
+    metric_FPCOV_10 = Column(DECIMAL(5, 2), comment='Coverage percent at depth 10', doc='Coverage percent at depth 10')
+    metric_FPCOV_20 = Column(DECIMAL(5, 2), comment='Coverage percent at depth 20', doc='Coverage percent at depth 20')
+    metric_FPCOV_100 = Column(DECIMAL(5, 2), comment='Coverage percent at depth 100', doc='Coverage percent at depth 100')
+    metric_FREADS = Column(mysqlINTEGER(10, unsigned=True), comment='Number of aligned filtered reads', doc='Number of aligned filtered reads')
+
+    iseq_product_metrics = relationship('IseqProductMetrics', back_populates='iseq_product_ampliconstats')
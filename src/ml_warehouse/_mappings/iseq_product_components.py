@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, ForeignKey, Index
+from sqlalchemy.dialects.mysql import BIGINT as mysqlBIGINT, TINYINT as mysqlTINYINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class IseqProductComponents(Base):
+    """Constructs a new IseqProductComponents.
+
+    Parameters
+    ----------
+    id_iseq_pr_components_tmp: Internal to this database id, value can change
+    id_iseq_pr_tmp: iseq_product_metrics table row id for the product
+    id_iseq_pr_component_tmp: iseq_product_metrics table row id for one of this product's components
+    num_components: Number of component products for this product
+    component_index: Unique component index within all components of this product, \\na value from 1 to the value of num_components column for this product
+    """
+
+    __tablename__ = 'iseq_product_components'
+    __table_args__ = (
+        Index('iseq_pr_comp_compi', 'component_index', 'num_components'),
+        Index('iseq_pr_comp_ncomp', 'num_components', 'id_iseq_pr_tmp'),
+        Index('iseq_pr_comp_unique', 'id_iseq_pr_tmp', 'id_iseq_pr_component_tmp', unique=True)
+    )
+
+    id_iseq_pr_components_tmp = Column(mysqlBIGINT(20, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    id_iseq_pr_tmp = Column(ForeignKey('iseq_product_metrics.id_iseq_pr_metrics_tmp', ondelete='CASCADE'), nullable=False, comment='iseq_product_metrics table row id for the product', doc='iseq_product_metrics table row id for the product')
+    id_iseq_pr_component_tmp = Column(ForeignKey('iseq_product_metrics.id_iseq_pr_metrics_tmp'), nullable=False, index=True, comment="iseq_product_metrics table row id for one of this product's components", doc="iseq_product_metrics table row id for one of this product's components")
+    num_components = Column(mysqlTINYINT(3, unsigned=True), nullable=False, comment='Number of component products for this product', doc='Number of component products for this product')
+    component_index = Column(mysqlTINYINT(3, unsigned=True), nullable=False, comment='Unique component index within all components of this product, \\na value from 1 to the value of num_components column for this product', doc='Unique component index within all components of this product, \\na value from 1 to the value of num_components column for this product')
+
+    iseq_product_metrics = relationship('IseqProductMetrics', foreign_keys=[id_iseq_pr_component_tmp], back_populates='iseq_product_components')
+    iseq_product_metrics_ = relationship('IseqProductMetrics', foreign_keys=[id_iseq_pr_tmp], back_populates='iseq_product_components_')
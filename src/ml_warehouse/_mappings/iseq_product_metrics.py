@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import CHAR, Column, DateTime, ForeignKey, ForeignKeyConstraint, Index, String, text
+from sqlalchemy.dialects.mysql import BIGINT as mysqlBIGINT, FLOAT as mysqlFLOAT, INTEGER as mysqlINTEGER, SMALLINT as mysqlSMALLINT, TINYINT as mysqlTINYINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class IseqProductMetrics(Base):
+    """Constructs a new IseqProductMetrics.
+
+    Parameters
+    ----------
+    id_iseq_pr_metrics_tmp: Internal to this database id, value can change
+    id_iseq_product: Product id
+    last_changed: Date this record was created or changed
+    id_iseq_flowcell_tmp: Flowcell id, see "iseq_flowcell.id_iseq_flowcell_tmp"
+    id_run: NPG run identifier
+    position: Flowcell lane number
+    tag_index: Tag index, NULL if lane is not a pool
+    iseq_composition_tmp: JSON representation of the composition object, the column might be deleted in future
+    qc_seq: Sequencing lane level QC outcome, a result of either manual or automatic assessment by core
+    qc_lib: Library QC outcome, a result of either manual or automatic assessment by core
+    qc_user: Library QC outcome according to the data user criteria, a result of either manual or automatic assessment
+    qc: Overall QC assessment outcome, a logical product (conjunction) of qc_seq and qc_lib values, defaults to the qc_seq value when qc_lib is not defined
+    tag_sequence4deplexing: Tag sequence used for deplexing the lane, common suffix might have been truncated
+    actual_forward_read_length: Actual forward read length, bp
+    actual_reverse_read_length: Actual reverse read length, bp
+    indexing_read_length: Indexing read length, bp
+    tag_decode_percent
+    tag_decode_count
+    insert_size_quartile1
+    insert_size_quartile3
+    insert_size_median
+    insert_size_num_modes
+    insert_size_normal_fit_confidence
+    gc_percent_forward_read
+    gc_percent_reverse_read
+    sequence_mismatch_percent_forward_read
+    sequence_mismatch_percent_reverse_read
+    adapters_percent_forward_read
+    adapters_percent_reverse_read
+    ref_match1_name
+    ref_match1_percent
+    ref_match2_name
+    ref_match2_percent
+    q20_yield_kb_forward_read
+    q20_yield_kb_reverse_read
+    q30_yield_kb_forward_read
+    q30_yield_kb_reverse_read
+    q40_yield_kb_forward_read
+    q40_yield_kb_reverse_read
+    num_reads
+    percent_mapped
+    percent_duplicate
+    chimeric_reads_percent: mate_mapped_defferent_chr_5 as percentage of all
+    human_percent_mapped
+    human_percent_duplicate
+    genotype_sample_name_match
+    genotype_sample_name_relaxed_match
+    genotype_mean_depth
+    mean_bait_coverage
+    on_bait_percent
+    on_or_near_bait_percent
+    verify_bam_id_average_depth
+    verify_bam_id_score
+    verify_bam_id_snp_count
+    rna_exonic_rate: Exonic Rate is the fraction mapping within exons
+    rna_percent_end_2_reads_sense: Percentage of intragenic End 2 reads that were sequenced in the sense direction.
+    rna_rrna_rate: rRNA Rate is per total reads
+    rna_genes_detected: Number of genes detected with at least 5 reads.
+    rna_norm_3_prime_coverage: 3 prime n-based normalization: n is the transcript length at that end; norm is the ratio between the coverage at the 3 prime end and the average coverage of the full transcript, averaged over all transcripts
+    rna_norm_5_prime_coverage: 5 prime n-based normalization: n is the transcript length at that end; norm is the ratio between the coverage at the 5 prime end and the average coverage of the full transcript, averaged over all transcripts
+    rna_intronic_rate: Intronic rate is the fraction mapping within introns
+    rna_transcripts_detected: Number of transcripts detected with at least 5 reads
+    rna_globin_percent_tpm: Percentage of globin genes TPM (transcripts per million) detected
+    rna_mitochondrial_percent_tpm: Percentage of mitochondrial genes TPM (transcripts per million) detected
+    gbs_call_rate: The GbS call rate is the fraction of loci called on the relevant primer panel
+    gbs_pass_rate: The GbS pass rate is the fraction of loci called and passing filters on the relevant primer panel
+    nrd_percent: Percent of non-reference discordance
+    target_filter: Filter used to produce the target stats file
+    target_length: The total length of the target regions
+    target_mapped_reads: The number of mapped reads passing the target filter
+    target_proper_pair_mapped_reads: The number of proper pair mapped reads passing the target filter
+    target_mapped_bases: The number of mapped bases passing the target filter
+    target_coverage_threshold: The coverage threshold used in the target perc target greater than depth calculation
+    target_percent_gt_coverage_threshold: The percentage of the target covered at greater than the depth specified
+    target_autosome_coverage_threshold: The coverage threshold used in the perc target autosome greater than depth calculation
+    target_autosome_percent_gt_coverage_threshold: The percentage of the target autosome covered at greater than the depth specified
+    """
+
+    __tablename__ = 'iseq_product_metrics'
+    __table_args__ = (
+        ForeignKeyConstraint(['id_run', 'position'], ['iseq_run_lane_metrics.id_run', 'iseq_run_lane_metrics.position'], ondelete='CASCADE'),
+        Index('iseq_pm_fcid_run_pos_tag_index', 'id_run', 'position', 'tag_index')
+    )
+
+    id_iseq_pr_metrics_tmp = Column(mysqlBIGINT(20, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    id_iseq_product = Column(CHAR(64, 'utf8_unicode_ci'), nullable=False, unique=True, comment='Product id', doc='Product id')
+    last_changed = Column(DateTime, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='Date this record was created or changed', doc='Date this record was created or changed')
+    id_iseq_flowcell_tmp = Column(ForeignKey('iseq_flowcell.id_iseq_flowcell_tmp', ondelete='SET NULL'), index=True, comment='Flowcell id, see "iseq_flowcell.id_iseq_flowcell_tmp"', doc='Flowcell id, see "iseq_flowcell.id_iseq_flowcell_tmp"')
+    id_run = Column(mysqlINTEGER(10, unsigned=True), comment='NPG run identifier', doc='NPG run identifier')
+    position = Column(mysqlSMALLINT(2, unsigned=True), comment='Flowcell lane number', doc='Flowcell lane number')
+    tag_index = Column(mysqlSMALLINT(5, unsigned=True), comment='Tag index, NULL if lane is not a pool', doc='Tag index, NULL if lane is not a pool')
+    iseq_composition_tmp = Column(String(600, 'utf8_unicode_ci'), comment='JSON representation of the composition object, the column might be deleted in future', doc='JSON representation of the composition object, the column might be deleted in future')
+    qc_seq = Column(mysqlTINYINT(1), comment='Sequencing lane level QC outcome, a result of either manual or automatic assessment by core', doc='Sequencing lane level QC outcome, a result of either manual or automatic assessment by core')
+    qc_lib = Column(mysqlTINYINT(1), comment='Library QC outcome, a result of either manual or automatic assessment by core', doc='Library QC outcome, a result of either manual or automatic assessment by core')
+    qc_user = Column(mysqlTINYINT(1), comment='Library QC outcome according to the data user criteria, a result of either manual or automatic assessment', doc='Library QC outcome according to the data user criteria, a result of either manual or automatic assessment')
+    qc = Column(mysqlTINYINT(1), comment='Overall QC assessment outcome, a logical product (conjunction) of qc_seq and qc_lib values, defaults to the qc_seq value when qc_lib is not defined', doc='Overall QC assessment outcome, a logical product (conjunction) of qc_seq and qc_lib values, defaults to the qc_seq value when qc_lib is not defined')
+    tag_sequence4deplexing = Column(String(30, 'utf8_unicode_ci'), comment='Tag sequence used for deplexing the lane, common suffix might have been truncated', doc='Tag sequence used for deplexing the lane, common suffix might have been truncated')
+    actual_forward_read_length = Column(mysqlSMALLINT(4, unsigned=True), comment='Actual forward read length, bp', doc='Actual forward read length, bp')
+    actual_reverse_read_length = Column(mysqlSMALLINT(4, unsigned=True), comment='Actual reverse read length, bp', doc='Actual reverse read length, bp')
+    indexing_read_length = Column(mysqlSMALLINT(2, unsigned=True), comment='Indexing read length, bp', doc='Indexing read length, bp')
+    tag_decode_percent = Column(mysqlFLOAT(5, 2, unsigned=True))
+    tag_decode_count = Column(mysqlINTEGER(10, unsigned=True))
+    insert_size_quartile1 = Column(mysqlSMALLINT(5, unsigned=True))
+    insert_size_quartile3 = Column(mysqlSMALLINT(5, unsigned=True))
+    insert_size_median = Column(mysqlSMALLINT(5, unsigned=True))
+    insert_size_num_modes = Column(mysqlSMALLINT(4, unsigned=True))
+    insert_size_normal_fit_confidence = Column(mysqlFLOAT(3, 2, unsigned=True))
+    gc_percent_forward_read = Column(mysqlFLOAT(5, 2, unsigned=True))
+    gc_percent_reverse_read = Column(mysqlFLOAT(5, 2, unsigned=True))
+    sequence_mismatch_percent_forward_read = Column(mysqlFLOAT(4, 2, unsigned=True))
+    sequence_mismatch_percent_reverse_read = Column(mysqlFLOAT(4, 2, unsigned=True))
+    adapters_percent_forward_read = Column(mysqlFLOAT(5, 2, unsigned=True))
+    adapters_percent_reverse_read = Column(mysqlFLOAT(5, 2, unsigned=True))
+    ref_match1_name = Column(String(100, 'utf8_unicode_ci'))
+    ref_match1_percent = Column(mysqlFLOAT(5, 2))
+    ref_match2_name = Column(String(100, 'utf8_unicode_ci'))
+    ref_match2_percent = Column(mysqlFLOAT(5, 2))
+    q20_yield_kb_forward_read = Column(mysqlINTEGER(10, unsigned=True))
+    q20_yield_kb_reverse_read = Column(mysqlINTEGER(10, unsigned=True))
+    q30_yield_kb_forward_read = Column(mysqlINTEGER(10, unsigned=True))
+    q30_yield_kb_reverse_read = Column(mysqlINTEGER(10, unsigned=True))
+    q40_yield_kb_forward_read = Column(mysqlINTEGER(10, unsigned=True))
+    q40_yield_kb_reverse_read = Column(mysqlINTEGER(10, unsigned=True))
+    num_reads = Column(mysqlBIGINT(20, unsigned=True))
+    percent_mapped = Column(mysqlFLOAT(5, 2))
+    percent_duplicate = Column(mysqlFLOAT(5, 2))
+    chimeric_reads_percent = Column(mysqlFLOAT(5, 2, unsigned=True), comment='mate_mapped_defferent_chr_5 as percentage of all', doc='mate_mapped_defferent_chr_5 as percentage of all')
+    human_percent_mapped = Column(mysqlFLOAT(5, 2))
+    human_percent_duplicate = Column(mysqlFLOAT(5, 2))
+    genotype_sample_name_match = Column(String(8, 'utf8_unicode_ci'))
+    genotype_sample_name_relaxed_match = Column(String(8, 'utf8_unicode_ci'))
+    genotype_mean_depth = Column(mysqlFLOAT(7, 2))
+    mean_bait_coverage = Column(mysqlFLOAT(8, 2, unsigned=True))
+    on_bait_percent = Column(mysqlFLOAT(5, 2, unsigned=True))
+    on_or_near_bait_percent = Column(mysqlFLOAT(5, 2, unsigned=True))
+    verify_bam_id_average_depth = Column(mysqlFLOAT(11, 2, unsigned=True))
+    verify_bam_id_score = Column(mysqlFLOAT(6, 5, unsigned=True))
+    verify_bam_id_snp_count = Column(mysqlINTEGER(10, unsigned=True))
+    rna_exonic_rate = Column(mysqlFLOAT(unsigned=True), comment='Exonic Rate is the fraction mapping within exons', doc='Exonic Rate is the fraction mapping within exons')
+    rna_percent_end_2_reads_sense = Column(mysqlFLOAT(unsigned=True), comment='Percentage of intragenic End 2 reads that were sequenced in the sense direction.', doc='Percentage of intragenic End 2 reads that were sequenced in the sense direction.')
+    rna_rrna_rate = Column(mysqlFLOAT(unsigned=True), comment='rRNA Rate is per total reads', doc='rRNA Rate is per total reads')
+    rna_genes_detected = Column(mysqlINTEGER(10, unsigned=True), comment='Number of genes detected with at least 5 reads.', doc='Number of genes detected with at least 5 reads.')
+    rna_norm_3_prime_coverage = Column(mysqlFLOAT(unsigned=True), comment='3 prime n-based normalization: n is the transcript length at that end; norm is the ratio between the coverage at the 3 prime end and the average coverage of the full transcript, averaged over all transcripts', doc='3 prime n-based normalization: n is the transcript length at that end; norm is the ratio between the coverage at the 3 prime end and the average coverage of the full transcript, averaged over all transcripts')
+    rna_norm_5_prime_coverage = Column(mysqlFLOAT(unsigned=True), comment='5 prime n-based normalization: n is the transcript length at that end; norm is the ratio between the coverage at the 5 prime end and the average coverage of the full transcript, averaged over all transcripts', doc='5 prime n-based normalization: n is the transcript length at that end; norm is the ratio between the coverage at the 5 prime end and the average coverage of the full transcript, averaged over all transcripts')
+    rna_intronic_rate = Column(mysqlFLOAT(unsigned=True), comment='Intronic rate is the fraction mapping within introns', doc='Intronic rate is the fraction mapping within introns')
+    rna_transcripts_detected = Column(mysqlINTEGER(10, unsigned=True), comment='Number of transcripts detected with at least 5 reads', doc='Number of transcripts detected with at least 5 reads')
+    rna_globin_percent_tpm = Column(mysqlFLOAT(unsigned=True), comment='Percentage of globin genes TPM (transcripts per million) detected', doc='Percentage of globin genes TPM (transcripts per million) detected')
+    rna_mitochondrial_percent_tpm = Column(mysqlFLOAT(unsigned=True), comment='Percentage of mitochondrial genes TPM (transcripts per million) detected', doc='Percentage of mitochondrial genes TPM (transcripts per million) detected')
+    gbs_call_rate = Column(mysqlFLOAT(unsigned=True), comment='The GbS call rate is the fraction of loci called on the relevant primer panel', doc='The GbS call rate is the fraction of loci called on the relevant primer panel')
+    gbs_pass_rate = Column(mysqlFLOAT(unsigned=True), comment='The GbS pass rate is the fraction of loci called and passing filters on the relevant primer panel', doc='The GbS pass rate is the fraction of loci called and passing filters on the relevant primer panel')
+    nrd_percent = Column(mysqlFLOAT(5, 2), comment='Percent of non-reference discordance', doc='Percent of non-reference discordance')
+    target_filter = Column(String(30, 'utf8_unicode_ci'), comment='Filter used to produce the target stats file', doc='Filter used to produce the target stats file')
+    target_length = Column(mysqlBIGINT(12, unsigned=True), comment='The total length of the target regions', doc='The total length of the target regions')
+    target_mapped_reads = Column(mysqlBIGINT(20, unsigned=True), comment='The number of mapped reads passing the target filter', doc='The number of mapped reads passing the target filter')
+    target_proper_pair_mapped_reads = Column(mysqlBIGINT(20, unsigned=True), comment='The number of proper pair mapped reads passing the target filter', doc='The number of proper pair mapped reads passing the target filter')
+    target_mapped_bases = Column(mysqlBIGINT(20, unsigned=True), comment='The number of mapped bases passing the target filter', doc='The number of mapped bases passing the target filter')
+    target_coverage_threshold = Column(mysqlINTEGER(4), comment='The coverage threshold used in the target perc target greater than depth calculation', doc='The coverage threshold used in the target perc target greater than depth calculation')
+    target_percent_gt_coverage_threshold = Column(mysqlFLOAT(5, 2), comment='The percentage of the target covered at greater than the depth specified', doc='The percentage of the target covered at greater than the depth specified')
+    target_autosome_coverage_threshold = Column(mysqlINTEGER(4), comment='The coverage threshold used in the perc target autosome greater than depth calculation', doc='The coverage threshold used in the perc target autosome greater than depth calculation')
+    target_autosome_percent_gt_coverage_threshold = Column(mysqlFLOAT(5, 2), comment='The percentage of the target autosome covered at greater than the depth specified', doc='The percentage of the target autosome covered at greater than the depth specified')
+
+    iseq_flowcell = relationship('IseqFlowcell', back_populates='iseq_product_metrics')
+    iseq_run_lane_metrics = relationship('IseqRunLaneMetrics', back_populates='iseq_product_metrics')
+    iseq_product_ampliconstats = relationship('IseqProductAmpliconstats', back_populates='iseq_product_metrics')
+    iseq_product_components = relationship('IseqProductComponents', foreign_keys='[IseqProductComponents.id_iseq_pr_component_tmp]', back_populates='iseq_product_metrics')
+    iseq_product_components_ = relationship('IseqProductComponents', foreign_keys='[IseqProductComponents.id_iseq_pr_tmp]', back_populates='iseq_product_metrics_')
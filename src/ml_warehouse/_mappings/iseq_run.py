@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER, SMALLINT as mysqlSMALLINT
+
+
+@add_docstring
+class IseqRun(Base):
+    """Constructs a new IseqRun.
+
+    Parameters
+    ----------
+    id_run: NPG run identifier
+    id_flowcell_lims: LIMS specific flowcell id
+    folder_name: Runfolder name
+    rp__read1_number_of_cycles: Read 1 number of cycles
+    rp__read2_number_of_cycles: Read 2 number of cycles
+    rp__flow_cell_mode: Flowcell mode
+    rp__workflow_type: Workflow type
+    rp__flow_cell_consumable_version: Flowcell consumable version
+    rp__sbs_consumable_version: Sbs consumable version
+    """
+
+    __tablename__ = 'iseq_run'
+    __table_args__ = {'comment': 'Table linking run and flowcell identities with the run folder '
+                'name'}
+
+    id_run = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, comment='NPG run identifier', doc='NPG run identifier')
+    id_flowcell_lims = Column(String(20, 'utf8_unicode_ci'), index=True, comment='LIMS specific flowcell id', doc='LIMS specific flowcell id')
+    folder_name = Column(String(64, 'utf8_unicode_ci'), comment='Runfolder name', doc='Runfolder name')
+    rp__read1_number_of_cycles = Column(mysqlSMALLINT(5, unsigned=True), comment='Read 1 number of cycles', doc='Read 1 number of cycles')
+    rp__read2_number_of_cycles = Column(mysqlSMALLINT(5, unsigned=True), comment='Read 2 number of cycles', doc='Read 2 number of cycles')
+    rp__flow_cell_mode = Column(String(4, 'utf8_unicode_ci'), comment='Flowcell mode', doc='Flowcell mode')
+    rp__workflow_type = Column(String(16, 'utf8_unicode_ci'), comment='Workflow type', doc='Workflow type')
+    rp__flow_cell_consumable_version = Column(String(4, 'utf8_unicode_ci'), comment='Flowcell consumable version', doc='Flowcell consumable version')
+    rp__sbs_consumable_version = Column(String(4, 'utf8_unicode_ci'), comment='Sbs consumable version', doc='Sbs consumable version')
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from ml_warehouse._mappings.iseq_run import IseqRun
+from sqlalchemy import Column, ForeignKey, Text
+
+
+@add_docstring
+class IseqRunInfo(IseqRun):
+    """Constructs a new IseqRunInfo.
+
+    Parameters
+    ----------
+    id_run: NPG run identifier
+    run_parameters_xml: The contents of Illumina's {R,r}unParameters.xml file
+    """
+
+    __tablename__ = 'iseq_run_info'
+    __table_args__ = {'comment': 'Table storing selected text files from the run folder'}
+
+    id_run = Column(ForeignKey('iseq_run.id_run'), primary_key=True, comment='NPG run identifier', doc='NPG run identifier')
+    run_parameters_xml = Column(Text(collation='utf8_unicode_ci'), comment="The contents of Illumina's {R,r}unParameters.xml file", doc="The contents of Illumina's {R,r}unParameters.xml file")
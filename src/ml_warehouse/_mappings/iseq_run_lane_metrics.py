@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import CHAR, Column, DateTime, Index, String, text
+from sqlalchemy.dialects.mysql import BIGINT as mysqlBIGINT, DOUBLE as mysqlDOUBLE, FLOAT as mysqlFLOAT, INTEGER as mysqlINTEGER, SMALLINT as mysqlSMALLINT, TINYINT as mysqlTINYINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class IseqRunLaneMetrics(Base):
+    """Constructs a new IseqRunLaneMetrics.
+
+    Parameters
+    ----------
+    id_run: NPG run identifier
+    position: Flowcell lane number
+    paired_read
+    cycles
+    cancelled: Boolen flag to indicate whether the run was cancelled
+    flowcell_barcode: Manufacturer flowcell barcode or other identifier as recorded by NPG
+    last_changed: Date this record was created or changed
+    qc_seq: Sequencing lane level QC outcome, a result of either manual or automatic assessment by core
+    instrument_name
+    instrument_external_name: Name assigned to the instrument by the manufacturer
+    instrument_model
+    instrument_side: Illumina instrument side (A or B), if appropriate
+    workflow_type: Illumina instrument workflow type
+    run_pending: Timestamp of run pending status
+    run_complete: Timestamp of run complete status
+    qc_complete: Timestamp of qc complete status
+    pf_cluster_count
+    raw_cluster_count
+    raw_cluster_density
+    pf_cluster_density
+    pf_bases
+    q20_yield_kb_forward_read
+    q20_yield_kb_reverse_read
+    q30_yield_kb_forward_read
+    q30_yield_kb_reverse_read
+    q40_yield_kb_forward_read
+    q40_yield_kb_reverse_read
+    tags_decode_percent
+    tags_decode_cv
+    unexpected_tags_percent: tag0_perfect_match_reads as a percentage of total_lane_reads
+    tag_hops_percent: Percentage tag hops for dual index runs
+    tag_hops_power: Power to detect tag hops for dual index runs
+    run_priority: Sequencing lane level run priority, a result of either manual or default value set by core
+    interop_cluster_count_total: Total cluster count for this lane (derived from Illumina InterOp files)
+    interop_cluster_count_mean: Total cluster count, mean value over tiles of this lane (derived from Illumina InterOp files)
+    interop_cluster_count_stdev: Standard deviation value for interop_cluster_count_mean
+    interop_cluster_count_pf_total: Purity-filtered cluster count for this lane (derived from Illumina InterOp files)
+    interop_cluster_count_pf_mean: Purity-filtered cluster count, mean value over tiles of this lane (derived from Illumina InterOp files)
+    interop_cluster_count_pf_stdev: Standard deviation value for interop_cluster_count_pf_mean
+    interop_cluster_density_mean: Cluster density, mean value over tiles of this lane (derived from Illumina InterOp files)
+    interop_cluster_density_stdev: Standard deviation value for interop_cluster_density_mean
+    interop_cluster_density_pf_mean: Purity-filtered cluster density, mean value over tiles of this lane (derived from Illumina InterOp files)
+    interop_cluster_density_pf_stdev: Standard deviation value for interop_cluster_density_pf_mean
+    interop_cluster_pf_mean:  Percent of purity-filtered clusters, mean value over tiles of this lane (derived from Illumina InterOp files)
+    interop_cluster_pf_stdev: Standard deviation value for interop_cluster_pf_mean
+    interop_occupied_mean: Percent of occupied flowcell wells, a mean value over tiles of this lane (derived from Illumina InterOp files)
+    interop_occupied_stdev: Standard deviation value for interop_occupied_mean
+    """
+
+    __tablename__ = 'iseq_run_lane_metrics'
+    __table_args__ = (
+        Index('iseq_rlm_cancelled_and_run_complete_index', 'cancelled', 'run_complete'),
+        Index('iseq_rlm_cancelled_and_run_pending_index', 'cancelled', 'run_pending')
+    )
+
+    id_run = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, nullable=False, index=True, comment='NPG run identifier', doc='NPG run identifier')
+    position = Column(mysqlSMALLINT(2, unsigned=True), primary_key=True, nullable=False, comment='Flowcell lane number', doc='Flowcell lane number')
+    paired_read = Column(mysqlTINYINT(1, unsigned=True), nullable=False, server_default=text("'0'"))
+    cycles = Column(mysqlINTEGER(4, unsigned=True), nullable=False)
+    cancelled = Column(mysqlTINYINT(1, unsigned=True), nullable=False, server_default=text("'0'"), comment='Boolen flag to indicate whether the run was cancelled', doc='Boolen flag to indicate whether the run was cancelled')
+    flowcell_barcode = Column(String(15, 'utf8_unicode_ci'), comment='Manufacturer flowcell barcode or other identifier as recorded by NPG', doc='Manufacturer flowcell barcode or other identifier as recorded by NPG')
+    last_changed = Column(DateTime, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='Date this record was created or changed', doc='Date this record was created or changed')
+    qc_seq = Column(mysqlTINYINT(1), comment='Sequencing lane level QC outcome, a result of either manual or automatic assessment by core', doc='Sequencing lane level QC outcome, a result of either manual or automatic assessment by core')
+    instrument_name = Column(CHAR(32, 'utf8_unicode_ci'))
+    instrument_external_name = Column(CHAR(10, 'utf8_unicode_ci'), comment='Name assigned to the instrument by the manufacturer', doc='Name assigned to the instrument by the manufacturer')
+    instrument_model = Column(CHAR(64, 'utf8_unicode_ci'))
+    instrument_side = Column(CHAR(1, 'utf8_unicode_ci'), comment='Illumina instrument side (A or B), if appropriate', doc='Illumina instrument side (A or B), if appropriate')
+    workflow_type = Column(String(20, 'utf8_unicode_ci'), comment='Illumina instrument workflow type', doc='Illumina instrument workflow type')
+    run_pending = Column(DateTime, comment='Timestamp of run pending status', doc='Timestamp of run pending status')
+    run_complete = Column(DateTime, comment='Timestamp of run complete status', doc='Timestamp of run complete status')
+    qc_complete = Column(DateTime, comment='Timestamp of qc complete status', doc='Timestamp of qc complete status')
+    pf_cluster_count = Column(mysqlBIGINT(20, unsigned=True))
+    raw_cluster_count = Column(mysqlBIGINT(20, unsigned=True))
+    raw_cluster_density = Column(mysqlDOUBLE(12, 3, unsigned=True))
+    pf_cluster_density = Column(mysqlDOUBLE(12, 3, unsigned=True))
+    pf_bases = Column(mysqlBIGINT(20, unsigned=True))
+    q20_yield_kb_forward_read = Column(mysqlINTEGER(10, unsigned=True))
+    q20_yield_kb_reverse_read = Column(mysqlINTEGER(10, unsigned=True))
+    q30_yield_kb_forward_read = Column(mysqlINTEGER(10, unsigned=True))
+    q30_yield_kb_reverse_read = Column(mysqlINTEGER(10, unsigned=True))
+    q40_yield_kb_forward_read = Column(mysqlINTEGER(10, unsigned=True))
+    q40_yield_kb_reverse_read = Column(mysqlINTEGER(10, unsigned=True))
+    tags_decode_percent = Column(mysqlFLOAT(5, 2, unsigned=True))
+    tags_decode_cv = Column(mysqlFLOAT(6, 2, unsigned=True))
+    unexpected_tags_percent = Column(mysqlFLOAT(5, 2, unsigned=True), comment='tag0_perfect_match_reads as a percentage of total_lane_reads', doc='tag0_perfect_match_reads as a percentage of total_lane_reads')
+    tag_hops_percent = Column(mysqlFLOAT(unsigned=True), comment='Percentage tag hops for dual index runs', doc='Percentage tag hops for dual index runs')
+    tag_hops_power = Column(mysqlFLOAT(unsigned=True), comment='Power to detect tag hops for dual index runs', doc='Power to detect tag hops for dual index runs')
+    run_priority = Column(mysqlTINYINT(3), comment='Sequencing lane level run priority, a result of either manual or default value set by core', doc='Sequencing lane level run priority, a result of either manual or default value set by core')
+    interop_cluster_count_total = Column(mysqlBIGINT(20, unsigned=True), comment='Total cluster count for this lane (derived from Illumina InterOp files)', doc='Total cluster count for this lane (derived from Illumina InterOp files)')
+    interop_cluster_count_mean = Column(mysqlDOUBLE(unsigned=True), comment='Total cluster count, mean value over tiles of this lane (derived from Illumina InterOp files)', doc='Total cluster count, mean value over tiles of this lane (derived from Illumina InterOp files)')
+    interop_cluster_count_stdev = Column(mysqlDOUBLE(unsigned=True), comment='Standard deviation value for interop_cluster_count_mean', doc='Standard deviation value for interop_cluster_count_mean')
+    interop_cluster_count_pf_total = Column(mysqlBIGINT(20, unsigned=True), comment='Purity-filtered cluster count for this lane (derived from Illumina InterOp files)', doc='Purity-filtered cluster count for this lane (derived from Illumina InterOp files)')
+    interop_cluster_count_pf_mean = Column(mysqlDOUBLE(unsigned=True), comment='Purity-filtered cluster count, mean value over tiles of this lane (derived from Illumina InterOp files)', doc='Purity-filtered cluster count, mean value over tiles of this lane (derived from Illumina InterOp files)')
+    interop_cluster_count_pf_stdev = Column(mysqlDOUBLE(unsigned=True), comment='Standard deviation value for interop_cluster_count_pf_mean', doc='Standard deviation value for interop_cluster_count_pf_mean')
+    interop_cluster_density_mean = Column(mysqlDOUBLE(unsigned=True), comment='Cluster density, mean value over tiles of this lane (derived from Illumina InterOp files)', doc='Cluster density, mean value over tiles of this lane (derived from Illumina InterOp files)')
+    interop_cluster_density_stdev = Column(mysqlDOUBLE(unsigned=True), comment='Standard deviation value for interop_cluster_density_mean', doc='Standard deviation value for interop_cluster_density_mean')
+    interop_cluster_density_pf_mean = Column(mysqlDOUBLE(unsigned=True), comment='Purity-filtered cluster density, mean value over tiles of this lane (derived from Illumina InterOp files)', doc='Purity-filtered cluster density, mean value over tiles of this lane (derived from Illumina InterOp files)')
+    interop_cluster_density_pf_stdev = Column(mysqlDOUBLE(unsigned=True), comment='Standard deviation value for interop_cluster_density_pf_mean', doc='Standard deviation value for interop_cluster_density_pf_mean')
+    interop_cluster_pf_mean = Column(mysqlFLOAT(5, 2, unsigned=True), comment=' Percent of purity-filtered clusters, mean value over tiles of this lane (derived from Illumina InterOp files)', doc=' Percent of purity-filtered clusters, mean value over tiles of this lane (derived from Illumina InterOp files)')
+    interop_cluster_pf_stdev = Column(mysqlFLOAT(5, 2, unsigned=True), comment='Standard deviation value for interop_cluster_pf_mean', doc='Standard deviation value for interop_cluster_pf_mean')
+    interop_occupied_mean = Column(mysqlFLOAT(5, 2, unsigned=True), comment='Percent of occupied flowcell wells, a mean value over tiles of this lane (derived from Illumina InterOp files)', doc='Percent of occupied flowcell wells, a mean value over tiles of this lane (derived from Illumina InterOp files)')
+    interop_occupied_stdev = Column(mysqlFLOAT(5, 2, unsigned=True), comment='Standard deviation value for interop_occupied_mean', doc='Standard deviation value for interop_occupied_mean')
+
+    iseq_product_metrics = relationship('IseqProductMetrics', back_populates='iseq_run_lane_metrics')
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, ForeignKey
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER, TINYINT as mysqlTINYINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class IseqRunStatus(Base):
+    """Constructs a new IseqRunStatus.
+
+    Parameters
+    ----------
+    id_run_status
+    id_run: NPG run identifier
+    date: Status timestamp
+    id_run_status_dict: Status identifier, see iseq_run_status_dict.id_run_status_dict
+    iscurrent: Boolean flag, 1 is the status is current, 0 otherwise
+    """
+
+    __tablename__ = 'iseq_run_status'
+
+    id_run_status = Column(mysqlINTEGER(11, unsigned=True), primary_key=True)
+    id_run = Column(mysqlINTEGER(10, unsigned=True), nullable=False, index=True, comment='NPG run identifier', doc='NPG run identifier')
+    date = Column(DateTime, nullable=False, comment='Status timestamp', doc='Status timestamp')
+    id_run_status_dict = Column(ForeignKey('iseq_run_status_dict.id_run_status_dict'), nullable=False, index=True, comment='Status identifier, see iseq_run_status_dict.id_run_status_dict', doc='Status identifier, see iseq_run_status_dict.id_run_status_dict')
+    iscurrent = Column(mysqlTINYINT(1), nullable=False, comment='Boolean flag, 1 is the status is current, 0 otherwise', doc='Boolean flag, 1 is the status is current, 0 otherwise')
+
+    iseq_run_status_dict = relationship('IseqRunStatusDict', back_populates='iseq_run_status')
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER, SMALLINT as mysqlSMALLINT, TINYINT as mysqlTINYINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class IseqRunStatusDict(Base):
+    """Constructs a new IseqRunStatusDict.
+
+    Parameters
+    ----------
+    id_run_status_dict
+    description
+    iscurrent
+    temporal_index
+    """
+
+    __tablename__ = 'iseq_run_status_dict'
+
+    id_run_status_dict = Column(mysqlINTEGER(10, unsigned=True), primary_key=True)
+    description = Column(String(64, 'utf8_unicode_ci'), nullable=False, index=True)
+    iscurrent = Column(mysqlTINYINT(3, unsigned=True), nullable=False)
+    temporal_index = Column(mysqlSMALLINT(5, unsigned=True))
+
+    iseq_run_status = relationship('IseqRunStatus', back_populates='iseq_run_status_dict')
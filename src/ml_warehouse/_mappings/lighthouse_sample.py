@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, Computed, DECIMAL, DateTime, Index, String, text
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER, TINYINT as mysqlTINYINT
+
+
+@add_docstring
+class LighthouseSample(Base):
+    """Constructs a new LighthouseSample.
+
+    Parameters
+    ----------
+    id
+    root_sample_id: Id for this sample provided by the Lighthouse lab
+    rna_id: Lighthouse lab-provided id made up of plate barcode and well
+    result: Covid-19 test result from the Lighthouse lab
+    is_current: Identifies if this sample has the most up to date information for the same rna_id
+    mongodb_id: Auto-generated id from MongoDB
+    cog_uk_id: Consortium-wide id, generated by Sanger on import to LIMS
+    plate_barcode: Barcode of plate sample arrived in, from rna_id
+    coordinate: Well position from plate sample arrived in, from rna_id
+    date_tested_string: When the covid-19 test was carried out by the Lighthouse lab
+    date_tested: date_tested_string in date format
+    source: Lighthouse centre that the sample came from
+    lab_id: Id of the lab, within the Lighthouse centre
+    ch1_target
+    ch1_result
+    ch1_cq
+    ch2_target
+    ch2_result
+    ch2_cq
+    ch3_target
+    ch3_result
+    ch3_cq
+    ch4_target
+    ch4_result
+    ch4_cq
+    filtered_positive: Filtered positive result value
+    filtered_positive_version: Filtered positive version
+    filtered_positive_timestamp: Filtered positive timestamp
+    lh_sample_uuid: Sample uuid created in crawler
+    lh_source_plate_uuid: Source plate uuid created in crawler
+    created_at: When this record was inserted
+    updated_at: When this record was last updated
+    must_sequence: PAM provided value whether sample is of high importance
+    preferentially_sequence: PAM provided value whether sample is important
+    current_rna_id
+    """
+
+    __tablename__ = 'lighthouse_sample'
+    __table_args__ = (
+        Index('index_lighthouse_sample_on_plate_barcode_and_created_at', 'plate_barcode', 'created_at'),
+        Index('index_lighthouse_sample_on_root_sample_id_and_rna_id_and_result', 'root_sample_id', 'rna_id', 'result', unique=True)
+    )
+
+    id = Column(mysqlINTEGER(11), primary_key=True)
+    root_sample_id = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='Id for this sample provided by the Lighthouse lab', doc='Id for this sample provided by the Lighthouse lab')
+    rna_id = Column(String(255, 'utf8_unicode_ci'), nullable=False, index=True, comment='Lighthouse lab-provided id made up of plate barcode and well', doc='Lighthouse lab-provided id made up of plate barcode and well')
+    result = Column(String(255, 'utf8_unicode_ci'), nullable=False, index=True, comment='Covid-19 test result from the Lighthouse lab', doc='Covid-19 test result from the Lighthouse lab')
+    is_current = Column(mysqlTINYINT(1), nullable=False, server_default=text("'0'"), comment='Identifies if this sample has the most up to date information for the same rna_id', doc='Identifies if this sample has the most up to date information for the same rna_id')
+    mongodb_id = Column(String(255, 'utf8_unicode_ci'), unique=True, comment='Auto-generated id from MongoDB', doc='Auto-generated id from MongoDB')
+    cog_uk_id = Column(String(255, 'utf8_unicode_ci'), index=True, comment='Consortium-wide id, generated by Sanger on import to LIMS', doc='Consortium-wide id, generated by Sanger on import to LIMS')
+    plate_barcode = Column(String(255, 'utf8_unicode_ci'), comment='Barcode of plate sample arrived in, from rna_id', doc='Barcode of plate sample arrived in, from rna_id')
+    coordinate = Column(String(255, 'utf8_unicode_ci'), comment='Well position from plate sample arrived in, from rna_id', doc='Well position from plate sample arrived in, from rna_id')
+    date_tested_string = Column(String(255, 'utf8_unicode_ci'), comment='When the covid-19 test was carried out by the Lighthouse lab', doc='When the covid-19 test was carried out by the Lighthouse lab')
+    date_tested = Column(DateTime, index=True, comment='date_tested_string in date format', doc='date_tested_string in date format')
+    source = Column(String(255, 'utf8_unicode_ci'), comment='Lighthouse centre that the sample came from', doc='Lighthouse centre that the sample came from')
+    lab_id = Column(String(255, 'utf8_unicode_ci'), comment='Id of the lab, within the Lighthouse centre', doc='Id of the lab, within the Lighthouse centre')
+    ch1_target = Column(String(255, 'utf8_unicode_ci'))
+    ch1_result = Column(String(255, 'utf8_unicode_ci'))
+    ch1_cq = Column(DECIMAL(11, 8))
+    ch2_target = Column(String(255, 'utf8_unicode_ci'))
+    ch2_result = Column(String(255, 'utf8_unicode_ci'))
+    ch2_cq = Column(DECIMAL(11, 8))
+    ch3_target = Column(String(255, 'utf8_unicode_ci'))
+    ch3_result = Column(String(255, 'utf8_unicode_ci'))
+    ch3_cq = Column(DECIMAL(11, 8))
+    ch4_target = Column(String(255, 'utf8_unicode_ci'))
+    ch4_result = Column(String(255, 'utf8_unicode_ci'))
+    ch4_cq = Column(DECIMAL(11, 8))
+    filtered_positive = Column(mysqlTINYINT(1), index=True, comment='Filtered positive result value', doc='Filtered positive result value')
+    filtered_positive_version = Column(String(255, 'utf8_unicode_ci'), comment='Filtered positive version', doc='Filtered positive version')
+    filtered_positive_timestamp = Column(DateTime, comment='Filtered positive timestamp', doc='Filtered positive timestamp')
+    lh_sample_uuid = Column(String(36, 'utf8_unicode_ci'), unique=True, comment='Sample uuid created in crawler', doc='Sample uuid created in crawler')
+    lh_source_plate_uuid = Column(String(36, 'utf8_unicode_ci'), comment='Source plate uuid created in crawler', doc='Source plate uuid created in crawler')
+    created_at = Column(DateTime, comment='When this record was inserted', doc='When this record was inserted')
+    updated_at = Column(DateTime, comment='When this record was last updated', doc='When this record was last updated')
+    must_sequence = Column(mysqlTINYINT(1), comment='PAM provided value whether sample is of high importance', doc='PAM provided value whether sample is of high importance')
+    preferentially_sequence = Column(mysqlTINYINT(1), comment='PAM provided value whether sample is important', doc='PAM provided value whether sample is important')
+    current_rna_id = Column(String(255, 'utf8_unicode_ci'), Computed('(if((`is_current` = 1),`rna_id`,NULL))', persisted=True), unique=True)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class OseqFlowcell(Base):
+    """Constructs a new OseqFlowcell.
+
+    Parameters
+    ----------
+    id_oseq_flowcell_tmp
+    id_flowcell_lims: LIMs-specific flowcell id
+    last_updated: Timestamp of last update
+    recorded_at: Timestamp of warehouse update
+    id_sample_tmp: Sample id, see "sample.id_sample_tmp"
+    id_study_tmp: Study id, see "study.id_study_tmp"
+    experiment_name: The name of the experiment, eg. The lims generated run id
+    instrument_name: The name of the instrument on which the sample was run
+    instrument_slot: The numeric identifier of the slot on which the sample was run
+    id_lims: LIM system identifier
+    pipeline_id_lims: LIMs-specific pipeline identifier that unambiguously defines library type
+    requested_data_type: The type of data produced by sequencing, eg. basecalls only
+    deleted_at: Timestamp of any flowcell destruction
+    tag_identifier: Position of the first tag within the tag group
+    tag_sequence: Sequence of the first tag
+    tag_set_id_lims: LIMs-specific identifier of the tag set for the first tag
+    tag_set_name: WTSI-wide tag set name for the first tag
+    tag2_identifier: Position of the second tag within the tag group
+    tag2_sequence: Sequence of the second tag
+    tag2_set_id_lims: LIMs-specific identifier of the tag set for the second tag
+    tag2_set_name: WTSI-wide tag set name for the second tag
+    """
+
+    __tablename__ = 'oseq_flowcell'
+
+    id_oseq_flowcell_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True)
+    id_flowcell_lims = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='LIMs-specific flowcell id', doc='LIMs-specific flowcell id')
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last update', doc='Timestamp of last update')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update', doc='Timestamp of warehouse update')
+    id_sample_tmp = Column(ForeignKey('sample.id_sample_tmp'), nullable=False, index=True, comment='Sample id, see "sample.id_sample_tmp"', doc='Sample id, see "sample.id_sample_tmp"')
+    id_study_tmp = Column(ForeignKey('study.id_study_tmp'), nullable=False, index=True, comment='Study id, see "study.id_study_tmp"', doc='Study id, see "study.id_study_tmp"')
+    experiment_name = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The name of the experiment, eg. The lims generated run id', doc='The name of the experiment, eg. The lims generated run id')
+    instrument_name = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The name of the instrument on which the sample was run', doc='The name of the instrument on which the sample was run')
+    instrument_slot = Column(mysqlINTEGER(11), nullable=False, comment='The numeric identifier of the slot on which the sample was run', doc='The numeric identifier of the slot on which the sample was run')
+    id_lims = Column(String(10, 'utf8_unicode_ci'), nullable=False, comment='LIM system identifier', doc='LIM system identifier')
+    pipeline_id_lims = Column(String(255, 'utf8_unicode_ci'), comment='LIMs-specific pipeline identifier that unambiguously defines library type', doc='LIMs-specific pipeline identifier that unambiguously defines library type')
+    requested_data_type = Column(String(255, 'utf8_unicode_ci'), comment='The type of data produced by sequencing, eg. basecalls only', doc='The type of data produced by sequencing, eg. basecalls only')
+    deleted_at = Column(DateTime, comment='Timestamp of any flowcell destruction', doc='Timestamp of any flowcell destruction')
+    tag_identifier = Column(String(255, 'utf8_unicode_ci'), comment='Position of the first tag within the tag group', doc='Position of the first tag within the tag group')
+    tag_sequence = Column(String(255, 'utf8_unicode_ci'), comment='Sequence of the first tag', doc='Sequence of the first tag')
+    tag_set_id_lims = Column(String(255, 'utf8_unicode_ci'), comment='LIMs-specific identifier of the tag set for the first tag', doc='LIMs-specific identifier of the tag set for the first tag')
+    tag_set_name = Column(String(255, 'utf8_unicode_ci'), comment='WTSI-wide tag set name for the first tag', doc='WTSI-wide tag set name for the first tag')
+    tag2_identifier = Column(String(255, 'utf8_unicode_ci'), comment='Position of the second tag within the tag group', doc='Position of the second tag within the tag group')
+    tag2_sequence = Column(String(255, 'utf8_unicode_ci'), comment='Sequence of the second tag', doc='Sequence of the second tag')
+    tag2_set_id_lims = Column(String(255, 'utf8_unicode_ci'), comment='LIMs-specific identifier of the tag set for the second tag', doc='LIMs-specific identifier of the tag set for the second tag')
+    tag2_set_name = Column(String(255, 'utf8_unicode_ci'), comment='WTSI-wide tag set name for the second tag', doc='WTSI-wide tag set name for the second tag')
+
+    sample = relationship('Sample', back_populates='oseq_flowcell')
+    study = relationship('Study', back_populates='oseq_flowcell')
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, ForeignKey
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class PacBioProductMetrics(Base):
+    """Constructs a new PacBioProductMetrics.
+
+    Parameters
+    ----------
+    id_pac_bio_pr_metrics_tmp
+    id_pac_bio_rw_metrics_tmp: PacBio run well metrics id, see "pac_bio_run_well_metrics.id_pac_bio_rw_metrics_tmp"
+    id_pac_bio_tmp: PacBio run id, see "pac_bio_run.id_pac_bio_tmp"
+    """
+
+    __tablename__ = 'pac_bio_product_metrics'
+    __table_args__ = {'comment': 'A linking table for the pac_bio_run and pac_bio_run_well_metrics '
+                'tables with a potential for adding per-product QC data'}
+
+    id_pac_bio_pr_metrics_tmp = Column(mysqlINTEGER(11), primary_key=True)
+    id_pac_bio_rw_metrics_tmp = Column(ForeignKey('pac_bio_run_well_metrics.id_pac_bio_rw_metrics_tmp', ondelete='CASCADE'), nullable=False, index=True, comment='PacBio run well metrics id, see "pac_bio_run_well_metrics.id_pac_bio_rw_metrics_tmp"', doc='PacBio run well metrics id, see "pac_bio_run_well_metrics.id_pac_bio_rw_metrics_tmp"')
+    id_pac_bio_tmp = Column(ForeignKey('pac_bio_run.id_pac_bio_tmp', ondelete='SET NULL'), index=True, comment='PacBio run id, see "pac_bio_run.id_pac_bio_tmp"', doc='PacBio run id, see "pac_bio_run.id_pac_bio_tmp"')
+
+    pac_bio_run_well_metrics = relationship('PacBioRunWellMetrics', back_populates='pac_bio_product_metrics')
+    pac_bio_run = relationship('PacBioRun', back_populates='pac_bio_product_metrics')
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, Computed, DateTime, ForeignKey, Index, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class PacBioRun(Base):
+    """Constructs a new PacBioRun.
+
+    Parameters
+    ----------
+    id_pac_bio_tmp
+    last_updated: Timestamp of last update
+    recorded_at: Timestamp of warehouse update
+    id_sample_tmp: Sample id, see "sample.id_sample_tmp"
+    id_study_tmp: Sample id, see "study.id_study_tmp"
+    id_pac_bio_run_lims: Lims specific identifier for the pacbio run
+    cost_code: Valid WTSI cost-code
+    id_lims: LIM system identifier
+    plate_barcode: The human readable barcode for the plate loaded onto the machine
+    plate_uuid_lims: The plate uuid
+    well_label: The well identifier for the plate, A1-H12
+    well_uuid_lims: The well uuid
+    pac_bio_library_tube_id_lims: LIMS specific identifier for originating library tube
+    pac_bio_library_tube_uuid: The uuid for the originating library tube
+    pac_bio_library_tube_name: The name of the originating library tube
+    pac_bio_run_uuid: Uuid identifier for the pacbio run
+    tag_identifier: Tag index within tag set, NULL if untagged
+    tag_sequence: Tag sequence for tag
+    tag_set_id_lims: LIMs-specific identifier of the tag set for tag
+    tag_set_name: WTSI-wide tag set name for tag
+    tag2_sequence
+    tag2_set_id_lims
+    tag2_set_name
+    tag2_identifier
+    pac_bio_library_tube_legacy_id: Legacy library_id for backwards compatibility.
+    library_created_at: Timestamp of library creation
+    pac_bio_run_name: Name of the run
+    pipeline_id_lims: LIMS-specific pipeline identifier that unambiguously defines library type (eg. Sequel-v1, IsoSeq-v1)
+    comparable_tag_identifier
+    comparable_tag2_identifier
+    """
+
+    __tablename__ = 'pac_bio_run'
+    __table_args__ = (
+        Index('unique_pac_bio_entry', 'id_lims', 'id_pac_bio_run_lims', 'well_label', 'comparable_tag_identifier', 'comparable_tag2_identifier', unique=True),
+    )
+
+    id_pac_bio_tmp = Column(mysqlINTEGER(11), primary_key=True)
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last update', doc='Timestamp of last update')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update', doc='Timestamp of warehouse update')
+    id_sample_tmp = Column(ForeignKey('sample.id_sample_tmp'), nullable=False, index=True, comment='Sample id, see "sample.id_sample_tmp"', doc='Sample id, see "sample.id_sample_tmp"')
+    id_study_tmp = Column(ForeignKey('study.id_study_tmp'), nullable=False, index=True, comment='Sample id, see "study.id_study_tmp"', doc='Sample id, see "study.id_study_tmp"')
+    id_pac_bio_run_lims = Column(String(20, 'utf8_unicode_ci'), nullable=False, comment='Lims specific identifier for the pacbio run', doc='Lims specific identifier for the pacbio run')
+    cost_code = Column(String(20, 'utf8_unicode_ci'), nullable=False, comment='Valid WTSI cost-code', doc='Valid WTSI cost-code')
+    id_lims = Column(String(10, 'utf8_unicode_ci'), nullable=False, comment='LIM system identifier', doc='LIM system identifier')
+    plate_barcode = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The human readable barcode for the plate loaded onto the machine', doc='The human readable barcode for the plate loaded onto the machine')
+    plate_uuid_lims = Column(String(36, 'utf8_unicode_ci'), nullable=False, comment='The plate uuid', doc='The plate uuid')
+    well_label = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The well identifier for the plate, A1-H12', doc='The well identifier for the plate, A1-H12')
+    well_uuid_lims = Column(String(36, 'utf8_unicode_ci'), nullable=False, comment='The well uuid', doc='The well uuid')
+    pac_bio_library_tube_id_lims = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='LIMS specific identifier for originating library tube', doc='LIMS specific identifier for originating library tube')
+    pac_bio_library_tube_uuid = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The uuid for the originating library tube', doc='The uuid for the originating library tube')
+    pac_bio_library_tube_name = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The name of the originating library tube', doc='The name of the originating library tube')
+    pac_bio_run_uuid = Column(String(36, 'utf8_unicode_ci'), comment='Uuid identifier for the pacbio run', doc='Uuid identifier for the pacbio run')
+    tag_identifier = Column(String(30, 'utf8_unicode_ci'), comment='Tag index within tag set, NULL if untagged', doc='Tag index within tag set, NULL if untagged')
+    tag_sequence = Column(String(30, 'utf8_unicode_ci'), comment='Tag sequence for tag', doc='Tag sequence for tag')
+    tag_set_id_lims = Column(String(20, 'utf8_unicode_ci'), comment='LIMs-specific identifier of the tag set for tag', doc='LIMs-specific identifier of the tag set for tag')
+    tag_set_name = Column(String(100, 'utf8_unicode_ci'), comment='WTSI-wide tag set name for tag', doc='WTSI-wide tag set name for tag')
+    tag2_sequence = Column(String(30, 'utf8_unicode_ci'))
+    tag2_set_id_lims = Column(String(20, 'utf8_unicode_ci'))
+    tag2_set_name = Column(String(100, 'utf8_unicode_ci'))
+    tag2_identifier = Column(String(30, 'utf8_unicode_ci'))
+    pac_bio_library_tube_legacy_id = Column(mysqlINTEGER(11), comment='Legacy library_id for backwards compatibility.', doc='Legacy library_id for backwards compatibility.')
+    library_created_at = Column(DateTime, comment='Timestamp of library creation', doc='Timestamp of library creation')
+    pac_bio_run_name = Column(String(255, 'utf8_unicode_ci'), comment='Name of the run', doc='Name of the run')
+    pipeline_id_lims = Column(String(60, 'utf8_unicode_ci'), comment='LIMS-specific pipeline identifier that unambiguously defines library type (eg. Sequel-v1, IsoSeq-v1)', doc='LIMS-specific pipeline identifier that unambiguously defines library type (eg. Sequel-v1, IsoSeq-v1)')
+    comparable_tag_identifier = Column(String(255, 'utf8_unicode_ci'), Computed('(ifnull(`tag_identifier`,-(1)))', persisted=False))
+    comparable_tag2_identifier = Column(String(255, 'utf8_unicode_ci'), Computed('(ifnull(`tag2_identifier`,-(1)))', persisted=False))
+
+    sample = relationship('Sample', back_populates='pac_bio_run')
+    study = relationship('Study', back_populates='pac_bio_run')
+    pac_bio_product_metrics = relationship('PacBioProductMetrics', back_populates='pac_bio_run')
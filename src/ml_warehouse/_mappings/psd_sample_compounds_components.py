@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime
+from sqlalchemy.dialects.mysql import BIGINT as mysqlBIGINT, INTEGER as mysqlINTEGER
+
+
+@add_docstring
+class PsdSampleCompoundsComponents(Base):
+    """Constructs a new PsdSampleCompoundsComponents.
+
+    Parameters
+    ----------
+    id
+    compound_id_sample_tmp: The warehouse ID of the compound sample in the association.
+    component_id_sample_tmp: The warehouse ID of the component sample in the association.
+    last_updated: Timestamp of last update.
+    recorded_at: Timestamp of warehouse update.
+    """
+
+    __tablename__ = 'psd_sample_compounds_components'
+    __table_args__ = {'comment': 'A join table owned by PSD to associate compound samples with '
+                'their component samples.'}
+
+    id = Column(mysqlBIGINT(20), primary_key=True)
+    compound_id_sample_tmp = Column(mysqlINTEGER(11), nullable=False, comment='The warehouse ID of the compound sample in the association.', doc='The warehouse ID of the compound sample in the association.')
+    component_id_sample_tmp = Column(mysqlINTEGER(11), nullable=False, comment='The warehouse ID of the component sample in the association.', doc='The warehouse ID of the component sample in the association.')
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last update.', doc='Timestamp of last update.')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update.', doc='Timestamp of warehouse update.')
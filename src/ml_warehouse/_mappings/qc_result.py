@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class QcResult(Base):
+    """Constructs a new QcResult.
+
+    Parameters
+    ----------
+    id_qc_result_tmp
+    id_sample_tmp
+    id_qc_result_lims: LIMS-specific qc_result identifier
+    id_lims: LIMS system identifier (e.g. SEQUENCESCAPE)
+    value: Value of the mesurement
+    units: Mesurement unit
+    qc_type: Type of mesurement
+    date_created: The date the qc_result was first created in SS
+    last_updated: The date the qc_result was last updated in SS
+    recorded_at: Timestamp of warehouse update
+    id_pool_lims: Most specific LIMs identifier associated with the pool. (Asset external_identifier in SS)
+    id_library_lims: Earliest LIMs identifier associated with library creation. (Aliquot external_identifier in SS)
+    labware_purpose: Labware Purpose name. (e.g. Plate Purpose for a Well)
+    assay: assay type and version
+    cv: Coefficient of variance
+    """
+
+    __tablename__ = 'qc_result'
+    __table_args__ = (
+        Index('lookup_index', 'id_qc_result_lims', 'id_lims'),
+    )
+
+    id_qc_result_tmp = Column(mysqlINTEGER(11), primary_key=True)
+    id_sample_tmp = Column(ForeignKey('sample.id_sample_tmp'), nullable=False, index=True)
+    id_qc_result_lims = Column(String(20), nullable=False, comment='LIMS-specific qc_result identifier', doc='LIMS-specific qc_result identifier')
+    id_lims = Column(String(10), nullable=False, comment='LIMS system identifier (e.g. SEQUENCESCAPE)', doc='LIMS system identifier (e.g. SEQUENCESCAPE)')
+    value = Column(String(255), nullable=False, comment='Value of the mesurement', doc='Value of the mesurement')
+    units = Column(String(255), nullable=False, comment='Mesurement unit', doc='Mesurement unit')
+    qc_type = Column(String(255), nullable=False, comment='Type of mesurement', doc='Type of mesurement')
+    date_created = Column(DateTime, nullable=False, comment='The date the qc_result was first created in SS', doc='The date the qc_result was first created in SS')
+    last_updated = Column(DateTime, nullable=False, comment='The date the qc_result was last updated in SS', doc='The date the qc_result was last updated in SS')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update', doc='Timestamp of warehouse update')
+    id_pool_lims = Column(String(255), comment='Most specific LIMs identifier associated with the pool. (Asset external_identifier in SS)', doc='Most specific LIMs identifier associated with the pool. (Asset external_identifier in SS)')
+    id_library_lims = Column(String(255), index=True, comment='Earliest LIMs identifier associated with library creation. (Aliquot external_identifier in SS)', doc='Earliest LIMs identifier associated with library creation. (Aliquot external_identifier in SS)')
+    labware_purpose = Column(String(255), comment='Labware Purpose name. (e.g. Plate Purpose for a Well)', doc='Labware Purpose name. (e.g. Plate Purpose for a Well)')
+    assay = Column(String(255), comment='assay type and version', doc='assay type and version')
+    cv = Column(Float, comment='Coefficient of variance', doc='Coefficient of variance')
+
+    sample = relationship('Sample', back_populates='qc_result')
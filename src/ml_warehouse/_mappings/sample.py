@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, Index, String, Text, text
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER, TINYINT as mysqlTINYINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class Sample(Base):
+    """Constructs a new Sample.
+
+    Parameters
+    ----------
+    id_sample_tmp: Internal to this database id, value can change
+    id_lims: LIM system identifier, e.g. CLARITY-GCLP, SEQSCAPE
+    id_sample_lims: LIMS-specific sample identifier
+    last_updated: Timestamp of last update
+    recorded_at: Timestamp of warehouse update
+    consent_withdrawn
+    uuid_sample_lims: LIMS-specific sample uuid
+    deleted_at: Timestamp of sample deletion
+    created: Timestamp of sample creation
+    name
+    reference_genome
+    organism
+    accession_number
+    common_name
+    description
+    taxon_id
+    father
+    mother
+    replicate
+    ethnicity
+    gender
+    cohort
+    country_of_origin
+    geographical_region
+    sanger_sample_id
+    control
+    supplier_name
+    public_name
+    sample_visibility
+    strain
+    donor_id
+    phenotype: The phenotype of the sample as described in Sequencescape
+    developmental_stage: Developmental Stage
+    control_type
+    sibling
+    is_resubmitted
+    date_of_sample_collection
+    date_of_sample_extraction
+    extraction_method
+    purified
+    purification_method
+    customer_measured_concentration
+    concentration_determined_by
+    sample_type
+    storage_conditions
+    genotype
+    age
+    cell_type
+    disease_state
+    compound
+    dose
+    immunoprecipitate
+    growth_condition
+    organism_part
+    time_point
+    disease
+    subject
+    treatment
+    date_of_consent_withdrawn
+    marked_as_consent_withdrawn_by
+    customer_measured_volume
+    gc_content
+    dna_source
+    """
+
+    __tablename__ = 'sample'
+    __table_args__ = (
+        Index('index_sample_on_id_sample_lims_and_id_lims', 'id_sample_lims', 'id_lims', unique=True),
+    )
+
+    id_sample_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    id_lims = Column(String(10, 'utf8_unicode_ci'), nullable=False, comment='LIM system identifier, e.g. CLARITY-GCLP, SEQSCAPE', doc='LIM system identifier, e.g. CLARITY-GCLP, SEQSCAPE')
+    id_sample_lims = Column(String(20, 'utf8_unicode_ci'), nullable=False, comment='LIMS-specific sample identifier', doc='LIMS-specific sample identifier')
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last update', doc='Timestamp of last update')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update', doc='Timestamp of warehouse update')
+    consent_withdrawn = Column(mysqlTINYINT(1), nullable=False, server_default=text("'0'"))
+    uuid_sample_lims = Column(String(36, 'utf8_unicode_ci'), unique=True, comment='LIMS-specific sample uuid', doc='LIMS-specific sample uuid')
+    deleted_at = Column(DateTime, comment='Timestamp of sample deletion', doc='Timestamp of sample deletion')
+    created = Column(DateTime, comment='Timestamp of sample creation', doc='Timestamp of sample creation')
+    name = Column(String(255, 'utf8_unicode_ci'), index=True)
+    reference_genome = Column(String(255, 'utf8_unicode_ci'))
+    organism = Column(String(255, 'utf8_unicode_ci'))
+    accession_number = Column(String(50, 'utf8_unicode_ci'), index=True)
+    common_name = Column(String(255, 'utf8_unicode_ci'))
+    description = Column(Text(collation='utf8_unicode_ci'))
+    taxon_id = Column(mysqlINTEGER(6, unsigned=True))
+    father = Column(String(255, 'utf8_unicode_ci'))
+    mother = Column(String(255, 'utf8_unicode_ci'))
+    replicate = Column(String(255, 'utf8_unicode_ci'))
+    ethnicity = Column(String(255, 'utf8_unicode_ci'))
+    gender = Column(String(20, 'utf8_unicode_ci'))
+    cohort = Column(String(255, 'utf8_unicode_ci'))
+    country_of_origin = Column(String(255, 'utf8_unicode_ci'))
+    geographical_region = Column(String(255, 'utf8_unicode_ci'))
+    sanger_sample_id = Column(String(255, 'utf8_unicode_ci'), index=True)
+    control = Column(mysqlTINYINT(1))
+    supplier_name = Column(String(255, 'utf8_unicode_ci'), index=True)
+    public_name = Column(String(255, 'utf8_unicode_ci'))
+    sample_visibility = Column(String(255, 'utf8_unicode_ci'))
+    strain = Column(String(255, 'utf8_unicode_ci'))
+    donor_id = Column(String(255, 'utf8_unicode_ci'))
+    phenotype = Column(String(255, 'utf8_unicode_ci'), comment='The phenotype of the sample as described in Sequencescape', doc='The phenotype of the sample as described in Sequencescape')
+    developmental_stage = Column(String(255, 'utf8_unicode_ci'), comment='Developmental Stage', doc='Developmental Stage')
+    control_type = Column(String(255, 'utf8_unicode_ci'))
+    sibling = Column(String(255, 'utf8_unicode_ci'))
+    is_resubmitted = Column(mysqlTINYINT(1))
+    date_of_sample_collection = Column(String(255, 'utf8_unicode_ci'))
+    date_of_sample_extraction = Column(String(255, 'utf8_unicode_ci'))
+    extraction_method = Column(String(255, 'utf8_unicode_ci'))
+    purified = Column(String(255, 'utf8_unicode_ci'))
+    purification_method = Column(String(255, 'utf8_unicode_ci'))
+    customer_measured_concentration = Column(String(255, 'utf8_unicode_ci'))
+    concentration_determined_by = Column(String(255, 'utf8_unicode_ci'))
+    sample_type = Column(String(255, 'utf8_unicode_ci'))
+    storage_conditions = Column(String(255, 'utf8_unicode_ci'))
+    genotype = Column(String(255, 'utf8_unicode_ci'))
+    age = Column(String(255, 'utf8_unicode_ci'))
+    cell_type = Column(String(255, 'utf8_unicode_ci'))
+    disease_state = Column(String(255, 'utf8_unicode_ci'))
+    compound = Column(String(255, 'utf8_unicode_ci'))
+    dose = Column(String(255, 'utf8_unicode_ci'))
+    immunoprecipitate = Column(String(255, 'utf8_unicode_ci'))
+    growth_condition = Column(String(255, 'utf8_unicode_ci'))
+    organism_part = Column(String(255, 'utf8_unicode_ci'))
+    time_point = Column(String(255, 'utf8_unicode_ci'))
+    disease = Column(String(255, 'utf8_unicode_ci'))
+    subject = Column(String(255, 'utf8_unicode_ci'))
+    treatment = Column(String(255, 'utf8_unicode_ci'))
+    date_of_consent_withdrawn = Column(DateTime)
+    marked_as_consent_withdrawn_by = Column(String(255, 'utf8_unicode_ci'))
+    customer_measured_volume = Column(String(255, 'utf8_unicode_ci'))
+    gc_content = Column(String(255, 'utf8_unicode_ci'))
+    dna_source = Column(String(255, 'utf8_unicode_ci'))
+
+    bmap_flowcell = relationship('BmapFlowcell', back_populates='sample')
+    flgen_plate = relationship('FlgenPlate', back_populates='sample')
+    iseq_flowcell = relationship('IseqFlowcell', back_populates='sample')
+    oseq_flowcell = relationship('OseqFlowcell', back_populates='sample')
+    pac_bio_run = relationship('PacBioRun', back_populates='sample')
+    qc_result = relationship('QcResult', back_populates='sample')
+    samples_extraction_activity = relationship('SamplesExtractionActivity', back_populates='sample')
+    stock_resource = relationship('StockResource', back_populates='sample')
+    tol_sample_bioproject = relationship('TolSampleBioproject', back_populates='sample')
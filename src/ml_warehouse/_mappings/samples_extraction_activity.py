@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class SamplesExtractionActivity(Base):
+    """Constructs a new SamplesExtractionActivity.
+
+    Parameters
+    ----------
+    id_activity_tmp
+    id_activity_lims: LIMs-specific activity id
+    id_sample_tmp: Sample id, see "sample.id_sample_tmp"
+    activity_type: The type of the activity performed
+    instrument: The name of the instrument used to perform the activity
+    kit_barcode: The barcode of the kit used to perform the activity
+    kit_type: The type of kit used to perform the activity
+    input_barcode: The barcode of the labware (eg. plate or tube) at the begining of the activity
+    output_barcode: The barcode of the labware (eg. plate or tube)  at the end of the activity
+    user: The name of the user who was most recently associated with the activity
+    last_updated: Timestamp of last change to activity
+    recorded_at: Timestamp of warehouse update
+    completed_at: Timestamp of activity completion
+    id_lims: LIM system identifier
+    deleted_at: Timestamp of any activity removal
+    """
+
+    __tablename__ = 'samples_extraction_activity'
+
+    id_activity_tmp = Column(mysqlINTEGER(11), primary_key=True)
+    id_activity_lims = Column(String(255, 'utf8_unicode_ci'), nullable=False, index=True, comment='LIMs-specific activity id', doc='LIMs-specific activity id')
+    id_sample_tmp = Column(ForeignKey('sample.id_sample_tmp'), nullable=False, index=True, comment='Sample id, see "sample.id_sample_tmp"', doc='Sample id, see "sample.id_sample_tmp"')
+    activity_type = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The type of the activity performed', doc='The type of the activity performed')
+    instrument = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The name of the instrument used to perform the activity', doc='The name of the instrument used to perform the activity')
+    kit_barcode = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The barcode of the kit used to perform the activity', doc='The barcode of the kit used to perform the activity')
+    kit_type = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The type of kit used to perform the activity', doc='The type of kit used to perform the activity')
+    input_barcode = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The barcode of the labware (eg. plate or tube) at the begining of the activity', doc='The barcode of the labware (eg. plate or tube) at the begining of the activity')
+    output_barcode = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The barcode of the labware (eg. plate or tube)  at the end of the activity', doc='The barcode of the labware (eg. plate or tube)  at the end of the activity')
+    user = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The name of the user who was most recently associated with the activity', doc='The name of the user who was most recently associated with the activity')
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last change to activity', doc='Timestamp of last change to activity')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update', doc='Timestamp of warehouse update')
+    completed_at = Column(DateTime, nullable=False, comment='Timestamp of activity completion', doc='Timestamp of activity completion')
+    id_lims = Column(String(10, 'utf8_unicode_ci'), nullable=False, comment='LIM system identifier', doc='LIM system identifier')
+    deleted_at = Column(DateTime, comment='Timestamp of any activity removal', doc='Timestamp of any activity removal')
+
+    sample = relationship('Sample', back_populates='samples_extraction_activity')
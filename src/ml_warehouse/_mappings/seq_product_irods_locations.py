@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, Enum, Index, String, text
+from sqlalchemy.dialects.mysql import BIGINT as mysqlBIGINT, VARCHAR as mysqlVARCHAR
+
+
+@add_docstring
+class SeqProductIrodsLocations(Base):
+    """Constructs a new SeqProductIrodsLocations.
+
+    Parameters
+    ----------
+    id_seq_product_irods_locations_tmp: Internal to this database id, value can change
+    id_product: A sequencing platform specific product id. For Illumina, data corresponds to the id_iseq_product column in the iseq_product_metrics table
+    seq_platform_name: Name of the sequencing platform used to produce raw data
+    pipeline_name: The name of the pipeline used to produce the data, values are: npg-prod, npg-prod-alt-process, cellranger, spaceranger, ncov2019-artic-nf
+    irods_root_collection: Path to the product root collection in iRODS
+    created: Datetime this record was created
+    last_changed: Datetime this record was created or changed
+    irods_data_relative_path: The path, relative to the root collection, to the most used data location
+    irods_secondary_data_relative_path: The path, relative to the root collection, to a useful data location
+    """
+
+    __tablename__ = 'seq_product_irods_locations'
+    __table_args__ = (
+        Index('pi_root_product', 'irods_root_collection', 'id_product', unique=True),
+        {'comment': 'Table relating products to their irods locations'}
+    )
+
+    id_seq_product_irods_locations_tmp = Column(mysqlBIGINT(20, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    id_product = Column(mysqlVARCHAR(64, charset='utf8', collation='utf8_unicode_ci'), nullable=False, index=True, comment='A sequencing platform specific product id. For Illumina, data corresponds to the id_iseq_product column in the iseq_product_metrics table', doc='A sequencing platform specific product id. For Illumina, data corresponds to the id_iseq_product column in the iseq_product_metrics table')
+    seq_platform_name = Column(Enum('Illumina', 'PacBio', 'ONT'), nullable=False, index=True, comment='Name of the sequencing platform used to produce raw data', doc='Name of the sequencing platform used to produce raw data')
+    pipeline_name = Column(String(32), nullable=False, index=True, comment='The name of the pipeline used to produce the data, values are: npg-prod, npg-prod-alt-process, cellranger, spaceranger, ncov2019-artic-nf', doc='The name of the pipeline used to produce the data, values are: npg-prod, npg-prod-alt-process, cellranger, spaceranger, ncov2019-artic-nf')
+    irods_root_collection = Column(String(255), nullable=False, comment='Path to the product root collection in iRODS', doc='Path to the product root collection in iRODS')
+    created = Column(DateTime, server_default=text('CURRENT_TIMESTAMP'), comment='Datetime this record was created', doc='Datetime this record was created')
+    last_changed = Column(DateTime, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='Datetime this record was created or changed', doc='Datetime this record was created or changed')
+    irods_data_relative_path = Column(String(255), comment='The path, relative to the root collection, to the most used data location', doc='The path, relative to the root collection, to the most used data location')
+    irods_secondary_data_relative_path = Column(String(255), comment='The path, relative to the root collection, to a useful data location', doc='The path, relative to the root collection, to a useful data location')
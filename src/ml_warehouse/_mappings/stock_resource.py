@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class StockResource(Base):
+    """Constructs a new StockResource.
+
+    Parameters
+    ----------
+    id_stock_resource_tmp
+    last_updated: Timestamp of last update
+    recorded_at: Timestamp of warehouse update
+    created: Timestamp of initial registration of stock in LIMS
+    id_sample_tmp: Sample id, see "sample.id_sample_tmp"
+    id_study_tmp: Sample id, see "study.id_study_tmp"
+    id_lims: LIM system identifier
+    id_stock_resource_lims: Lims specific identifier for the stock
+    labware_type: The type of labware containing the stock. eg. Well, Tube
+    labware_machine_barcode: The barcode of the containing labware as read by a barcode scanner
+    labware_human_barcode: The barcode of the containing labware in human readable format
+    deleted_at: Timestamp of initial registration of deletion in parent LIMS. NULL if not deleted.
+    stock_resource_uuid: Uuid identifier for the stock
+    labware_coordinate: For wells, the coordinate on the containing plate. Null for tubes.
+    current_volume: The current volume of material in microlitres based on measurements and know usage
+    initial_volume: The result of the initial volume measurement in microlitres conducted on the material
+    concentration: The concentration of material recorded in the lab in nanograms per microlitre
+    gel_pass: The recorded result for the qel QC assay.
+    pico_pass: The recorded result for the pico green assay. A pass indicates a successful assay, not sufficient material.
+    snp_count: The number of markers detected in genotyping assays
+    measured_gender: The gender call base on the genotyping assay
+    """
+
+    __tablename__ = 'stock_resource'
+    __table_args__ = (
+        Index('composition_lookup_index', 'id_stock_resource_lims', 'id_sample_tmp', 'id_lims'),
+    )
+
+    id_stock_resource_tmp = Column(mysqlINTEGER(11), primary_key=True)
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last update', doc='Timestamp of last update')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update', doc='Timestamp of warehouse update')
+    created = Column(DateTime, nullable=False, comment='Timestamp of initial registration of stock in LIMS', doc='Timestamp of initial registration of stock in LIMS')
+    id_sample_tmp = Column(ForeignKey('sample.id_sample_tmp'), nullable=False, index=True, comment='Sample id, see "sample.id_sample_tmp"', doc='Sample id, see "sample.id_sample_tmp"')
+    id_study_tmp = Column(ForeignKey('study.id_study_tmp'), nullable=False, index=True, comment='Sample id, see "study.id_study_tmp"', doc='Sample id, see "study.id_study_tmp"')
+    id_lims = Column(String(10, 'utf8_unicode_ci'), nullable=False, comment='LIM system identifier', doc='LIM system identifier')
+    id_stock_resource_lims = Column(String(20, 'utf8_unicode_ci'), nullable=False, comment='Lims specific identifier for the stock', doc='Lims specific identifier for the stock')
+    labware_type = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The type of labware containing the stock. eg. Well, Tube', doc='The type of labware containing the stock. eg. Well, Tube')
+    labware_machine_barcode = Column(String(255, 'utf8_unicode_ci'), nullable=False, comment='The barcode of the containing labware as read by a barcode scanner', doc='The barcode of the containing labware as read by a barcode scanner')
+    labware_human_barcode = Column(String(255, 'utf8_unicode_ci'), nullable=False, index=True, comment='The barcode of the containing labware in human readable format', doc='The barcode of the containing labware in human readable format')
+    deleted_at = Column(DateTime, comment='Timestamp of initial registration of deletion in parent LIMS. NULL if not deleted.', doc='Timestamp of initial registration of deletion in parent LIMS. NULL if not deleted.')
+    stock_resource_uuid = Column(String(36, 'utf8_unicode_ci'), comment='Uuid identifier for the stock', doc='Uuid identifier for the stock')
+    labware_coordinate = Column(String(255, 'utf8_unicode_ci'), comment='For wells, the coordinate on the containing plate. Null for tubes.', doc='For wells, the coordinate on the containing plate. Null for tubes.')
+    current_volume = Column(Float, comment='The current volume of material in microlitres based on measurements and know usage', doc='The current volume of material in microlitres based on measurements and know usage')
+    initial_volume = Column(Float, comment='The result of the initial volume measurement in microlitres conducted on the material', doc='The result of the initial volume measurement in microlitres conducted on the material')
+    concentration = Column(Float, comment='The concentration of material recorded in the lab in nanograms per microlitre', doc='The concentration of material recorded in the lab in nanograms per microlitre')
+    gel_pass = Column(String(255, 'utf8_unicode_ci'), comment='The recorded result for the qel QC assay.', doc='The recorded result for the qel QC assay.')
+    pico_pass = Column(String(255, 'utf8_unicode_ci'), comment='The recorded result for the pico green assay. A pass indicates a successful assay, not sufficient material.', doc='The recorded result for the pico green assay. A pass indicates a successful assay, not sufficient material.')
+    snp_count = Column(mysqlINTEGER(11), comment='The number of markers detected in genotyping assays', doc='The number of markers detected in genotyping assays')
+    measured_gender = Column(String(255, 'utf8_unicode_ci'), comment='The gender call base on the genotyping assay', doc='The gender call base on the genotyping assay')
+
+    sample = relationship('Sample', back_populates='stock_resource')
+    study = relationship('Study', back_populates='stock_resource')
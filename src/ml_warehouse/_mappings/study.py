@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, Index, String, Text, text
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER, TINYINT as mysqlTINYINT
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class Study(Base):
+    """Constructs a new Study.
+
+    Parameters
+    ----------
+    id_study_tmp: Internal to this database id, value can change
+    id_lims: LIM system identifier, e.g. GCLP-CLARITY, SEQSCAPE
+    id_study_lims: LIMS-specific study identifier
+    last_updated: Timestamp of last update
+    recorded_at: Timestamp of warehouse update
+    remove_x_and_autosomes
+    aligned
+    separate_y_chromosome_data
+    uuid_study_lims: LIMS-specific study uuid
+    deleted_at: Timestamp of study deletion
+    created: Timestamp of study creation
+    name
+    reference_genome
+    ethically_approved
+    faculty_sponsor
+    state
+    study_type
+    abstract
+    abbreviation
+    accession_number
+    description
+    contains_human_dna: Lane may contain human DNA
+    contaminated_human_dna: Human DNA in the lane is a contaminant and should be removed
+    data_release_strategy
+    data_release_sort_of_study
+    ena_project_id
+    study_title
+    study_visibility
+    ega_dac_accession_number
+    array_express_accession_number
+    ega_policy_accession_number
+    data_release_timing
+    data_release_delay_period
+    data_release_delay_reason
+    data_access_group
+    prelim_id: The preliminary study id prior to entry into the LIMS
+    hmdmc_number: The Human Materials and Data Management Committee approval number(s) for the study.
+    data_destination: The data destination type(s) for the study. It could be 'standard', '14mg' or 'gseq'. This may be extended, if Sanger gains more external customers. It can contain multiply destinations separated by a space.
+    s3_email_list
+    data_deletion_period
+    """
+
+    __tablename__ = 'study'
+    __table_args__ = (
+        Index('study_id_lims_id_study_lims_index', 'id_lims', 'id_study_lims', unique=True),
+    )
+
+    id_study_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    id_lims = Column(String(10, 'utf8_unicode_ci'), nullable=False, comment='LIM system identifier, e.g. GCLP-CLARITY, SEQSCAPE', doc='LIM system identifier, e.g. GCLP-CLARITY, SEQSCAPE')
+    id_study_lims = Column(String(20, 'utf8_unicode_ci'), nullable=False, comment='LIMS-specific study identifier', doc='LIMS-specific study identifier')
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last update', doc='Timestamp of last update')
+    recorded_at = Column(DateTime, nullable=False, comment='Timestamp of warehouse update', doc='Timestamp of warehouse update')
+    remove_x_and_autosomes = Column(mysqlTINYINT(1), nullable=False, server_default=text("'0'"))
+    aligned = Column(mysqlTINYINT(1), nullable=False, server_default=text("'1'"))
+    separate_y_chromosome_data = Column(mysqlTINYINT(1), nullable=False, server_default=text("'0'"))
+    uuid_study_lims = Column(String(36, 'utf8_unicode_ci'), unique=True, comment='LIMS-specific study uuid', doc='LIMS-specific study uuid')
+    deleted_at = Column(DateTime, comment='Timestamp of study deletion', doc='Timestamp of study deletion')
+    created = Column(DateTime, comment='Timestamp of study creation', doc='Timestamp of study creation')
+    name = Column(String(255, 'utf8_unicode_ci'), index=True)
+    reference_genome = Column(String(255, 'utf8_unicode_ci'))
+    ethically_approved = Column(mysqlTINYINT(1))
+    faculty_sponsor = Column(String(255, 'utf8_unicode_ci'))
+    state = Column(String(50, 'utf8_unicode_ci'))
+    study_type = Column(String(50, 'utf8_unicode_ci'))
+    abstract = Column(Text(collation='utf8_unicode_ci'))
+    abbreviation = Column(String(255, 'utf8_unicode_ci'))
+    accession_number = Column(String(50, 'utf8_unicode_ci'), index=True)
+    description = Column(Text(collation='utf8_unicode_ci'))
+    contains_human_dna = Column(mysqlTINYINT(1), comment='Lane may contain human DNA', doc='Lane may contain human DNA')
+    contaminated_human_dna = Column(mysqlTINYINT(1), comment='Human DNA in the lane is a contaminant and should be removed', doc='Human DNA in the lane is a contaminant and should be removed')
+    data_release_strategy = Column(String(255, 'utf8_unicode_ci'))
+    data_release_sort_of_study = Column(String(255, 'utf8_unicode_ci'))
+    ena_project_id = Column(String(255, 'utf8_unicode_ci'))
+    study_title = Column(String(255, 'utf8_unicode_ci'))
+    study_visibility = Column(String(255, 'utf8_unicode_ci'))
+    ega_dac_accession_number = Column(String(255, 'utf8_unicode_ci'))
+    array_express_accession_number = Column(String(255, 'utf8_unicode_ci'))
+    ega_policy_accession_number = Column(String(255, 'utf8_unicode_ci'))
+    data_release_timing = Column(String(255, 'utf8_unicode_ci'))
+    data_release_delay_period = Column(String(255, 'utf8_unicode_ci'))
+    data_release_delay_reason = Column(String(255, 'utf8_unicode_ci'))
+    data_access_group = Column(String(255, 'utf8_unicode_ci'))
+    prelim_id = Column(String(20, 'utf8_unicode_ci'), comment='The preliminary study id prior to entry into the LIMS', doc='The preliminary study id prior to entry into the LIMS')
+    hmdmc_number = Column(String(255, 'utf8_unicode_ci'), comment='The Human Materials and Data Management Committee approval number(s) for the study.', doc='The Human Materials and Data Management Committee approval number(s) for the study.')
+    data_destination = Column(String(255, 'utf8_unicode_ci'), comment="The data destination type(s) for the study. It could be 'standard', '14mg' or 'gseq'. This may be extended, if Sanger gains more external customers. It can contain multiply destinations separated by a space.", doc="The data destination type(s) for the study. It could be 'standard', '14mg' or 'gseq'. This may be extended, if Sanger gains more external customers. It can contain multiply destinations separated by a space.")
+    s3_email_list = Column(String(255, 'utf8_unicode_ci'))
+    data_deletion_period = Column(String(255, 'utf8_unicode_ci'))
+
+    bmap_flowcell = relationship('BmapFlowcell', back_populates='study')
+    flgen_plate = relationship('FlgenPlate', back_populates='study')
+    iseq_flowcell = relationship('IseqFlowcell', back_populates='study')
+    oseq_flowcell = relationship('OseqFlowcell', back_populates='study')
+    pac_bio_run = relationship('PacBioRun', back_populates='study')
+    stock_resource = relationship('StockResource', back_populates='study')
+    study_users = relationship('StudyUsers', back_populates='study')
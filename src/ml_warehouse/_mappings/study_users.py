@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class StudyUsers(Base):
+    """Constructs a new StudyUsers.
+
+    Parameters
+    ----------
+    id_study_users_tmp: Internal to this database id, value can change
+    id_study_tmp: Study id, see "study.id_study_tmp"
+    last_updated: Timestamp of last update
+    role
+    login
+    email
+    name
+    """
+
+    __tablename__ = 'study_users'
+
+    id_study_users_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True, comment='Internal to this database id, value can change', doc='Internal to this database id, value can change')
+    id_study_tmp = Column(ForeignKey('study.id_study_tmp'), nullable=False, index=True, comment='Study id, see "study.id_study_tmp"', doc='Study id, see "study.id_study_tmp"')
+    last_updated = Column(DateTime, nullable=False, comment='Timestamp of last update', doc='Timestamp of last update')
+    role = Column(String(255, 'utf8_unicode_ci'))
+    login = Column(String(255, 'utf8_unicode_ci'))
+    email = Column(String(255, 'utf8_unicode_ci'))
+    name = Column(String(255, 'utf8_unicode_ci'))
+
+    study = relationship('Study', back_populates='study_users')
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author mgcam <mg8@sanger.ac.uk>
+
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse._mappings._base import Base
+from sqlalchemy import Column, Enum, ForeignKey, String, TIMESTAMP, text
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.orm import relationship
+
+
+@add_docstring
+class TolSampleBioproject(Base):
+    """Constructs a new TolSampleBioproject.
+
+    Parameters
+    ----------
+    id_tsb_tmp
+    date_added
+    date_updated
+    id_sample_tmp
+    file
+    library_type
+    tolid
+    biosample_accession
+    bioproject_accession
+    filename
+    """
+
+    __tablename__ = 'tol_sample_bioproject'
+
+    id_tsb_tmp = Column(mysqlINTEGER(10, unsigned=True), primary_key=True)
+    date_added = Column(TIMESTAMP, nullable=False, server_default=text('CURRENT_TIMESTAMP'))
+    date_updated = Column(TIMESTAMP, nullable=False, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'))
+    id_sample_tmp = Column(ForeignKey('sample.id_sample_tmp', ondelete='SET NULL'), index=True)
+    file = Column(String(255), unique=True)
+    library_type = Column(Enum('Chromium genome', 'Haplotagging', 'Hi-C', 'Hi-C - Arima v1', 'Hi-C - Arima v2', 'Hi-C - Dovetail', 'Hi-C - Omni-C', 'Hi-C - Qiagen', 'PacBio - CLR', 'PacBio - HiFi', 'ONT', 'RNA PolyA', 'RNA-seq dUTP eukaryotic', 'Standard', 'unknown', 'HiSeqX PCR free'))
+    tolid = Column(String(40))
+    biosample_accession = Column(String(255))
+    bioproject_accession = Column(String(255))
+    filename = Column(String(255))
+
+    sample = relationship('Sample', back_populates='tol_sample_bioproject')
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Async engines and sessions for the ML warehouse.
+
+For asyncio services, which can then run many lookups concurrently over a
+small pool of connections, without a thread each:
+
+    engine = get_async_engine(url_from_env())
+    Session = get_async_sessionmaker(engine)
+
+    async with Session() as session:
+        runs = await run_query(session, find_pacbio_runs, run_id, well)
+
+run_query runs the Query of any synchronous builder, such as the example
+queries, so the builders need no async copies; asynchronous wraps one as an
+async function. Relationships cannot be loaded lazily from async code, so
+use a loading profile (see ml_warehouse.loading) for those to be read.
+
+Requires an async MySQL driver, aiomysql by default or asyncmy, installed
+with the "async" extra.
+"""
+
+import functools
+import os
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Query, sessionmaker
+
+from ml_warehouse.engine import DEFAULT_POOL_OPTIONS, _engine_key
+
+DEFAULT_DRIVER = "aiomysql"
+
+_engines: Dict[Tuple[str, Hashable], AsyncEngine] = {}
+
+
+def async_url(url: URL, driver: str = DEFAULT_DRIVER) -> URL:
+    """Returns a MySQL URL using an async driver.
+
+    Arguments
+    ---------
+    url: URL
+        A MySQL URL, e.g. from ml_warehouse.engine.url_from_env.
+    driver: str
+        The async driver, "aiomysql" or "asyncmy".
+
+    Returns
+    -------
+    URL
+    """
+
+    if url.get_backend_name() != "mysql":
+        raise ValueError(f"Not a MySQL URL: {url!r}")
+
+    return url.set(drivername=f"mysql+{driver}")
+
+
+def get_async_engine(
+    url: URL, driver: str = DEFAULT_DRIVER, **options: Any
+) -> AsyncEngine:
+    """Returns a pooled AsyncEngine, shared with other callers in this process.
+
+    Arguments
+    ---------
+    url: URL
+        The database URL. Its driver is replaced by the async driver.
+    driver: str
+        The async driver, "aiomysql" or "asyncmy".
+    options: Any
+        Options to pass to create_async_engine, overriding
+        DEFAULT_POOL_OPTIONS.
+
+    Returns
+    -------
+    AsyncEngine
+        The same AsyncEngine is returned for the same URL and options.
+    """
+
+    url = async_url(url, driver)
+    options = {**DEFAULT_POOL_OPTIONS, **options}
+    key = _engine_key(url, options)
+
+    engine = _engines.get(key)
+    if engine is None:
+        engine = _engines[key] = create_async_engine(url, **options)
+
+    return engine
+
+
+async def dispose_async_engines():
+    """Closes the connections of, and forgets, every shared AsyncEngine."""
+
+    engines = list(_engines.values())
+    _engines.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
+def _reset_after_fork():
+    # As for ml_warehouse.engine, leave the parent's connections open.
+    for engine in _engines.values():
+        engine.sync_engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_async_sessionmaker(engine: AsyncEngine, **kwargs: Any) -> sessionmaker:
+    """Returns a sessionmaker of AsyncSessions for the warehouse.
+
+    Objects are not expired on commit, as reloading their attributes
+    afterwards would need an await.
+
+    Arguments
+    ---------
+    engine: AsyncEngine
+        The AsyncEngine, e.g. from get_async_engine.
+    kwargs: Any
+        Other options to pass to the sessionmaker.
+
+    Returns
+    -------
+    sessionmaker
+    """
+
+    kwargs.setdefault("expire_on_commit", False)
+
+    return sessionmaker(engine, class_=AsyncSession, future=True, **kwargs)
+
+
+async def run_query(
+    sess: AsyncSession, build: Callable[..., Query], *args: Any, **kwargs: Any
+) -> List[Any]:
+    """Builds a Query with a synchronous builder and runs it asynchronously.
+
+    The builder may itself run queries with the Session it is given.
+
+    Arguments
+    ---------
+    sess: AsyncSession
+        The AsyncSession to run the query with.
+    build: Callable[..., Query]
+        A function building a Query from a Session and the other arguments,
+        such as the example query builders.
+    args: Any
+        The arguments for build, after the Session.
+    kwargs: Any
+        The keyword arguments for build.
+
+    Returns
+    -------
+    List[Any]
+        The results, as Query.all would return them.
+    """
+
+    # Builders may query while building, e.g. to look up cached reference
+    # rows, which needs a greenlet to run the synchronous session in.
+    query = await sess.run_sync(lambda sync_sess: build(sync_sess, *args, **kwargs))
+    result = await sess.execute(query.statement)
+
+    # Like Query.all, return each combination of objects once.
+    entities = [d["expr"] is d["entity"] for d in query.column_descriptions]
+    if any(entities):
+        result = result.unique()
+    if entities == [True]:
+        return result.scalars().all()
+
+    return result.all()
+
+
+def asynchronous(build: Callable[..., Query]) -> Callable[..., Any]:
+    """Returns an async variant of a query builder, running it with run_query.
+
+    Arguments
+    ---------
+    build: Callable[..., Query]
+        A function building a Query from a Session and other arguments.
+
+    Returns
+    -------
+    Callable[..., Any]
+        A coroutine function taking an AsyncSession and the other arguments,
+        returning the results of the Query.
+    """
+
+    @functools.wraps(build)
+    async def run(sess: AsyncSession, *args: Any, **kwargs: Any) -> List[Any]:
+        return await run_query(sess, build, *args, **kwargs)
+
+    return run
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Loading samtools ampliconstats metrics into iseq_product_ampliconstats.
+
+The pipeline produces a row per product, primer panel and amplicon, so
+hundreds per sample. upsert_ampliconstats loads them in batches, replacing
+the metrics of rows already loaded for the same product, primer panel and
+amplicon index (the iseq_hrm_digest_unq unique key), so that running the
+pipeline again updates rather than duplicates them:
+
+    with engine.begin() as conn:
+        print(upsert_ampliconstats(conn, rows))
+
+Rows may name their product by id_iseq_product, or by id_run, position and
+tag_index, which are resolved to an id_iseq_product with a query per batch.
+Rows for products not in iseq_product_metrics are skipped, and counted.
+"""
+
+from typing import Dict, Iterable, Iterator, Set, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.engine import Connection
+
+from ml_warehouse.bulk import DEFAULT_BATCH_SIZE, LoadStats, _batches, upsert_rows
+
+# The columns of iseq_product_metrics which can identify a product instead
+# of id_iseq_product.
+PRODUCT_KEYS = ("id_run", "position", "tag_index")
+
+ProductKey = Tuple[int, int, int]
+
+
+def known_products(conn: Connection, id_iseq_products: Iterable[str]) -> Set[str]:
+    """Returns those of some product ids which are in iseq_product_metrics.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to query with.
+    id_iseq_products: Iterable[str]
+        The product ids.
+
+    Returns
+    -------
+    Set[str]
+    """
+
+    from ml_warehouse.schema import IseqProductMetrics
+
+    wanted = set(id_iseq_products)
+    if not wanted:
+        return set()
+
+    table = IseqProductMetrics.__table__
+    query = select(table.c.id_iseq_product).where(
+        table.c.id_iseq_product.in_(sorted(wanted))
+    )
+
+    return set(conn.execute(query).scalars())
+
+
+def resolve_products(
+    conn: Connection, keys: Iterable[ProductKey]
+) -> Dict[ProductKey, str]:
+    """Returns the product ids of some (id_run, position, tag_index) keys.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to query with.
+    keys: Iterable[Tuple[int, int, int]]
+        The keys. A tag_index of None matches no product.
+
+    Returns
+    -------
+    Dict[Tuple[int, int, int], str]
+        The id_iseq_product of each key in iseq_product_metrics.
+    """
+
+    from ml_warehouse.schema import IseqProductMetrics
+
+    wanted = set(keys)
+    if not wanted:
+        return {}
+
+    table = IseqProductMetrics.__table__
+    columns = [table.c[k] for k in PRODUCT_KEYS]
+    query = select(*columns, table.c.id_iseq_product).where(
+        tuple_(*columns).in_(sorted(wanted, key=repr))
+    )
+
+    return {tuple(row[:-1]): row.id_iseq_product for row in conn.execute(query)}
+
+
+def _resolve(conn: Connection, batch: Iterable[dict]) -> Iterator[dict]:
+    batch = list(batch)
+    by_key = [r for r in batch if "id_iseq_product" not in r]
+    products = resolve_products(
+        conn, (tuple(r[k] for k in PRODUCT_KEYS) for r in by_key)
+    )
+    known = known_products(
+        conn, (r["id_iseq_product"] for r in batch if "id_iseq_product" in r)
+    )
+
+    for row in batch:
+        if "id_iseq_product" in row:
+            if row["id_iseq_product"] in known:
+                yield row
+            continue
+
+        id_iseq_product = products.get(tuple(row[k] for k in PRODUCT_KEYS))
+        if id_iseq_product is not None:
+            row = {k: v for k, v in row.items() if k not in PRODUCT_KEYS}
+            row["id_iseq_product"] = id_iseq_product
+            yield row
+
+
+def upsert_ampliconstats(
+    conn: Connection, rows: Iterable[dict], batch_size: int = DEFAULT_BATCH_SIZE
+) -> LoadStats:
+    """Inserts or updates rows of iseq_product_ampliconstats in batches.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to insert with. The caller is responsible for
+        committing.
+    rows: Iterable[dict]
+        The rows, with either id_iseq_product or id_run, position and
+        tag_index, and the other columns to set. They are consumed lazily,
+        batch_size at a time.
+    batch_size: int
+        The number of rows per batch.
+
+    Returns
+    -------
+    LoadStats
+        The number of rows inserted or updated, the number skipped for
+        unknown products and the throughput.
+    """
+
+    from ml_warehouse.schema import IseqProductAmpliconstats
+
+    skipped = 0
+
+    def resolved() -> Iterator[dict]:
+        nonlocal skipped
+        for batch in _batches(rows, batch_size):
+            kept = list(_resolve(conn, batch))
+            skipped += len(batch) - len(kept)
+            yield from kept
+
+    stats = upsert_rows(conn, IseqProductAmpliconstats, resolved(), batch_size)
+    stats.skipped = skipped
+
+    return stats
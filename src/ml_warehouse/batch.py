@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Looking up many composite keys at once.
+
+Looking up records by, say, chip serial number and position one key at a
+time costs a round trip per key. batch_lookup resolves a whole list of keys
+with a statement per chunk of them, comparing the key columns with a tuple
+IN, or for very many keys with a single statement semi-joining a temporary
+table of them:
+
+    records = batch_lookup(
+        session.query(BmapFlowcell),
+        (BmapFlowcell.chip_serialnumber, BmapFlowcell.position),
+        [("KHPZDTGLPQJGPNWU", 2), ("KHPZDTGLPQJGPNWU", 3)],
+    )
+    records[("KHPZDTGLPQJGPNWU", 2)]  # The BmapFlowcells at that position
+
+Each statement only avoids a scan of the table if an index covers the key
+columns; ml_warehouse.explain can propose one.
+"""
+
+import uuid
+from typing import Any, Dict, Hashable, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import Column, Index, MetaData, Table, select, tuple_
+from sqlalchemy.orm import Query
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+from ml_warehouse.bulk import load_rows
+from ml_warehouse.in_lists import TEMP_TABLE_THRESHOLD
+
+DEFAULT_CHUNK_SIZE = 1000
+
+Key = Tuple[Hashable, ...]
+
+
+def _chunked(query: Query, columns, keys: List[Key], chunk_size: int) -> List[Any]:
+    key = tuple_(*columns)
+    results = []
+    for i in range(0, len(keys), chunk_size):
+        results += query.filter(key.in_(keys[i : i + chunk_size])).all()
+
+    return results
+
+
+def _temp_table(query: Query, columns, keys: List[Key], batch_size: int) -> List[Any]:
+    # The key columns keep the types, and so the collations, of the columns
+    # they are compared with. Keys distinct in Python may then be equal under
+    # a case-insensitive collation, so they are indexed rather than unique,
+    # and matched with a semi-join, which finds each result once however many
+    # keys it matches, as the IN of _chunked does.
+    name = f"tmp_batch_keys_{uuid.uuid4().hex[:12]}"
+    table = Table(
+        name,
+        MetaData(),
+        *(Column(c.key, c.property.columns[0].type) for c in columns),
+        prefixes=["TEMPORARY"],
+    )
+    Index(f"{name}_key", *table.c)
+    rows = ({c.key: value for c, value in zip(columns, key)} for key in keys)
+
+    conn = query.session.connection()
+    table.create(conn)
+    try:
+        load_rows(conn, table, rows, batch_size)
+        return query.filter(tuple_(*columns).in_(select(*table.c))).all()
+    finally:
+        table.drop(conn)
+
+
+def batch_lookup(
+    query: Query,
+    columns: Sequence[InstrumentedAttribute],
+    keys: Iterable[Key],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    temp_table_threshold: int = TEMP_TABLE_THRESHOLD,
+) -> Dict[Key, List[Any]]:
+    """Runs a query for many keys and groups its results by key.
+
+    Arguments
+    ---------
+    query: Query
+        The query to restrict to the keys, e.g. session.query(FlgenPlate). Its
+        results must have the key columns as attributes.
+    columns: Sequence[InstrumentedAttribute]
+        The key columns, e.g. (FlgenPlate.plate_barcode, FlgenPlate.well_label).
+    keys: Iterable[Tuple]
+        The keys to look up, each a tuple of values of the key columns, of
+        the types the columns return. Duplicates are looked up once.
+    chunk_size: int
+        The number of keys per statement.
+    temp_table_threshold: int
+        Join a temporary table of the keys for more keys than this.
+
+    Returns
+    -------
+    Dict[Tuple, List[Any]]
+        The results for each key, in the order of the query within a
+        statement. Keys without results have an empty list. Results
+        matching a key only under the column's collation, e.g. differing in
+        case, are keyed by their own values.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+
+    found: Dict[Key, List[Any]] = {tuple(key): [] for key in keys}
+    if not found:
+        return found
+
+    unique_keys = list(found)
+    if len(unique_keys) > temp_table_threshold:
+        results = _temp_table(query, columns, unique_keys, chunk_size)
+    else:
+        results = _chunked(query, columns, unique_keys, chunk_size)
+
+    for result in results:
+        key = tuple(getattr(result, c.key) for c in columns)
+        found.setdefault(key, []).append(result)
+
+    return found
@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Bulk loading of rows into warehouse tables.
+
+Rows are inserted with Core executemany batches, which PyMySQL sends as
+multi-row INSERT statements, rather than through ORM objects. upsert_rows
+adds ON DUPLICATE KEY UPDATE to them, so that rows already present under a
+unique key are updated instead, and loading the same rows again changes
+nothing. upsert_many also leaves out rows whose last_updated is no later
+than that of the row already present, as a loader reading rows again would
+otherwise rewrite them unchanged.
+"""
+
+import csv
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from sqlalchemy import Column, Index, Table, UniqueConstraint, select, tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm.decl_api import DeclarativeMeta
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None
+
+DEFAULT_BATCH_SIZE = 1000
+
+# MySQL's marker for NULL in delimited text files.
+NULL = "\\N"
+
+Target = Union[Table, DeclarativeMeta]
+
+
+@dataclass
+class LoadStats:
+    """Statistics of loading rows into one table."""
+
+    table: str
+    rows: int
+    batches: int
+    seconds: float
+    skipped: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self):
+        skipped = f", {self.skipped} skipped" if self.skipped else ""
+        return (
+            f"{self.table}: {self.rows} rows in {self.batches} batches{skipped}, "
+            f"{self.seconds:.3f} s ({self.rows_per_second:.0f} rows/s)"
+        )
+
+
+def _table(target: Target) -> Table:
+    return target if isinstance(target, Table) else target.__table__
+
+
+def _column_keys(target: Target) -> Dict[str, str]:
+    """Maps the attribute names of a mapped class to its column keys."""
+
+    if isinstance(target, Table):
+        return {}
+
+    return {
+        attr: column.key
+        for attr, column in target.__mapper__.columns.items()
+        if attr != column.key
+    }
+
+
+def _batches(rows: Iterable[dict], batch_size: int) -> Iterator[List[dict]]:
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, not {batch_size}")
+
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _groups(batch: List[dict]) -> Iterator[List[dict]]:
+    # executemany needs the same keys in every row, otherwise missing
+    # values would be sent as NULL rather than the column defaults.
+    groups: Dict[frozenset, List[dict]] = {}
+    for row in batch:
+        groups.setdefault(frozenset(row), []).append(row)
+
+    return iter(groups.values())
+
+
+def read_rows(path: str) -> Iterator[dict]:
+    """Reads rows from a YAML, CSV or TSV file.
+
+    YAML files hold a list of mappings. CSV and TSV files have a header line
+    naming the columns; they are read lazily and "\\N" is read as NULL.
+
+    Arguments
+    ---------
+    path: str
+        The file path. The format is chosen from the extension, one of .yml,
+        .yaml, .csv or .tsv.
+
+    Returns
+    -------
+    Iterator[dict]
+        The rows, mapping column or attribute names to values.
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension in (".yml", ".yaml"):
+        if yaml is None:
+            raise ImportError("PyYAML is required to read YAML files")
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path, "r") as f:
+            yield from yaml.load(f, Loader=loader) or []
+        return
+
+    if extension not in (".csv", ".tsv"):
+        raise ValueError(f"Unsupported file type for {path}")
+
+    delimiter = "\t" if extension == ".tsv" else ","
+    with open(path, "r", newline="") as f:
+        for row in csv.DictReader(f, delimiter=delimiter):
+            yield {k: (None if v == NULL else v) for k, v in row.items()}
+
+
+def load_rows(
+    conn: Connection,
+    target: Target,
+    rows: Iterable[dict],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> LoadStats:
+    """Inserts rows into a table in batches.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to insert with, e.g. Session.connection(). The caller
+        is responsible for committing.
+    target: Union[Table, DeclarativeMeta]
+        The Table, or mapped class, to insert into. For a mapped class, rows
+        may use attribute names where they differ from column names.
+    rows: Iterable[dict]
+        The rows to insert. They are consumed lazily, batch_size at a time.
+    batch_size: int
+        The number of rows per executemany call.
+
+    Returns
+    -------
+    LoadStats
+        The number of rows inserted and the throughput.
+    """
+
+    table = _table(target)
+    keys = _column_keys(target)
+    stmt = table.insert()
+
+    stats = LoadStats(table.name, 0, 0, 0.0)
+    start = time.perf_counter()
+
+    for batch in _batches(rows, batch_size):
+        if keys:
+            batch = [{keys.get(k, k): v for k, v in row.items()} for row in batch]
+        for group in _groups(batch):
+            conn.execute(stmt, group)
+            stats.batches += 1
+
+        stats.rows += len(batch)
+
+    stats.seconds = time.perf_counter() - start
+
+    return stats
+
+
+def upsert_rows(
+    conn: Connection,
+    target: Target,
+    rows: Iterable[dict],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    update_columns: Optional[Sequence[str]] = None,
+) -> LoadStats:
+    """Inserts rows into a MySQL table in batches, updating any already present.
+
+    A row is already present if it has the same values as a row of the
+    table for any unique key, including the primary key.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to insert with, e.g. Session.connection(). The caller
+        is responsible for committing.
+    target: Union[Table, DeclarativeMeta]
+        The Table, or mapped class, to insert into. For a mapped class, rows
+        may use attribute names where they differ from column names.
+    rows: Iterable[dict]
+        The rows to insert. They are consumed lazily, batch_size at a time.
+    batch_size: int
+        The number of rows per executemany call.
+    update_columns: Optional[Sequence[str]]
+        The columns to update in rows already present. By default, every
+        column given in the row apart from the primary key.
+
+    Returns
+    -------
+    LoadStats
+        The number of rows inserted or updated and the throughput.
+    """
+
+    upsert = _Upsert(target, update_columns)
+    stats = LoadStats(upsert.table.name, 0, 0, 0.0)
+    start = time.perf_counter()
+
+    for batch in _batches(rows, batch_size):
+        batch = upsert.rename(batch)
+        stats.batches += upsert.execute(conn, batch)
+        stats.rows += len(batch)
+
+    stats.seconds = time.perf_counter() - start
+
+    return stats
+
+
+class _Upsert:
+    """The INSERT ... ON DUPLICATE KEY UPDATE statements of a table."""
+
+    def __init__(self, target: Target, update_columns: Optional[Sequence[str]]):
+        self.table = _table(target)
+        self.keys = _column_keys(target)
+        self.update_columns = update_columns
+        self._primary_key = {c.key for c in self.table.primary_key}
+        self._statements = {}
+
+    def rename(self, batch: List[dict]) -> List[dict]:
+        """Returns the rows of a batch keyed by column rather than attribute."""
+
+        if not self.keys:
+            return batch
+
+        return [{self.keys.get(k, k): v for k, v in row.items()} for row in batch]
+
+    def execute(self, conn: Connection, batch: List[dict]) -> int:
+        """Upserts a batch of rows and returns the number of statements run."""
+
+        n = 0
+        for group in _groups(batch):
+            columns = frozenset(group[0])
+            stmt = self._statements.get(columns)
+            if stmt is None:
+                stmt = mysql_insert(self.table)
+                update = self.update_columns or sorted(columns - self._primary_key)
+                update = [self.keys.get(c, c) for c in update]
+                stmt = self._statements[columns] = stmt.on_duplicate_key_update(
+                    {c: stmt.inserted[c] for c in update}
+                )
+            conn.execute(stmt, group)
+            n += 1
+
+        return n
+
+
+def unique_keys(target: Target) -> List[Tuple[str, ...]]:
+    """Returns the unique keys of a table.
+
+    Arguments
+    ---------
+    target: Union[Table, DeclarativeMeta]
+        The Table, or mapped class.
+
+    Returns
+    -------
+    List[Tuple[str, ...]]
+        The column names of each unique index and unique constraint, in
+        order of name, then of the primary key.
+    """
+
+    table = _table(target)
+
+    named = {}
+    for item in list(table.indexes) + list(table.constraints):
+        if isinstance(item, UniqueConstraint) or (
+            isinstance(item, Index) and item.unique
+        ):
+            columns = tuple(c.key for c in item.columns)
+            named.setdefault(columns, str(item.name or ""))
+
+    keys = sorted(named, key=lambda columns: (named[columns], columns))
+    primary_key = tuple(c.key for c in table.primary_key)
+    if primary_key and primary_key not in keys:
+        keys.append(primary_key)
+
+    return keys
+
+
+def _timestamp_column(table: Table) -> Optional[str]:
+    from ml_warehouse.changes import TIMESTAMP_ATTRIBUTES
+
+    for name in TIMESTAMP_ATTRIBUTES:
+        if name in table.c:
+            return name
+
+    return None
+
+
+def _as_python(column: Column, value: Any) -> Any:
+    """Returns a value read from a file as the column's values are read back.
+
+    Rows read from CSV, TSV and some YAML hold strings where the database
+    returns ints, Decimals or datetimes, which would never compare equal.
+    """
+
+    if not isinstance(value, str):
+        return value
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if python_type in (datetime, date):
+        return python_type.fromisoformat(value)
+    if python_type in (int, float, Decimal):
+        return python_type(value)
+
+    return value
+
+
+def _key_values(table: Table, key: Tuple[str, ...], row: dict) -> tuple:
+    return tuple(_as_python(table.c[c], row[c]) for c in key)
+
+
+def _current(
+    conn: Connection,
+    table: Table,
+    key: Tuple[str, ...],
+    timestamp: str,
+    batch: List[dict],
+) -> Dict[tuple, Any]:
+    """Returns the timestamps of the rows present under a key for a batch."""
+
+    columns = [table.c[c] for c in key]
+    values = {_key_values(table, key, row) for row in batch}
+    query = select(*columns, table.c[timestamp]).where(
+        tuple_(*columns).in_(sorted(values, key=repr))
+    )
+
+    return {tuple(row[:-1]): row[-1] for row in conn.execute(query)}
+
+
+def upsert_many(
+    conn: Connection,
+    target: Target,
+    rows: Iterable[dict],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    update_columns: Optional[Sequence[str]] = None,
+) -> List[LoadStats]:
+    """Inserts or updates rows of a MySQL table, skipping those unchanged.
+
+    Each row is matched to the row already present, if any, under the first
+    of the table's unique keys (see unique_keys) it has every value of.
+    Rows with a last_updated, or last_changed, no later than that of the
+    row they match are skipped; the others are upserted as by upsert_rows.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to insert with. The caller is responsible for
+        committing.
+    target: Union[Table, DeclarativeMeta]
+        The Table, or mapped class, to insert into. For a mapped class, rows
+        may use attribute names where they differ from column names.
+    rows: Iterable[dict]
+        The rows. They are consumed lazily, batch_size at a time.
+    batch_size: int
+        The number of rows per batch, checked with one SELECT per unique key
+        used and upserted with one executemany call.
+    update_columns: Optional[Sequence[str]]
+        The columns to update in rows already present. By default, every
+        column given in the row apart from the primary key.
+
+    Returns
+    -------
+    List[LoadStats]
+        The statistics of each batch: the rows upserted, the rows skipped
+        and the time taken.
+    """
+
+    upsert = _Upsert(target, update_columns)
+    table = upsert.table
+    keys = unique_keys(table)
+    timestamp = _timestamp_column(table)
+
+    stats = []
+    for batch in _batches(rows, batch_size):
+        start = time.perf_counter()
+        batch = upsert.rename(batch)
+
+        changed = batch
+        if timestamp is not None:
+            by_key: Dict[Tuple[str, ...], List[dict]] = {}
+            for row in batch:
+                if row.get(timestamp) is None:
+                    continue
+                for key in keys:
+                    if all(row.get(c) is not None for c in key):
+                        by_key.setdefault(key, []).append(row)
+                        break
+
+            unchanged = set()
+            for key, matched in by_key.items():
+                current = _current(conn, table, key, timestamp, matched)
+                for row in matched:
+                    present = current.get(_key_values(table, key, row))
+                    updated = _as_python(table.c[timestamp], row[timestamp])
+                    if present is not None and updated <= present:
+                        unchanged.add(id(row))
+            changed = [row for row in batch if id(row) not in unchanged]
+
+        batch_stats = LoadStats(table.name, len(changed), 0, 0.0)
+        batch_stats.skipped = len(batch) - len(changed)
+        if changed:
+            batch_stats.batches = upsert.execute(conn, changed)
+        batch_stats.seconds = time.perf_counter() - start
+        stats.append(batch_stats)
+
+    return stats
+
+
+def load_files(
+    conn: Connection,
+    files: Mapping[Target, str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> List[LoadStats]:
+    """Loads YAML, CSV or TSV files into their tables, in dependency order.
+
+    Tables are loaded so that those referred to by foreign keys are loaded
+    before the tables referring to them.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to insert with. The caller is responsible for
+        committing.
+    files: Mapping[Union[Table, DeclarativeMeta], str]
+        The file to load for each Table or mapped class.
+    batch_size: int
+        The number of rows per executemany call.
+
+    Returns
+    -------
+    List[LoadStats]
+        The statistics for each table, in the order they were loaded.
+    """
+
+    targets = list(files)
+    if not targets:
+        return []
+
+    order = {t: i for i, t in enumerate(_table(targets[0]).metadata.sorted_tables)}
+    targets.sort(key=lambda t: order.get(_table(t), len(order)))
+
+    return [
+        load_rows(conn, target, read_rows(files[target]), batch_size)
+        for target in targets
+    ]
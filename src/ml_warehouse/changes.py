@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Incremental change feeds over the warehouse's modification timestamps.
+
+Most tables record when each row was last modified, in a last_updated or
+last_changed column. A ChangeFeed remembers, per consumer and table, the
+(timestamp, primary key) of the last row it handed out and only returns rows
+modified after it:
+
+    feed = ChangeFeed("irods-publisher", [Sample, Study], JSONMarkStore(path))
+    changes = feed.poll(session)
+    ... process changes["sample"] and changes["study"] ...
+    feed.acknowledge()
+
+Marks only move forward when the consumer acknowledges a poll, so rows from a
+poll that failed part way are returned again.
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.orm.decl_api import DeclarativeMeta
+
+DEFAULT_LIMIT = 10000
+
+TIMESTAMP_ATTRIBUTES = ("last_updated", "last_changed")
+
+
+@dataclass(frozen=True)
+class Mark:
+    """The position of the last row returned to a consumer for a table."""
+
+    timestamp: datetime
+    key: Any
+
+
+class MarkStore(ABC):
+    """Persistent storage for the marks of change feed consumers."""
+
+    @abstractmethod
+    def get(self, consumer: str, table: str) -> Optional[Mark]:
+        """Returns the mark of a consumer for a table, if it has one."""
+
+    @abstractmethod
+    def set(self, consumer: str, table: str, mark: Mark):
+        """Records the mark of a consumer for a table."""
+
+
+class JSONMarkStore(MarkStore):
+    """A MarkStore keeping marks in a JSON file.
+
+    The file is rewritten atomically on each update, so a crash never leaves
+    it half written.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def get(self, consumer: str, table: str) -> Optional[Mark]:
+        entry = self._read().get(consumer, {}).get(table)
+        if entry is None:
+            return None
+
+        return Mark(datetime.fromisoformat(entry["timestamp"]), entry["key"])
+
+    def set(self, consumer: str, table: str, mark: Mark):
+        marks = self._read()
+        marks.setdefault(consumer, {})[table] = {
+            "timestamp": mark.timestamp.isoformat(),
+            "key": mark.key,
+        }
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(marks, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def timestamp_attribute(table_cls: DeclarativeMeta) -> InstrumentedAttribute:
+    """Returns the attribute recording when rows of a mapped class changed."""
+
+    for name in TIMESTAMP_ATTRIBUTES:
+        attr = getattr(table_cls, name, None)
+        if attr is not None:
+            return attr
+
+    raise ValueError(f"{table_cls.__name__} has no modification timestamp")
+
+
+def _key_attribute(table_cls: DeclarativeMeta) -> InstrumentedAttribute:
+    primary_key = table_cls.__mapper__.primary_key
+    if len(primary_key) != 1:
+        raise ValueError(f"{table_cls.__name__} does not have a single column key")
+
+    return getattr(table_cls, primary_key[0].key)
+
+
+class ChangeFeed:
+    """Rows of chosen tables changed since a consumer last acknowledged a poll.
+
+    Arguments
+    ---------
+    consumer: str
+        The consumer name under which marks are stored.
+    tables: Sequence[DeclarativeMeta]
+        The mapped classes to follow. Each must have a last_updated or
+        last_changed column and a single column primary key.
+    store: MarkStore
+        Where the marks are kept.
+    start: Optional[datetime]
+        Where to start for tables without a stored mark. By default, all
+        rows are returned on the first poll.
+    settle_seconds: int
+        Ignore rows changed within this many seconds of the database's
+        current time, leaving them for the next poll. This gives
+        transactions which were open during a poll time to commit, so their
+        rows are not skipped.
+    """
+
+    def __init__(
+        self,
+        consumer: str,
+        tables: Sequence[DeclarativeMeta],
+        store: MarkStore,
+        start: Optional[datetime] = None,
+        settle_seconds: int = 0,
+    ):
+        self.consumer = consumer
+        self.tables = list(tables)
+        self.store = store
+        self.start = start
+        self.settle_seconds = settle_seconds
+        self._pending: Dict[str, Mark] = {}
+
+        self._columns: Dict[str, Tuple[InstrumentedAttribute, ...]] = {
+            t.__tablename__: (timestamp_attribute(t), _key_attribute(t))
+            for t in self.tables
+        }
+
+    def poll(self, sess: Session, limit: int = DEFAULT_LIMIT) -> Dict[str, List[Any]]:
+        """Returns rows changed since the last acknowledged poll.
+
+        Arguments
+        ---------
+        sess: Session
+            The Session to query with.
+        limit: int
+            The maximum number of rows to return per table. Polling again
+            before acknowledging returns the same rows; acknowledge and poll
+            again to get the next ones.
+
+        Returns
+        -------
+        Dict[str, List[Any]]
+            The changed rows of each table, keyed by table name, oldest
+            change first.
+        """
+
+        self._pending = {}
+        changes = {}
+
+        for table_cls in self.tables:
+            name = table_cls.__tablename__
+            timestamp, key = self._columns[name]
+
+            query = sess.query(table_cls)
+
+            mark = self.store.get(self.consumer, name)
+            if mark is not None:
+                query = query.filter(
+                    (timestamp > mark.timestamp)
+                    | ((timestamp == mark.timestamp) & (key > mark.key))
+                )
+            elif self.start is not None:
+                query = query.filter(timestamp > self.start)
+
+            if self.settle_seconds > 0:
+                settled = func.now() - literal_column(
+                    f"INTERVAL {int(self.settle_seconds)} SECOND"
+                )
+                query = query.filter(timestamp <= settled)
+
+            rows = query.order_by(timestamp, key).limit(limit).all()
+            changes[name] = rows
+
+            if rows:
+                last = rows[-1]
+                self._pending[name] = Mark(
+                    getattr(last, timestamp.key), getattr(last, key.key)
+                )
+
+        return changes
+
+    def acknowledge(self):
+        """Records that the rows returned by the last poll have been handled."""
+
+        for name, mark in self._pending.items():
+            self.store.set(self.consumer, name, mark)
+        self._pending = {}
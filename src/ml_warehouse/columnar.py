@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Columnar export of query results to Arrow record batches and Parquet.
+
+The results of a Core SELECT are read through a server-side cursor a batch
+at a time and converted column by column into Arrow arrays, typed from the
+column definitions of the schema, without creating ORM objects:
+
+    stmt = product_metrics_select(IseqProductMetrics.id_run.in_(run_ids))
+    with engine.connect() as conn:
+        write_parquet(conn, stmt, "product_metrics.parquet")
+
+Requires pyarrow, installed with the "arrow" extra.
+"""
+
+from typing import Any, Iterator, Optional, Sequence
+
+from sqlalchemy import select, types
+from sqlalchemy.dialects import mysql
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+DEFAULT_BATCH_SIZE = 10000
+
+# The iseq_flowcell and study columns added to product_metrics_select, by the
+# name they are selected as.
+FLOWCELL_KEYS = (
+    "id_lims",
+    "id_flowcell_lims",
+    "flowcell_barcode",
+    "id_pool_lims",
+    "entity_type",
+    "id_sample_tmp",
+    "id_study_tmp",
+)
+STUDY_KEYS = {"id_study_lims": "id_study_lims", "study_name": "name"}
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow is required for columnar export")
+
+
+def _integer_bits(type_: types.Integer) -> int:
+    """Returns the width in bits of an integer column type."""
+
+    if isinstance(type_, mysql.TINYINT):
+        return 8
+    if isinstance(type_, types.SmallInteger):
+        return 16
+    if isinstance(type_, types.BigInteger):
+        return 64
+    return 32
+
+
+def _float_bits(type_: types.Float) -> int:
+    """Returns the width in bits of a floating point column type.
+
+    MySQL DOUBLE, and FLOAT(p) for p above 24, are double precision; FLOAT
+    is single precision. ml_warehouse.frames chooses NumPy dtypes by the
+    same rules.
+    """
+
+    if isinstance(type_, mysql.DOUBLE) or (
+        type_.precision is not None
+        and type_.precision > 24
+        and getattr(type_, "scale", None) is None
+    ):
+        return 64
+    return 32
+
+
+def arrow_type(type_: types.TypeEngine) -> "pa.DataType":
+    """Returns the Arrow type holding the values of a column type.
+
+    Integers keep their width and signedness, MySQL FLOAT is single and
+    DOUBLE double precision, and DECIMAL keeps its precision and scale.
+
+    Arguments
+    ---------
+    type_: TypeEngine
+        A column type, e.g. IseqProductMetrics.num_reads.type.
+
+    Returns
+    -------
+    pa.DataType
+    """
+
+    _require_pyarrow()
+
+    if isinstance(type_, types.Boolean):
+        return pa.bool_()
+    if isinstance(type_, types.Integer):
+        unsigned = getattr(type_, "unsigned", False)
+        bits = _integer_bits(type_)
+        return getattr(pa, f"{'uint' if unsigned else 'int'}{bits}")()
+    if isinstance(type_, types.Float):
+        return pa.float64() if _float_bits(type_) == 64 else pa.float32()
+    if isinstance(type_, types.Numeric):
+        if type_.precision is None:
+            return pa.float64()
+        return pa.decimal128(type_.precision, type_.scale or 0)
+    if isinstance(type_, types.DateTime):
+        return pa.timestamp("us")
+    if isinstance(type_, types.Date):
+        return pa.date32()
+    if isinstance(type_, types.Time):
+        return pa.time64("us")
+    if isinstance(type_, (types.String, types.Enum)):
+        return pa.string()
+    if isinstance(type_, types._Binary):
+        return pa.binary()
+
+    raise TypeError(f"No Arrow type for column type {type_!r}")
+
+
+def arrow_schema(stmt: Select) -> "pa.Schema":
+    """Returns the Arrow schema of the results of a SELECT."""
+
+    _require_pyarrow()
+
+    return pa.schema(
+        [pa.field(c.name, arrow_type(c.type)) for c in stmt.selected_columns]
+    )
+
+
+def product_metrics_select(
+    *criteria: Any, columns: Optional[Sequence[str]] = None
+) -> Select:
+    """Returns a SELECT of iseq_product_metrics with flowcell and study keys.
+
+    Products without a flowcell, or whose flowcell has no study, have NULL
+    keys.
+
+    Arguments
+    ---------
+    criteria: Any
+        Filters for the WHERE clause, e.g. IseqProductMetrics.id_run == 40000.
+    columns: Optional[Sequence[str]]
+        The iseq_product_metrics columns to select. All by default.
+
+    Returns
+    -------
+    Select
+        Ordered by id_iseq_pr_metrics_tmp.
+    """
+
+    from ml_warehouse.schema import IseqFlowcell, IseqProductMetrics, Study
+
+    ipm = IseqProductMetrics.__table__
+    flowcell = IseqFlowcell.__table__
+    study = Study.__table__
+
+    selected = [ipm.c[name] for name in columns or ipm.c.keys()]
+    selected += [flowcell.c[name].label(name) for name in FLOWCELL_KEYS]
+    selected += [study.c[name].label(label) for label, name in STUDY_KEYS.items()]
+
+    return (
+        select(*selected)
+        .select_from(
+            ipm.outerjoin(
+                flowcell, flowcell.c.id_iseq_flowcell_tmp == ipm.c.id_iseq_flowcell_tmp
+            ).outerjoin(study, study.c.id_study_tmp == flowcell.c.id_study_tmp)
+        )
+        .where(*criteria)
+        .order_by(ipm.c.id_iseq_pr_metrics_tmp)
+    )
+
+
+def _array(values: Sequence[Any], type_: "pa.DataType") -> "pa.Array":
+    # MySQL DOUBLE and unscaled NUMERIC columns return Decimals, which Arrow
+    # will not convert to floats itself.
+    if pa.types.is_floating(type_):
+        values = [v if v is None else float(v) for v in values]
+
+    return pa.array(values, type=type_)
+
+
+def record_batches(
+    conn: Connection, stmt: Select, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator["pa.RecordBatch"]:
+    """Reads the results of a SELECT as Arrow record batches.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to read with. It is busy until the last batch has
+        been read.
+    stmt: Select
+        The SELECT to run.
+    batch_size: int
+        The maximum number of rows per batch, which is also the number of
+        rows fetched from the cursor at a time.
+
+    Returns
+    -------
+    Iterator[pa.RecordBatch]
+        The batches, in the order of the results.
+    """
+
+    _require_pyarrow()
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, not {batch_size}")
+
+    schema = arrow_schema(stmt)
+    result = conn.execution_options(stream_results=True).execute(stmt)
+
+    for rows in result.partitions(batch_size):
+        columns = zip(*rows)
+        yield pa.RecordBatch.from_arrays(
+            [_array(values, field.type) for values, field in zip(columns, schema)],
+            schema=schema,
+        )
+
+
+def write_parquet(
+    conn: Connection,
+    stmt: Select,
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **options: Any,
+) -> int:
+    """Writes the results of a SELECT to a Parquet file.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to read with.
+    stmt: Select
+        The SELECT to run.
+    path: str
+        The file to write.
+    batch_size: int
+        The number of rows per batch, and so per row group at most.
+    options: Any
+        Options for pyarrow.parquet.ParquetWriter, e.g. compression="zstd".
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+
+    _require_pyarrow()
+
+    written = 0
+    with pq.ParquetWriter(path, arrow_schema(stmt), **options) as writer:
+        for batch in record_batches(conn, stmt, batch_size):
+            writer.write_batch(batch)
+            written += batch.num_rows
+
+    return written
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @author Adam Blanchet <ab59@sanger.ac.uk>
+
+"""Engine and session factories for the ML warehouse.
+
+Engines are pooled and shared within a process: asking twice for an engine
+with the same URL and options returns the same Engine, so that connections
+are reused rather than re-established for each unit of work. After a fork,
+the child process drops the connections inherited from its parent and opens
+its own.
+"""
+
+import configparser
+import os
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import Select
+
+DEFAULT_POOL_OPTIONS = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    # Below the usual MySQL wait_timeout, so the server never closes
+    # connections the pool believes to be open.
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
+_engines: Dict[Tuple[str, Hashable], Engine] = {}
+
+# Called with each Engine get_engine creates, e.g. to instrument it.
+_engine_hooks: List[Callable[[Engine], None]] = []
+
+
+def mysql_url(user: str, password: str, host: str, port: Any, schema: str) -> URL:
+    """Returns a URL for a MySQL database, using the PyMySQL driver."""
+
+    return URL.create(
+        "mysql+pymysql",
+        username=user,
+        password=password,
+        host=host,
+        port=int(port),
+        database=schema,
+        query={"charset": "utf8mb4"},
+    )
+
+
+def url_from_env(prefix: str = "MYSQL") -> Optional[URL]:
+    """Returns a MySQL URL configured through environment variables.
+
+    The variables are <prefix>_USER, <prefix>_PW, <prefix>_HOST, <prefix>_PORT
+    and <prefix>_DBNAME.
+
+    Arguments
+    ---------
+    prefix: str
+        The prefix of the variable names, e.g. "MYSQL_REPLICA" for a read
+        replica.
+
+    Returns
+    -------
+    Optional[URL]
+        The URL, or None if any of the variables is unset.
+    """
+
+    values = [
+        os.environ.get(f"{prefix}_{name}")
+        for name in ("USER", "PW", "HOST", "PORT", "DBNAME")
+    ]
+
+    if None in values:
+        return None
+
+    return mysql_url(*values)
+
+
+def url_from_config(config: configparser.ConfigParser, section: str = "MySQL") -> URL:
+    """Returns a MySQL URL configured through an ini file.
+
+    The keys and values are:
+
+    [MySQL]
+    user       = <database user, defaults to "mlwh">
+    password   = <database password, defaults to empty i.e. "">
+    ip_address = <database IP address, defaults to "127.0.0.1">
+    port       = <database port, defaults to 3306>
+    schema     = <database schema, defaults to "mlwh">
+
+    Arguments
+    ---------
+    config: configparser.ConfigParser
+        The parsed ini file.
+    section: str
+        The section to read, e.g. "MySQLReplica" for a read replica.
+
+    Returns
+    -------
+    URL
+        The URL.
+    """
+
+    if section not in config.sections():
+        raise configparser.Error(
+            "The {} configuration section is missing. "
+            "You need to fill this in before connecting "
+            "to a {} database".format(section, section)
+        )
+    connection_conf = config[section]
+
+    return mysql_url(
+        connection_conf.get("user", "mlwh"),
+        connection_conf.get("password", ""),
+        connection_conf.get("ip_address", "127.0.0.1"),
+        connection_conf.get("port", "3306"),
+        connection_conf.get("schema", "mlwh"),
+    )
+
+
+def pool_options_from_config(
+    config: configparser.ConfigParser, section: str = "MySQL"
+) -> Dict[str, Any]:
+    """Returns any pool options set in an ini file section.
+
+    The recognised keys are pool_size, max_overflow, pool_timeout,
+    pool_recycle and pool_pre_ping, as understood by create_engine.
+    """
+
+    connection_conf = config[section]
+    options = {}
+
+    for key in ("pool_size", "max_overflow", "pool_timeout", "pool_recycle"):
+        if key in connection_conf:
+            options[key] = connection_conf.getint(key)
+    if "pool_pre_ping" in connection_conf:
+        options["pool_pre_ping"] = connection_conf.getboolean("pool_pre_ping")
+
+    return options
+
+
+def _freeze(value: Any) -> Hashable:
+    # Options such as connect_args hold dicts and lists, which cannot be
+    # part of a dict key as they are.
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(_freeze(v)) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+
+    return value
+
+
+def _engine_key(url: URL, options: Dict[str, Any]) -> Tuple[str, Hashable]:
+    return url.render_as_string(hide_password=False), _freeze(options)
+
+
+def get_engine(url: URL, **options) -> Engine:
+    """Returns a pooled Engine, shared with other callers in this process.
+
+    Arguments
+    ---------
+    url: URL
+        The database URL.
+    options:
+        Options to pass to create_engine, overriding DEFAULT_POOL_OPTIONS.
+
+    Returns
+    -------
+    Engine
+        An Engine using the "future" API. The same Engine is returned for the
+        same URL and options.
+    """
+
+    options = {**DEFAULT_POOL_OPTIONS, "future": True, **options}
+    key = _engine_key(url, options)
+
+    engine = _engines.get(key)
+    if engine is None:
+        engine = _engines[key] = create_engine(url, **options)
+        for hook in _engine_hooks:
+            hook(engine)
+
+    return engine
+
+
+def dispose_engines():
+    """Closes the connections of, and forgets, every shared Engine."""
+
+    for engine in _engines.values():
+        engine.dispose()
+    _engines.clear()
+
+
+def _reset_after_fork():
+    # The connections belong to the parent process; give the child fresh
+    # pools without closing the parent's sockets.
+    for engine in _engines.values():
+        engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class RoutingSession(Session):
+    """A Session sending SELECT statements to a read replica.
+
+    Everything else, including flushes, SELECT ... FOR UPDATE and textual SQL,
+    goes to the primary.
+    Set `use_primary` to send reads to the primary too, e.g. to read back
+    rows written earlier in the same transaction.
+    """
+
+    def __init__(self, primary: Engine, replica: Optional[Engine] = None, **kwargs):
+        kwargs["bind"] = primary
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica if replica is not None else primary
+        self.use_primary = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.use_primary or self._flushing or not isinstance(clause, Select):
+            return self.primary
+        # Locking reads must lock the rows on the primary.
+        if clause._for_update_arg is not None:
+            return self.primary
+
+        return self.replica
+
+
+def get_sessionmaker(
+    primary: Engine, replica: Optional[Engine] = None, **kwargs
+) -> sessionmaker:
+    """Returns a sessionmaker for the warehouse.
+
+    Arguments
+    ---------
+    primary: Engine
+        The Engine for the primary database.
+    replica: Optional[Engine]
+        An Engine for a read replica. If given, sessions send SELECT
+        statements to the replica (see RoutingSession).
+    kwargs:
+        Other options to pass to the sessionmaker.
+
+    Returns
+    -------
+    sessionmaker
+        The sessionmaker.
+    """
+
+    if replica is None:
+        return sessionmaker(bind=primary, future=True, **kwargs)
+
+    return sessionmaker(
+        class_=RoutingSession, primary=primary, replica=replica, future=True, **kwargs
+    )
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Checking that queries use the warehouse's indexes.
+
+An IndexAdvisor runs EXPLAIN for registered query builders and reports the
+tables each query reads with a full table scan, a filesort or a temporary
+table, together with a proposed index covering the columns the query uses
+from that table:
+
+    advisor = IndexAdvisor()
+    advisor.register("recent_ont", lambda sess: get_recent_ont(sess, max_age))
+    for name, findings in advisor.run(session).items():
+        for finding in findings:
+            print(name, finding)
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Union
+
+from sqlalchemy import Column, Table
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import BinaryExpression, ClauseElement
+from sqlalchemy.sql.selectable import Alias, FromClause
+
+# Indexes proposed as covering are capped at this many columns; beyond it a
+# plain index on the filtered columns is proposed instead.
+MAX_COVERING_COLUMNS = 6
+
+EQUALITY_OPERATORS = (operators.eq, operators.in_op, operators.is_)
+
+
+class Explain(Executable, ClauseElement):
+    """An EXPLAIN statement for a SELECT."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN " + compiler.process(element.statement, **kw)
+
+
+@dataclass
+class Finding:
+    """A table read inefficiently by a query."""
+
+    table: str
+    problem: str
+    rows: int
+    proposal: Optional[str] = None
+
+    def __str__(self):
+        text = f"{self.table}: {self.problem} (~{self.rows} rows)"
+        if self.proposal is not None:
+            text += f"; consider {self.proposal}"
+        return text
+
+
+def _statement(query: Union[Query, Executable]):
+    return query.statement if isinstance(query, Query) else query
+
+
+def explain(sess: Session, query: Union[Query, Executable]) -> List[dict]:
+    """Returns the rows of MySQL's EXPLAIN output for a query."""
+
+    result = sess.execute(Explain(_statement(query)))
+
+    return [dict(row) for row in result.mappings()]
+
+
+def _tables(sess: Session, statement) -> Dict[str, FromClause]:
+    """Maps the names EXPLAIN gives the tables of a statement to them.
+
+    EXPLAIN names a table read through an alias, e.g. one made by
+    sqlalchemy.orm.aliased, by the alias, which for an anonymous alias is
+    only chosen when the statement is compiled.
+    """
+
+    compiled = statement.compile(dialect=sess.get_bind().dialect)
+    tables = {}
+    for element in visitors.iterate(statement):
+        if isinstance(element, Table):
+            tables[element.name] = element
+        elif isinstance(element, Alias) and isinstance(element.element, Table):
+            name = compiled.truncated_names.get(("alias", element.name), element.name)
+            tables[name] = element
+
+    return tables
+
+
+def propose_index(statement, table: FromClause) -> Optional[str]:
+    """Proposes an index on a table for a statement.
+
+    Columns compared for equality come first, then columns compared with
+    other operators, then GROUP BY and ORDER BY columns. If the statement
+    uses few enough of the table's columns, the remaining selected columns
+    are added so that the index covers the query.
+
+    Arguments
+    ---------
+    statement:
+        The SELECT statement.
+    table: FromClause
+        The table to index, or an alias of it in the statement, in which case
+        only the columns used through the alias are considered.
+
+    Returns
+    -------
+    Optional[str]
+        The CREATE INDEX statement, or None if the statement does not filter,
+        group or sort on any column of the table.
+    """
+
+    equality, ranges, selected = [], [], []
+
+    def add(columns, column):
+        if column not in equality + ranges + columns:
+            columns.append(column)
+
+    def belongs(element):
+        # Compare by name: ORM statements refer to annotated copies of tables.
+        return (
+            isinstance(element, Column)
+            and getattr(element.table, "name", None) == table.name
+        )
+
+    for element in visitors.iterate(statement):
+        if not isinstance(element, BinaryExpression):
+            continue
+        left, right = element.left, element.right
+        # Join conditions are left out, since the schema indexes foreign keys.
+        if isinstance(left, Column) and isinstance(right, Column):
+            continue
+        for side in (left, right):
+            if belongs(side):
+                if element.operator in EQUALITY_OPERATORS:
+                    add(equality, side)
+                else:
+                    add(ranges, side)
+
+    ordering = []
+    for clause in list(getattr(statement, "_group_by_clauses", ())) + list(
+        getattr(statement, "_order_by_clauses", ())
+    ):
+        for element in visitors.iterate(clause):
+            if belongs(element):
+                add(ordering, element)
+
+    if not (equality or ranges or ordering):
+        return None
+
+    # A range comparison stops the index being used for later columns, so
+    # only the first is useful before the ordering columns.
+    columns = equality + ranges[:1] + ordering + ranges[1:]
+
+    for element in getattr(statement, "selected_columns", ()):
+        if belongs(element):
+            add(selected, element)
+    if len(set(columns + selected)) <= MAX_COVERING_COLUMNS:
+        columns += [c for c in selected if c not in columns]
+
+    names = [c.name for c in columns]
+    indexed = table.element.name if isinstance(table, Alias) else table.name
+    index_name = "ix_" + "_".join([indexed] + names)[:61]
+
+    return f"CREATE INDEX {index_name} ON {indexed} ({', '.join(names)})"
+
+
+def check_query(
+    sess: Session, query: Union[Query, Executable], min_rows: int = 0
+) -> List[Finding]:
+    """Reports the tables a query reads without making good use of indexes.
+
+    Arguments
+    ---------
+    sess: Session
+        A Session on a MySQL database with the warehouse schema.
+    query: Union[Query, Executable]
+        The query to check.
+    min_rows: int
+        Ignore tables MySQL expects to read fewer rows from than this, where
+        a scan is as cheap as an index lookup.
+
+    Returns
+    -------
+    List[Finding]
+        A Finding for each table scanned, sorted with a filesort or using a
+        temporary table.
+    """
+
+    statement = _statement(query)
+    tables = _tables(sess, statement)
+    findings = []
+
+    for row in explain(sess, statement):
+        rows = int(row.get("rows") or 0)
+        if rows < min_rows:
+            continue
+
+        extra = row.get("Extra") or ""
+        problems = []
+        if row.get("type") == "ALL":
+            problems.append("full table scan")
+        if "Using filesort" in extra:
+            problems.append("filesort")
+        if "Using temporary" in extra:
+            problems.append("temporary table")
+        if not problems:
+            continue
+
+        name = row.get("table") or ""
+        table = tables.get(name)
+        proposal = propose_index(statement, table) if table is not None else None
+
+        findings.append(Finding(name, ", ".join(problems), rows, proposal))
+
+    return findings
+
+
+class IndexAdvisor:
+    """Checks a set of registered query builders against the indexes."""
+
+    def __init__(self):
+        self.builders: Dict[str, Callable[[Session], Query]] = {}
+
+    def register(self, name: str, builder: Callable[[Session], Query]):
+        """Registers a function building a query from a Session."""
+
+        self.builders[name] = builder
+
+    def run(self, sess: Session, min_rows: int = 0) -> Dict[str, List[Finding]]:
+        """Checks every registered query.
+
+        Arguments
+        ---------
+        sess: Session
+            A Session on a MySQL database with the warehouse schema.
+        min_rows: int
+            Passed to check_query.
+
+        Returns
+        -------
+        Dict[str, List[Finding]]
+            The findings for each registered query, keyed by name.
+        """
+
+        return {
+            name: check_query(sess, builder(sess), min_rows)
+            for name, builder in self.builders.items()
+        }
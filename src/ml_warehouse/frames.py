@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Fetching query results as NumPy arrays and pandas DataFrames.
+
+The results of a Core SELECT are read from the cursor a chunk at a time and
+each column is converted straight into an array whose dtype is chosen up
+front from the column's type in the schema, without creating ORM objects:
+
+    lanes = IseqRunLaneMetrics.__table__
+    with engine.connect() as conn:
+        frame = fetch_frame(conn, select(lanes).where(lanes.c.id_run > 40000))
+
+Integer and boolean columns with NULLs become masked arrays, or pandas
+nullable arrays in a DataFrame. Requires numpy, and pandas for fetch_frame,
+installed with the "pandas" extra.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import types
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+
+from ml_warehouse.columnar import _float_bits, _integer_bits
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def numpy_dtype(type_: types.TypeEngine) -> "np.dtype":
+    """Returns the NumPy dtype holding the values of a column type.
+
+    Integers keep their width and signedness, MySQL FLOAT is single and
+    DOUBLE double precision, DECIMAL is double precision, dates and times
+    are datetime64[us] and strings are objects.
+
+    Arguments
+    ---------
+    type_: TypeEngine
+        A column type, e.g. IseqRunLaneMetrics.cycles.type.
+
+    Returns
+    -------
+    np.dtype
+    """
+
+    if np is None:
+        raise ImportError("numpy is required to fetch arrays")
+
+    if isinstance(type_, types.Boolean):
+        return np.dtype(bool)
+    if isinstance(type_, types.Integer):
+        unsigned = getattr(type_, "unsigned", False)
+        bits = _integer_bits(type_)
+        return np.dtype(f"{'u' if unsigned else 'i'}{bits // 8}")
+    if isinstance(type_, types.Float):
+        return np.dtype(f"f{_float_bits(type_) // 8}")
+    if isinstance(type_, types.Numeric):
+        return np.dtype("f8")
+    if isinstance(type_, types.DateTime):
+        return np.dtype("datetime64[us]")
+    if isinstance(type_, types.Date):
+        return np.dtype("datetime64[D]")
+    if isinstance(type_, types.Time):
+        return np.dtype("timedelta64[us]")
+
+    return np.dtype(object)
+
+
+def _fill(dtype: "np.dtype") -> Any:
+    """Returns the value standing in for NULL in an array of a dtype."""
+
+    if dtype.kind == "f":
+        return np.nan
+    if dtype.kind in "mM":
+        return dtype.type("NaT")
+
+    return dtype.type(0)
+
+
+def _convert(values: Tuple[Any, ...], dtype: "np.dtype"):
+    """Returns the array of some values and its mask of NULLs, if any."""
+
+    if dtype.kind == "O":
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array, None
+
+    mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    if not mask.any():
+        return np.array(values, dtype=dtype), None
+
+    fill = _fill(dtype)
+    return np.array([fill if v is None else v for v in values], dtype=dtype), mask
+
+
+def _fetch(
+    conn: Connection, stmt: Select, chunk_size: int
+) -> Dict[str, Tuple["np.ndarray", Optional["np.ndarray"]]]:
+    if np is None:
+        raise ImportError("numpy is required to fetch arrays")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+
+    names = [c.name for c in stmt.selected_columns]
+    dtypes = [numpy_dtype(c.type) for c in stmt.selected_columns]
+    chunks: List[List[Tuple[Any, Any]]] = [[] for _ in names]
+
+    result = conn.execution_options(stream_results=True).execute(stmt)
+    for rows in result.partitions(chunk_size):
+        for i, values in enumerate(zip(*rows)):
+            chunks[i].append(_convert(values, dtypes[i]))
+
+    columns = {}
+    for name, dtype, converted in zip(names, dtypes, chunks):
+        if not converted:
+            columns[name] = (np.empty(0, dtype=dtype), None)
+            continue
+
+        data = np.concatenate([c[0] for c in converted])
+        mask = None
+        if any(c[1] is not None for c in converted):
+            mask = np.concatenate(
+                [np.zeros(len(d), dtype=bool) if m is None else m for d, m in converted]
+            )
+        columns[name] = (data, mask)
+
+    return columns
+
+
+def fetch_arrays(
+    conn: Connection, stmt: Select, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Dict[str, "np.ma.MaskedArray"]:
+    """Runs a SELECT and returns each column of its results as an array.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to read with.
+    stmt: Select
+        The SELECT to run.
+    chunk_size: int
+        The number of rows fetched from the cursor at a time.
+
+    Returns
+    -------
+    Dict[str, np.ma.MaskedArray]
+        The columns by name, with NULLs masked.
+    """
+
+    return {
+        name: np.ma.masked_array(data, mask=np.ma.nomask if mask is None else mask)
+        for name, (data, mask) in _fetch(conn, stmt, chunk_size).items()
+    }
+
+
+def fetch_frame(
+    conn: Connection, stmt: Select, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> "pd.DataFrame":
+    """Runs a SELECT and returns its results as a DataFrame.
+
+    NULLs are NaN in floating point columns, NaT in date and time columns
+    and NA in integer and boolean columns, which then have the pandas
+    nullable dtype of the same width, e.g. UInt16.
+
+    Arguments
+    ---------
+    conn: Connection
+        The Connection to read with.
+    stmt: Select
+        The SELECT to run.
+    chunk_size: int
+        The number of rows fetched from the cursor at a time.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+
+    if pd is None:
+        raise ImportError("pandas is required to fetch DataFrames")
+
+    columns = {}
+    for name, (data, mask) in _fetch(conn, stmt, chunk_size).items():
+        if mask is None or data.dtype.kind not in "biu":
+            columns[name] = data
+        elif data.dtype.kind == "b":
+            columns[name] = pd.arrays.BooleanArray(data, mask)
+        else:
+            columns[name] = pd.arrays.IntegerArray(data, mask)
+
+    return pd.DataFrame(columns, copy=False)
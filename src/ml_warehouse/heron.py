@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Heron racks and the queue of tubes waiting to be wrangled.
+
+cgap_heron has a row per tube, unique by rack (container_barcode) and
+position. fetch_racks reads whole racks with one statement using the
+cgap_heron_rack_and_position index, rather than a query per tube, and
+RackCache keeps them for a while:
+
+    racks = fetch_racks(session, ["SA00882381", "SA00882382"])
+    tube = racks["SA00882381"].tube("A1")
+
+Tubes not yet wrangled for a destination form a work queue, read in pages
+of the cgap_heron_destination_wrangled index by cgap_heron_tmp, so each page
+is a range scan wherever it starts. Workers share the queue by claiming a
+batch, which locks its rows until they commit:
+
+    tubes = claim_unwrangled(session, "Lighthouse", 100)
+    ... wrangle the tubes ...
+    mark_wrangled(session, [t.cgap_heron_tmp for t in tubes])
+    session.commit()
+
+Racks and tubes are plain rows, not ORM objects.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from ml_warehouse.reference import DEFAULT_TTL
+
+DEFAULT_BATCH_SIZE = 100
+
+
+class Rack:
+    """The tubes of a Heron rack, by position.
+
+    Arguments
+    ---------
+    container_barcode: str
+        The rack barcode.
+    tubes: Iterable[Row]
+        The rack's cgap_heron rows.
+    """
+
+    def __init__(self, container_barcode: str, tubes: Iterable[Row]):
+        self.container_barcode = container_barcode
+        self._tubes: Dict[str, Row] = {tube.position: tube for tube in tubes}
+
+    def __len__(self) -> int:
+        return len(self._tubes)
+
+    def __iter__(self) -> Iterator[Row]:
+        return iter(self._tubes.values())
+
+    def positions(self) -> List[str]:
+        """Returns the positions holding tubes, in the order fetched."""
+
+        return list(self._tubes)
+
+    def tube(self, position: str) -> Optional[Row]:
+        """Returns the tube at a position, if there is one."""
+
+        return self._tubes.get(position)
+
+
+def fetch_racks(sess: Session, container_barcodes: Iterable[str]) -> Dict[str, Rack]:
+    """Fetches the tubes of racks with one statement.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to query with.
+    container_barcodes: Iterable[str]
+        The rack barcodes.
+
+    Returns
+    -------
+    Dict[str, Rack]
+        The rack of each barcode, empty if it has no tubes.
+    """
+
+    from ml_warehouse.schema import CgapHeron
+
+    racks: Dict[str, List[Row]] = {barcode: [] for barcode in container_barcodes}
+    if not racks:
+        return {}
+
+    table = CgapHeron.__table__
+    query = (
+        select(table)
+        .where(table.c.container_barcode.in_(sorted(racks)))
+        .order_by(table.c.container_barcode, table.c.position)
+    )
+    for tube in sess.execute(query):
+        racks.setdefault(tube.container_barcode, []).append(tube)
+
+    return {barcode: Rack(barcode, tubes) for barcode, tubes in racks.items()}
+
+
+class RackCache:
+    """Racks fetched from the database, each kept for a limited time.
+
+    Arguments
+    ---------
+    ttl: float
+        The number of seconds to keep each rack for.
+    clock: Callable[[], float]
+        The source of the current time, in seconds.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_TTL, clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: Dict[str, Tuple[float, Rack]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, sess: Session, container_barcode: str) -> Rack:
+        """Returns a rack, fetching it with sess if not cached."""
+
+        return self.get_many(sess, [container_barcode])[container_barcode]
+
+    def get_many(
+        self, sess: Session, container_barcodes: Iterable[str]
+    ) -> Dict[str, Rack]:
+        """Returns racks, fetching those not cached with one statement."""
+
+        barcodes = list(dict.fromkeys(container_barcodes))
+
+        with self._lock:
+            now = self.clock()
+            missing = [
+                barcode
+                for barcode in barcodes
+                if barcode not in self._entries or self._entries[barcode][0] <= now
+            ]
+            if missing:
+                for barcode, rack in fetch_racks(sess, missing).items():
+                    self._entries[barcode] = (now + self.ttl, rack)
+
+            return {barcode: self._entries[barcode][1] for barcode in barcodes}
+
+    def invalidate(self, *container_barcodes: str):
+        """Drops some cached racks, or every rack if none given."""
+
+        with self._lock:
+            if not container_barcodes:
+                self._entries.clear()
+            for barcode in container_barcodes:
+                self._entries.pop(barcode, None)
+
+
+def _unwrangled(destination: str, after: Optional[int], limit: int):
+    from ml_warehouse.schema import CgapHeron
+
+    table = CgapHeron.__table__
+
+    # The index on (destination, wrangled) ends with the primary key, so
+    # this is a range scan of it, in order.
+    query = select(table).where(
+        table.c.destination == destination, table.c.wrangled.is_(None)
+    )
+    if after is not None:
+        query = query.where(table.c.cgap_heron_tmp > after)
+
+    return query.order_by(table.c.cgap_heron_tmp).limit(limit)
+
+
+def unwrangled_pages(
+    sess: Session,
+    destination: str,
+    page_size: int = DEFAULT_BATCH_SIZE,
+    after: Optional[int] = None,
+) -> Iterator[List[Row]]:
+    """Pages through the tubes for a destination not yet wrangled.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to query with.
+    destination: str
+        The destination.
+    page_size: int
+        The maximum number of tubes per page.
+    after: Optional[int]
+        Start after the tube with this cgap_heron_tmp, e.g. the last of a
+        page read earlier.
+
+    Returns
+    -------
+    Iterator[List[Row]]
+        The pages of tubes, in cgap_heron_tmp order.
+    """
+
+    if page_size < 1:
+        raise ValueError(f"page_size must be positive, not {page_size}")
+
+    while True:
+        tubes = sess.execute(_unwrangled(destination, after, page_size)).all()
+        if tubes:
+            yield tubes
+        if len(tubes) < page_size:
+            return
+
+        after = tubes[-1].cgap_heron_tmp
+
+
+def claim_unwrangled(
+    sess: Session, destination: str, limit: int = DEFAULT_BATCH_SIZE
+) -> List[Row]:
+    """Claims a batch of the tubes for a destination not yet wrangled.
+
+    The tubes' rows are locked until the Session's transaction ends, and
+    are skipped by the claims of other workers until then, so that no two
+    workers claim the same tube. Mark them wrangled before committing.
+    Skipping locked rows needs MySQL 8.0 or later.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to query with, in the transaction to hold the claim.
+    destination: str
+        The destination.
+    limit: int
+        The maximum number of tubes to claim.
+
+    Returns
+    -------
+    List[Row]
+        The tubes claimed, in cgap_heron_tmp order, none if there are no
+        unclaimed tubes left.
+    """
+
+    query = _unwrangled(destination, None, limit).with_for_update(skip_locked=True)
+
+    return sess.execute(query).all()
+
+
+def mark_wrangled(
+    sess: Session, cgap_heron_tmps: Iterable[int], when: Optional[datetime] = None
+) -> int:
+    """Records that tubes have been wrangled.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to update with. The caller is responsible for
+        committing.
+    cgap_heron_tmps: Iterable[int]
+        The cgap_heron_tmp of each tube.
+    when: Optional[datetime]
+        When they were wrangled. The database's current time by default.
+
+    Returns
+    -------
+    int
+        The number of tubes updated.
+    """
+
+    from ml_warehouse.schema import CgapHeron
+
+    ids = sorted(set(cgap_heron_tmps))
+    if not ids:
+        return 0
+
+    table = CgapHeron.__table__
+    stmt = (
+        table.update()
+        .where(table.c.cgap_heron_tmp.in_(ids))
+        .values(wrangled=func.now() if when is None else when)
+    )
+
+    return sess.execute(stmt).rowcount
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Running queries with large IN lists.
+
+A query builder taking a list of values for an IN clause, such as the run
+ids of the npg_qc examples, produces one enormous statement when given tens
+of thousands of them. The strategies here run such a builder differently:
+
+    InList           one statement with every value, as the builder would
+    ChunkedInList    one statement per chunk of values, run concurrently
+    TempTableInList  one statement selecting the values from a temporary
+                     table, which they are first inserted into
+    AutoInList       whichever of the above suits the number of values
+
+Each returns all the rows, as if the builder had been run once:
+
+    rows = AutoInList().all(
+        session,
+        lambda sess, run_ids: get_iseq_product_metrics_by_study(
+            sess, study_name, run_ids
+        ),
+        run_ids,
+    )
+
+The builder's results must be partitioned by the values, e.g. grouped by
+or DISTINCT on the column they are compared with, for the rows of separate
+chunks to add up to the rows of a single statement. Duplicate values are
+ignored. benchmarks/in_lists.py measures where the strategies cross over.
+"""
+
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Sequence, Union
+
+from sqlalchemy import Column, Index, Integer, MetaData, String, Table, inspect, select
+from sqlalchemy.engine import Row
+from sqlalchemy.engine.result import result_tuple
+from sqlalchemy.orm import InstanceState, Query, Session
+from sqlalchemy.sql import Select
+
+from ml_warehouse.bulk import load_rows
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_WORKERS = 4
+
+# The numbers of values above which AutoInList switches from a single
+# statement to chunks, and from chunks to a temporary table.
+CHUNK_THRESHOLD = 2000
+TEMP_TABLE_THRESHOLD = 20000
+
+# Builds a query from a Session and the values, or a SELECT of them, to
+# compare with.
+Builder = Callable[[Session, Union[Sequence[Any], Select]], Query]
+
+
+def _unique(values: Iterable[Any]) -> List[Any]:
+    return sorted(set(values))
+
+
+def _merged(sess: Session, result: Any) -> Any:
+    """Returns a result read by another Session with its instances in sess."""
+
+    if isinstance(result, Row):
+        return result_tuple(result._fields)([_merged(sess, v) for v in result])
+    if isinstance(inspect(result, raiseerr=False), InstanceState):
+        return sess.merge(result, load=False)
+
+    return result
+
+
+class InListStrategy(ABC):
+    """A way of running a query builder with many values for an IN clause."""
+
+    @abstractmethod
+    def all(self, sess: Session, build: Builder, values: Iterable[Any]) -> List[Any]:
+        """Returns every row of the query for the values.
+
+        Arguments
+        ---------
+        sess: Session
+            The Session to query with.
+        build: Callable[[Session, Union[Sequence[Any], Select]], Query]
+            A function building the query from a Session and the values.
+        values: Iterable[Any]
+            The values for the IN clause.
+
+        Returns
+        -------
+        List[Any]
+            The rows of the query.
+        """
+
+
+class InList(InListStrategy):
+    """Runs a single statement with every value in its IN clause."""
+
+    def all(self, sess: Session, build: Builder, values: Iterable[Any]) -> List[Any]:
+        return build(sess, _unique(values)).all()
+
+
+class ChunkedInList(InListStrategy):
+    """Runs one statement per chunk of values and concatenates the rows.
+
+    With more than one worker, the chunks are run concurrently, each in a
+    Session of its own bound to the same Engine, so up to that many pooled
+    connections are used at once. The ORM instances they return are merged
+    into the caller's Session, without loading them again. Each chunk is
+    read in a transaction of its own, so the rows do not come from one
+    consistent snapshot: a row changed while the chunks run may be seen
+    before the change by one chunk and after it by another.
+
+    Arguments
+    ---------
+    chunk_size: int
+        The number of values per statement.
+    workers: int
+        The number of statements to run at once.
+    """
+
+    def __init__(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = DEFAULT_WORKERS
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+        if workers < 1:
+            raise ValueError(f"workers must be positive, not {workers}")
+        self.chunk_size = chunk_size
+        self.workers = workers
+
+    def all(self, sess: Session, build: Builder, values: Iterable[Any]) -> List[Any]:
+        values = _unique(values)
+        chunks = [
+            values[i : i + self.chunk_size]
+            for i in range(0, len(values), self.chunk_size)
+        ]
+
+        if self.workers == 1 or len(chunks) < 2:
+            results = [build(sess, chunk).all() for chunk in chunks]
+        else:
+            bind = sess.get_bind()
+
+            def run(chunk):
+                with Session(bind, future=True) as chunk_sess:
+                    return build(chunk_sess, chunk).all()
+
+            with ThreadPoolExecutor(min(self.workers, len(chunks))) as executor:
+                results = [
+                    [_merged(sess, row) for row in rows]
+                    for rows in executor.map(run, chunks)
+                ]
+
+        return [row for rows in results for row in rows]
+
+
+class TempTableInList(InListStrategy):
+    """Inserts the values into a temporary table and selects them from it.
+
+    The table lives on the Session's connection for the duration of the
+    query, which runs in the Session's transaction.
+
+    Arguments
+    ---------
+    batch_size: int
+        The number of values per insert.
+    """
+
+    def __init__(self, batch_size: int = 10000):
+        self.batch_size = batch_size
+
+    def all(self, sess: Session, build: Builder, values: Iterable[Any]) -> List[Any]:
+        values = _unique(values)
+        if not values:
+            return build(sess, values).all()
+
+        column_type = Integer if isinstance(values[0], int) else String(255)
+        # Values distinct in Python may be equal under the table's collation,
+        # so they are indexed rather than unique. The builder selects them
+        # in an IN, which finds each row once however many values match it.
+        name = f"tmp_in_list_{uuid.uuid4().hex[:12]}"
+        table = Table(
+            name,
+            MetaData(),
+            Column("value", column_type, nullable=False),
+            prefixes=["TEMPORARY"],
+        )
+        Index(f"{name}_value", table.c.value)
+
+        conn = sess.connection()
+        table.create(conn)
+        try:
+            load_rows(conn, table, ({"value": v} for v in values), self.batch_size)
+            return build(sess, select(table.c.value)).all()
+        finally:
+            table.drop(conn)
+
+
+class AutoInList(InListStrategy):
+    """Chooses a strategy by the number of values.
+
+    Arguments
+    ---------
+    chunk_threshold: int
+        Use ChunkedInList for more values than this.
+    temp_table_threshold: int
+        Use TempTableInList for more values than this.
+    chunk_size: int
+        The chunk size for ChunkedInList.
+    workers: int
+        The number of workers for ChunkedInList.
+    """
+
+    def __init__(
+        self,
+        chunk_threshold: int = CHUNK_THRESHOLD,
+        temp_table_threshold: int = TEMP_TABLE_THRESHOLD,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: int = DEFAULT_WORKERS,
+    ):
+        self.chunk_threshold = chunk_threshold
+        self.temp_table_threshold = temp_table_threshold
+        self.chunked = ChunkedInList(chunk_size, workers)
+
+    def all(self, sess: Session, build: Builder, values: Iterable[Any]) -> List[Any]:
+        values = _unique(values)
+
+        if len(values) > self.temp_table_threshold:
+            strategy = TempTableInList()
+        elif len(values) > self.chunk_threshold:
+            strategy = self.chunked
+        else:
+            strategy = InList()
+
+        return strategy.all(sess, build, values)
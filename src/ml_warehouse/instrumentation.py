@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Opt-in timing of the statements sent to the warehouse.
+
+Statements are grouped by fingerprint, their SQL with literals and bound
+parameters replaced by "?", and for each fingerprint a QueryRecorder keeps
+the number of executions and errors, a latency histogram, and the rows and
+bytes fetched:
+
+    recorder = enable()
+    ... run queries on engines from ml_warehouse.engine.get_engine ...
+    print(recorder.to_prometheus())
+
+Nothing is hooked into SQLAlchemy until enable() or QueryRecorder.instrument
+is called, so there is no overhead otherwise.
+"""
+
+import bisect
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ml_warehouse import engine as mlwh_engine
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 60)
+
+# The size assumed for values which are not strings or bytes, such as
+# numbers and dates.
+SCALAR_BYTES = 8
+
+_START_KEY = "ml_warehouse_query_start"
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"")
+_NUMBER = re.compile(r"(?<![\w.])\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|:\w+|\?")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """Returns a statement with literals and parameters replaced by "?".
+
+    Lists of values, such as those of IN clauses, are collapsed to "(...)"
+    so that the same query with a different number of values has the same
+    fingerprint.
+    """
+
+    text = _STRING.sub("?", statement)
+    text = _PARAMETER.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _LIST.sub("(...)", text)
+
+    return _SPACE.sub(" ", text).strip()
+
+
+def digest(fingerprint: str) -> str:
+    """Returns a short identifier for a fingerprint."""
+
+    return hashlib.sha1(fingerprint.encode()).hexdigest()[:12]
+
+
+@dataclass
+class StatementStats:
+    """Measurements of the statements sharing a fingerprint."""
+
+    fingerprint: str
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    # The number of calls in each latency bucket, the last being unbounded.
+    buckets: List[int] = field(default_factory=list)
+
+
+def _result_size(cursor, count_bytes: bool) -> Tuple[int, int]:
+    """Returns the rows and approximate bytes fetched by a DBAPI cursor."""
+
+    if cursor.description is None:
+        return 0, 0
+
+    rows = max(cursor.rowcount, 0)
+    if not count_bytes:
+        return rows, 0
+
+    # PyMySQL's buffered cursors hold the whole result by now. Server-side
+    # cursors have not fetched anything yet, so their bytes are not counted.
+    buffered = getattr(cursor, "_rows", None)
+    if not buffered:
+        return rows, 0
+
+    size = 0
+    for row in buffered:
+        for value in row:
+            if value is None:
+                continue
+            if isinstance(value, (str, bytes, bytearray)):
+                size += len(value)
+            else:
+                size += SCALAR_BYTES
+
+    return rows, size
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class QueryRecorder:
+    """Records the statements executed by instrumented engines.
+
+    Arguments
+    ---------
+    buckets: Sequence[float]
+        The upper bounds of the latency histogram buckets, in seconds.
+    count_bytes: bool
+        Estimate the size of each result, from the lengths of its string
+        and bytes values. This reads every value of every row, so can be
+        turned off for queries fetching millions of rows.
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, count_bytes: bool = True
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.count_bytes = count_bytes
+        self.stats: Dict[str, StatementStats] = {}
+        self.engines: List[Engine] = []
+        self._lock = threading.Lock()
+
+    def instrument(self, engine: Engine):
+        """Starts recording the statements executed by an Engine."""
+
+        if engine in self.engines:
+            return
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        event.listen(engine, "handle_error", self._error)
+        self.engines.append(engine)
+
+    def uninstrument(self, engine: Engine):
+        """Stops recording the statements executed by an Engine."""
+
+        if engine not in self.engines:
+            return
+        event.remove(engine, "before_cursor_execute", self._before)
+        event.remove(engine, "after_cursor_execute", self._after)
+        event.remove(engine, "handle_error", self._error)
+        self.engines.remove(engine)
+
+    def reset(self):
+        """Forgets everything recorded so far."""
+
+        with self._lock:
+            self.stats = {}
+
+    def _stats(self, statement: str) -> StatementStats:
+        fp = fingerprint(statement)
+        stats = self.stats.get(fp)
+        if stats is None:
+            stats = self.stats[fp] = StatementStats(
+                fp, buckets=[0] * (len(self.buckets) + 1)
+            )
+        return stats
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info[_START_KEY].pop()
+        rows, size = _result_size(cursor, self.count_bytes)
+
+        bucket = bisect.bisect_left(self.buckets, elapsed)
+
+        with self._lock:
+            stats = self._stats(statement)
+            stats.calls += 1
+            stats.seconds += elapsed
+            stats.rows += rows
+            stats.bytes += size
+            stats.buckets[bucket] += 1
+
+    def _error(self, exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(_START_KEY):
+            conn.info[_START_KEY].pop()
+        if exception_context.statement is None:
+            return
+
+        with self._lock:
+            self._stats(exception_context.statement).errors += 1
+
+    def to_json(self) -> str:
+        """Returns the measurements as JSON, the slowest statements in total first."""
+
+        with self._lock:
+            stats = sorted(self.stats.values(), key=lambda s: -s.seconds)
+            records = [{"digest": digest(s.fingerprint), **asdict(s)} for s in stats]
+
+        return json.dumps(
+            {"buckets": list(self.buckets), "statements": records}, indent=2
+        )
+
+    def to_prometheus(self) -> str:
+        """Returns the measurements in the Prometheus text exposition format.
+
+        Each fingerprint is labelled by its digest; the ml_warehouse_query_info
+        metric maps the digests to the fingerprints themselves.
+        """
+
+        with self._lock:
+            stats = list(self.stats.values())
+
+        lines = [
+            "# HELP ml_warehouse_query_info The statement with a digest.",
+            "# TYPE ml_warehouse_query_info gauge",
+        ]
+        for s in stats:
+            lines.append(
+                f'ml_warehouse_query_info{{query="{digest(s.fingerprint)}",'
+                f'statement="{_escape_label(s.fingerprint)}"}} 1'
+            )
+
+        lines += [
+            "# HELP ml_warehouse_query_duration_seconds Statement execution time.",
+            "# TYPE ml_warehouse_query_duration_seconds histogram",
+        ]
+        for s in stats:
+            label = f'query="{digest(s.fingerprint)}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), s.buckets):
+                cumulative += count
+                lines.append(
+                    f"ml_warehouse_query_duration_seconds_bucket"
+                    f'{{{label},le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f"ml_warehouse_query_duration_seconds_sum{{{label}}} {s.seconds}"
+            )
+            lines.append(
+                f"ml_warehouse_query_duration_seconds_count{{{label}}} {s.calls}"
+            )
+
+        for name, attribute, text in (
+            ("rows", "rows", "Rows returned."),
+            ("bytes", "bytes", "Approximate bytes fetched."),
+            ("errors", "errors", "Statements which failed."),
+        ):
+            metric = f"ml_warehouse_query_{name}_total"
+            lines += [f"# HELP {metric} {text}", f"# TYPE {metric} counter"]
+            for s in stats:
+                lines.append(
+                    f'{metric}{{query="{digest(s.fingerprint)}"}} '
+                    f"{getattr(s, attribute)}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+_recorder: Optional[QueryRecorder] = None
+
+
+def enable(recorder: Optional[QueryRecorder] = None) -> QueryRecorder:
+    """Records the statements of every Engine from get_engine.
+
+    Engines already created are instrumented at once, and those created
+    later as get_engine makes them.
+
+    Arguments
+    ---------
+    recorder: Optional[QueryRecorder]
+        The recorder to use; a new one with the default settings otherwise.
+
+    Returns
+    -------
+    QueryRecorder
+        The recorder in use.
+    """
+
+    global _recorder
+
+    disable()
+    _recorder = recorder if recorder is not None else QueryRecorder()
+    for engine in mlwh_engine._engines.values():
+        _recorder.instrument(engine)
+    mlwh_engine._engine_hooks.append(_recorder.instrument)
+
+    return _recorder
+
+
+def disable():
+    """Stops recording statements, removing every hook added by enable()."""
+
+    global _recorder
+
+    if _recorder is None:
+        return
+    mlwh_engine._engine_hooks.remove(_recorder.instrument)
+    for engine in list(_recorder.engines):
+        _recorder.uninstrument(engine)
+    _recorder = None
+
+
+def get_recorder() -> Optional[QueryRecorder]:
+    """Returns the recorder installed by enable(), if any."""
+
+    return _recorder
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Looking up Lighthouse samples a plate at a time.
+
+Tools handling the plates Lighthouse labs sent look up the sample in each
+well, by rna_id or by plate barcode and coordinate, with a query per well.
+A PlateIndex fetches every sample of a set of plates with one query, using
+the index_lighthouse_sample_on_plate_barcode_and_created_at index, and
+answers the lookups of their wells from memory:
+
+    plates = PlateIndex()
+    plates.load(session, ["AP-rna-00110029", "AP-rna-00110030"])
+
+    sample = plates.current("AP-rna-00110029", "A01")
+    sample = plates.current_by_rna_id("AP-rna-00110029_A01")
+
+A well may have several samples, one per result received, of which at most
+one is current (is_current). Samples are plain rows, not ORM objects, so an
+index can be shared between sessions and threads once loaded.
+"""
+
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+Well = Tuple[str, int]
+
+_COORDINATE = re.compile(r"^([A-Za-z]+)0*(\d+)$")
+
+
+def well(coordinate: str) -> Well:
+    """Returns the row and column of a well coordinate.
+
+    Arguments
+    ---------
+    coordinate: str
+        A coordinate such as "A01" or "a1".
+
+    Returns
+    -------
+    Tuple[str, int]
+        The row letters, in upper case, and the column number, so that "A1"
+        and "A01" are the same well.
+    """
+
+    match = _COORDINATE.match(coordinate.strip())
+    if match is None:
+        raise ValueError(f"Invalid well coordinate {coordinate!r}")
+
+    return match.group(1).upper(), int(match.group(2))
+
+
+class Plate:
+    """The Lighthouse samples of a plate, by well.
+
+    Arguments
+    ---------
+    plate_barcode: str
+        The plate barcode.
+    samples: Iterable[Row]
+        The plate's lighthouse_sample rows, oldest first.
+    """
+
+    def __init__(self, plate_barcode: str, samples: Iterable[Row]):
+        self.plate_barcode = plate_barcode
+
+        # The samples of each (well, is_current), oldest first.
+        self._samples: Dict[Tuple[Well, bool], List[Row]] = {}
+        for sample in samples:
+            if sample.coordinate is None:
+                continue
+            key = (well(sample.coordinate), bool(sample.is_current))
+            self._samples.setdefault(key, []).append(sample)
+
+    def __len__(self) -> int:
+        return sum(len(samples) for samples in self._samples.values())
+
+    def wells(self) -> List[Well]:
+        """Returns the wells with samples, in row then column order."""
+
+        return sorted({w for w, _ in self._samples})
+
+    def current(self, coordinate: str) -> Optional[Row]:
+        """Returns the current sample of a well, if it has one."""
+
+        samples = self._samples.get((well(coordinate), True))
+
+        # current_rna_id is unique, so there is at most one.
+        return samples[-1] if samples else None
+
+    def samples(self, coordinate: str, is_current: Optional[bool] = None) -> List[Row]:
+        """Returns the samples of a well, oldest first.
+
+        Arguments
+        ---------
+        coordinate: str
+            The well coordinate.
+        is_current: Optional[bool]
+            Only current samples if True, only earlier samples if False, or
+            every sample by default.
+
+        Returns
+        -------
+        List[Row]
+        """
+
+        flags = (False, True) if is_current is None else (is_current,)
+        samples = []
+        for flag in flags:
+            samples += self._samples.get((well(coordinate), flag), [])
+
+        return sorted(samples, key=lambda s: (s.created_at is not None, s.created_at))
+
+
+class PlateIndex:
+    """The Lighthouse samples of the plates loaded so far, by well."""
+
+    def __init__(self):
+        self._plates: Dict[str, Plate] = {}
+        self._by_root_sample_id: Dict[str, List[Row]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, plate_barcode: str) -> bool:
+        return plate_barcode in self._plates
+
+    def load(
+        self, sess: Session, plate_barcodes: Iterable[str], reload: bool = False
+    ) -> int:
+        """Fetches the samples of plates with one query.
+
+        Arguments
+        ---------
+        sess: Session
+            The Session to query with.
+        plate_barcodes: Iterable[str]
+            The plate barcodes.
+        reload: bool
+            Fetch plates already loaded again, to see new results.
+
+        Returns
+        -------
+        int
+            The number of samples fetched.
+        """
+
+        from ml_warehouse.schema import LighthouseSample
+
+        wanted = set(plate_barcodes)
+        if not reload:
+            wanted -= set(self._plates)
+        if not wanted:
+            return 0
+
+        table = LighthouseSample.__table__
+        query = (
+            select(table)
+            .where(table.c.plate_barcode.in_(sorted(wanted)))
+            .order_by(table.c.plate_barcode, table.c.created_at, table.c.id)
+        )
+
+        # Plates without samples are remembered too, so that they are not
+        # fetched again.
+        samples: Dict[str, List[Row]] = {barcode: [] for barcode in wanted}
+        n = 0
+        for sample in sess.execute(query):
+            samples.setdefault(sample.plate_barcode, []).append(sample)
+            n += 1
+
+        with self._lock:
+            reloaded = set(samples) & set(self._plates)
+            if reloaded:
+                for root_sample_id, found in list(self._by_root_sample_id.items()):
+                    kept = [s for s in found if s.plate_barcode not in reloaded]
+                    if kept:
+                        self._by_root_sample_id[root_sample_id] = kept
+                    else:
+                        del self._by_root_sample_id[root_sample_id]
+
+            for barcode, plate_samples in samples.items():
+                self._plates[barcode] = Plate(barcode, plate_samples)
+                for sample in plate_samples:
+                    self._by_root_sample_id.setdefault(
+                        sample.root_sample_id, []
+                    ).append(sample)
+
+        return n
+
+    def plate(self, plate_barcode: str) -> Plate:
+        """Returns a loaded plate."""
+
+        try:
+            return self._plates[plate_barcode]
+        except KeyError:
+            raise KeyError(f"Plate {plate_barcode} has not been loaded") from None
+
+    def current(self, plate_barcode: str, coordinate: str) -> Optional[Row]:
+        """Returns the current sample of a well of a loaded plate, if any."""
+
+        return self.plate(plate_barcode).current(coordinate)
+
+    def samples(
+        self, plate_barcode: str, coordinate: str, is_current: Optional[bool] = None
+    ) -> List[Row]:
+        """Returns the samples of a well of a loaded plate, oldest first."""
+
+        return self.plate(plate_barcode).samples(coordinate, is_current)
+
+    def by_root_sample_id(self, root_sample_id: str) -> List[Row]:
+        """Returns the samples of the loaded plates with a root_sample_id."""
+
+        return list(self._by_root_sample_id.get(root_sample_id, ()))
+
+    def current_by_rna_id(self, rna_id: str) -> Optional[Row]:
+        """Returns the current sample with an rna_id, as current_rna_id would.
+
+        Arguments
+        ---------
+        rna_id: str
+            The rna_id, the plate barcode and coordinate joined by "_". Its
+            plate must have been loaded.
+
+        Returns
+        -------
+        Optional[Row]
+        """
+
+        plate_barcode, _, coordinate = rna_id.rpartition("_")
+        if not plate_barcode:
+            raise ValueError(f"Invalid rna_id {rna_id!r}")
+
+        return self.current(plate_barcode, coordinate)
@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""The lineage of CGAP cell lines.
+
+Each cgap_line_identifier row names the line it was derived from, in
+direct_parent_uuid, so finding every descendant of a line takes a query per
+generation. A LineageGraph reads the table once and computes the ancestors
+and descendants of every line in memory; queries for the labware, releases
+and donor of a line and its relatives are then single statements:
+
+    graph = LineageGraph()
+    graph.refresh(session)
+
+    graph.descendants(line_uuid)
+    lineage_labware(session, graph, line_uuid).all()
+    lineage_donor(session, graph, line_uuid)
+
+refresh reads only the rows added since the last refresh, by primary key,
+unless rows have been deleted, when it reads the table again. Changes to
+existing rows are only seen by load.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query, Session
+
+
+class Line(NamedTuple):
+    """A cell line, from cgap_line_identifier."""
+
+    line_uuid: str
+    friendly_name: str
+    biomaterial_uuid: str
+    direct_parent_uuid: Optional[str]
+    accession_number: Optional[str]
+    project: Optional[str]
+
+
+class LineageGraph:
+    """Cell lines with their ancestors and descendants."""
+
+    def __init__(self):
+        self._lines: Dict[str, Line] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._ancestors: Dict[str, Tuple[str, ...]] = {}
+        self._descendants: Dict[str, List[str]] = {}
+
+        # The number of rows and the highest primary key read, to tell
+        # whether later rows have only been added.
+        self._count = 0
+        self._last_key: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __contains__(self, line_uuid: str) -> bool:
+        return line_uuid in self._lines
+
+    def line(self, line_uuid: str) -> Line:
+        """Returns a line."""
+
+        try:
+            return self._lines[line_uuid]
+        except KeyError:
+            raise KeyError(f"Unknown cell line {line_uuid}") from None
+
+    def children(self, line_uuid: str) -> List[str]:
+        """Returns the lines derived directly from a line."""
+
+        self.line(line_uuid)
+
+        return list(self._children.get(line_uuid, ()))
+
+    def ancestors(self, line_uuid: str) -> List[str]:
+        """Returns the ancestors of a line, its direct parent first.
+
+        A parent which is not itself in cgap_line_identifier ends the list.
+        """
+
+        self.line(line_uuid)
+
+        return list(self._ancestors[line_uuid])
+
+    def descendants(self, line_uuid: str) -> List[str]:
+        """Returns the descendants of a line, generation by generation."""
+
+        self.line(line_uuid)
+        depth = len(self._ancestors[line_uuid])
+
+        return sorted(
+            self._descendants.get(line_uuid, ()),
+            key=lambda d: (len(self._ancestors[d]) - depth, d),
+        )
+
+    def root(self, line_uuid: str) -> str:
+        """Returns the earliest known ancestor of a line, or the line itself."""
+
+        known = [a for a in self.ancestors(line_uuid) if a in self._lines]
+
+        return known[-1] if known else line_uuid
+
+    def lineage(self, line_uuid: str) -> List[str]:
+        """Returns a line, its ancestors and its descendants."""
+
+        return [line_uuid] + self.ancestors(line_uuid) + self.descendants(line_uuid)
+
+    def _add(self, lines: Iterable[Line]) -> Set[str]:
+        added = set()
+        for line in lines:
+            previous = self._lines.get(line.line_uuid)
+            if previous is not None and previous.direct_parent_uuid is not None:
+                self._children[previous.direct_parent_uuid].remove(line.line_uuid)
+            self._lines[line.line_uuid] = line
+            if line.direct_parent_uuid is not None:
+                self._children.setdefault(line.direct_parent_uuid, []).append(
+                    line.line_uuid
+                )
+            added.add(line.line_uuid)
+
+        return added
+
+    def _ancestry(self, line_uuid: str) -> Tuple[str, ...]:
+        # Walk up until reaching a line whose ancestors are known, or one
+        # not in the table. A cycle, which would be an error in the data,
+        # ends the walk too.
+        chain = []
+        seen = {line_uuid}
+        parent = self._lines[line_uuid].direct_parent_uuid
+        while parent is not None and parent not in seen:
+            chain.append(parent)
+            if parent in self._ancestors:
+                return tuple(chain) + self._ancestors[parent]
+            if parent not in self._lines:
+                break
+            seen.add(parent)
+            parent = self._lines[parent].direct_parent_uuid
+
+        return tuple(chain)
+
+    def _close(self, line_uuids: Iterable[str]):
+        """Computes the ancestors of lines, adding them to their descendants."""
+
+        # Parents first, so that their children reuse their ancestors.
+        pending = sorted(line_uuids, key=lambda u: len(self._ancestry(u)))
+        for line_uuid in pending:
+            ancestors = self._ancestors[line_uuid] = self._ancestry(line_uuid)
+            for ancestor in ancestors:
+                self._descendants.setdefault(ancestor, []).append(line_uuid)
+
+    def _rebuild(self):
+        self._ancestors.clear()
+        self._descendants.clear()
+        self._close(list(self._lines))
+
+    def update(self, lines: Iterable[Line]):
+        """Adds or replaces lines, updating the ancestors and descendants.
+
+        Arguments
+        ---------
+        lines: Iterable[Line]
+            The lines, or rows with the same columns.
+        """
+
+        with self._lock:
+            added = self._add(
+                Line(*(getattr(row, f) for f in Line._fields)) for row in lines
+            )
+
+            # Lines which are new leaves only extend the closures; any other
+            # change may alter those of existing lines.
+            if any(u in self._ancestors or u in self._children for u in added):
+                self._rebuild()
+            else:
+                self._close(added)
+
+    def load(self, sess: Session) -> int:
+        """Replaces the graph with every row of cgap_line_identifier.
+
+        Arguments
+        ---------
+        sess: Session
+            The Session to query with.
+
+        Returns
+        -------
+        int
+            The number of rows read.
+        """
+
+        from ml_warehouse.schema import CgapLineIdentifier
+
+        table = CgapLineIdentifier.__table__
+        rows = sess.execute(select(table)).all()
+
+        with self._lock:
+            self._lines.clear()
+            self._children.clear()
+            self._ancestors.clear()
+            self._descendants.clear()
+            self._count = 0
+            self._last_key = None
+        self.update(rows)
+        self._read(rows)
+
+        return len(rows)
+
+    def _read(self, rows: List[Any]):
+        with self._lock:
+            self._count += len(rows)
+            for row in rows:
+                if self._last_key is None or row.cgap_line_identifier_tmp > (
+                    self._last_key
+                ):
+                    self._last_key = row.cgap_line_identifier_tmp
+
+    def refresh(self, sess: Session) -> int:
+        """Reads the rows added since the last refresh, or every row if none.
+
+        Arguments
+        ---------
+        sess: Session
+            The Session to query with.
+
+        Returns
+        -------
+        int
+            The number of rows read.
+        """
+
+        from ml_warehouse.schema import CgapLineIdentifier
+
+        if self._last_key is None:
+            return self.load(sess)
+
+        table = CgapLineIdentifier.__table__
+        key = table.c.cgap_line_identifier_tmp
+        (count,) = sess.execute(
+            select(func.count()).select_from(table).where(key <= self._last_key)
+        ).one()
+        if count != self._count:
+            return self.load(sess)
+
+        rows = sess.execute(select(table).where(key > self._last_key)).all()
+        self.update(rows)
+        self._read(rows)
+
+        return len(rows)
+
+
+def _lineage_query(
+    sess: Session,
+    graph: LineageGraph,
+    table_cls: Any,
+    line_uuid: str,
+    relatives: str,
+) -> Query:
+    if relatives == "descendants":
+        uuids = [line_uuid] + graph.descendants(line_uuid)
+    elif relatives == "lineage":
+        uuids = graph.lineage(line_uuid)
+    elif relatives == "line":
+        uuids = [line_uuid]
+    else:
+        raise ValueError(
+            f"Unknown relatives {relatives!r}, expected line, descendants or lineage"
+        )
+
+    return sess.query(table_cls).filter(table_cls.cell_line_uuid.in_(uuids))
+
+
+def lineage_labware(
+    sess: Session, graph: LineageGraph, line_uuid: str, relatives: str = "descendants"
+) -> Query:
+    """Returns a query for the conjured labware of a line and its relatives.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to query with.
+    graph: LineageGraph
+        A graph holding the line.
+    line_uuid: str
+        The line.
+    relatives: str
+        Which relatives to include: "line" for none, "descendants" or
+        "lineage" for ancestors and descendants.
+
+    Returns
+    -------
+    Query
+        A query for CgapConjuredLabware.
+    """
+
+    from ml_warehouse.schema import CgapConjuredLabware
+
+    return _lineage_query(sess, graph, CgapConjuredLabware, line_uuid, relatives)
+
+
+def lineage_releases(
+    sess: Session, graph: LineageGraph, line_uuid: str, relatives: str = "descendants"
+) -> Query:
+    """Returns a query for the releases of a line and its relatives.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to query with.
+    graph: LineageGraph
+        A graph holding the line.
+    line_uuid: str
+        The line.
+    relatives: str
+        Which relatives to include: "line" for none, "descendants" or
+        "lineage" for ancestors and descendants.
+
+    Returns
+    -------
+    Query
+        A query for CgapRelease.
+    """
+
+    from ml_warehouse.schema import CgapRelease
+
+    return _lineage_query(sess, graph, CgapRelease, line_uuid, relatives)
+
+
+def lineage_donor(sess: Session, graph: LineageGraph, line_uuid: str) -> Optional[Any]:
+    """Returns the biomaterial, naming the donor, a line was derived from.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to query with.
+    graph: LineageGraph
+        A graph holding the line.
+    line_uuid: str
+        The line.
+
+    Returns
+    -------
+    Optional[CgapBiomaterial]
+        The biomaterial of the line's earliest known ancestor, if it is in
+        cgap_biomaterial.
+    """
+
+    from ml_warehouse.schema import CgapBiomaterial
+
+    root = graph.line(graph.root(line_uuid))
+
+    return (
+        sess.query(CgapBiomaterial)
+        .filter(CgapBiomaterial.biomaterial_uuid == root.biomaterial_uuid)
+        .one_or_none()
+    )
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Named eager-loading profiles for related rows.
+
+Relationships are loaded lazily by default, so reading .sample and .study
+of each of a query's results runs two more SELECTs per result. A profile
+names the relationships a kind of caller reads and how to load them with
+the query instead, as the Perl prefetch option does:
+
+    runs = apply_profile(session.query(PacBioRun).filter(...), "irods").all()
+
+    irods  sample and study of the LIMS tables, as npg_irods reads them
+    qc     product metrics of flowcells and runs, and the flowcell, lane
+           metrics, sample and study of Illumina product metrics
+
+Many-to-one relationships to tables with a row per result, such as sample,
+are joined into the query; those to tables shared by many results, such as
+study, and one-to-many relationships are loaded by one more SELECT ... IN
+each. Either way the number of statements does not depend on the number of
+results.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy.orm import Query, defaultload, joinedload, selectinload
+
+# Loader strategies, named after the loader option functions.
+JOINED = "joinedload"
+SELECTIN = "selectinload"
+
+_STRATEGIES = {JOINED: joinedload, SELECTIN: selectinload}
+
+_LIMS_TABLES = (
+    "BmapFlowcell",
+    "FlgenPlate",
+    "IseqFlowcell",
+    "OseqFlowcell",
+    "PacBioRun",
+    "StockResource",
+)
+
+# For each profile, the relationships to load for each mapped class, by
+# class name, as (path, strategy) pairs. A path of "a.b" loads b of the
+# objects loaded for a, which must come before it.
+PROFILES: Dict[str, Dict[str, Tuple[Tuple[str, str], ...]]] = {
+    "irods": {name: (("sample", JOINED), ("study", SELECTIN)) for name in _LIMS_TABLES},
+    "qc": {
+        "IseqFlowcell": (
+            ("sample", JOINED),
+            ("study", SELECTIN),
+            ("iseq_product_metrics", SELECTIN),
+        ),
+        "IseqProductMetrics": (
+            ("iseq_flowcell", JOINED),
+            ("iseq_flowcell.sample", JOINED),
+            ("iseq_flowcell.study", SELECTIN),
+            ("iseq_run_lane_metrics", JOINED),
+        ),
+        "PacBioRun": (
+            ("sample", JOINED),
+            ("study", SELECTIN),
+            ("pac_bio_product_metrics", SELECTIN),
+            ("pac_bio_product_metrics.pac_bio_run_well_metrics", JOINED),
+        ),
+    },
+}
+
+
+def _check_profile(profile: str):
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown loading profile {profile!r}, expected one of {list(PROFILES)}"
+        )
+
+
+def loader_options(profile: str, cls: type) -> List[Any]:
+    """Returns the loader options of a profile for a mapped class.
+
+    Arguments
+    ---------
+    profile: str
+        The profile name, one of the keys of PROFILES.
+    cls: type
+        The mapped class queried for.
+
+    Returns
+    -------
+    List[Any]
+        Options for Query.options, none if the profile does not cover cls.
+    """
+
+    _check_profile(profile)
+
+    options = []
+    for path, strategy in PROFILES[profile].get(cls.__name__, ()):
+        *parents, name = path.split(".")
+
+        # Reach the last relationship through the earlier ones, leaving
+        # their own loading as set by their entries.
+        parent_option = None
+        target = cls
+        for parent in parents:
+            attr = getattr(target, parent)
+            if parent_option is None:
+                parent_option = defaultload(attr)
+            else:
+                parent_option = parent_option.defaultload(attr)
+            target = attr.property.mapper.class_
+
+        if parent_option is None:
+            load = _STRATEGIES[strategy]
+        else:
+            load = getattr(parent_option, strategy)
+        options.append(load(getattr(target, name)))
+
+    return options
+
+
+def apply_profile(query: Query, profile: str) -> Query:
+    """Adds the loader options of a profile to a query.
+
+    Arguments
+    ---------
+    query: Query
+        A query for one or more mapped classes.
+    profile: str
+        The profile name, one of the keys of PROFILES.
+
+    Returns
+    -------
+    Query
+        The query, loading the relationships of the profile for each mapped
+        class it returns.
+    """
+
+    _check_profile(profile)
+
+    options = []
+    for description in query.column_descriptions:
+        entity = description["entity"]
+        if entity is not None and description["expr"] is entity:
+            options += loader_options(profile, entity)
+
+    return query.options(*options) if options else query
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Resolving product ids to iRODS locations in memory.
+
+Tools publishing to iRODS look up where each product lives, in
+seq_product_irods_locations, once per product. A ProductLocationIndex reads
+the whole table once, then only the rows changed since, and answers those
+lookups from memory, keyed as the table's pi_root_product unique index is:
+
+    index = ProductLocationIndex.from_snapshot(path)  # Empty if no file yet
+    index.refresh(session)
+    index.save(path)
+
+    for location in index.locations(id_product):
+        print(location.data_path())
+
+The snapshot lets another process start from where this one left off
+rather than reading the whole table again. Incremental refreshes see rows
+added or changed, but not rows deleted; call load to read the table afresh.
+"""
+
+import json
+import os
+import posixpath
+import sys
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Rows changed this many seconds before the last change seen are read again
+# on refresh, so that those committed late by long transactions are not
+# missed. Reading a row again is harmless.
+DEFAULT_OVERLAP_SECONDS = 300
+
+SNAPSHOT_VERSION = 1
+
+
+class ProductLocation(NamedTuple):
+    """The iRODS location of a product, from seq_product_irods_locations."""
+
+    id_product: str
+    irods_root_collection: str
+    irods_data_relative_path: Optional[str]
+    irods_secondary_data_relative_path: Optional[str]
+    seq_platform_name: str
+    pipeline_name: str
+
+    def data_path(self) -> Optional[str]:
+        """Returns the iRODS path of the product's most used data, if known."""
+
+        if self.irods_data_relative_path is None:
+            return None
+
+        return posixpath.join(self.irods_root_collection, self.irods_data_relative_path)
+
+    def secondary_data_path(self) -> Optional[str]:
+        """Returns the iRODS path of the product's other useful data, if known."""
+
+        if self.irods_secondary_data_relative_path is None:
+            return None
+
+        return posixpath.join(
+            self.irods_root_collection, self.irods_secondary_data_relative_path
+        )
+
+
+def _location(row: Any) -> ProductLocation:
+    # Many products share a root collection, platform and pipeline; keep
+    # one copy of each of those strings.
+    return ProductLocation(
+        row.id_product,
+        sys.intern(row.irods_root_collection),
+        row.irods_data_relative_path,
+        row.irods_secondary_data_relative_path,
+        sys.intern(row.seq_platform_name),
+        sys.intern(row.pipeline_name),
+    )
+
+
+class ProductLocationIndex:
+    """The iRODS locations of products, keyed by id_product.
+
+    Arguments
+    ---------
+    overlap_seconds: int
+        How far before the last change seen to read again on refresh.
+    """
+
+    def __init__(self, overlap_seconds: int = DEFAULT_OVERLAP_SECONDS):
+        self.overlap_seconds = overlap_seconds
+        self.last_changed: Optional[datetime] = None
+
+        # The location of each (irods_root_collection, id_product), and the
+        # root collections of each id_product.
+        self._locations: Dict[Tuple[str, str], ProductLocation] = {}
+        self._roots: Dict[str, Tuple[str, ...]] = {}
+        # The key of each row, by id_seq_product_irods_locations_tmp, so
+        # that a row changed to another key is moved.
+        self._keys: Dict[int, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def location(
+        self, id_product: str, irods_root_collection: Optional[str] = None
+    ) -> Optional[ProductLocation]:
+        """Returns a product's location, if known.
+
+        Arguments
+        ---------
+        id_product: str
+            The product id.
+        irods_root_collection: Optional[str]
+            The root collection. If not given, the product must have at
+            most one location.
+
+        Returns
+        -------
+        Optional[ProductLocation]
+        """
+
+        if irods_root_collection is not None:
+            with self._lock:
+                return self._locations.get((irods_root_collection, id_product))
+
+        locations = self.locations(id_product)
+        if len(locations) > 1:
+            raise ValueError(
+                f"Product {id_product} has {len(locations)} locations, "
+                "give an irods_root_collection"
+            )
+
+        return locations[0] if locations else None
+
+    def locations(self, id_product: str) -> List[ProductLocation]:
+        """Returns every location of a product, ordered by root collection."""
+
+        with self._lock:
+            return [
+                self._locations[(root, id_product)]
+                for root in self._roots.get(id_product, ())
+            ]
+
+    def update(self, rows: Iterable[Any]) -> int:
+        """Adds or replaces the locations of rows of seq_product_irods_locations.
+
+        Arguments
+        ---------
+        rows: Iterable[Any]
+            Rows with the columns of seq_product_irods_locations, e.g. from a
+            select of its table.
+
+        Returns
+        -------
+        int
+            The number of rows read.
+        """
+
+        read = [
+            (row.id_seq_product_irods_locations_tmp, _location(row), row.last_changed)
+            for row in rows
+        ]
+
+        with self._lock:
+            # Remove the old keys of rows changed to another key before adding
+            # any, so that rows swapping keys do not remove each other's.
+            for id_tmp, location, _ in read:
+                key = (location.irods_root_collection, location.id_product)
+                previous = self._keys.get(id_tmp)
+                if previous is not None and previous != key:
+                    self._remove(previous)
+
+            for id_tmp, location, last_changed in read:
+                key = (location.irods_root_collection, location.id_product)
+                self._keys[id_tmp] = key
+
+                self._locations[key] = location
+                roots = self._roots.get(location.id_product, ())
+                if key[0] not in roots:
+                    self._roots[location.id_product] = tuple(sorted(roots + key[:1]))
+
+                if last_changed is not None and (
+                    self.last_changed is None or last_changed > self.last_changed
+                ):
+                    self.last_changed = last_changed
+
+        return len(read)
+
+    def _remove(self, key: Tuple[str, str]):
+        root, id_product = key
+        self._locations.pop(key, None)
+
+        roots = tuple(r for r in self._roots.get(id_product, ()) if r != root)
+        if roots:
+            self._roots[id_product] = roots
+        else:
+            self._roots.pop(id_product, None)
+
+    def _clear(self):
+        with self._lock:
+            self._locations.clear()
+            self._roots.clear()
+            self._keys.clear()
+            self.last_changed = None
+
+    def load(self, sess: Session) -> int:
+        """Replaces the index with every row of seq_product_irods_locations.
+
+        Arguments
+        ---------
+        sess: Session
+            The Session to query with.
+
+        Returns
+        -------
+        int
+            The number of rows read.
+        """
+
+        from ml_warehouse.schema import SeqProductIrodsLocations
+
+        table = SeqProductIrodsLocations.__table__
+        query = select(table).execution_options(stream_results=True)
+
+        self._clear()
+        return self.update(sess.execute(query))
+
+    def refresh(self, sess: Session) -> int:
+        """Reads the rows changed since the last refresh, or every row if none.
+
+        Arguments
+        ---------
+        sess: Session
+            The Session to query with.
+
+        Returns
+        -------
+        int
+            The number of rows read.
+        """
+
+        from ml_warehouse.schema import SeqProductIrodsLocations
+
+        if self.last_changed is None:
+            return self.load(sess)
+
+        table = SeqProductIrodsLocations.__table__
+        since = self.last_changed - timedelta(seconds=self.overlap_seconds)
+        query = (
+            select(table)
+            .where(table.c.last_changed >= since)
+            .order_by(table.c.last_changed, table.c.id_seq_product_irods_locations_tmp)
+        )
+
+        return self.update(sess.execute(query))
+
+    def save(self, path: str):
+        """Writes a snapshot of the index to a file.
+
+        The file is rewritten atomically, so a crash never leaves it half
+        written and other processes never read it half written.
+
+        Arguments
+        ---------
+        path: str
+            The snapshot file path.
+        """
+
+        with self._lock:
+            snapshot = {
+                "version": SNAPSHOT_VERSION,
+                "last_changed": None
+                if self.last_changed is None
+                else self.last_changed.isoformat(),
+                "rows": [
+                    [id_tmp, *self._locations[key]]
+                    for id_tmp, key in self._keys.items()
+                    if key in self._locations
+                ],
+            }
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_snapshot(cls, path: str, **kwargs: Any) -> "ProductLocationIndex":
+        """Returns an index read from a snapshot file written by save.
+
+        Arguments
+        ---------
+        path: str
+            The snapshot file path. If there is no file, or it was written by
+            an incompatible version, the index is empty and its next refresh
+            reads the whole table.
+        kwargs: Any
+            Other arguments for ProductLocationIndex.
+
+        Returns
+        -------
+        ProductLocationIndex
+        """
+
+        index = cls(**kwargs)
+        try:
+            with open(path, "r") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return index
+
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return index
+
+        with index._lock:
+            for id_tmp, *values in snapshot["rows"]:
+                location = _location(ProductLocation(*values))
+                key = (location.irods_root_collection, location.id_product)
+                index._keys[id_tmp] = key
+                index._locations[key] = location
+                index._roots[location.id_product] = tuple(
+                    sorted(index._roots.get(location.id_product, ()) + key[:1])
+                )
+
+            if snapshot["last_changed"] is not None:
+                index.last_changed = datetime.fromisoformat(snapshot["last_changed"])
+
+        return index
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""In-process caches of small reference tables.
+
+Tables such as iseq_run_status_dict hardly ever change, yet queries join
+them just to turn an id into a description. The functions here read them
+once and keep them in memory for DEFAULT_TTL seconds, so that a query can
+filter on the ids instead:
+
+    qc_complete = run_status_ids(session, "qc complete")
+    session.query(IseqRunStatus).filter(
+        IseqRunStatus.id_run_status_dict.in_(qc_complete)
+    )
+
+Cached values are plain rows, not ORM objects, so they can be shared between
+sessions and threads. They are kept apart for each database, identified by
+the URL a session is bound to. Call invalidate_on_commit to drop cached tables
+whenever a session commits changes to them through the ORM; changes made
+any other way are picked up when the entries expire, or by calling
+invalidate.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import URL, Row
+from sqlalchemy.orm import Session, attributes
+
+DEFAULT_TTL = 300.0
+
+_INFO_KEY = "ml_warehouse_reference_changes"
+
+
+def _database(sess: Session) -> URL:
+    """Returns the URL of the database a Session is bound to."""
+
+    # A Session may be bound to a Connection, e.g. to join its transaction.
+    return sess.get_bind().engine.url
+
+
+class TTLCache:
+    """Values loaded from the database, each kept for a limited time.
+
+    Values are cached for each database separately, so that sessions on
+    different databases never see each other's.
+
+    Arguments
+    ---------
+    loader: Callable[[Session, Hashable], Any]
+        A function loading the value for a key.
+    ttl: float
+        The number of seconds to keep each value for.
+    clock: Callable[[], float]
+        The source of the current time, in seconds.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Session, Hashable], Any],
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.loader = loader
+        self.ttl = ttl
+        self.clock = clock
+        # Keyed by (database URL, key).
+        self._entries: Dict[Tuple[URL, Hashable], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+        # Loads run outside self._lock, so that a slow one does not hold up
+        # other keys, but each key is loaded by one thread at a time. The
+        # generation of each key is advanced when it is invalidated, so that
+        # a load which began earlier is not cached.
+        self._load_locks: Dict[Tuple[URL, Hashable], threading.Lock] = {}
+        self._generations: Dict[Tuple[URL, Hashable], int] = {}
+
+    def _cached(self, key: Tuple[URL, Hashable]) -> Optional[Tuple[float, Any]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.clock():
+            return None
+
+        return entry
+
+    def get(self, sess: Session, key: Hashable = None) -> Any:
+        """Returns the value for a key, loading it with sess if not cached."""
+
+        entry_key = (_database(sess), key)
+
+        with self._lock:
+            entry = self._cached(entry_key)
+            if entry is not None:
+                return entry[1]
+            load_lock = self._load_locks.setdefault(entry_key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                # Another thread may have loaded it while this one waited.
+                entry = self._cached(entry_key)
+                if entry is not None:
+                    return entry[1]
+                generation = self._generations.get(entry_key, 0)
+                now = self.clock()
+
+            value = self.loader(sess, key)
+
+            with self._lock:
+                if self._generations.get(entry_key, 0) == generation:
+                    self._entries[entry_key] = (now + self.ttl, value)
+
+            return value
+
+    def invalidate(self, *keys: Hashable, database: Optional[URL] = None):
+        """Drops the cached values of some keys, or of every key if none given.
+
+        Arguments
+        ---------
+        keys: Hashable
+            The keys to drop.
+        database: Optional[URL]
+            The URL of the database to drop them for. Every database by
+            default.
+        """
+
+        with self._lock:
+            # Every key loaded, or being loaded, has a load lock.
+            for entry_key in set(self._entries) | set(self._load_locks):
+                url, key = entry_key
+                if (not keys or key in keys) and database in (None, url):
+                    self._entries.pop(entry_key, None)
+                    self._generations[entry_key] = (
+                        self._generations.get(entry_key, 0) + 1
+                    )
+
+
+def _load_run_status_dict(sess: Session, key) -> Dict[int, Row]:
+    from ml_warehouse.schema import IseqRunStatusDict
+
+    table = IseqRunStatusDict.__table__
+
+    return {row.id_run_status_dict: row for row in sess.execute(select(table))}
+
+
+def _load_ar_internal_metadata(sess: Session, key) -> Dict[str, Optional[str]]:
+    from ml_warehouse.schema import ArInternalMetadata
+
+    table = ArInternalMetadata.__table__
+
+    return {row.key: row.value for row in sess.execute(select(table))}
+
+
+def _load_study_users(sess: Session, id_study_tmp: int) -> Tuple[Row, ...]:
+    from ml_warehouse.schema import StudyUsers
+
+    table = StudyUsers.__table__
+    query = (
+        select(table)
+        .where(table.c.id_study_tmp == id_study_tmp)
+        .order_by(table.c.id_study_users_tmp)
+    )
+
+    return tuple(sess.execute(query))
+
+
+# The cache of each table, keyed by table name. study_users is cached per
+# study; the others are cached whole.
+CACHES: Dict[str, TTLCache] = {
+    "iseq_run_status_dict": TTLCache(_load_run_status_dict),
+    "ar_internal_metadata": TTLCache(_load_ar_internal_metadata),
+    "study_users": TTLCache(_load_study_users),
+}
+
+
+def run_status_dict(sess: Session) -> Dict[int, Row]:
+    """Returns the rows of iseq_run_status_dict, keyed by id_run_status_dict."""
+
+    return CACHES["iseq_run_status_dict"].get(sess)
+
+
+def run_status_description(sess: Session, id_run_status_dict: int) -> str:
+    """Returns the description of a run status."""
+
+    return run_status_dict(sess)[id_run_status_dict].description
+
+
+def run_status_ids(sess: Session, *descriptions: str) -> List[int]:
+    """Returns the ids of the run statuses with the given descriptions."""
+
+    wanted = set(descriptions)
+
+    return sorted(
+        row.id_run_status_dict
+        for row in run_status_dict(sess).values()
+        if row.description in wanted
+    )
+
+
+def ar_internal_metadata(sess: Session) -> Dict[str, Optional[str]]:
+    """Returns the values of ar_internal_metadata, keyed by key."""
+
+    return CACHES["ar_internal_metadata"].get(sess)
+
+
+def study_users(sess: Session, id_study_tmp: int) -> Tuple[Row, ...]:
+    """Returns the study_users rows of a study."""
+
+    return CACHES["study_users"].get(sess, id_study_tmp)
+
+
+def invalidate(table: Optional[str] = None):
+    """Drops the cached rows of a table, or of every table.
+
+    Arguments
+    ---------
+    table: Optional[str]
+        The table name, one of the keys of CACHES. All tables by default.
+    """
+
+    caches = CACHES.values() if table is None else [CACHES[table]]
+    for cache in caches:
+        cache.invalidate()
+
+
+def _after_flush(sess: Session, flush_context):
+    changes = sess.info.setdefault(_INFO_KEY, set())
+
+    for obj in list(sess.new) + list(sess.dirty) + list(sess.deleted):
+        name = getattr(obj, "__tablename__", None)
+        if name == "study_users":
+            # A user moved to another study is stale in both.
+            history = attributes.get_history(obj, "id_study_tmp")
+            for id_study_tmp in history.sum() or [obj.id_study_tmp]:
+                changes.add((name, id_study_tmp))
+        elif name in CACHES:
+            changes.add((name, None))
+
+
+def _after_commit(sess: Session):
+    changes = sess.info.pop(_INFO_KEY, ())
+    if not changes:
+        return
+
+    database = _database(sess)
+    for name, key in changes:
+        if key is None:
+            CACHES[name].invalidate(database=database)
+        else:
+            CACHES[name].invalidate(key, database=database)
+
+
+def _after_rollback(sess: Session):
+    sess.info.pop(_INFO_KEY, None)
+
+
+def invalidate_on_commit(target: Any = Session):
+    """Drops cached rows when a session commits ORM changes to their table.
+
+    Arguments
+    ---------
+    target: Any
+        The Session class, sessionmaker or Session to watch. By default,
+        every Session.
+    """
+
+    for name, listener in (
+        ("after_flush", _after_flush),
+        ("after_commit", _after_commit),
+        ("after_rollback", _after_rollback),
+    ):
+        if not event.contains(target, name, listener):
+            event.listen(target, name, listener)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Read-only rows in place of ORM instances.
+
+Callers which only read the columns of the objects a query returns need
+none of what makes them ORM instances: identity map entries, change
+tracking, lazy-loading relationships. fetch_rows runs such a query for the
+columns alone and returns a named tuple per row instead, with the same
+attribute names as the mapped class:
+
+    for stock in fetch_rows(get_stock_records(session, stock_id)):
+        print(stock.id_stock_resource_lims, stock.labware_human_barcode)
+
+The row class of each mapped class, e.g. StockResourceRow for
+StockResource, is generated on first use. benchmarks/read_only_rows.py
+compares the time and memory taken with those of ORM instances.
+"""
+
+from collections import namedtuple
+from typing import Any, Dict, List, Type
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Load, Query
+
+_ROW_CLASSES: Dict[type, Type[tuple]] = {}
+
+
+def row_class(cls: type) -> Type[tuple]:
+    """Returns the read-only row class of a mapped class.
+
+    Arguments
+    ---------
+    cls: type
+        A mapped class, e.g. StockResource.
+
+    Returns
+    -------
+    Type[tuple]
+        A named tuple with a field per column attribute of cls, in the
+        order of the table's columns.
+    """
+
+    row_cls = _ROW_CLASSES.get(cls)
+    if row_cls is None:
+        mapper = inspect(cls)
+        keys = [mapper.get_property_by_column(c).key for c in mapper.local_table.c]
+        row_cls = namedtuple(f"{cls.__name__}Row", keys)
+        row_cls.__doc__ = f"A read-only row of {cls.__tablename__}."
+        _ROW_CLASSES[cls] = row_cls
+
+    return row_cls
+
+
+def fetch_rows(query: Query) -> List[Any]:
+    """Runs a query for a mapped class and returns read-only rows.
+
+    Arguments
+    ---------
+    query: Query
+        A query returning instances of a single mapped class, such as one
+        from the example query builders. Its filters, joins, ordering and
+        limits are kept. Its loader options, e.g. from
+        loading.apply_profile, are dropped, since rows load no
+        relationships.
+
+    Returns
+    -------
+    List[Any]
+        A row of row_class(cls) per instance the query would have returned.
+    """
+
+    descriptions = query.column_descriptions
+    cls = descriptions[0]["entity"] if len(descriptions) == 1 else None
+    if cls is None or descriptions[0]["expr"] is not cls:
+        raise ValueError("fetch_rows needs a query for a single mapped class")
+
+    row_cls = row_class(cls)
+    columns = query.with_entities(*(getattr(cls, key) for key in row_cls._fields))
+    # Loader options name relationships of the entities, which a query for
+    # columns does not have. Other options, such as loader criteria, filter
+    # the rows and are kept.
+    columns._with_options = tuple(
+        opt for opt in columns._with_options if not isinstance(opt, Load)
+    )
+
+    return list(map(row_cls._make, query.session.execute(columns.statement)))
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""A summary of the state of each Illumina run, kept up to date incrementally.
+
+The iseq_run_state table holds one row per run with its current status, the
+date it entered it and the date the run first became pending. It is not part
+of the warehouse schema; create it with create_run_state and bring it up to
+date with refresh_run_state, e.g. from a cron job:
+
+    with engine.begin() as conn:
+        refresh_run_state(conn)
+
+Each refresh only reads the iseq_run_status rows added since the previous
+one, so queries about run durations can read a row per run instead of
+grouping the whole status history.
+"""
+
+from typing import Collection, Dict, Iterable
+
+from sqlalchemy import Column, DateTime, MetaData, Table, case, func, select
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.engine import Connection, Row
+from sqlalchemy.orm import Session
+
+from ml_warehouse import reference
+
+DEFAULT_BATCH_SIZE = 10000
+
+# Rows of iseq_run_status with ids this far below the highest one seen are
+# read again on each refresh, to catch rows from transactions which
+# committed out of id order. Reading a row twice does no harm.
+DEFAULT_OVERLAP = 1000
+
+metadata = MetaData()
+
+iseq_run_state = Table(
+    "iseq_run_state",
+    metadata,
+    Column(
+        "id_run",
+        mysqlINTEGER(10, unsigned=True),
+        primary_key=True,
+        autoincrement=False,
+        comment="NPG run identifier",
+    ),
+    Column(
+        "id_run_status_dict",
+        mysqlINTEGER(10, unsigned=True),
+        comment="Current status (iscurrent = 1), "
+        "see iseq_run_status_dict.id_run_status_dict",
+    ),
+    Column(
+        "id_run_status",
+        mysqlINTEGER(11, unsigned=True),
+        comment="The iseq_run_status.id_run_status of the current status",
+    ),
+    Column(
+        "state_date",
+        DateTime,
+        comment="Timestamp of the current status",
+    ),
+    Column(
+        "pending_date",
+        DateTime,
+        comment="Timestamp of the earliest run pending status",
+    ),
+    Column(
+        "last_id_run_status",
+        mysqlINTEGER(11, unsigned=True),
+        nullable=False,
+        index=True,
+        comment="The highest iseq_run_status.id_run_status summarised",
+    ),
+    comment="The current state of each Illumina run, see ml_warehouse.run_state",
+)
+
+
+def create_run_state(conn: Connection):
+    """Creates the iseq_run_state table, if it does not exist."""
+
+    metadata.create_all(conn)
+
+
+def summarise(rows: Iterable[Row], pending: Collection[int]) -> Dict[int, dict]:
+    """Summarises iseq_run_status rows by run.
+
+    Arguments
+    ---------
+    rows: Iterable[Row]
+        Rows with id_run_status, id_run, date, id_run_status_dict and
+        iscurrent.
+    pending: Collection[int]
+        The ids of the "run pending" status.
+
+    Returns
+    -------
+    Dict[int, dict]
+        A row of iseq_run_state for each run, from its current status, its
+        earliest pending status, and its highest id. The current status is
+        None if none of the run's rows is current.
+    """
+
+    summaries = {}
+
+    for row in rows:
+        summary = summaries.get(row.id_run)
+        if summary is None:
+            summary = summaries[row.id_run] = {
+                "id_run": row.id_run,
+                "id_run_status_dict": None,
+                "id_run_status": None,
+                "state_date": None,
+                "pending_date": None,
+                "last_id_run_status": row.id_run_status,
+            }
+
+        if row.iscurrent and (
+            summary["id_run_status"] is None
+            or row.id_run_status > summary["id_run_status"]
+        ):
+            summary["id_run_status_dict"] = row.id_run_status_dict
+            summary["id_run_status"] = row.id_run_status
+            summary["state_date"] = row.date
+
+        if row.id_run_status_dict in pending and (
+            summary["pending_date"] is None or row.date < summary["pending_date"]
+        ):
+            summary["pending_date"] = row.date
+        summary["last_id_run_status"] = max(
+            summary["last_id_run_status"], row.id_run_status
+        )
+
+    return summaries
+
+
+def _upsert():
+    state = iseq_run_state
+    stmt = insert(state)
+    new = stmt.inserted
+
+    # A status read as current replaces the one held, which NPG will have
+    # marked as no longer current when it added it.
+    current = new.id_run_status.isnot(None)
+
+    return stmt.on_duplicate_key_update(
+        [
+            (
+                "pending_date",
+                func.least(
+                    func.coalesce(state.c.pending_date, new.pending_date),
+                    func.coalesce(new.pending_date, state.c.pending_date),
+                ),
+            ),
+            (
+                "id_run_status_dict",
+                case(
+                    (current, new.id_run_status_dict),
+                    else_=state.c.id_run_status_dict,
+                ),
+            ),
+            (
+                "id_run_status",
+                case((current, new.id_run_status), else_=state.c.id_run_status),
+            ),
+            (
+                "state_date",
+                case((current, new.state_date), else_=state.c.state_date),
+            ),
+            (
+                "last_id_run_status",
+                func.greatest(state.c.last_id_run_status, new.last_id_run_status),
+            ),
+        ]
+    )
+
+
+def refresh_run_state(
+    conn: Connection,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    overlap: int = DEFAULT_OVERLAP,
+) -> int:
+    """Updates iseq_run_state from the iseq_run_status rows added since.
+
+    Arguments
+    ---------
+    conn: Connection
+        A Connection to the warehouse. The caller is responsible for
+        committing.
+    batch_size: int
+        The number of iseq_run_status rows to read at a time.
+    overlap: int
+        How far below the highest id_run_status already summarised to start
+        reading.
+
+    Returns
+    -------
+    int
+        The number of iseq_run_state rows inserted or updated.
+    """
+
+    from ml_warehouse.schema import IseqRunStatus
+
+    with Session(bind=conn, future=True) as sess:
+        pending = reference.run_status_ids(sess, "run pending")
+
+    status = IseqRunStatus.__table__
+    mark = conn.execute(select(func.max(iseq_run_state.c.last_id_run_status))).scalar()
+    last = max((mark or 0) - overlap, 0)
+
+    upsert = _upsert()
+    updated = 0
+    while True:
+        rows = conn.execute(
+            select(
+                status.c.id_run_status,
+                status.c.id_run,
+                status.c.date,
+                status.c.id_run_status_dict,
+                status.c.iscurrent,
+            )
+            .where(status.c.id_run_status > last)
+            .order_by(status.c.id_run_status)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        summaries = summarise(rows, pending)
+        conn.execute(upsert, list(summaries.values()))
+        updated += len(summaries)
+
+        if len(rows) < batch_size:
+            break
+        last = rows[-1].id_run_status
+
+    return updated
+
+
+def rebuild_run_state(conn: Connection, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Recomputes iseq_run_state from the whole status history.
+
+    Needed only if iseq_run_status rows are changed or deleted, which a
+    refresh does not notice.
+    """
+
+    conn.execute(iseq_run_state.delete())
+
+    return refresh_run_state(conn, batch_size, overlap=0)
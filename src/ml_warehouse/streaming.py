@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Iterating over large query results in bounded-size chunks.
+
+keyset_chunks runs one short query per chunk, so nothing is held open on the
+server between chunks. stream_chunks runs the query once and reads it
+through a server-side cursor, which is faster but keeps the connection busy
+until the last chunk has been read.
+"""
+
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Callable, Iterator, List, Optional
+
+from sqlalchemy.engine.result import result_tuple
+from sqlalchemy.orm import Query
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _key_getter(query: Query, key: InstrumentedAttribute) -> Optional[Callable]:
+    """Returns a function reading the key from a row of a query, if it selects it.
+
+    The key is selected if it is one of the query's columns, or an attribute
+    of one of its entities.
+    """
+
+    descriptions = query.column_descriptions
+    single = len(descriptions) == 1
+    for i, desc in enumerate(descriptions):
+        if desc["expr"] is key:
+            return itemgetter(i)
+        if desc["expr"] is key.class_:
+            if single:
+                return lambda row: getattr(row, key.key)
+            return lambda row, i=i: getattr(row[i], key.key)
+
+    return None
+
+
+def _key_stripper(query: Query) -> Callable:
+    """Returns a function removing a key added to the columns of a query."""
+
+    descriptions = query.column_descriptions
+    if len(descriptions) == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]:
+        # A query for a single entity yields the entities themselves.
+        return itemgetter(0)
+
+    make_row = result_tuple([desc["name"] for desc in descriptions])
+
+    return lambda row: make_row(row[:-1])
+
+
+def keyset_chunks(
+    query: Query,
+    key: InstrumentedAttribute,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    descending: bool = False,
+) -> Iterator[List[Any]]:
+    """Pages through a query by a unique key, one chunk at a time.
+
+    Each chunk is fetched with "WHERE key > <last key seen> ORDER BY key
+    LIMIT chunk_size", so every page is an index range scan regardless of how
+    far through the results it is.
+
+    If the query does not select the key, as a column or as an attribute of
+    a selected entity, the key is added to its columns and removed from the
+    rows yielded. A DISTINCT query must select the key, since adding it
+    would change which rows are distinct.
+
+    Arguments
+    ---------
+    query: Query
+        The query to page through, e.g. one returned by the example query
+        builders. Any ORDER BY or LIMIT it has is replaced.
+    key: InstrumentedAttribute
+        A column attribute, such as PacBioRun.id_pac_bio_tmp, which is unique
+        within the results.
+    chunk_size: int
+        The maximum number of rows per chunk.
+    descending: bool
+        Page from the highest key to the lowest.
+
+    Returns
+    -------
+    Iterator[List[Any]]
+        The chunks of rows, in key order.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+
+    get_key = _key_getter(query, key)
+    strip = None
+    if get_key is None:
+        if query._distinct:
+            raise ValueError(
+                f"A DISTINCT query must select its key {key}, "
+                "as a column or as an attribute of a selected entity"
+            )
+        strip = _key_stripper(query)
+        query = query.add_columns(key)
+        get_key = itemgetter(-1)
+
+    order = key.desc() if descending else key.asc()
+    ordered = query.order_by(None).order_by(order)
+
+    last = None
+    while True:
+        page = ordered
+        if last is not None:
+            page = page.filter(key < last if descending else key > last)
+        rows = page.limit(chunk_size).all()
+
+        if rows:
+            yield rows if strip is None else [strip(row) for row in rows]
+        if len(rows) < chunk_size:
+            return
+
+        last = get_key(rows[-1])
+
+
+def stream_chunks(
+    query: Query, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[List[Any]]:
+    """Reads a query through a server-side cursor, one chunk at a time.
+
+    Arguments
+    ---------
+    query: Query
+        The query to read.
+    chunk_size: int
+        The maximum number of rows per chunk, which is also the number of
+        rows fetched from the cursor at a time.
+
+    Returns
+    -------
+    Iterator[List[Any]]
+        The chunks of rows, in the order of the query.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+
+    # yield_per asks for stream_results, which PyMySQL serves with SSCursor.
+    rows = iter(query.yield_per(chunk_size))
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
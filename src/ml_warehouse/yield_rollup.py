@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Monthly sequencing yield, rolled up as runs reach "qc complete".
+
+The iseq_yield_month table holds, for each month and instrument model, the
+bases sequenced (cycles times interop_cluster_count_pf_total, summed over
+lanes) and the number of lanes, for runs which reached "qc complete" that
+month. refresh_yield_rollup adds the runs which have reached it since the
+last refresh, recording each "qc complete" status it has counted in
+iseq_yield_event so that none is counted twice:
+
+    with engine.begin() as conn:
+        create_yield_rollup(conn)
+        refresh_yield_rollup(conn)
+
+As in a live query joining iseq_run_status, a run which reaches
+"qc complete" more than once is counted each time. A status whose run has no
+lane metrics yet is recorded with no lanes, and counted by the first refresh
+after they arrive. Unlike a live query, lanes whose metrics arrive after that
+are not counted. Neither table is part of the warehouse schema.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from sqlalchemy import (
+    CHAR,
+    Column,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    func,
+    select,
+)
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.engine import Connection
+
+DEFAULT_BATCH_SIZE = 1000
+
+# As for ml_warehouse.run_state, statuses this far below the highest one
+# counted are looked at again, to catch late commits.
+DEFAULT_OVERLAP = 1000
+
+QC_COMPLETE = "qc complete"
+
+# The instrument_model recorded for lanes without one.
+UNKNOWN_MODEL = ""
+
+metadata = MetaData()
+
+iseq_yield_month = Table(
+    "iseq_yield_month",
+    metadata,
+    Column("month", CHAR(7), primary_key=True, comment="Year and month, YYYY-MM"),
+    Column(
+        "instrument_model",
+        String(64),
+        primary_key=True,
+        comment="Instrument model, empty if unknown",
+    ),
+    Column("bases", Numeric(30, 0), nullable=False, comment="Bases sequenced"),
+    Column("lanes", Integer, nullable=False, comment="Lanes sequenced"),
+    comment="Monthly sequencing yield, see ml_warehouse.yield_rollup",
+)
+
+iseq_yield_event = Table(
+    "iseq_yield_event",
+    metadata,
+    Column(
+        "id_run_status",
+        mysqlINTEGER(11, unsigned=True),
+        primary_key=True,
+        autoincrement=False,
+        comment="The qc complete iseq_run_status.id_run_status counted",
+    ),
+    Column(
+        "instrument_model",
+        String(64),
+        primary_key=True,
+        comment="Instrument model, empty if unknown",
+    ),
+    Column("id_run", mysqlINTEGER(10, unsigned=True), nullable=False),
+    Column("month", CHAR(7), nullable=False, comment="Year and month, YYYY-MM"),
+    Column("bases", Numeric(30, 0), nullable=False, comment="Bases sequenced"),
+    Column(
+        "lanes",
+        Integer,
+        nullable=False,
+        comment="Lanes sequenced, 0 while the run has no lane metrics",
+    ),
+    comment="The statuses counted in iseq_yield_month",
+)
+
+
+def create_yield_rollup(conn: Connection):
+    """Creates the rollup tables, if they do not exist."""
+
+    metadata.create_all(conn)
+
+
+def month_of(date: datetime) -> str:
+    """Returns the rollup month of a date, as DATE_FORMAT(date, "%Y-%m")."""
+
+    return date.strftime("%Y-%m")
+
+
+def _lane_yields(conn: Connection, run_ids) -> Dict[int, List[Tuple[str, int, int]]]:
+    """Returns the (instrument model, bases, lanes) of each run."""
+
+    from ml_warehouse.schema import IseqRunLaneMetrics
+
+    lanes = IseqRunLaneMetrics.__table__
+    model = func.coalesce(lanes.c.instrument_model, UNKNOWN_MODEL)
+    rows = conn.execute(
+        select(
+            lanes.c.id_run,
+            model.label("instrument_model"),
+            func.coalesce(
+                func.sum(lanes.c.cycles * lanes.c.interop_cluster_count_pf_total), 0
+            ).label("bases"),
+            func.count().label("lanes"),
+        )
+        .where(lanes.c.id_run.in_(run_ids))
+        .group_by(lanes.c.id_run, model)
+    )
+
+    yields = {}
+    for row in rows:
+        yields.setdefault(row.id_run, []).append(
+            (row.instrument_model, int(row.bases), row.lanes)
+        )
+
+    return yields
+
+
+def _events(statuses, yields) -> List[dict]:
+    """Returns the iseq_yield_event rows of statuses.
+
+    Each status, an (id_run_status, id_run, month), has a row for each
+    instrument model of its run's lanes, or a single row with no lanes if
+    the run has no lane metrics.
+    """
+
+    return [
+        {
+            "id_run_status": id_run_status,
+            "instrument_model": model,
+            "id_run": id_run,
+            "month": month,
+            "bases": bases,
+            "lanes": lanes,
+        }
+        for id_run_status, id_run, month in statuses
+        for model, bases, lanes in yields.get(id_run, [(UNKNOWN_MODEL, 0, 0)])
+    ]
+
+
+def _record(conn: Connection, events: List[dict]):
+    """Inserts events and adds those with lanes to iseq_yield_month."""
+
+    conn.execute(iseq_yield_event.insert(), events)
+
+    months: Dict[Tuple[str, str], dict] = {}
+    for e in events:
+        if not e["lanes"]:
+            continue
+        total = months.setdefault(
+            (e["month"], e["instrument_model"]),
+            {
+                "month": e["month"],
+                "instrument_model": e["instrument_model"],
+                "bases": 0,
+                "lanes": 0,
+            },
+        )
+        total["bases"] += e["bases"]
+        total["lanes"] += e["lanes"]
+
+    if months:
+        upsert = insert(iseq_yield_month)
+        upsert = upsert.on_duplicate_key_update(
+            bases=iseq_yield_month.c.bases + upsert.inserted.bases,
+            lanes=iseq_yield_month.c.lanes + upsert.inserted.lanes,
+        )
+        conn.execute(upsert, list(months.values()))
+
+
+def _count_waiting(conn: Connection, batch_size: int) -> int:
+    """Counts the statuses recorded with no lanes whose lanes have arrived."""
+
+    event = iseq_yield_event.c
+    waiting = conn.execute(
+        select(event.id_run_status, event.id_run, event.month)
+        .where(event.lanes == 0)
+        .order_by(event.id_run_status)
+    ).all()
+
+    counted = 0
+    for i in range(0, len(waiting), batch_size):
+        batch = waiting[i : i + batch_size]
+        yields = _lane_yields(conn, {w.id_run for w in batch})
+        arrived = [w for w in batch if w.id_run in yields]
+        if not arrived:
+            continue
+
+        conn.execute(
+            iseq_yield_event.delete().where(
+                event.id_run_status.in_([w.id_run_status for w in arrived])
+            )
+        )
+        _record(conn, _events(arrived, yields))
+        counted += len(arrived)
+
+    return counted
+
+
+def refresh_yield_rollup(
+    conn: Connection,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    overlap: int = DEFAULT_OVERLAP,
+) -> int:
+    """Adds the runs which reached "qc complete" since the last refresh.
+
+    Statuses recorded earlier with no lanes are counted if their runs' lane
+    metrics have since arrived.
+
+    Arguments
+    ---------
+    conn: Connection
+        A Connection to the warehouse. The caller is responsible for
+        committing.
+    batch_size: int
+        The number of "qc complete" statuses to read at a time.
+    overlap: int
+        How far below the highest id_run_status already counted to start
+        reading.
+
+    Returns
+    -------
+    int
+        The number of "qc complete" statuses recorded, or counted after
+        waiting for lane metrics.
+    """
+
+    from ml_warehouse.schema import IseqRunStatus, IseqRunStatusDict
+
+    status = IseqRunStatus.__table__
+    status_dict = IseqRunStatusDict.__table__
+
+    mark = conn.execute(select(func.max(iseq_yield_event.c.id_run_status))).scalar()
+    last = max((mark or 0) - overlap, 0)
+
+    counted = _count_waiting(conn, batch_size)
+    while True:
+        statuses = conn.execute(
+            select(status.c.id_run_status, status.c.id_run, status.c.date)
+            .join(
+                status_dict,
+                status_dict.c.id_run_status_dict == status.c.id_run_status_dict,
+            )
+            .where(
+                (status.c.id_run_status > last)
+                & (status_dict.c.description == QC_COMPLETE)
+            )
+            .order_by(status.c.id_run_status)
+            .limit(batch_size)
+        ).all()
+        if not statuses:
+            break
+
+        seen = set(
+            conn.execute(
+                select(iseq_yield_event.c.id_run_status).where(
+                    iseq_yield_event.c.id_run_status.between(
+                        statuses[0].id_run_status, statuses[-1].id_run_status
+                    )
+                )
+            ).scalars()
+        )
+        new = [s for s in statuses if s.id_run_status not in seen]
+        if new:
+            yields = _lane_yields(conn, {s.id_run for s in new})
+            entries = [(s.id_run_status, s.id_run, month_of(s.date)) for s in new]
+            _record(conn, _events(entries, yields))
+
+        counted += len(new)
+        if len(statuses) < batch_size:
+            break
+        last = statuses[-1].id_run_status
+
+    return counted
@@ -3,11 +3,12 @@ import os
 from typing import Optional
 
 import pytest
-import yaml
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
+from ml_warehouse.bulk import load_rows, read_rows
+from ml_warehouse.engine import get_engine, url_from_config, url_from_env
 from ml_warehouse.schema import (
     Base,
     BmapFlowcell,
@@ -46,19 +47,8 @@ def config() -> configparser.ConfigParser:
 
 def insert_from_yaml(sess: Session, table_type, fixtures_fname: str):
 
-    with open(fixtures_fname, "r") as f:
-        fixtures = yaml.safe_load(f)
-        objs = []
-
-        for row in fixtures:
-            table = table_type()
-            for key, value in row.items():
-                setattr(table, key, value)
-
-            objs.append(table)
-
-        sess.add_all(objs)
-        sess.commit()
+    load_rows(sess.connection(), table_type, read_rows(fixtures_fname))
+    sess.commit()
 
 
 def initialize_mlwh(session: Session):
@@ -109,19 +99,13 @@ def mlwh_session_ipm(mlwh_session) -> Session:
 @pytest.fixture(scope="function")
 def prod_session() -> Optional[Session]:
 
-    user = os.environ.get("MYSQL_USER")
-    db = os.environ.get("MYSQL_DBNAME")
-    password = os.environ.get("MYSQL_PW")
-    host = os.environ.get("MYSQL_HOST")
-    port = os.environ.get("MYSQL_PORT")
+    url = url_from_env()
 
-    if None in (user, db, password, host, port):
+    if url is None:
         yield None
         return
 
-    url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{db}?charset=utf8mb4"
-    engine = create_engine(url, future=True)
-    session = Session(engine)
+    session = Session(get_engine(url))
 
     yield session
 
@@ -131,7 +115,7 @@ def prod_session() -> Optional[Session]:
 @pytest.fixture(scope="function")
 def mlwh_session(config: configparser.ConfigParser) -> Session:
 
-    uri = mysql_url(config)
+    uri = url_from_config(config)
     engine = create_engine(uri, echo=False, future=True)
 
     if not database_exists(engine.url):
@@ -159,36 +143,3 @@ def mlwh_session(config: configparser.ConfigParser) -> Session:
     sess.close()
 
     drop_database(engine.url)
-
-
-def mysql_url(config: configparser.ConfigParser):
-    """Returns a MySQL URL configured through an ini file.
-
-    The keys and values are:
-
-    [MySQL]
-    user       = <database user, defaults to "mlwh">
-    password   = <database password, defaults to empty i.e. "">
-    ip_address = <database IP address, defaults to "127.0.0.1">
-    port       = <database port, defaults to 3306>
-    schema     = <database schema, defaults to "mlwh">
-    """
-    section = "MySQL"
-
-    if section not in config.sections():
-        raise configparser.Error(
-            "The {} configuration section is missing. "
-            "You need to fill this in before running "
-            "tests on a {} database".format(section, section)
-        )
-    connection_conf = config[section]
-    user = connection_conf.get("user", "mlwh")
-    password = connection_conf.get("password", "")
-    ip_address = connection_conf.get("ip_address", "127.0.0.1")
-    port = connection_conf.get("port", "3306")
-    schema = connection_conf.get("schema", "mlwh")
-
-    return (
-        f"mysql+pymysql://{user}:{password}@"
-        f"{ip_address}:{port}/{schema}?charset=utf8mb4"
-    )
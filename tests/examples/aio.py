@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Async variants of the example queries.
+
+Each takes an AsyncSession in place of a Session, and the same other
+arguments, and returns the results of the query rather than the Query:
+
+    async with Session() as session:
+        runs = await find_pacbio_runs(session, run_id, well, profile="irods")
+"""
+
+from examples import (
+    genotyping,
+    long_illumina,
+    npg_irods,
+    npg_qc,
+    recently_updated,
+    stats,
+)
+from ml_warehouse.aio import asynchronous
+
+get_flgen_plate = asynchronous(genotyping.get_flgen_plate)
+
+summarize_long_illumina = asynchronous(long_illumina.summarize_long_illumina)
+
+get_stock_records = asynchronous(npg_irods.get_stock_records)
+get_bmap_flowcell_records = asynchronous(npg_irods.get_bmap_flowcell_records)
+find_pacbio_runs = asynchronous(npg_irods.find_pacbio_runs)
+
+get_iseq_product_metrics_run = asynchronous(npg_qc.get_iseq_product_metrics_run)
+get_iseq_product_metrics_by_study = asynchronous(
+    npg_qc.get_iseq_product_metrics_by_study
+)
+get_iseq_product_metrics_by_decode_percent = asynchronous(
+    npg_qc.get_iseq_product_metrics_by_decode_percent
+)
+
+get_recent_pacbio_runs = asynchronous(recently_updated.get_recent_pacbio_runs)
+get_recent_ont = asynchronous(recently_updated.get_recent_ont)
+get_recent_fluidigm = asynchronous(recently_updated.get_recent_fluidigm)
+
+get_sequenced_sum = asynchronous(stats.get_sequenced_sum)
@@ -17,12 +17,18 @@
 #
 # @author Adam Blanchet <ab59@sanger.ac.uk>
 
+from typing import Dict, Iterable, List, Optional, Tuple
+
 from sqlalchemy.orm import Session
 
+from ml_warehouse.batch import batch_lookup
+from ml_warehouse.loading import apply_profile
 from ml_warehouse.schema import FlgenPlate
 
 
-def get_flgen_plate(sess: Session, plate_barcode: int, well_label: str):
+def get_flgen_plate(
+    sess: Session, plate_barcode: int, well_label: str, profile: Optional[str] = None
+):
     """Get set of FlgenPlate with matching plate barcode and well label.
 
     Arguments
@@ -33,6 +39,9 @@ def get_flgen_plate(sess: Session, plate_barcode: int, well_label: str):
         The manufacturer (Fluidigm) barcode.
     well_label: str
         The manufacturer well identifier.
+    profile: Optional[str]
+        An eager-loading profile of ml_warehouse.loading, e.g. "irods" to load
+        the sample and study of each plate with it.
 
     Returns
     -------
@@ -54,4 +63,37 @@ def get_flgen_plate(sess: Session, plate_barcode: int, well_label: str):
         & (FlgenPlate.well_label == well_label)
     )
 
+    if profile is not None:
+        result = apply_profile(result, profile)
+
     return result
+
+
+def get_flgen_plate_batch(
+    sess: Session, wells: Iterable[Tuple[int, str]], profile: Optional[str] = None
+) -> Dict[Tuple[int, str], List[FlgenPlate]]:
+    """Get FlgenPlates for many plate barcodes and well labels.
+
+    Equivalent to calling get_flgen_plate for each, in a few statements
+    rather than one each.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to perform the search against.
+    wells: Iterable[Tuple[int, str]]
+        The (plate barcode, well label) pairs to look up.
+    profile: Optional[str]
+        An eager-loading profile of ml_warehouse.loading.
+
+    Returns
+    -------
+    Dict[Tuple[int, str], List[FlgenPlate]]
+        The FlgenPlates of each pair.
+    """
+
+    query = sess.query(FlgenPlate)
+    if profile is not None:
+        query = apply_profile(query, profile)
+
+    return batch_lookup(query, (FlgenPlate.plate_barcode, FlgenPlate.well_label), wells)
@@ -20,18 +20,19 @@
 from datetime import datetime, timedelta
 from typing import Sequence
 
+from sqlalchemy import case
 from sqlalchemy.orm import Query, Session
 from sqlalchemy.sql.functions import func
 from sqlalchemy.sql.schema import Column
 from sqlalchemy.types import INTEGER
 
-from ml_warehouse.schema import (
-    IseqFlowcell,
-    IseqProductMetrics,
-    IseqRunStatus,
-    IseqRunStatusDict,
-    Study,
+from ml_warehouse.reference import (
+    run_status_description,
+    run_status_dict,
+    run_status_ids,
 )
+from ml_warehouse.run_state import iseq_run_state
+from ml_warehouse.schema import IseqFlowcell, IseqProductMetrics, IseqRunStatus, Study
 
 
 def summarize_long_illumina(
@@ -41,6 +42,7 @@ def summarize_long_illumina(
     active_run_min_age: timedelta,
     min_tot_days: int,
     ids_also_included: Sequence[int],
+    use_run_state: bool = False,
 ) -> Query:
     """
     Get a summary of long running Illumina runs within a specific group this year.
@@ -57,6 +59,10 @@ def summarize_long_illumina(
         The minimum age to consider still active runs.
     ids_also_included:
         Run IDs to include in the results regardless.
+    use_run_state: bool
+        Read the current state and first pending date of each run from the
+        iseq_run_state summary table (see ml_warehouse.run_state), which
+        must be up to date, instead of from iseq_run_status.
 
     Returns
     -------
@@ -116,22 +122,51 @@ def summarize_long_illumina(
     ```
     """
 
-    irps = (
-        sess.query(
-            func.min(IseqRunStatus.date).label("pending_date"), IseqRunStatus.id_run
+    if use_run_state:
+        run_table = iseq_run_state
+        run = iseq_run_state.c
+        irps = None
+        run_join = (run.id_run == IseqProductMetrics.id_run) & (
+            run.pending_date != None
         )
-        .filter(IseqRunStatus.id_run_status_dict == 1)
-        .group_by(IseqRunStatus.id_run)
-        .subquery("irps")
-    )
+        tot_days = func.datediff(run.state_date, run.pending_date)
+        date = run.state_date
+    else:
+        run_table = run = IseqRunStatus
+        irps = (
+            sess.query(
+                func.min(IseqRunStatus.date).label("pending_date"),
+                IseqRunStatus.id_run,
+            )
+            .filter(
+                IseqRunStatus.id_run_status_dict.in_(
+                    run_status_ids(sess, "run pending")
+                )
+            )
+            .group_by(IseqRunStatus.id_run)
+            .subquery("irps")
+        )
+        run_join = (IseqRunStatus.id_run == IseqProductMetrics.id_run) & (
+            IseqRunStatus.iscurrent == 1
+        )
+        tot_days = func.datediff(IseqRunStatus.date, irps.c.pending_date)
+        date = IseqRunStatus.date
 
-    tot_days = func.datediff(IseqRunStatus.date, irps.c.pending_date).label("tot_days")
+    # Label the current state from the cached iseq_run_status_dict rather
+    # than joining it.
+    current_state = case(
+        {i: run_status_description(sess, i) for i in run_status_dict(sess)},
+        value=run.id_run_status_dict,
+    )
+    finished = run_status_ids(
+        sess, "qc complete", "archival complete", "analysis cancelled"
+    )
 
-    return (
+    query = (
         sess.query(
-            IseqRunStatus.id_run,
-            IseqRunStatusDict.description.label("current_state"),
-            IseqRunStatus.date,
+            run.id_run,
+            current_state.label("current_state"),
+            date.label("date"),
             tot_days.label("tot_days"),
             func.group_concat(func.distinct(Study.name)).label("studies"),
         )
@@ -141,33 +176,17 @@ def summarize_long_illumina(
             IseqProductMetrics.id_iseq_flowcell_tmp
             == IseqFlowcell.id_iseq_flowcell_tmp,
         )
-        .join(irps, irps.c.id_run == IseqProductMetrics.id_run)
-        .join(
-            IseqRunStatus,
-            (IseqRunStatus.id_run == IseqProductMetrics.id_run)
-            & (IseqRunStatus.iscurrent == 1),
-        )
-        .join(
-            IseqRunStatusDict,
-            IseqRunStatusDict.id_run_status_dict == IseqRunStatus.id_run_status_dict,
-        )
+    )
+    if irps is not None:
+        query = query.join(irps, irps.c.id_run == IseqProductMetrics.id_run)
+
+    return (
+        query.join(run_table, run_join)
         .filter(Study.faculty_sponsor.like(faculty_sponsor_pattern))
-        .group_by(IseqRunStatus.id_run)
+        .group_by(run.id_run)
         .having(
-            (
-                (
-                    ~(
-                        IseqRunStatusDict.description.in_(
-                            ("qc complete", "archival complete", "analysis cancelled")
-                        )
-                    )
-                )
-                & (IseqRunStatus.date < (active_run_min_age))
-            )
-            | (
-                (Column(INTEGER, name="tot_days") > min_tot_days)
-                & (IseqRunStatus.date > (max_age))
-            )
-            | (IseqRunStatus.id_run.in_(ids_also_included))
+            (~run.id_run_status_dict.in_(finished) & (date < (active_run_min_age)))
+            | ((Column(INTEGER, name="tot_days") > min_tot_days) & (date > (max_age)))
+            | (run.id_run.in_(ids_also_included))
         )
     )
@@ -17,14 +17,16 @@
 #
 # @author Adam Blanchet <ab59@sanger.ac.uk>
 
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy.orm import Query, Session
 
+from ml_warehouse.batch import batch_lookup
+from ml_warehouse.loading import apply_profile
 from ml_warehouse.schema import BmapFlowcell, PacBioRun, StockResource
 
 
-def get_stock_records(sess: Session, stock_id: str):
+def get_stock_records(sess: Session, stock_id: str, profile: Optional[str] = None):
     """Get StockResource records by stock ID.
 
     Arguments
@@ -33,6 +35,9 @@ def get_stock_records(sess: Session, stock_id: str):
         The Session to perform the query against.
     stock_id: str
         The stock ID for the StockResource.
+    profile: Optional[str]
+        An eager-loading profile of ml_warehouse.loading, e.g. "irods" to load
+        the sample and study of each record with it.
 
     Returns
     -------
@@ -52,10 +57,15 @@ def get_stock_records(sess: Session, stock_id: str):
         StockResource.id_stock_resource_lims == stock_id
     )
 
+    if profile is not None:
+        result = apply_profile(result, profile)
+
     return result
 
 
-def get_bmap_flowcell_records(sess: Session, chip_serialnumber: str, position: int):
+def get_bmap_flowcell_records(
+    sess: Session, chip_serialnumber: str, position: int, profile: Optional[str] = None
+):
     """Get BmapFlowcell records by chip serialnumber and flowcell position.
 
     Arguments
@@ -66,6 +76,9 @@ def get_bmap_flowcell_records(sess: Session, chip_serialnumber: str, position: i
         The chip serialnumber.
     position: int
         The BmapFlowcell position.
+    profile: Optional[str]
+        An eager-loading profile of ml_warehouse.loading, e.g. "irods" to load
+        the sample and study of each record with it.
 
     Returns
     -------
@@ -86,11 +99,50 @@ def get_bmap_flowcell_records(sess: Session, chip_serialnumber: str, position: i
         & (BmapFlowcell.position == position)
     )
 
+    if profile is not None:
+        result = apply_profile(result, profile)
+
     return result
 
 
+def get_bmap_flowcell_records_batch(
+    sess: Session, positions: Iterable[Tuple[str, int]], profile: Optional[str] = None
+) -> Dict[Tuple[str, int], List[BmapFlowcell]]:
+    """Get BmapFlowcell records for many chip serialnumbers and positions.
+
+    Equivalent to calling get_bmap_flowcell_records for each, in a few
+    statements rather than one each.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to perform the query against.
+    positions: Iterable[Tuple[str, int]]
+        The (chip serialnumber, position) pairs to look up.
+    profile: Optional[str]
+        An eager-loading profile of ml_warehouse.loading.
+
+    Returns
+    -------
+    Dict[Tuple[str, int], List[BmapFlowcell]]
+        The records of each pair.
+    """
+
+    query = sess.query(BmapFlowcell)
+    if profile is not None:
+        query = apply_profile(query, profile)
+
+    return batch_lookup(
+        query, (BmapFlowcell.chip_serialnumber, BmapFlowcell.position), positions
+    )
+
+
 def find_pacbio_runs(
-    sess: Session, run_id: str, plate_well: str, tag_identifier: Optional[str] = None
+    sess: Session,
+    run_id: str,
+    plate_well: str,
+    tag_identifier: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Query:
     """Find run records for a PacBio run ID.
 
@@ -104,6 +156,9 @@ def find_pacbio_runs(
         PacBio plate well, zero-padded form.
     tag_identifier: Optional[str]
         Tag identifier.
+    profile: Optional[str]
+        An eager-loading profile of ml_warehouse.loading, e.g. "irods" to load
+        the sample and study of each record with it.
 
     Returns
     -------
@@ -118,6 +173,9 @@ def find_pacbio_runs(
     if tag_identifier is not None:
         result = result.filter(PacBioRun.tag_identifier == tag_identifier)
 
+    if profile is not None:
+        result = apply_profile(result, profile)
+
     return result.group_by(
         PacBioRun.pac_bio_run_name, PacBioRun.well_label, PacBioRun.tag_identifier
     )
@@ -17,9 +17,10 @@
 #
 # @author Adam Blanchet <ab59@sanger.ac.uk>
 
-from typing import Sequence
+from typing import Sequence, Union
 
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
 from sqlalchemy.sql.expression import distinct
 from sqlalchemy.sql.functions import func
 from sqlalchemy.sql.schema import Column
@@ -34,7 +35,10 @@ from ml_warehouse.schema import (
 
 
 def get_iseq_product_metrics_run(
-    sess: Session, run_ids: Sequence[int], excluded_type: str, study_count: int
+    sess: Session,
+    run_ids: Union[Sequence[int], Select],
+    excluded_type: str,
+    study_count: int,
 ):
     """
     Get IseqProductMetrics run IDs and Study count given certain constraints.
@@ -43,8 +47,9 @@ def get_iseq_product_metrics_run(
     ---------
     sess: Session
         The Session to perform the query against.
-    run_ids: Sequence[int]
-        The run IDs to check.
+    run_ids: Union[Sequence[int], Select]
+        The run IDs to check, or a SELECT of them. The results are grouped
+        by run, so ml_warehouse.in_lists can split up long lists.
     excluded_type: str
         The Flowcell type to exclude from the search.
     study_count: int
@@ -82,7 +87,7 @@ def get_iseq_product_metrics_run(
 
 
 def get_iseq_product_metrics_by_study(
-    sess: Session, study_name: str, run_ids: Sequence[int]
+    sess: Session, study_name: str, run_ids: Union[Sequence[int], Select]
 ):
     """
     Get IseqProductMetrics run IDs from a set, given a study name.
@@ -93,8 +98,8 @@ def get_iseq_product_metrics_by_study(
         The Session to perform the search against.
     study_name: str
         The Study name to match against.
-    run_ids: Sequence[int]
-        The set of run IDs to search within.
+    run_ids: Union[Sequence[int], Select]
+        The set of run IDs to search within, or a SELECT of them.
 
     Returns
     -------
@@ -123,7 +128,7 @@ def get_iseq_product_metrics_by_study(
 
 
 def get_iseq_product_metrics_by_decode_percent(
-    sess: Session, max_decode_percent: int, run_ids: Sequence[int]
+    sess: Session, max_decode_percent: int, run_ids: Union[Sequence[int], Select]
 ):
     """
     Get IseqRunLaneMetrics run IDs from a set within a maximum tags_decode_percent.
@@ -134,8 +139,9 @@ def get_iseq_product_metrics_by_decode_percent(
         The Session to perform the search against.
     max_decode_percent: int
         The maximum desired tags_decode_percent.
-    run_ids: Sequence[int]
-        The set of run IDs against which to perform the search.
+    run_ids: Union[Sequence[int], Select]
+        The set of run IDs against which to perform the search, or a SELECT
+        of them.
 
     Returns
     -------
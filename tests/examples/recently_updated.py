@@ -22,6 +22,7 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 
 from ml_warehouse.schema import FlgenPlate, OseqFlowcell, PacBioRun, Sample, Study
+from ml_warehouse.streaming import DEFAULT_CHUNK_SIZE, keyset_chunks
 
 
 def get_recent_pacbio_runs(sess: Session, max_age: datetime):
@@ -63,6 +64,32 @@ def get_recent_pacbio_runs(sess: Session, max_age: datetime):
     )
 
 
+def get_recent_pacbio_run_chunks(
+    sess: Session, max_age: datetime, chunk_size: int = DEFAULT_CHUNK_SIZE
+):
+    """Get recently updated Pacbio runs within a given timeframe, in chunks.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to perform the search against.
+    max_age: timedelta
+        The maximum age of the PacBio runs.
+    chunk_size: int
+        The maximum number of rows per chunk.
+
+    Returns
+    -------
+    Iterator[List[Row]]
+        The rows of get_recent_pacbio_runs with id_pac_bio_tmp, a chunk at a
+        time, so one per pac_bio_run row.
+    """
+
+    query = get_recent_pacbio_runs(sess, max_age).add_columns(PacBioRun.id_pac_bio_tmp)
+
+    return keyset_chunks(query, PacBioRun.id_pac_bio_tmp, chunk_size)
+
+
 def get_recent_ont(sess: Session, max_age: datetime):
     """Get recently updated OseqFlowcell within a given timeframe.
 
@@ -105,6 +132,32 @@ def get_recent_ont(sess: Session, max_age: datetime):
     )
 
 
+def get_recent_ont_chunks(
+    sess: Session, max_age: datetime, chunk_size: int = DEFAULT_CHUNK_SIZE
+):
+    """Get recently updated OseqFlowcell within a given timeframe, in chunks.
+
+    Arguments
+    ---------
+    sess: Session
+        The Session to perform the search against.
+    max_age: time_delta
+        The maximum age of the last update to the OseqFlowcell entry.
+    chunk_size: int
+        The maximum number of rows per chunk.
+
+    Returns
+    -------
+    Iterator[List[Row]]
+        The rows of get_recent_ont with id_oseq_flowcell_tmp, a chunk at a
+        time, so one per oseq_flowcell row.
+    """
+
+    query = get_recent_ont(sess, max_age).add_columns(OseqFlowcell.id_oseq_flowcell_tmp)
+
+    return keyset_chunks(query, OseqFlowcell.id_oseq_flowcell_tmp, chunk_size)
+
+
 def get_recent_fluidigm(sess: Session, max_age: datetime):
     """Get recemt Fludigm details more recent than a certain age.
 
@@ -19,17 +19,15 @@
 
 from datetime import datetime
 
-from ml_warehouse.schema import (
-    IseqRunLaneMetrics,
-    IseqRunStatus,
-    IseqRunStatusDict,
-)
+from ml_warehouse.reference import run_status_ids
+from ml_warehouse.schema import IseqRunLaneMetrics, IseqRunStatus
+from ml_warehouse.yield_rollup import iseq_yield_month, month_of
 
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.functions import func
 
 
-def get_sequenced_sum(sess: Session, since: datetime):
+def get_sequenced_sum(sess: Session, since: datetime, use_rollup: bool = False):
     """
     Get number of sequenced bases each month from IseqRunLaneMetrics.
 
@@ -39,6 +37,11 @@ def get_sequenced_sum(sess: Session, since: datetime):
         The Session to perform the search against.
     since: datetime
         The earliest date from which to count sequencing runs.
+    use_rollup: bool
+        Read whole months before the current one from the iseq_yield_month
+        rollup (see ml_warehouse.yield_rollup), which must be up to date,
+        and only compute the current month, and the month of `since` if it
+        does not start on the first, from the lane metrics.
 
     Returns
     -------
@@ -46,6 +49,35 @@ def get_sequenced_sum(sess: Session, since: datetime):
         The Query corresponding to the search, with fields `bases`, `month`, `count`.
     """
 
+    if not use_rollup:
+        return _live_sequenced_sum(sess, since).order_by("month")
+
+    now = datetime.now()
+    current_month = datetime(now.year, now.month, 1)
+    first_month = datetime(since.year, since.month, 1)
+    if first_month < since:
+        first_month = datetime(since.year + since.month // 12, since.month % 12 + 1, 1)
+
+    rolled_up = (
+        sess.query(
+            func.sum(iseq_yield_month.c.bases).label("bases"),
+            iseq_yield_month.c.month.label("month"),
+            func.sum(iseq_yield_month.c.lanes).label("count"),
+        )
+        .filter(
+            (iseq_yield_month.c.month >= month_of(first_month))
+            & (iseq_yield_month.c.month < month_of(current_month))
+        )
+        .group_by(iseq_yield_month.c.month)
+    )
+    live = _live_sequenced_sum(sess, since).filter(
+        (IseqRunStatus.date < first_month) | (IseqRunStatus.date >= current_month)
+    )
+
+    return rolled_up.union_all(live).order_by("month")
+
+
+def _live_sequenced_sum(sess: Session, since: datetime):
     return (
         sess.query(
             func.sum(
@@ -57,10 +89,8 @@ def get_sequenced_sum(sess: Session, since: datetime):
         )
         .filter(
             (IseqRunLaneMetrics.id_run == IseqRunStatus.id_run)
-            & (IseqRunStatus.id_run_status_dict == IseqRunStatusDict.id_run_status_dict)
-            & (IseqRunStatusDict.description == "qc complete")
+            & IseqRunStatus.id_run_status_dict.in_(run_status_ids(sess, "qc complete"))
             & (IseqRunStatus.date > since)
         )
         .group_by("month")
-        .order_by("month")
     )
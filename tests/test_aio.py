@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import asyncio
+
+import pytest
+from pytest import mark as m
+from datetime import datetime
+
+from sqlalchemy import Column, ForeignKey, Integer, String, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import declarative_base, relationship
+
+from examples import aio as async_examples
+from examples.long_illumina import summarize_long_illumina
+from examples.npg_irods import find_pacbio_runs
+from examples.stats import get_sequenced_sum
+from ml_warehouse import reference
+from ml_warehouse.aio import (
+    async_url,
+    asynchronous,
+    dispose_async_engines,
+    get_async_engine,
+    get_async_sessionmaker,
+    run_query,
+)
+from ml_warehouse.engine import url_from_config
+
+Base = declarative_base()
+
+
+class Run(Base):
+    __tablename__ = "run"
+
+    id_run = Column(Integer, primary_key=True)
+    name = Column(String(10))
+    lanes = relationship("Lane")
+
+
+class Lane(Base):
+    __tablename__ = "lane"
+
+    id_lane = Column(Integer, primary_key=True)
+    id_run = Column(ForeignKey("run.id_run"))
+
+
+@pytest.fixture(scope="function")
+def sqlite_sessionmaker(tmp_path):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/runs.db")
+
+    async def populate():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with get_async_sessionmaker(engine)() as sess:
+            sess.add_all(
+                [Run(id_run=i, name=f"run {i}", lanes=[Lane(), Lane()]) for i in (1, 2)]
+            )
+            await sess.commit()
+
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "CREATE TABLE iseq_run_status_dict (id_run_status_dict INTEGER "
+                    "PRIMARY KEY, description VARCHAR(64), iscurrent INTEGER, "
+                    "temporal_index INTEGER)"
+                )
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO iseq_run_status_dict VALUES "
+                    "(1, 'run pending', 1, 10), (2, 'run in progress', 1, 20)"
+                )
+            )
+
+    asyncio.run(populate())
+    yield get_async_sessionmaker(engine)
+    asyncio.run(engine.dispose())
+
+
+@m.describe("Async sessions")
+class TestAio(object):
+    @m.it("Switches MySQL URLs to an async driver")
+    def test_async_url(self):
+
+        url = make_url("mysql+pymysql://mlwh:pw@127.0.0.1:3306/mlwh?charset=utf8mb4")
+
+        assert async_url(url).drivername == "mysql+aiomysql"
+        assert async_url(url, "asyncmy").drivername == "mysql+asyncmy"
+        assert async_url(url).query == {"charset": "utf8mb4"}
+        with pytest.raises(ValueError):
+            async_url(make_url("sqlite://"))
+
+    @m.it("Shares engines by URL and options")
+    def test_get_async_engine(self):
+        pytest.importorskip("aiomysql")
+
+        url = make_url("mysql+pymysql://mlwh:pw@127.0.0.1:3306/mlwh")
+        try:
+            engine = get_async_engine(url)
+            assert get_async_engine(url) is engine
+            assert get_async_engine(url, pool_size=1) is not engine
+
+            tls = {"ssl": {"ca": "/etc/ssl/ca.pem"}}
+            engine = get_async_engine(url, connect_args=tls)
+            assert get_async_engine(url, connect_args=dict(tls)) is engine
+        finally:
+            asyncio.run(dispose_async_engines())
+
+    @m.it("Runs a query builder's Query like Query.all")
+    def test_run_query(self, sqlite_sessionmaker):
+        def runs(sess, name=None):
+            query = sess.query(Run).join(Run.lanes).order_by(Run.id_run)
+            return query if name is None else query.filter(Run.name == name)
+
+        async def run():
+            async with sqlite_sessionmaker() as sess:
+                objects = await run_query(sess, runs)
+                named = await asynchronous(runs)(sess, name="run 2")
+                rows = await run_query(
+                    sess, lambda s: s.query(Run.id_run, Lane.id_lane).join(Run.lanes)
+                )
+            return objects, named, rows
+
+        objects, named, rows = asyncio.run(run())
+
+        assert [r.id_run for r in objects] == [1, 2]
+        assert [r.name for r in named] == ["run 2"]
+        assert len(rows) == 4
+        assert rows[0]._fields == ("id_run", "id_lane")
+
+    @m.it("Runs builders which query while building")
+    def test_run_query_cold_cache(self, sqlite_sessionmaker):
+        def pending(sess):
+            ids = reference.run_status_ids(sess, "run in progress")
+            return sess.query(Run).filter(Run.id_run.in_(ids))
+
+        async def run():
+            async with sqlite_sessionmaker() as sess:
+                return await run_query(sess, pending)
+
+        reference.invalidate()
+        try:
+            assert [r.id_run for r in asyncio.run(run())] == [2]
+        finally:
+            reference.invalidate()
+
+    @m.it("Runs the example queries using cached run statuses")
+    def test_run_status_examples(self, config, mlwh_session_ipm):
+        pytest.importorskip("aiomysql")
+
+        mlwh_session_ipm.commit()
+        args = ("%tyler%", datetime(2015, 1, 14), datetime(2021, 8, 31), 3, [3434])
+        since = datetime(2015, 1, 1)
+        expected = (
+            summarize_long_illumina(mlwh_session_ipm, *args).all(),
+            get_sequenced_sum(mlwh_session_ipm, since).all(),
+        )
+
+        async def run():
+            engine = get_async_engine(url_from_config(config))
+            try:
+                async with get_async_sessionmaker(engine)() as sess:
+                    reference.invalidate()
+                    long_runs = await async_examples.summarize_long_illumina(
+                        sess, *args
+                    )
+                    reference.invalidate()
+                    sums = await async_examples.get_sequenced_sum(sess, since)
+                    return long_runs, sums
+            finally:
+                await dispose_async_engines()
+                reference.invalidate()
+
+        assert asyncio.run(run()) == expected
+
+    @m.it("Runs the example queries")
+    def test_find_pacbio_runs(self, config, mlwh_session):
+        pytest.importorskip("aiomysql")
+
+        # The async engine has connections of its own.
+        mlwh_session.commit()
+        expected = find_pacbio_runs(mlwh_session, "32669", "B1").all()
+
+        async def run():
+            engine = get_async_engine(url_from_config(config))
+            try:
+                async with get_async_sessionmaker(engine)() as sess:
+                    return await async_examples.find_pacbio_runs(
+                        sess, "32669", "B1", profile="irods"
+                    )
+            finally:
+                await dispose_async_engines()
+
+        observed = asyncio.run(run())
+
+        assert [r.id_pac_bio_tmp for r in observed] == [
+            r.id_pac_bio_tmp for r in expected
+        ]
+        assert all(r.sample is not None for r in observed)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from decimal import Decimal
+
+from pytest import mark as m
+from sqlalchemy.orm import Session
+
+from ml_warehouse.ampliconstats import resolve_products, upsert_ampliconstats
+from ml_warehouse.schema import IseqProductAmpliconstats
+
+PRODUCT = "e74060cfb37e375fbba63ebd189cd9dcfcb5f4ab5c0e5d0375f41649deb7a0e0"
+
+
+def amplicons(fpcov_1: str, **product) -> list:
+    return [
+        {
+            **product,
+            "primer_panel": "nCoV-2019/V3",
+            "primer_panel_num_amplicons": 98,
+            "amplicon_index": i,
+            "pp_name": "ncov2019-artic-nf ampliconstats",
+            "pp_version": "0.1",
+            "metric_FPCOV_1": Decimal(fpcov_1),
+            "metric_FREADS": 1000 + i,
+        }
+        for i in range(1, 99)
+    ]
+
+
+@m.describe("Loading ampliconstats")
+class TestAmpliconstats(object):
+    @m.it("Resolves products by run, position and tag index")
+    def test_resolve_products(self, mlwh_session_ipm: Session):
+
+        products = resolve_products(
+            mlwh_session_ipm.connection(), [(7915, 5, 0), (7915, 5, 9999)]
+        )
+
+        assert products == {(7915, 5, 0): PRODUCT}
+
+    @m.it("Updates the rows of a product when loaded again")
+    def test_upsert(self, mlwh_session_ipm: Session):
+
+        conn = mlwh_session_ipm.connection()
+        stats = upsert_ampliconstats(
+            conn, amplicons("99.5", id_iseq_product=PRODUCT), batch_size=40
+        )
+
+        assert stats.rows == 98
+        assert stats.skipped == 0
+
+        stats = upsert_ampliconstats(
+            conn,
+            amplicons("100", id_run=7915, position=5, tag_index=0)
+            + amplicons("100", id_iseq_product="unknown"),
+        )
+        mlwh_session_ipm.commit()
+
+        assert stats.rows == 98
+        assert stats.skipped == 98
+        assert stats.rows_per_second > 0
+
+        rows = mlwh_session_ipm.query(IseqProductAmpliconstats).all()
+        assert len(rows) == 98
+        assert {r.metric_FPCOV_1 for r in rows} == {Decimal("100")}
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import Column, Integer, String, create_engine, event
+from sqlalchemy.orm import Session, declarative_base
+
+from examples.genotyping import get_flgen_plate, get_flgen_plate_batch
+from examples.npg_irods import (
+    get_bmap_flowcell_records,
+    get_bmap_flowcell_records_batch,
+)
+from ml_warehouse.batch import batch_lookup
+
+Base = declarative_base()
+
+
+class Well(Base):
+    __tablename__ = "well"
+
+    id_well = Column(Integer, primary_key=True)
+    plate = Column(String(10, collation="NOCASE"))
+    label = Column(String(3))
+
+
+KEYS = [("P1", "A1"), ("P2", "B1"), ("P3", "A1"), ("P1", "A1")]
+
+
+@pytest.fixture(scope="function")
+def sqlite_session():
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine, future=True) as sess:
+        sess.add_all(
+            [
+                Well(plate=plate, label=label)
+                for plate in ("P1", "P2")
+                for label in ("A1", "B1", "A1")
+            ]
+        )
+        sess.commit()
+        yield sess
+    engine.dispose()
+
+
+def statements(sess):
+    executed = []
+    event.listen(
+        sess.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: executed.append(statement),
+    )
+
+    return executed
+
+
+@m.describe("Batch lookups")
+class TestBatch(object):
+    @m.it("Groups the results by key, in chunks of keys")
+    def test_chunked(self, sqlite_session):
+
+        executed = statements(sqlite_session)
+        found = batch_lookup(
+            sqlite_session.query(Well), (Well.plate, Well.label), KEYS, chunk_size=2
+        )
+
+        assert list(found) == [("P1", "A1"), ("P2", "B1"), ("P3", "A1")]
+        assert [w.id_well for w in found[("P1", "A1")]] == [1, 3]
+        assert [w.id_well for w in found[("P2", "B1")]] == [5]
+        assert found[("P3", "A1")] == []
+        assert len(executed) == 2
+
+    @m.it("Joins a temporary table of many keys")
+    def test_temp_table(self, sqlite_session):
+
+        query = sqlite_session.query(Well)
+        columns = (Well.plate, Well.label)
+
+        assert batch_lookup(query, columns, KEYS, temp_table_threshold=1) == (
+            batch_lookup(query, columns, KEYS)
+        )
+
+    @m.it("Joins keys equal under the column's collation once each")
+    def test_temp_table_collation(self, sqlite_session):
+
+        query = sqlite_session.query(Well)
+        columns = (Well.plate, Well.label)
+        keys = [("P1", "A1"), ("p1", "A1"), ("p2", "B1")]
+
+        found = batch_lookup(query, columns, keys, temp_table_threshold=1)
+
+        assert found == batch_lookup(query, columns, keys)
+        assert [w.id_well for w in found[("P1", "A1")]] == [1, 3]
+        assert found[("p1", "A1")] == []
+        assert [w.id_well for w in found[("P2", "B1")]] == [5]
+
+    @m.it("Returns nothing for no keys")
+    def test_no_keys(self, sqlite_session):
+
+        assert batch_lookup(sqlite_session.query(Well), (Well.plate,), []) == {}
+
+    @m.it("Finds the same BmapFlowcells as the single lookups")
+    def test_bmap_flowcell_batch(self, mlwh_session):
+
+        positions = [("KHPZDTGLPQJGPNWU", 2), ("KHPZDTGLPQJGPNWU", 3), ("NONE", 1)]
+        found = get_bmap_flowcell_records_batch(mlwh_session, positions)
+
+        for chip, position in positions:
+            assert found[(chip, position)] == (
+                get_bmap_flowcell_records(mlwh_session, chip, position).all()
+            )
+
+    @m.it("Finds the same FlgenPlates as the single lookups")
+    def test_flgen_plate_batch(self, mlwh_session_flgen):
+
+        wells = [(1382108143, "S70"), (1382108143, "S71"), (1, "S01")]
+        found = get_flgen_plate_batch(mlwh_session_flgen, wells)
+
+        assert len(found[(1382108143, "S70")]) == 1
+        for barcode, label in wells:
+            assert found[(barcode, label)] == (
+                get_flgen_plate(mlwh_session_flgen, barcode, label).all()
+            )
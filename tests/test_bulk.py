@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+
+from pytest import mark as m
+from sqlalchemy.orm import Session
+
+from ml_warehouse.bulk import (
+    load_files,
+    load_rows,
+    read_rows,
+    unique_keys,
+    upsert_many,
+    upsert_rows,
+)
+from ml_warehouse.schema import (
+    IseqRunLaneMetrics,
+    IseqRunStatus,
+    IseqRunStatusDict,
+    SeqProductIrodsLocations,
+    Study,
+    StudyUsers,
+)
+
+
+@m.describe("Reading fixture files")
+class TestReadRows(object):
+    @m.it("Reads YAML files")
+    def test_read_yaml(self):
+
+        rows = list(read_rows("tests/fixtures/00-IseqRunStatusDict.yml"))
+
+        assert len(rows) == 24
+        assert rows[0]["description"] == "run pending"
+
+    @m.it("Reads CSV and TSV files, treating \\N as NULL")
+    def test_read_delimited(self, tmp_path):
+
+        csv_file = tmp_path / "users.csv"
+        csv_file.write_text("id_study_tmp,role,email\n1,owner,\\N\n2,,a@b.c\n")
+        tsv_file = tmp_path / "users.tsv"
+        tsv_file.write_text("id_study_tmp\trole\n3\towner\n")
+
+        assert list(read_rows(str(csv_file))) == [
+            {"id_study_tmp": "1", "role": "owner", "email": None},
+            {"id_study_tmp": "2", "role": "", "email": "a@b.c"},
+        ]
+        assert list(read_rows(str(tsv_file))) == [
+            {"id_study_tmp": "3", "role": "owner"}
+        ]
+
+
+@m.describe("Bulk loading rows")
+class TestLoadRows(object):
+    @m.it("Loads rows in batches")
+    def test_load_rows(self, mlwh_session: Session):
+
+        rows = [
+            {"id_study_tmp": 1, "role": "follower", "email": f"user{i}@sanger.ac.uk"}
+            for i in range(25)
+        ]
+        before = mlwh_session.query(StudyUsers).count()
+
+        stats = load_rows(mlwh_session.connection(), StudyUsers, rows, batch_size=10)
+        mlwh_session.commit()
+
+        assert stats.rows == 25
+        assert stats.batches == 3
+        assert stats.rows_per_second > 0
+        assert mlwh_session.query(StudyUsers).count() == before + 25
+
+    @m.it("Loads files in dependency order")
+    def test_load_files(self, mlwh_session: Session):
+
+        mlwh_session.query(IseqRunStatus).delete()
+        mlwh_session.query(IseqRunStatusDict).delete()
+        mlwh_session.commit()
+
+        stats = load_files(
+            mlwh_session.connection(),
+            {
+                IseqRunStatus: "tests/fixtures/100-IseqRunStatus.yml",
+                IseqRunStatusDict: "tests/fixtures/00-IseqRunStatusDict.yml",
+            },
+        )
+        mlwh_session.commit()
+
+        assert [s.table for s in stats] == ["iseq_run_status_dict", "iseq_run_status"]
+        assert mlwh_session.query(IseqRunStatus).count() == 28
+
+
+@m.describe("Bulk upserting rows")
+class TestUpsertRows(object):
+    @m.it("Updates rows already present under a unique key")
+    def test_upsert_rows(self, mlwh_session: Session):
+
+        rows = [
+            {
+                "id_run_status_dict": 100 + i,
+                "description": f"status {i}",
+                "iscurrent": 1,
+            }
+            for i in range(5)
+        ]
+        before = mlwh_session.query(IseqRunStatusDict).count()
+
+        upsert_rows(mlwh_session.connection(), IseqRunStatusDict, rows)
+        rows[0]["description"] = "renamed"
+        stats = upsert_rows(mlwh_session.connection(), IseqRunStatusDict, rows, 2)
+        mlwh_session.commit()
+
+        assert stats.rows == 5
+        assert stats.batches == 3
+        assert mlwh_session.query(IseqRunStatusDict).count() == before + 5
+        assert mlwh_session.get(IseqRunStatusDict, 100).description == "renamed"
+
+    @m.it("Finds the unique keys of a table")
+    def test_unique_keys(self):
+
+        assert unique_keys(Study) == [
+            ("uuid_study_lims",),
+            ("id_lims", "id_study_lims"),
+            ("id_study_tmp",),
+        ]
+        assert unique_keys(SeqProductIrodsLocations) == [
+            ("irods_root_collection", "id_product"),
+            ("id_seq_product_irods_locations_tmp",),
+        ]
+
+    @m.it("Skips rows no newer than those present")
+    def test_upsert_many(self, mlwh_session: Session):
+
+        rows = [
+            {
+                "id_lims": "SQSCP",
+                "id_study_lims": f"upsert-{i}",
+                "name": f"Study {i}",
+                "last_updated": datetime(2022, 1, 1),
+                "recorded_at": datetime(2022, 1, 1),
+            }
+            for i in range(5)
+        ]
+        conn = mlwh_session.connection()
+
+        stats = upsert_many(conn, Study, rows, batch_size=3)
+        assert [(s.rows, s.skipped) for s in stats] == [(3, 0), (2, 0)]
+
+        rows[1].update(name="Renamed", last_updated=datetime(2022, 2, 1))
+        rows[2].update(name="Stale", last_updated=datetime(2021, 1, 1))
+        stats = upsert_many(conn, Study, rows, batch_size=3)
+        mlwh_session.commit()
+
+        assert [(s.rows, s.skipped) for s in stats] == [(1, 2), (0, 2)]
+        names = {
+            s.id_study_lims: s.name
+            for s in mlwh_session.query(Study).filter(
+                Study.id_study_lims.like("upsert-%")
+            )
+        }
+        assert names == {
+            "upsert-0": "Study 0",
+            "upsert-1": "Renamed",
+            "upsert-2": "Study 2",
+            "upsert-3": "Study 3",
+            "upsert-4": "Study 4",
+        }
+
+    @m.it("Skips unchanged rows read from CSV files")
+    def test_upsert_many_csv(self, mlwh_session: Session, tmp_path):
+
+        users = tmp_path / "users.csv"
+        users.write_text(
+            "id_study_users_tmp,id_study_tmp,last_updated,role\n"
+            "5925,1954,2012-11-26 14:20:11,manager\n"
+            "5926,1954,2012-11-26 14:20:11,manager\n"
+        )
+        lanes = tmp_path / "lanes.csv"
+        lanes.write_text(
+            "id_run,position,last_changed,cycles\n7915,5,2019-01-26 18:58:02,208\n"
+        )
+        conn = mlwh_session.connection()
+
+        stats = upsert_many(conn, StudyUsers, read_rows(str(users)))
+        assert [(s.rows, s.skipped) for s in stats] == [(0, 2)]
+
+        stats = upsert_many(conn, IseqRunLaneMetrics, read_rows(str(lanes)))
+        assert [(s.rows, s.skipped) for s in stats] == [(0, 1)]
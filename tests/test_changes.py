@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+
+import pytest
+from pytest import mark as m
+
+from ml_warehouse.changes import ChangeFeed, JSONMarkStore, Mark
+from ml_warehouse.schema import CgapHeron, PacBioRun, Study
+
+
+@m.describe("Storing change feed marks")
+class TestJSONMarkStore(object):
+    @m.it("Stores marks per consumer and table")
+    def test_round_trip(self, tmp_path):
+
+        store = JSONMarkStore(str(tmp_path / "marks.json"))
+        mark = Mark(datetime(2021, 8, 12, 12, 0, 43), 42)
+
+        assert store.get("qc", "study") is None
+
+        store.set("qc", "study", mark)
+
+        assert JSONMarkStore(store.path).get("qc", "study") == mark
+        assert store.get("irods", "study") is None
+
+    @m.it("Rejects tables without a modification timestamp")
+    def test_no_timestamp(self, tmp_path):
+
+        with pytest.raises(ValueError):
+            ChangeFeed("qc", [CgapHeron], JSONMarkStore(str(tmp_path / "m.json")))
+
+
+@m.describe("Following changes")
+class TestChangeFeed(object):
+    @m.it("Returns only rows changed since the last acknowledged poll")
+    def test_poll(self, mlwh_session, tmp_path):
+
+        store = JSONMarkStore(str(tmp_path / "marks.json"))
+        feed = ChangeFeed("qc", [Study, PacBioRun], store)
+        n_studies = mlwh_session.query(Study).count()
+        n_runs = mlwh_session.query(PacBioRun).count()
+
+        # Poll until every table is drained, not just the smaller one.
+        seen, runs = [], []
+        while True:
+            changes = feed.poll(mlwh_session, limit=10)
+            seen.extend(s.id_study_tmp for s in changes["study"])
+            runs.extend(r.id_pac_bio_tmp for r in changes["pac_bio_run"])
+            feed.acknowledge()
+            if all(len(rows) < 10 for rows in changes.values()):
+                break
+
+        assert len(seen) == len(set(seen)) == n_studies
+        assert len(runs) == len(set(runs)) == n_runs
+        assert store.get("qc", "pac_bio_run") is not None
+
+        study = mlwh_session.query(Study).first()
+        study.last_updated = datetime(2030, 1, 1)
+        mlwh_session.commit()
+
+        changes = feed.poll(mlwh_session)
+        assert [s.id_study_tmp for s in changes["study"]] == [study.id_study_tmp]
+        assert changes["pac_bio_run"] == []
+
+    @m.it("Returns the same rows again if a poll is not acknowledged")
+    def test_unacknowledged(self, mlwh_session, tmp_path):
+
+        feed = ChangeFeed(
+            "qc",
+            [Study],
+            JSONMarkStore(str(tmp_path / "marks.json")),
+            start=datetime(2021, 1, 1),
+        )
+
+        first = feed.poll(mlwh_session, limit=5)["study"]
+        again = feed.poll(mlwh_session, limit=5)["study"]
+
+        assert first == again
+        assert all(s.last_updated > datetime(2021, 1, 1) for s in first)
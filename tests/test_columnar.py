@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import (
+    DECIMAL,
+    Column,
+    DateTime,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    create_engine,
+    select,
+    text,
+)
+from sqlalchemy.dialects.mysql import DOUBLE as mysqlDOUBLE
+from sqlalchemy.dialects.mysql import FLOAT as mysqlFLOAT
+from sqlalchemy.dialects.mysql import INTEGER as mysqlINTEGER
+
+from ml_warehouse.columnar import (
+    arrow_schema,
+    arrow_type,
+    product_metrics_select,
+    record_batches,
+    write_parquet,
+)
+from ml_warehouse.schema import IseqProductAmpliconstats, IseqProductMetrics
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+metadata = MetaData()
+metrics = Table(
+    "metrics",
+    metadata,
+    Column("id", mysqlINTEGER(10, unsigned=True), primary_key=True),
+    Column("name", String(10)),
+    Column("percent", mysqlFLOAT(5, 2)),
+    Column("ratio", DECIMAL(5, 2)),
+    Column("date", DateTime),
+)
+
+# Like iseq_run_lane_metrics.raw_cluster_density, returning Decimals. SQLite
+# cannot create DOUBLE columns, so the table is created with plain SQL.
+densities = Table(
+    "densities",
+    MetaData(),
+    Column("id", mysqlINTEGER(10, unsigned=True), primary_key=True),
+    Column("density", mysqlDOUBLE(12, 3)),
+    Column("unscaled", Numeric()),
+)
+
+
+@pytest.fixture(scope="function")
+def sqlite_engine():
+    engine = create_engine("sqlite://", future=True)
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            metrics.insert(),
+            [
+                {
+                    "id": i,
+                    "name": None if i == 3 else f"m{i}",
+                    "percent": i / 4,
+                    "ratio": Decimal(i) / 2,
+                    "date": datetime(2022, 1, i),
+                }
+                for i in range(1, 6)
+            ],
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE densities "
+                "(id INTEGER PRIMARY KEY, density FLOAT, unscaled NUMERIC)"
+            )
+        )
+        conn.execute(
+            densities.insert(),
+            [
+                {"id": 1, "density": 1.5, "unscaled": 2},
+                {"id": 2, "density": None, "unscaled": None},
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+@m.describe("Columnar export")
+class TestColumnar(object):
+    @m.it("Types columns from the schema")
+    def test_arrow_type(self):
+
+        assert arrow_type(IseqProductMetrics.num_reads.type) == pa.uint64()
+        assert arrow_type(IseqProductMetrics.position.type) == pa.uint16()
+        assert arrow_type(IseqProductMetrics.qc.type) == pa.int8()
+        assert arrow_type(IseqProductMetrics.tag_decode_percent.type) == pa.float32()
+        assert arrow_type(IseqProductMetrics.last_changed.type) == pa.timestamp("us")
+        assert arrow_type(IseqProductMetrics.id_iseq_product.type) == pa.string()
+        assert arrow_type(
+            IseqProductAmpliconstats.metric_FPCOV_1.type
+        ) == pa.decimal128(5, 2)
+
+    @m.it("Adds the flowcell and study keys to product metrics")
+    def test_product_metrics_schema(self):
+
+        schema = arrow_schema(
+            product_metrics_select(columns=["id_iseq_product", "num_reads"])
+        )
+
+        assert schema.names == [
+            "id_iseq_product",
+            "num_reads",
+            "id_lims",
+            "id_flowcell_lims",
+            "flowcell_barcode",
+            "id_pool_lims",
+            "entity_type",
+            "id_sample_tmp",
+            "id_study_tmp",
+            "id_study_lims",
+            "study_name",
+        ]
+
+    @m.it("Reads results in typed record batches")
+    def test_record_batches(self, sqlite_engine):
+
+        with sqlite_engine.connect() as conn:
+            batches = list(
+                record_batches(conn, select(metrics).order_by(metrics.c.id), 2)
+            )
+
+        assert [b.num_rows for b in batches] == [2, 2, 1]
+        table = pa.Table.from_batches(batches)
+        assert table.schema.field("id").type == pa.uint32()
+        assert table.column("name").to_pylist() == ["m1", "m2", None, "m4", "m5"]
+        assert table.column("ratio").to_pylist()[1] == Decimal("1.00")
+
+    @m.it("Reads DOUBLE and unscaled NUMERIC columns as floats")
+    def test_record_batches_double(self, sqlite_engine):
+
+        with sqlite_engine.connect() as conn:
+            stmt = select(densities).order_by(densities.c.id)
+            table = pa.Table.from_batches(list(record_batches(conn, stmt)))
+
+        assert table.schema.field("density").type == pa.float64()
+        assert table.schema.field("unscaled").type == pa.float64()
+        assert table.column("density").to_pylist() == [1.5, None]
+        assert table.column("unscaled").to_pylist() == [2.0, None]
+
+    @m.it("Writes results to Parquet")
+    def test_write_parquet(self, sqlite_engine, tmp_path):
+
+        path = str(tmp_path / "metrics.parquet")
+        with sqlite_engine.connect() as conn:
+            written = write_parquet(conn, select(metrics), path, batch_size=2)
+
+        table = pq.read_table(path)
+        assert written == table.num_rows == 5
+        assert table.schema == arrow_schema(select(metrics))
+        assert table.column("date").to_pylist()[4] == datetime(2022, 1, 5)
+
+    @m.it("Exports every product with its keys")
+    def test_export_product_metrics(self, mlwh_session_ipm, tmp_path):
+
+        path = str(tmp_path / "product_metrics.parquet")
+        written = write_parquet(
+            mlwh_session_ipm.connection(), product_metrics_select(), path
+        )
+
+        table = pq.read_table(path)
+        expected = mlwh_session_ipm.query(IseqProductMetrics).count()
+        assert written == table.num_rows == expected
+        assert table.column("id_iseq_product").to_pylist() == [
+            p.id_iseq_product
+            for p in mlwh_session_ipm.query(IseqProductMetrics).order_by(
+                IseqProductMetrics.id_iseq_pr_metrics_tmp
+            )
+        ]
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import configparser
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import insert, select, text
+
+from ml_warehouse import engine as mlwh_engine
+from ml_warehouse.engine import (
+    RoutingSession,
+    get_engine,
+    get_sessionmaker,
+    pool_options_from_config,
+    url_from_config,
+    url_from_env,
+)
+from ml_warehouse.schema import Study
+
+
+@m.describe("Building warehouse URLs")
+class TestURLs(object):
+    @m.it("Builds a URL from the ini file")
+    def test_url_from_config(self, config):
+
+        url = url_from_config(config)
+
+        assert url.drivername == "mysql+pymysql"
+        assert url.database == "mlwarehouse"
+        assert url.port == 3306
+        assert url.query == {"charset": "utf8mb4"}
+
+    @m.it("Fails if the ini section is missing")
+    def test_url_from_config_missing(self, config):
+
+        with pytest.raises(configparser.Error):
+            url_from_config(config, "MySQLReplica")
+
+    @m.it("Builds a URL from environment variables")
+    def test_url_from_env(self, monkeypatch):
+
+        for name, value in [
+            ("USER", "user"),
+            ("PW", "p@ss"),
+            ("HOST", "replica"),
+            ("PORT", "3307"),
+            ("DBNAME", "mlwh"),
+        ]:
+            monkeypatch.setenv(f"MYSQL_REPLICA_{name}", value)
+
+        url = url_from_env("MYSQL_REPLICA")
+
+        assert url.host == "replica"
+        assert url.password == "p@ss"
+        assert url_from_env("MYSQL_MISSING") is None
+
+    @m.it("Reads pool options from the ini file")
+    def test_pool_options_from_config(self):
+
+        config = configparser.ConfigParser()
+        config.read_string("[MySQL]\npool_size = 2\npool_pre_ping = no\n")
+
+        assert pool_options_from_config(config) == {
+            "pool_size": 2,
+            "pool_pre_ping": False,
+        }
+
+
+@m.describe("Sharing engines")
+class TestEngines(object):
+    @m.it("Returns the same engine for the same URL and options")
+    def test_get_engine(self, config):
+
+        url = url_from_config(config)
+
+        assert get_engine(url) is get_engine(url)
+        assert get_engine(url) is not get_engine(url, pool_size=1)
+        assert get_engine(url).pool.size() == 5
+
+    @m.it("Shares engines with connect_args, such as TLS options")
+    def test_get_engine_connect_args(self, config):
+
+        url = url_from_config(config)
+        tls = {"ssl": {"ca": "/etc/ssl/ca.pem", "check_hostname": True}}
+
+        engine = get_engine(url, connect_args=tls)
+        assert get_engine(url, connect_args=dict(tls)) is engine
+        assert get_engine(url, connect_args={"ssl": {"ca": "other.pem"}}) is not engine
+
+    @m.it("Replaces the pools of shared engines after a fork")
+    def test_reset_after_fork(self, config):
+
+        engine = get_engine(url_from_config(config))
+        pool = engine.pool
+
+        mlwh_engine._reset_after_fork()
+
+        assert engine.pool is not pool
+
+
+@m.describe("Routing sessions")
+class TestRoutingSession(object):
+    @m.it("Sends SELECT statements to the replica and others to the primary")
+    def test_get_bind(self, config):
+
+        primary = get_engine(url_from_config(config))
+        replica = get_engine(url_from_config(config), pool_size=1)
+        session = get_sessionmaker(primary, replica)()
+
+        assert isinstance(session, RoutingSession)
+        assert session.get_bind(clause=select(Study)) is replica
+        assert session.get_bind(clause=insert(Study)) is primary
+        assert session.get_bind(clause=text("SELECT 1")) is primary
+        locking = select(Study).with_for_update(skip_locked=True)
+        assert session.get_bind(clause=locking) is primary
+
+        session.use_primary = True
+        assert session.get_bind(clause=select(Study)) is primary
@@ -17,6 +17,7 @@
 #
 # @author Adam Blanchet <ab59@sanger.ac.uk>
 
+from collections import Counter
 from datetime import datetime
 
 from pytest import mark as m
@@ -36,8 +37,11 @@ from examples.npg_qc import (
 from examples.recently_updated import (
     get_recent_fluidigm,
     get_recent_ont,
+    get_recent_ont_chunks,
+    get_recent_pacbio_run_chunks,
     get_recent_pacbio_runs,
 )
+from ml_warehouse.schema import OseqFlowcell
 
 
 @m.describe("Running example queries")
@@ -64,6 +68,22 @@ class TestMLWarehouseExampleRecentQueries(object):
 
         assert set(observed_lims_ids) == set(expected_lims_ids)
 
+    @m.it("Retrieves recently updated PacBio runs in chunks")
+    def test_retrieve_recent_pacbio_chunks(self, mlwh_session):
+
+        max_age = datetime(year=2021, month=1, day=31)
+        recent_runs = get_recent_pacbio_runs(mlwh_session, max_age)
+
+        chunks = list(get_recent_pacbio_run_chunks(mlwh_session, max_age, 2))
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+
+        # Each of these runs has one pac_bio_run row, so paging by it returns
+        # the same rows, and no more, as the DISTINCT query.
+        observed = [tuple(row[:-1]) for chunk in chunks for row in chunk]
+        ids = [row.id_pac_bio_tmp for chunk in chunks for row in chunk]
+        assert ids == sorted(ids)
+        assert Counter(observed) == Counter(tuple(r) for r in recent_runs.all())
+
     @m.it("Retrieves recently updated ONT runs")
     def test_retrieve_recent_ont(self, mlwh_session):
 
@@ -89,6 +109,19 @@ class TestMLWarehouseExampleRecentQueries(object):
 
         assert set(observed_names) == set(expected_names)
 
+    @m.it("Retrieves recently updated ONT runs in chunks")
+    def test_retrieve_recent_ont_chunks(self, mlwh_session):
+
+        max_age = datetime(year=2018, month=1, day=1)
+        key = OseqFlowcell.id_oseq_flowcell_tmp
+        expected = get_recent_ont(mlwh_session, max_age).add_columns(key)
+
+        chunks = list(get_recent_ont_chunks(mlwh_session, max_age, chunk_size=4))
+        assert all(len(chunk) <= 4 for chunk in chunks)
+
+        observed = [row for chunk in chunks for row in chunk]
+        assert observed == expected.order_by(key).all()
+
     @m.it("Retrieves recently updated Fluidigm runs")
     def test_retrieve_recent_fluidigm(self, mlwh_session_flgen):
 
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    select,
+)
+from sqlalchemy.dialects.mysql import SMALLINT as mysqlSMALLINT
+
+from ml_warehouse.frames import fetch_arrays, fetch_frame, numpy_dtype
+from ml_warehouse.schema import IseqRunLaneMetrics, PacBioRunWellMetrics
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+metadata = MetaData()
+lanes = Table(
+    "lanes",
+    metadata,
+    Column("position", mysqlSMALLINT(2, unsigned=True), primary_key=True),
+    Column("cycles", mysqlSMALLINT(5, unsigned=True)),
+    Column("yield", Float(53)),
+    Column("name", String(10)),
+    Column("date", DateTime),
+)
+
+
+@pytest.fixture(scope="function")
+def sqlite_engine():
+    engine = create_engine("sqlite://", future=True)
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            lanes.insert(),
+            [
+                {
+                    "position": p,
+                    "cycles": None if p == 2 else 300 + p,
+                    "yield": None if p == 3 else p * 1.5,
+                    "name": f"lane {p}",
+                    "date": datetime(2022, 1, p),
+                }
+                for p in range(1, 6)
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+@m.describe("Fetching NumPy arrays and DataFrames")
+class TestFrames(object):
+    @m.it("Picks dtypes from the schema")
+    def test_numpy_dtype(self):
+
+        assert numpy_dtype(IseqRunLaneMetrics.cycles.type) == np.uint32
+        assert numpy_dtype(IseqRunLaneMetrics.position.type) == np.uint16
+        assert numpy_dtype(IseqRunLaneMetrics.raw_cluster_density.type) == np.float64
+        assert numpy_dtype(PacBioRunWellMetrics.movie_minutes.type) == np.uint16
+        assert numpy_dtype(PacBioRunWellMetrics.loading_conc.type) == np.float32
+        assert numpy_dtype(PacBioRunWellMetrics.run_start.type) == np.dtype(
+            "datetime64[us]"
+        )
+
+    @m.it("Fetches columns as masked arrays")
+    def test_fetch_arrays(self, sqlite_engine):
+
+        with sqlite_engine.connect() as conn:
+            arrays = fetch_arrays(conn, select(lanes).order_by(lanes.c.position), 2)
+
+        assert arrays["cycles"].dtype == np.uint16
+        assert arrays["cycles"].mask.tolist() == [False, True, False, False, False]
+        assert arrays["cycles"].sum() == 301 + 303 + 304 + 305
+        assert arrays["position"].mask is np.ma.nomask
+        assert arrays["name"].tolist()[4] == "lane 5"
+
+    @m.it("Fetches a DataFrame with nullable columns")
+    def test_fetch_frame(self, sqlite_engine):
+
+        with sqlite_engine.connect() as conn:
+            frame = fetch_frame(conn, select(lanes).order_by(lanes.c.position), 2)
+
+        assert frame["position"].dtype == np.uint16
+        assert frame["cycles"].dtype == pd.UInt16Dtype()
+        assert frame["cycles"].isna().tolist() == [False, True, False, False, False]
+        assert frame["yield"].dtype == np.float64
+        assert np.isnan(frame["yield"][2])
+        assert frame["date"][4] == pd.Timestamp(2022, 1, 5)
+
+    @m.it("Fetches an empty DataFrame")
+    def test_fetch_empty(self, sqlite_engine):
+
+        with sqlite_engine.connect() as conn:
+            frame = fetch_frame(conn, select(lanes).where(lanes.c.position > 5))
+
+        assert len(frame) == 0
+        assert frame["cycles"].dtype == np.uint16
+
+    @m.it("Fetches lane metrics like the ORM")
+    def test_fetch_lane_metrics(self, mlwh_session):
+
+        table = IseqRunLaneMetrics.__table__
+        frame = fetch_frame(
+            mlwh_session.connection(),
+            select(table.c.id_run, table.c.position, table.c.cycles).order_by(
+                table.c.id_run, table.c.position
+            ),
+        )
+
+        expected = (
+            mlwh_session.query(
+                IseqRunLaneMetrics.id_run,
+                IseqRunLaneMetrics.position,
+                IseqRunLaneMetrics.cycles,
+            )
+            .order_by(IseqRunLaneMetrics.id_run, IseqRunLaneMetrics.position)
+            .all()
+        )
+        assert list(frame.itertuples(index=False, name=None)) == [
+            tuple(row) for row in expected
+        ]
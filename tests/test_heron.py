@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from pytest import mark as m
+from sqlalchemy.orm import Session
+
+from ml_warehouse import heron
+from ml_warehouse.bulk import load_rows
+from ml_warehouse.heron import (
+    Rack,
+    RackCache,
+    claim_unwrangled,
+    fetch_racks,
+    mark_wrangled,
+    unwrangled_pages,
+)
+from ml_warehouse.schema import CgapHeron
+
+
+def tube(i: int, rack: str, position: str, destination: str = "Lighthouse") -> dict:
+    return {
+        "cgap_heron_tmp": i,
+        "container_barcode": rack,
+        "supplier_sample_id": f"SUPPLIER-{i}",
+        "position": position,
+        "sample_type": "VTM",
+        "release_time": datetime(2020, 11, 1),
+        "study": "HERON",
+        "destination": destination,
+        "sample_state": "ok",
+        "tube_barcode": f"TUBE-{i}",
+    }
+
+
+TUBES = [tube(i + 1, f"SA{i // 10:08d}", f"A{i % 10 + 1}") for i in range(25)] + [
+    tube(100, "SA00000009", "A1", destination="Other")
+]
+
+
+@m.describe("Heron racks")
+class TestHeronRacks(object):
+    @m.it("Finds tubes by position")
+    def test_rack(self):
+
+        rack = Rack("SA00000000", [SimpleNamespace(**t) for t in TUBES[:3]])
+
+        assert len(rack) == 3
+        assert rack.positions() == ["A1", "A2", "A3"]
+        assert rack.tube("A2").tube_barcode == "TUBE-2"
+        assert rack.tube("H12") is None
+
+    @m.it("Caches racks, fetching those missing together")
+    def test_rack_cache(self, monkeypatch):
+
+        fetched = []
+
+        def fetch(sess, barcodes):
+            fetched.append(sorted(barcodes))
+            return {barcode: Rack(barcode, []) for barcode in barcodes}
+
+        monkeypatch.setattr(heron, "fetch_racks", fetch)
+        now = [0.0]
+        cache = RackCache(ttl=10, clock=lambda: now[0])
+
+        cache.get_many(None, ["R1", "R2"])
+        cache.get_many(None, ["R2", "R3"])
+        now[0] = 11.0
+        cache.get(None, "R3")
+        cache.invalidate("R3")
+        cache.get(None, "R3")
+
+        assert fetched == [["R1", "R2"], ["R3"], ["R3"], ["R3"]]
+
+    @m.it("Fetches racks with one statement")
+    def test_fetch_racks(self, mlwh_session: Session):
+
+        load_rows(mlwh_session.connection(), CgapHeron, TUBES)
+        mlwh_session.commit()
+
+        racks = fetch_racks(mlwh_session, ["SA00000000", "SA00000002", "SA99"])
+
+        assert [len(r) for r in racks.values()] == [10, 5, 0]
+        assert racks["SA00000002"].tube("A3").cgap_heron_tmp == 23
+
+    @m.it("Pages through and claims the tubes not yet wrangled")
+    def test_work_queue(self, mlwh_session: Session):
+
+        load_rows(mlwh_session.connection(), CgapHeron, TUBES)
+        mlwh_session.commit()
+
+        pages = list(unwrangled_pages(mlwh_session, "Lighthouse", page_size=10))
+        assert [len(p) for p in pages] == [10, 10, 5]
+
+        claimed = claim_unwrangled(mlwh_session, "Lighthouse", 20)
+        assert [t.cgap_heron_tmp for t in claimed] == list(range(1, 21))
+        assert mark_wrangled(mlwh_session, [t.cgap_heron_tmp for t in claimed]) == 20
+        mlwh_session.commit()
+
+        remaining = [t for p in unwrangled_pages(mlwh_session, "Lighthouse") for t in p]
+        assert [t.cgap_heron_tmp for t in remaining] == list(range(21, 26))
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, func
+from sqlalchemy.orm import Session, declarative_base
+
+from examples.npg_qc import (
+    get_iseq_product_metrics_by_decode_percent,
+    get_iseq_product_metrics_by_study,
+    get_iseq_product_metrics_run,
+)
+from ml_warehouse.in_lists import (
+    AutoInList,
+    ChunkedInList,
+    InList,
+    TempTableInList,
+)
+
+STRATEGIES = [
+    InList(),
+    ChunkedInList(chunk_size=2, workers=1),
+    ChunkedInList(chunk_size=2, workers=3),
+    TempTableInList(),
+    AutoInList(chunk_threshold=2, temp_table_threshold=4),
+]
+
+metadata = MetaData()
+lanes = Table(
+    "lanes",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("id_run", Integer),
+)
+
+
+class Lane(declarative_base(metadata=metadata)):
+    __table__ = lanes
+
+
+@pytest.fixture(scope="function")
+def sqlite_session(tmp_path):
+    # A file, so that every connection of the pool sees the same database.
+    engine = create_engine(f"sqlite:///{tmp_path}/lanes.db", future=True)
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            lanes.insert(),
+            [{"id_run": run} for run in range(1, 11) for _ in range(run % 3 + 1)],
+        )
+    with Session(engine, future=True) as sess:
+        yield sess
+    engine.dispose()
+
+
+def lanes_per_run(sess, run_ids):
+    return (
+        sess.query(lanes.c.id_run, func.count().label("lanes"))
+        .filter(lanes.c.id_run.in_(run_ids))
+        .group_by(lanes.c.id_run)
+    )
+
+
+@m.describe("Running queries with long IN lists")
+class TestInLists(object):
+    @m.it("Returns the same rows with every strategy")
+    @pytest.mark.parametrize("strategy", STRATEGIES, ids=lambda s: type(s).__name__)
+    def test_strategies(self, sqlite_session, strategy):
+
+        run_ids = [9, 2, 3, 3, 5, 7, 42]
+        rows = strategy.all(sqlite_session, lanes_per_run, run_ids)
+
+        assert sorted(tuple(r) for r in rows) == [
+            (2, 3),
+            (3, 1),
+            (5, 3),
+            (7, 2),
+            (9, 1),
+        ]
+
+    @m.it("Returns no rows for no values")
+    @pytest.mark.parametrize("strategy", STRATEGIES, ids=lambda s: type(s).__name__)
+    def test_no_values(self, sqlite_session, strategy):
+
+        assert strategy.all(sqlite_session, lanes_per_run, []) == []
+
+    @m.it("Merges the instances read by each worker into the Session")
+    def test_chunked_instances(self, sqlite_session):
+
+        rows = ChunkedInList(chunk_size=2, workers=3).all(
+            sqlite_session,
+            lambda sess, run_ids: sess.query(Lane, Lane.id_run).filter(
+                Lane.id_run.in_(run_ids)
+            ),
+            [1, 2, 3, 4, 5],
+        )
+
+        assert len(rows) == 11
+        assert all(lane in sqlite_session for lane, _ in rows)
+        assert [row.id_run for row in rows] == [lane.id_run for lane, _ in rows]
+
+    @m.it("Drops the temporary table afterwards")
+    def test_temp_table_dropped(self, sqlite_session):
+
+        TempTableInList().all(sqlite_session, lanes_per_run, [1, 2])
+        tables = sqlite_session.execute(
+            func.count()
+            .select()
+            .select_from(Table("sqlite_temp_master", MetaData(), Column("name")))
+        ).scalar()
+
+        assert tables == 0
+
+    @m.it("Runs the npg_qc examples with every strategy")
+    def test_npg_qc_examples(self, mlwh_session_ipm):
+
+        run_ids = [7915, 15440, 17550, 18448, 18980, 26291]
+        builders = [
+            lambda s, ids: get_iseq_product_metrics_run(
+                s, ids, "library_indexed_spike", 5
+            ),
+            lambda s, ids: get_iseq_product_metrics_by_study(
+                s, "Illumina Controls", ids
+            ),
+            lambda s, ids: get_iseq_product_metrics_by_decode_percent(s, 95, ids),
+        ]
+
+        for build in builders:
+            expected = sorted(build(mlwh_session_ipm, run_ids).all())
+            for strategy in STRATEGIES:
+                assert sorted(strategy.all(mlwh_session_ipm, build, run_ids)) == (
+                    expected
+                )
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+
+from pytest import mark as m
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, aliased
+
+from examples.genotyping import get_flgen_plate
+from examples.long_illumina import summarize_long_illumina
+from examples.npg_irods import (
+    find_pacbio_runs,
+    get_bmap_flowcell_records,
+    get_stock_records,
+)
+from examples.npg_qc import (
+    get_iseq_product_metrics_by_decode_percent,
+    get_iseq_product_metrics_by_study,
+    get_iseq_product_metrics_run,
+)
+from examples.recently_updated import (
+    get_recent_fluidigm,
+    get_recent_ont,
+    get_recent_pacbio_runs,
+)
+from examples.stats import get_sequenced_sum
+from ml_warehouse.explain import IndexAdvisor, check_query, propose_index
+from ml_warehouse.schema import BmapFlowcell, OseqFlowcell, Sample
+
+RUN_IDS = [7915, 15440, 18448, 18980, 26291]
+SINCE = datetime(2018, 1, 1)
+
+# Tables which examples look up through an index, so should never scan.
+INDEXED = {"get_stock_records": ["stock_resource"]}
+
+# The indexes proposed for tables which examples have to scan, since no
+# index covers their filters.
+PROPOSALS = {
+    "get_flgen_plate": (
+        "flgen_plate",
+        "CREATE INDEX ix_flgen_plate_plate_barcode_well_label "
+        "ON flgen_plate (plate_barcode, well_label)",
+    ),
+    "get_bmap_flowcell_records": (
+        "bmap_flowcell",
+        "CREATE INDEX ix_bmap_flowcell_chip_serialnumber_position "
+        "ON bmap_flowcell (chip_serialnumber, position)",
+    ),
+}
+
+
+def example_advisor() -> IndexAdvisor:
+    advisor = IndexAdvisor()
+
+    for name, builder in {
+        "get_flgen_plate": lambda s: get_flgen_plate(s, 1382108143, "S70"),
+        "summarize_long_illumina": lambda s: summarize_long_illumina(
+            s, "%tyler%", SINCE, SINCE, 3, RUN_IDS
+        ),
+        "get_stock_records": lambda s: get_stock_records(s, "stock_barcode_01234"),
+        "get_bmap_flowcell_records": lambda s: get_bmap_flowcell_records(
+            s, "KHPZDTGLPQJGPNWU", 2
+        ),
+        "find_pacbio_runs": lambda s: find_pacbio_runs(s, "32669", "B1"),
+        "get_iseq_product_metrics_run": lambda s: get_iseq_product_metrics_run(
+            s, RUN_IDS, "library_indexed_spike", 5
+        ),
+        "get_iseq_product_metrics_by_study": lambda s: (
+            get_iseq_product_metrics_by_study(s, "Illumina Controls", RUN_IDS)
+        ),
+        "get_iseq_product_metrics_by_decode_percent": lambda s: (
+            get_iseq_product_metrics_by_decode_percent(s, 95, RUN_IDS)
+        ),
+        "get_recent_pacbio_runs": lambda s: get_recent_pacbio_runs(s, SINCE),
+        "get_recent_ont": lambda s: get_recent_ont(s, SINCE),
+        "get_recent_fluidigm": lambda s: get_recent_fluidigm(s, SINCE),
+        "get_sequenced_sum": lambda s: get_sequenced_sum(s, SINCE),
+    }.items():
+        advisor.register(name, builder)
+
+    return advisor
+
+
+@m.describe("Proposing indexes")
+class TestProposeIndex(object):
+    @m.it("Puts equality columns before range columns")
+    def test_propose_index(self):
+
+        sess = Session()
+        query = sess.query(Sample.name).filter(
+            (Sample.last_updated > SINCE) & (Sample.id_lims == "SQSCP")
+        )
+
+        assert propose_index(query.statement, Sample.__table__) == (
+            "CREATE INDEX ix_sample_id_lims_last_updated_name "
+            "ON sample (id_lims, last_updated, name)"
+        )
+
+    @m.it("Proposes nothing for tables only joined on")
+    def test_propose_nothing(self):
+
+        sess = Session()
+        query = sess.query(OseqFlowcell).join(OseqFlowcell.sample)
+
+        assert propose_index(query.statement, Sample.__table__) is None
+
+    @m.it("Proposes an index on the table of an alias")
+    def test_propose_index_alias(self):
+
+        sess = Session()
+        supplier = aliased(Sample)
+        query = (
+            sess.query(Sample.name)
+            .join(supplier, supplier.supplier_name == Sample.name)
+            .filter(supplier.id_lims == "SQSCP")
+        )
+        alias = inspect(supplier).selectable
+
+        assert propose_index(query.statement, alias) == (
+            "CREATE INDEX ix_sample_id_lims ON sample (id_lims)"
+        )
+
+
+@m.describe("Checking example queries against the indexes")
+class TestIndexAdvisor(object):
+    @m.it("Explains every example query")
+    def test_examples(self, mlwh_session_flgen):
+
+        results = example_advisor().run(mlwh_session_flgen)
+
+        assert set(results) == set(example_advisor().builders)
+
+        for name, tables in INDEXED.items():
+            scanned = [f.table for f in results[name] if "full table scan" in f.problem]
+            assert not set(scanned) & set(tables), name
+
+        for name, (table, proposal) in PROPOSALS.items():
+            scans = [f for f in results[name] if f.table == table]
+            assert [f.problem for f in scans] == ["full table scan"], name
+            assert scans[0].proposal == proposal
+
+    @m.it("Finds no problems with lookups on the primary key")
+    def test_indexed_lookup(self, mlwh_session):
+
+        query = mlwh_session.query(BmapFlowcell).filter(
+            BmapFlowcell.id_bmap_flowcell_tmp == 1
+        )
+
+        assert check_query(mlwh_session, query) == []
+
+    @m.it("Flags a full scan and proposes an index for an unindexed filter")
+    def test_unindexed_filter(self, mlwh_session):
+
+        query = mlwh_session.query(BmapFlowcell.id_bmap_flowcell_tmp).filter(
+            BmapFlowcell.last_updated > SINCE
+        )
+        findings = check_query(mlwh_session, query)
+
+        assert [f.table for f in findings] == ["bmap_flowcell"]
+        assert "full table scan" in findings[0].problem
+        assert findings[0].proposal == (
+            "CREATE INDEX ix_bmap_flowcell_last_updated_id_bmap_flowcell_tmp "
+            "ON bmap_flowcell (last_updated, id_bmap_flowcell_tmp)"
+        )
+
+    @m.it("Proposes an index for a table scanned through an alias")
+    def test_aliased_filter(self, mlwh_session):
+
+        flowcell = aliased(BmapFlowcell)
+        query = mlwh_session.query(flowcell.id_bmap_flowcell_tmp).filter(
+            flowcell.last_updated > SINCE
+        )
+        findings = check_query(mlwh_session, query)
+
+        assert [f.table for f in findings] == ["bmap_flowcell_1"]
+        assert findings[0].proposal == (
+            "CREATE INDEX ix_bmap_flowcell_last_updated_id_bmap_flowcell_tmp "
+            "ON bmap_flowcell (last_updated, id_bmap_flowcell_tmp)"
+        )
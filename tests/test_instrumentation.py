@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import json
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from ml_warehouse import engine as mlwh_engine
+from ml_warehouse import instrumentation
+from ml_warehouse.engine import get_engine, url_from_config
+from ml_warehouse.instrumentation import QueryRecorder, fingerprint
+
+
+@pytest.fixture(scope="function")
+def sqlite_engine():
+    engine = create_engine("sqlite://", future=True)
+    yield engine
+    engine.dispose()
+
+
+@m.describe("Fingerprinting statements")
+class TestFingerprint(object):
+    @m.it("Replaces literals and parameters")
+    def test_fingerprint(self):
+
+        assert (
+            fingerprint("SELECT a1 FROM t\n  WHERE b = 'x''y' AND c > 3.5")
+            == "SELECT a1 FROM t WHERE b = ? AND c > ?"
+        )
+        assert fingerprint("SELECT a FROM t WHERE b = %(b_1)s") == (
+            "SELECT a FROM t WHERE b = ?"
+        )
+
+    @m.it("Collapses lists of values")
+    def test_fingerprint_lists(self):
+
+        assert fingerprint("SELECT a FROM t WHERE b IN (%s, %s, %s)") == (
+            fingerprint("SELECT a FROM t WHERE b IN (1)")
+        )
+
+
+@m.describe("Recording statements")
+class TestQueryRecorder(object):
+    @m.it("Records calls, latency and rows per fingerprint")
+    def test_record(self, sqlite_engine):
+
+        recorder = QueryRecorder(buckets=(10,))
+        recorder.instrument(sqlite_engine)
+
+        with sqlite_engine.connect() as conn:
+            for value in (1, 2, 3):
+                conn.execute(text("SELECT :value"), {"value": value}).all()
+
+        [stats] = recorder.stats.values()
+        assert stats.fingerprint == "SELECT ?"
+        assert stats.calls == 3
+        assert stats.buckets == [3, 0]
+        assert stats.seconds > 0
+
+    @m.it("Records errors")
+    def test_record_errors(self, sqlite_engine):
+
+        recorder = QueryRecorder()
+        recorder.instrument(sqlite_engine)
+
+        with sqlite_engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing"))
+            conn.execute(text("SELECT 1"))
+
+        errors = {s.fingerprint: s.errors for s in recorder.stats.values()}
+        assert errors == {"SELECT * FROM missing": 1, "SELECT ?": 0}
+
+    @m.it("Records nothing once uninstrumented")
+    def test_uninstrument(self, sqlite_engine):
+
+        recorder = QueryRecorder()
+        recorder.instrument(sqlite_engine)
+        recorder.uninstrument(sqlite_engine)
+
+        with sqlite_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert recorder.stats == {}
+
+    @m.it("Exports JSON and Prometheus text")
+    def test_export(self, sqlite_engine):
+
+        recorder = QueryRecorder(buckets=(0.5, 10))
+        recorder.instrument(sqlite_engine)
+
+        with sqlite_engine.connect() as conn:
+            conn.execute(text('SELECT "quoted"'))
+
+        [record] = json.loads(recorder.to_json())["statements"]
+        assert record["fingerprint"] == "SELECT ?"
+        assert record["calls"] == 1
+
+        lines = recorder.to_prometheus().splitlines()
+        label = f'query="{record["digest"]}"'
+        assert f'ml_warehouse_query_info{{{label},statement="SELECT ?"}} 1' in lines
+        assert (
+            f'ml_warehouse_query_duration_seconds_bucket{{{label},le="+Inf"}} 1'
+            in lines
+        )
+        assert f"ml_warehouse_query_duration_seconds_count{{{label}}} 1" in lines
+        assert f"ml_warehouse_query_errors_total{{{label}}} 0" in lines
+
+
+@m.describe("Enabling instrumentation")
+class TestEnable(object):
+    @m.it("Instruments existing and new shared engines until disabled")
+    def test_enable(self, config):
+
+        existing = get_engine(url_from_config(config))
+        recorder = instrumentation.enable()
+        try:
+            new = get_engine(url_from_config(config), pool_size=2)
+
+            assert {existing, new} <= set(recorder.engines)
+            assert instrumentation.get_recorder() is recorder
+        finally:
+            instrumentation.disable()
+
+        assert recorder.engines == []
+        assert mlwh_engine._engine_hooks == []
+        assert instrumentation.get_recorder() is None
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import json
+import subprocess
+import sys
+
+from pytest import mark as m
+
+import ml_warehouse.schema
+
+# Reports which mappings have been built after running a statement. This has
+# to run in a fresh interpreter, since the test session loads all mappings.
+PROBE = """
+import json
+from sqlalchemy.orm import configure_mappers
+{statement}
+from ml_warehouse._mappings._base import Base
+configure_mappers()
+print(json.dumps(sorted(m.class_.__name__ for m in Base.registry.mappers)))
+"""
+
+
+def mapped_after(statement: str):
+    output = subprocess.check_output(
+        [sys.executable, "-c", PROBE.format(statement=statement)]
+    )
+
+    return json.loads(output)
+
+
+@m.describe("Loading mappings on demand")
+class TestLazySchema(object):
+    @m.it("Builds no mappings when the schema module is imported")
+    def test_import_schema(self):
+
+        assert mapped_after("import ml_warehouse.schema") == []
+
+    @m.it("Builds only the requested mapping when it is unrelated to others")
+    def test_import_isolated(self):
+
+        assert mapped_after("from ml_warehouse.schema import CgapHeron") == [
+            "CgapHeron"
+        ]
+
+    @m.it("Builds the mappings reachable through relationships")
+    def test_import_related(self):
+
+        assert mapped_after("from ml_warehouse.schema import IseqRunStatus") == [
+            "IseqRunStatus",
+            "IseqRunStatusDict",
+        ]
+
+        mapped = mapped_after("from ml_warehouse.schema import Study")
+        assert "Sample" in mapped
+        assert "IseqFlowcell" in mapped
+        assert "CgapHeron" not in mapped
+        assert "IseqRunStatus" not in mapped
+
+    @m.it("Builds all mappings when Base is requested")
+    def test_import_base(self):
+
+        mapped = mapped_after("from ml_warehouse.schema import Base")
+        expected = [name for name in ml_warehouse.schema.__all__ if name[0].isupper()]
+        expected.remove("Base")
+
+        assert mapped == sorted(expected)
+
+    @m.it("Lists every mapping")
+    def test_dir(self):
+
+        names = dir(ml_warehouse.schema)
+
+        assert "Study" in names
+        assert "t_schema_migrations" in names
+        assert len(ml_warehouse.schema.metadata.tables) == len(
+            ml_warehouse.schema._REGISTRY
+        )
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pytest import mark as m
+from sqlalchemy.orm import Session
+
+from ml_warehouse.bulk import load_rows
+from ml_warehouse.lighthouse import Plate, PlateIndex, well
+from ml_warehouse.schema import LighthouseSample
+
+BARCODE = "AP-rna-00110029"
+
+
+def sample(i: int, coordinate: str, result: str, is_current: bool) -> dict:
+    return {
+        "root_sample_id": f"ROOT-{coordinate}",
+        "rna_id": f"{BARCODE}_{coordinate}",
+        "result": result,
+        "is_current": int(is_current),
+        "plate_barcode": BARCODE,
+        "coordinate": coordinate,
+        "created_at": datetime(2020, 11, i),
+    }
+
+
+SAMPLES = [
+    sample(1, "A01", "Negative", False),
+    sample(2, "A01", "Positive", True),
+    sample(3, "B12", "Negative", True),
+    sample(4, "H12", "Void", False),
+]
+
+
+@m.describe("Indexing Lighthouse plates")
+class TestLighthousePlate(object):
+    @m.it("Reads well coordinates with or without leading zeros")
+    def test_well(self):
+
+        assert well("A01") == well("a1") == ("A", 1)
+        assert well("P24") == ("P", 24)
+
+        with pytest.raises(ValueError):
+            well("1A")
+
+    @m.it("Finds the current and earlier samples of each well")
+    def test_plate(self):
+
+        plate = Plate(BARCODE, [SimpleNamespace(**s) for s in SAMPLES])
+
+        assert len(plate) == 4
+        assert plate.wells() == [("A", 1), ("B", 12), ("H", 12)]
+        assert plate.current("A1").result == "Positive"
+        assert plate.current("H12") is None
+        assert plate.current("C03") is None
+        assert [s.result for s in plate.samples("A01")] == ["Negative", "Positive"]
+        assert [s.result for s in plate.samples("A01", is_current=False)] == [
+            "Negative"
+        ]
+
+    @m.it("Loads plates with one query")
+    def test_load(self, mlwh_session: Session):
+
+        load_rows(mlwh_session.connection(), LighthouseSample, SAMPLES)
+        mlwh_session.commit()
+
+        plates = PlateIndex()
+
+        assert plates.load(mlwh_session, [BARCODE, "AP-rna-none"]) == 4
+        assert plates.load(mlwh_session, [BARCODE]) == 0
+        assert len(plates.plate("AP-rna-none")) == 0
+        assert plates.current_by_rna_id(f"{BARCODE}_A01").result == "Positive"
+        assert plates.current(BARCODE, "B12").root_sample_id == "ROOT-B12"
+        assert len(plates.by_root_sample_id("ROOT-A01")) == 2
+
+        assert plates.load(mlwh_session, [BARCODE], reload=True) == 4
+        assert len(plates.by_root_sample_id("ROOT-A01")) == 2
+
+        with pytest.raises(KeyError):
+            plates.plate("AP-rna-other")
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import pytest
+from pytest import mark as m
+from sqlalchemy.orm import Session
+
+from ml_warehouse.bulk import load_rows
+from ml_warehouse.lineage import (
+    Line,
+    LineageGraph,
+    lineage_donor,
+    lineage_labware,
+)
+from ml_warehouse.schema import CgapBiomaterial, CgapConjuredLabware, CgapLineIdentifier
+
+
+def line(uuid: str, parent: str = None) -> Line:
+    return Line(uuid, f"line {uuid}", "biomaterial", parent, None, None)
+
+
+# ips -> clone1 -> subclone1
+#     -> clone2
+LINES = [
+    line("ips"),
+    line("clone1", "ips"),
+    line("clone2", "ips"),
+    line("subclone1", "clone1"),
+]
+
+
+@m.describe("Cell line lineage")
+class TestLineageGraph(object):
+    @m.it("Finds the ancestors and descendants of a line")
+    def test_closures(self):
+
+        graph = LineageGraph()
+        graph.update(reversed(LINES))
+
+        assert len(graph) == 4
+        assert graph.ancestors("subclone1") == ["clone1", "ips"]
+        assert graph.descendants("ips") == ["clone1", "clone2", "subclone1"]
+        assert graph.descendants("clone2") == []
+        assert sorted(graph.children("ips")) == ["clone1", "clone2"]
+        assert graph.root("subclone1") == graph.root("ips") == "ips"
+
+        with pytest.raises(KeyError):
+            graph.ancestors("unknown")
+
+    @m.it("Extends and rebuilds the closures as lines are added")
+    def test_update(self):
+
+        graph = LineageGraph()
+        graph.update(LINES[1:])
+
+        assert graph.ancestors("subclone1") == ["clone1", "ips"]
+        assert graph.root("subclone1") == "clone1"
+
+        graph.update([line("subclone2", "clone2")])
+        assert graph.descendants("clone2") == ["subclone2"]
+
+        graph.update([line("ips", "donor-line")])
+        assert graph.ancestors("subclone2") == ["clone2", "ips", "donor-line"]
+        assert graph.root("subclone2") == "ips"
+
+    @m.it("Stops at a cycle")
+    def test_cycle(self):
+
+        graph = LineageGraph()
+        graph.update([line("a", "b"), line("b", "a")])
+
+        assert graph.ancestors("a") == ["b"]
+
+    @m.it("Refreshes from the table and joins labware and donors")
+    def test_refresh(self, mlwh_session: Session):
+
+        conn = mlwh_session.connection()
+        load_rows(conn, CgapLineIdentifier, [l._asdict() for l in LINES[:2]])
+        load_rows(
+            conn,
+            CgapBiomaterial,
+            [{"donor_uuid": "donor", "biomaterial_uuid": "biomaterial"}],
+        )
+        load_rows(
+            conn,
+            CgapConjuredLabware,
+            [
+                {
+                    "barcode": f"CGAP-{uuid}",
+                    "cell_line_long_name": uuid,
+                    "cell_line_uuid": uuid,
+                    "passage_number": 1,
+                    "labware_state": "active",
+                    "slot_uuid": f"slot-{uuid}",
+                }
+                for uuid in ("ips", "clone1", "subclone1")
+            ],
+        )
+        mlwh_session.commit()
+
+        graph = LineageGraph()
+        assert graph.refresh(mlwh_session) == 2
+
+        load_rows(conn, CgapLineIdentifier, [l._asdict() for l in LINES[2:]])
+        mlwh_session.commit()
+
+        assert graph.refresh(mlwh_session) == 2
+        assert graph.descendants("ips") == ["clone1", "clone2", "subclone1"]
+        assert sorted(
+            l.cell_line_uuid for l in lineage_labware(mlwh_session, graph, "clone1")
+        ) == ["clone1", "subclone1"]
+        assert lineage_donor(mlwh_session, graph, "subclone1").donor_uuid == "donor"
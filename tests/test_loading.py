@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import event
+
+from examples.npg_irods import find_pacbio_runs
+from ml_warehouse import schema
+from ml_warehouse.loading import PROFILES, apply_profile, loader_options
+from ml_warehouse.schema import IseqFlowcell, IseqProductMetrics, PacBioRun, Sample
+
+
+def statements(sess, query):
+    """Returns the results of a query and the number of statements it ran,
+    reading the sample and study of each result."""
+
+    executed = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engine = sess.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        sess.expunge_all()
+        results = query.all()
+        for result in results:
+            assert result.sample is not None
+            assert result.study is not None
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    return results, len(executed)
+
+
+@m.describe("Eager-loading profiles")
+class TestLoading(object):
+    @m.it("Builds loader options for each profile's classes")
+    def test_loader_options(self):
+
+        for profile, classes in PROFILES.items():
+            for name, paths in classes.items():
+                options = loader_options(profile, getattr(schema, name))
+                assert len(options) == len(paths)
+
+        assert loader_options("irods", Sample) == []
+
+    @m.it("Rejects unknown profiles")
+    def test_unknown_profile(self):
+
+        with pytest.raises(ValueError, match="prefetch"):
+            loader_options("prefetch", PacBioRun)
+
+    @m.it("Only adds options for the classes queried")
+    def test_apply_profile(self, mlwh_session):
+
+        query = mlwh_session.query(IseqProductMetrics.id_run)
+        assert apply_profile(query, "qc") is query
+
+        query = mlwh_session.query(IseqFlowcell, IseqProductMetrics)
+        assert apply_profile(query, "qc") is not query
+
+    @m.it("Runs as many statements for many results as for one")
+    def test_statement_count(self, mlwh_session):
+        def query(limit):
+            return find_pacbio_runs(mlwh_session, "32669", "B1", profile="irods").limit(
+                limit
+            )
+
+        few, few_statements = statements(mlwh_session, query(1))
+        many, many_statements = statements(mlwh_session, query(100))
+
+        assert len(few) == 1
+        assert len(many) > 2
+        assert few_statements == many_statements <= 2
+
+    @m.it("Runs more statements without a profile")
+    def test_lazy_statement_count(self, mlwh_session):
+
+        runs, count = statements(
+            mlwh_session, find_pacbio_runs(mlwh_session, "32669", "B1")
+        )
+
+        assert len(runs) > 2
+        assert count > 2
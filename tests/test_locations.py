@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pytest import mark as m
+
+from ml_warehouse.bulk import load_rows
+from ml_warehouse.locations import ProductLocationIndex
+from ml_warehouse.schema import SeqProductIrodsLocations
+
+PRODUCT = "5d3fcbd9c3bd4b7d4ef3dbe7fa7d1a5f7a4d36b36c7b0e0a9a3b2f3e1a7b5c4d"
+
+
+def row(id_tmp, root, id_product=PRODUCT, relative="12345/12345_1#1", **kwargs):
+    values = {
+        "id_seq_product_irods_locations_tmp": id_tmp,
+        "id_product": id_product,
+        "irods_root_collection": root,
+        "irods_data_relative_path": relative,
+        "irods_secondary_data_relative_path": None,
+        "seq_platform_name": "Illumina",
+        "pipeline_name": "npg-prod",
+        "last_changed": datetime(2022, 3, 1, 12, id_tmp),
+    }
+    values.update(kwargs)
+
+    return values
+
+
+ROWS = [
+    row(1, "/seq/illumina/runs/12/12345"),
+    row(2, "/seq/illumina/cellranger/12/12345", pipeline_name="cellranger"),
+    row(3, "/seq/illumina/runs/12/12345", id_product="other", relative=None),
+]
+
+
+@pytest.fixture(scope="function")
+def index() -> ProductLocationIndex:
+    index = ProductLocationIndex()
+    index.update(SimpleNamespace(**r) for r in ROWS)
+
+    return index
+
+
+@m.describe("Resolving product locations")
+class TestProductLocationIndex(object):
+    @m.it("Finds locations by product and by root collection and product")
+    def test_locations(self, index):
+
+        assert len(index) == 3
+        assert [loc.pipeline_name for loc in index.locations(PRODUCT)] == [
+            "cellranger",
+            "npg-prod",
+        ]
+        assert (
+            index.location(PRODUCT, "/seq/illumina/runs/12/12345").data_path()
+            == "/seq/illumina/runs/12/12345/12345/12345_1#1"
+        )
+        assert index.location("other").data_path() is None
+        assert index.location("none") is None
+        assert index.locations("none") == []
+        assert index.last_changed == datetime(2022, 3, 1, 12, 3)
+
+        with pytest.raises(ValueError):
+            index.location(PRODUCT)
+
+    @m.it("Moves a row changed to another root collection")
+    def test_moved(self, index):
+
+        index.update([SimpleNamespace(**row(3, "/seq/elsewhere", id_product="other"))])
+
+        assert len(index) == 3
+        assert index.location("other").irods_root_collection == "/seq/elsewhere"
+
+    @m.it("Keeps both locations of rows swapping roots in one update")
+    def test_swapped(self, index):
+
+        runs, cellranger = (
+            "/seq/illumina/runs/12/12345",
+            "/seq/illumina/cellranger/12/12345",
+        )
+        index.update(
+            [
+                SimpleNamespace(**row(1, cellranger)),
+                SimpleNamespace(**row(2, runs, pipeline_name="cellranger")),
+            ]
+        )
+
+        assert len(index) == 3
+        assert index.location(PRODUCT, runs).pipeline_name == "cellranger"
+        assert index.location(PRODUCT, cellranger).pipeline_name == "npg-prod"
+
+    @m.it("Starts from a snapshot")
+    def test_snapshot(self, index, tmp_path):
+
+        path = str(tmp_path / "locations.json")
+
+        assert len(ProductLocationIndex.from_snapshot(path)) == 0
+
+        index.save(path)
+        restored = ProductLocationIndex.from_snapshot(path)
+
+        assert len(restored) == 3
+        assert restored.locations(PRODUCT) == index.locations(PRODUCT)
+        assert restored.last_changed == index.last_changed
+
+        restored.update(
+            [SimpleNamespace(**row(3, "/seq/elsewhere", id_product="other"))]
+        )
+        assert len(restored) == 3
+
+    @m.it("Loads, then refreshes changed rows")
+    def test_refresh(self, mlwh_session):
+
+        load_rows(mlwh_session.connection(), SeqProductIrodsLocations, ROWS)
+        mlwh_session.commit()
+
+        index = ProductLocationIndex(overlap_seconds=0)
+        assert index.refresh(mlwh_session) == 3
+
+        load_rows(
+            mlwh_session.connection(),
+            SeqProductIrodsLocations,
+            [row(4, "/seq/new", id_product="new", last_changed=datetime(2022, 4, 1))],
+        )
+        mlwh_session.commit()
+
+        assert index.refresh(mlwh_session) == 2
+        assert index.location("new").irods_root_collection == "/seq/new"
+        assert len(index) == 4
@@ -22,13 +22,14 @@ from typing import List, Optional
 import pytest
 import sqlalchemy
 from pytest import mark as m
-from sqlalchemy import Table, inspect
+from sqlalchemy import Column, Integer, Table, inspect
 from sqlalchemy.engine.reflection import Inspector
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, declarative_base
 from sqlalchemy.orm.decl_api import DeclarativeMeta
 
 import ml_warehouse
-from ml_warehouse.schema import OseqFlowcell, Study
+from ml_warehouse._decorators import add_docstring
+from ml_warehouse.schema import IseqExternalProductMetrics, OseqFlowcell, Study
 
 
 @m.describe("Querying the ML Warehouse")
@@ -41,6 +42,44 @@ class TestMLWarehouseQueries(object):
         assert len(all_studies) > 0
 
 
+@m.describe("Documenting the mappings")
+class TestMLWarehouseDocstrings(object):
+    @m.it("Documents every column in the constructor docstring")
+    def test_generated_docstrings(self):
+
+        for name in ml_warehouse.schema.__all__:
+            class_ = getattr(ml_warehouse.schema, name)
+            if (
+                not isinstance(class_, DeclarativeMeta)
+                or class_ is ml_warehouse.schema.Base
+            ):
+                continue
+
+            lines = class_.__init__.__doc__.splitlines()
+            documented = [line.strip().split(":")[0] for line in lines[4:]]
+            documented = [column for column in documented if column]
+
+            assert documented == [col.name for col in class_.__table__.columns]
+
+    @m.it("Documents column attributes with the column comment")
+    def test_column_docstrings(self):
+
+        assert Study.id_study_lims.__doc__ == "LIMS-specific study identifier"
+        assert IseqExternalProductMetrics.yield_.__doc__.startswith("Sequence data")
+
+    @m.it("Builds the docstring of a class without a generated one")
+    def test_fallback_docstrings(self):
+        @add_docstring
+        class HandWritten(declarative_base()):
+            __tablename__ = "hand_written"
+
+            id = Column(Integer, primary_key=True, comment="Identifier")
+
+        assert HandWritten.__init__.__doc__.startswith("Constructs a new HandWritten")
+        assert "id: Identifier" in HandWritten.__init__.__doc__
+        assert HandWritten.id.__doc__ == "Identifier"
+
+
 @m.describe("Resilience to modifying the database schema")
 class TestMLWarehouseResilience(object):
     @m.it("Retrieves a record of study after a column is added")
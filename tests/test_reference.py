@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import threading
+from datetime import datetime
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from ml_warehouse import reference
+from ml_warehouse.reference import (
+    TTLCache,
+    ar_internal_metadata,
+    invalidate_on_commit,
+    run_status_description,
+    run_status_ids,
+    study_users,
+)
+from ml_warehouse.schema import ArInternalMetadata, StudyUsers
+
+
+def unconnected_session(url: str = "sqlite://") -> Session:
+    # Binding a Session does not connect, so any URL will do.
+    return Session(create_engine(url, future=True))
+
+
+SESSION = unconnected_session()
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(scope="function")
+def fresh_caches():
+    reference.invalidate()
+    yield
+    reference.invalidate()
+
+
+@pytest.fixture(scope="function")
+def sqlite_session(fresh_caches):
+    engine = create_engine("sqlite://", future=True)
+    ArInternalMetadata.__table__.create(engine)
+    with Session(engine) as sess:
+        yield sess
+    engine.dispose()
+
+
+@m.describe("Caching values for a limited time")
+class TestTTLCache(object):
+    @m.it("Loads each key once until it expires")
+    def test_ttl(self):
+
+        loads = []
+        clock = Clock()
+        cache = TTLCache(lambda sess, key: loads.append(key) or key * 2, 10, clock)
+
+        assert cache.get(SESSION, 1) == 2
+        assert cache.get(SESSION, 1) == 2
+        assert loads == [1]
+
+        clock.now = 10
+        assert cache.get(SESSION, 1) == 2
+        assert loads == [1, 1]
+
+    @m.it("Drops invalidated keys")
+    def test_invalidate(self):
+
+        loads = []
+        cache = TTLCache(lambda sess, key: loads.append(key))
+
+        for key in (1, 2, 1, 2):
+            cache.get(SESSION, key)
+        cache.invalidate(1)
+        cache.get(SESSION, 1)
+        cache.get(SESSION, 2)
+        cache.invalidate()
+        cache.get(SESSION, 2)
+
+        assert loads == [1, 2, 1, 2]
+
+    @m.it("Keeps the values of each database apart")
+    def test_databases(self):
+
+        loads = []
+        cache = TTLCache(lambda sess, key: loads.append(sess) or str(sess.bind.url))
+        other = unconnected_session("sqlite:///other.db")
+
+        assert cache.get(SESSION, 1) == "sqlite://"
+        assert cache.get(other, 1) == "sqlite:///other.db"
+        assert cache.get(SESSION, 1) == "sqlite://"
+        assert loads == [SESSION, other]
+
+        cache.invalidate(1, database=other.bind.url)
+        cache.get(SESSION, 1)
+        cache.get(other, 1)
+        assert loads == [SESSION, other, other]
+
+    @m.it("Loads other keys while one is loading")
+    def test_concurrent_loads(self):
+
+        loading, release = threading.Event(), threading.Event()
+
+        def load(sess, key):
+            if key == 1:
+                loading.set()
+                release.wait(5)
+            return key * 2
+
+        cache = TTLCache(load)
+        thread = threading.Thread(target=cache.get, args=(SESSION, 1))
+        thread.start()
+        loading.wait(5)
+
+        assert cache.get(SESSION, 2) == 4
+
+        release.set()
+        thread.join(5)
+        assert cache.get(SESSION, 1) == 2
+
+    @m.it("Does not cache a value invalidated while loading")
+    def test_invalidate_while_loading(self):
+
+        loads = []
+
+        def load(sess, key):
+            loads.append(key)
+            if len(loads) == 1:
+                cache.invalidate(key)
+            return len(loads)
+
+        cache = TTLCache(load)
+
+        assert cache.get(SESSION, 1) == 1
+        assert cache.get(SESSION, 1) == 2
+        assert cache.get(SESSION, 1) == 2
+
+
+@m.describe("Caching reference tables")
+class TestReferenceTables(object):
+    @m.it("Drops a table when a session commits changes to it")
+    def test_invalidate_on_commit(self, sqlite_session):
+
+        now = datetime.now()
+        sqlite_session.add(
+            ArInternalMetadata(
+                key="environment", value="test", created_at=now, updated_at=now
+            )
+        )
+        sqlite_session.commit()
+
+        assert ar_internal_metadata(sqlite_session) == {"environment": "test"}
+
+        invalidate_on_commit(sqlite_session)
+        row = sqlite_session.get(ArInternalMetadata, "environment")
+        row.value = "production"
+        sqlite_session.rollback()
+
+        assert ar_internal_metadata(sqlite_session) == {"environment": "test"}
+
+        row.value = "production"
+        sqlite_session.commit()
+
+        assert ar_internal_metadata(sqlite_session) == {"environment": "production"}
+
+    @m.it("Resolves run status descriptions")
+    def test_run_status(self, mlwh_session, fresh_caches):
+
+        assert run_status_description(mlwh_session, 1) == "run pending"
+        assert run_status_ids(mlwh_session, "qc complete", "run pending") == [1, 20]
+
+    @m.it("Caches the users of each study")
+    def test_study_users(self, mlwh_session, fresh_caches):
+
+        id_study_tmp = mlwh_session.query(StudyUsers.id_study_tmp).first()[0]
+        users = study_users(mlwh_session, id_study_tmp)
+
+        assert users
+        assert {u.id_study_tmp for u in users} == {id_study_tmp}
+        assert study_users(mlwh_session, id_study_tmp) is users
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import Session, declarative_base, defer, load_only
+
+from examples.genotyping import get_flgen_plate
+from examples.npg_irods import get_bmap_flowcell_records, get_stock_records
+from ml_warehouse.loading import apply_profile
+from ml_warehouse.rows import fetch_rows, row_class
+from ml_warehouse.schema import FlgenPlate, StockResource
+
+Base = declarative_base()
+
+
+class Lane(Base):
+    __tablename__ = "lane"
+
+    id_lane = Column(Integer, primary_key=True)
+    lane_name = Column("name", String(10))
+
+
+@pytest.fixture(scope="function")
+def sqlite_session():
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine, future=True) as sess:
+        sess.add_all([Lane(id_lane=i, lane_name=f"lane {i}") for i in range(1, 4)])
+        sess.commit()
+        yield sess
+    engine.dispose()
+
+
+@m.describe("Read-only rows")
+class TestRows(object):
+    @m.it("Generates a row class per mapped class")
+    def test_row_class(self):
+
+        row_cls = row_class(StockResource)
+
+        assert row_cls.__name__ == "StockResourceRow"
+        assert row_cls._fields == tuple(c.key for c in StockResource.__table__.c)
+        assert row_class(StockResource) is row_cls
+
+        row = row_cls(*row_cls._fields)
+        assert not hasattr(row, "__dict__")
+        with pytest.raises(AttributeError):
+            row.id_lims = "SQSCP"
+
+    @m.it("Uses attribute names rather than column names")
+    def test_row_class_attributes(self):
+
+        assert row_class(Lane)._fields == ("id_lane", "lane_name")
+
+    @m.it("Returns rows without filling the identity map")
+    def test_fetch_rows(self, sqlite_session):
+
+        sqlite_session.expunge_all()
+        rows = fetch_rows(
+            sqlite_session.query(Lane).filter(Lane.id_lane > 1).order_by(Lane.id_lane)
+        )
+
+        assert rows == [row_class(Lane)(2, "lane 2"), row_class(Lane)(3, "lane 3")]
+        assert rows[0].lane_name == "lane 2"
+        assert len(sqlite_session.identity_map) == 0
+
+    @m.it("Drops loader options")
+    def test_fetch_rows_options(self, sqlite_session):
+
+        query = sqlite_session.query(Lane).order_by(Lane.id_lane)
+        loading = query.options(load_only(Lane.lane_name), defer(Lane.lane_name))
+
+        assert fetch_rows(loading) == fetch_rows(query)
+        assert loading._with_options
+
+    @m.it("Rejects queries for columns")
+    def test_fetch_columns(self, sqlite_session):
+
+        with pytest.raises(ValueError):
+            fetch_rows(sqlite_session.query(Lane.id_lane))
+
+    @m.it("Returns the same values as the example queries")
+    def test_example_queries(self, mlwh_session_flgen):
+
+        for query in (
+            get_stock_records(mlwh_session_flgen, "stock_barcode_01234"),
+            get_bmap_flowcell_records(mlwh_session_flgen, "KHPZDTGLPQJGPNWU", 2),
+            get_flgen_plate(mlwh_session_flgen, 1382108143, "S70"),
+        ):
+            expected = [
+                tuple(getattr(obj, c.key) for c in obj.__table__.c)
+                for obj in query.all()
+            ]
+
+            assert expected
+            assert fetch_rows(query) == expected
+            assert fetch_rows(apply_profile(query, "irods")) == expected
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from collections import namedtuple
+from datetime import datetime
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import select
+
+from examples.long_illumina import summarize_long_illumina
+from ml_warehouse.run_state import (
+    iseq_run_state,
+    metadata,
+    rebuild_run_state,
+    refresh_run_state,
+    summarise,
+)
+from ml_warehouse.schema import IseqRunStatus
+
+Status = namedtuple("Status", "id_run_status id_run date id_run_status_dict iscurrent")
+
+
+@pytest.fixture(scope="function")
+def run_state_session(mlwh_session_ipm):
+    conn = mlwh_session_ipm.connection()
+    metadata.drop_all(conn)
+    metadata.create_all(conn)
+    mlwh_session_ipm.commit()
+
+    yield mlwh_session_ipm
+
+    metadata.drop_all(mlwh_session_ipm.connection())
+    mlwh_session_ipm.commit()
+
+
+@m.describe("Summarising run states")
+class TestSummarise(object):
+    @m.it("Takes the current status and the first pending date of each run")
+    def test_summarise(self):
+
+        summaries = summarise(
+            [
+                Status(1, 10, datetime(2020, 1, 2), 1, 0),
+                Status(2, 10, datetime(2020, 1, 1), 1, 0),
+                Status(3, 11, datetime(2020, 1, 1), 2, 1),
+                Status(4, 10, datetime(2020, 1, 3), 2, 1),
+                Status(5, 10, datetime(2020, 1, 4), 4, 0),
+                Status(6, 12, datetime(2020, 1, 1), 1, 0),
+            ],
+            pending={1},
+        )
+
+        assert summaries[10] == {
+            "id_run": 10,
+            "id_run_status_dict": 2,
+            "id_run_status": 4,
+            "state_date": datetime(2020, 1, 3),
+            "pending_date": datetime(2020, 1, 1),
+            "last_id_run_status": 5,
+        }
+        assert summaries[11]["pending_date"] is None
+        assert summaries[12]["id_run_status"] is None
+        assert summaries[12]["pending_date"] == datetime(2020, 1, 1)
+
+
+@m.describe("Maintaining the run state table")
+class TestRunState(object):
+    @m.it("Answers the long Illumina runs query like the status history")
+    def test_summarize_long_illumina(self, run_state_session):
+
+        refresh_run_state(run_state_session.connection())
+        args = (
+            "%tyler%",
+            datetime(year=2015, month=1, day=14),
+            datetime(year=2021, month=8, day=31),
+            3,
+            [3434, 1239, 1453],
+        )
+
+        expected = summarize_long_illumina(run_state_session, *args).all()
+        observed = summarize_long_illumina(
+            run_state_session, *args, use_run_state=True
+        ).all()
+
+        assert observed == expected
+
+    @m.it("Only reads the statuses added since the last refresh")
+    def test_refresh(self, run_state_session):
+
+        conn = run_state_session.connection()
+        runs = refresh_run_state(conn)
+
+        assert runs > 0
+        assert refresh_run_state(conn, overlap=0) == 0
+
+        run_state_session.add(
+            IseqRunStatus(
+                id_run=15440,
+                date=datetime(2022, 1, 1),
+                id_run_status_dict=2,
+                iscurrent=1,
+            )
+        )
+        run_state_session.flush()
+
+        assert refresh_run_state(conn, overlap=0) == 1
+        state = conn.execute(
+            select(iseq_run_state).where(iseq_run_state.c.id_run == 15440)
+        ).one()
+        assert state.id_run_status_dict == 2
+        assert state.state_date == datetime(2022, 1, 1)
+
+        assert rebuild_run_state(conn) == runs
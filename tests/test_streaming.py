@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+
+import pytest
+from pytest import mark as m
+from sqlalchemy.orm import Session
+
+from ml_warehouse.schema import PacBioRun, Sample
+from ml_warehouse.streaming import keyset_chunks, stream_chunks
+
+
+@m.describe("Streaming query results")
+class TestStreaming(object):
+    @m.it("Pages through entities by a unique key")
+    def test_keyset_entities(self, mlwh_session):
+
+        query = mlwh_session.query(PacBioRun)
+        chunks = list(keyset_chunks(query, PacBioRun.id_pac_bio_tmp, chunk_size=10))
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 10, 10, 10, 6]
+
+        observed = [row.id_pac_bio_tmp for chunk in chunks for row in chunk]
+        assert observed == sorted(row.id_pac_bio_tmp for row in query.all())
+
+    @m.it("Pages through filtered columns in descending order")
+    def test_keyset_columns(self, mlwh_session):
+
+        query = mlwh_session.query(PacBioRun.id_pac_bio_tmp, Sample.name).join(
+            PacBioRun.sample
+        )
+        query = query.filter(Sample.last_updated > datetime(2021, 1, 31))
+
+        chunks = keyset_chunks(
+            query, PacBioRun.id_pac_bio_tmp, chunk_size=2, descending=True
+        )
+        observed = [row.id_pac_bio_tmp for chunk in chunks for row in chunk]
+
+        assert len(observed) == query.count()
+        assert observed == sorted(observed, reverse=True)
+
+    @m.it("Pages through several entities by a key of one of them")
+    def test_keyset_several_entities(self, mlwh_session):
+
+        query = mlwh_session.query(PacBioRun, Sample).join(PacBioRun.sample)
+        chunks = list(keyset_chunks(query, PacBioRun.id_pac_bio_tmp, chunk_size=10))
+
+        observed = [run.id_pac_bio_tmp for chunk in chunks for run, _ in chunk]
+        assert observed == sorted(run.id_pac_bio_tmp for run, _ in query.all())
+
+    @m.it("Pages through columns by a key not selected")
+    def test_keyset_unselected_key(self, mlwh_session):
+
+        # Many runs share a well label and LIMS, so rows repeat.
+        query = mlwh_session.query(PacBioRun.well_label, Sample.id_lims).join(
+            PacBioRun.sample
+        )
+        chunks = list(keyset_chunks(query, PacBioRun.id_pac_bio_tmp, chunk_size=10))
+
+        observed = [row for chunk in chunks for row in chunk]
+        assert observed[0]._fields == ("well_label", "id_lims")
+        assert observed == query.order_by(PacBioRun.id_pac_bio_tmp).all()
+        assert len(set(observed)) < len(observed)
+
+    @m.it("Refuses DISTINCT queries not selecting the key")
+    def test_keyset_distinct_unselected_key(self):
+
+        query = Session().query(Sample.name).join(PacBioRun.sample).distinct()
+        with pytest.raises(ValueError):
+            next(keyset_chunks(query, PacBioRun.id_pac_bio_tmp))
+
+    @m.it("Reads chunks through a server-side cursor")
+    def test_stream_chunks(self, mlwh_session):
+
+        query = mlwh_session.query(PacBioRun).order_by(PacBioRun.id_pac_bio_tmp)
+        chunks = list(stream_chunks(query, chunk_size=20))
+
+        assert [len(chunk) for chunk in chunks] == [20, 20, 16]
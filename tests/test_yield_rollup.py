@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2022 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+
+import pytest
+from pytest import mark as m
+from sqlalchemy import func, select
+
+from examples.stats import get_sequenced_sum
+from ml_warehouse import reference
+from ml_warehouse.schema import IseqRunLaneMetrics, IseqRunStatus
+from ml_warehouse.yield_rollup import (
+    QC_COMPLETE,
+    iseq_yield_event,
+    iseq_yield_month,
+    metadata,
+    month_of,
+    refresh_yield_rollup,
+)
+
+
+@pytest.fixture(scope="function")
+def yield_rollup_session(mlwh_session_ipm):
+    conn = mlwh_session_ipm.connection()
+    metadata.drop_all(conn)
+    metadata.create_all(conn)
+    mlwh_session_ipm.commit()
+
+    yield mlwh_session_ipm
+
+    metadata.drop_all(mlwh_session_ipm.connection())
+    mlwh_session_ipm.commit()
+
+
+@m.describe("Rolling up sequencing yield")
+class TestYieldRollup(object):
+    @m.it("Formats months as the live query does")
+    def test_month_of(self):
+
+        assert month_of(datetime(2021, 3, 31, 23, 59)) == "2021-03"
+
+    @m.it("Answers the sequenced sum query like the lane metrics")
+    def test_get_sequenced_sum(self, yield_rollup_session):
+
+        refresh_yield_rollup(yield_rollup_session.connection())
+
+        for since in (datetime(2015, 1, 1), datetime(2019, 6, 14)):
+            expected = get_sequenced_sum(yield_rollup_session, since).all()
+            observed = get_sequenced_sum(
+                yield_rollup_session, since, use_rollup=True
+            ).all()
+
+            assert [tuple(row) for row in observed] == [tuple(row) for row in expected]
+
+    @m.it("Counts each qc complete status once")
+    def test_refresh(self, yield_rollup_session):
+
+        conn = yield_rollup_session.connection()
+        counted = refresh_yield_rollup(conn, batch_size=2)
+        lanes = conn.execute(select(func.sum(iseq_yield_month.c.lanes))).scalar()
+
+        assert counted > 0
+        assert refresh_yield_rollup(conn) == 0
+        assert (
+            conn.execute(select(func.sum(iseq_yield_month.c.lanes))).scalar() == lanes
+        )
+
+    @m.it("Counts a qc complete status once its lane metrics arrive")
+    def test_refresh_waiting(self, yield_rollup_session):
+
+        sess = yield_rollup_session
+        conn = sess.connection()
+        refresh_yield_rollup(conn)
+        lanes = conn.execute(select(func.sum(iseq_yield_month.c.lanes))).scalar()
+
+        (qc_complete,) = reference.run_status_ids(sess, QC_COMPLETE)
+        sess.add(
+            IseqRunStatus(
+                id_run=99999,
+                date=datetime(2022, 1, 1),
+                id_run_status_dict=qc_complete,
+                iscurrent=1,
+            )
+        )
+        sess.flush()
+
+        assert refresh_yield_rollup(conn) == 1
+        waiting = conn.execute(
+            select(iseq_yield_event).where(iseq_yield_event.c.id_run == 99999)
+        ).one()
+        assert waiting.lanes == 0
+
+        # The status leaves the overlap window before its metrics arrive.
+        assert refresh_yield_rollup(conn, overlap=0) == 0
+        sess.add(
+            IseqRunLaneMetrics(
+                id_run=99999,
+                position=1,
+                cycles=302,
+                interop_cluster_count_pf_total=1000,
+                instrument_model="NovaSeq",
+            )
+        )
+        sess.flush()
+
+        assert refresh_yield_rollup(conn, overlap=0) == 1
+        month = conn.execute(
+            select(iseq_yield_month).where(iseq_yield_month.c.month == "2022-01")
+        ).one()
+        assert (month.instrument_model, month.bases, month.lanes) == (
+            "NovaSeq",
+            302000,
+            1,
+        )
+        assert (
+            conn.execute(select(func.sum(iseq_yield_month.c.lanes))).scalar()
+            == lanes + 1
+        )
+        assert refresh_yield_rollup(conn, overlap=0) == 0